@@ -18,14 +18,22 @@ from dataclasses import dataclass
 # Add arcade_game_launcher to path
 sys.path.append(os.path.join(os.path.dirname(__file__), 'arcade_game_launcher'))
 
+from config_service import get_setting, load_config, mixer_settings
+from process_supervisor import ProcessSupervisor
+from stats_journal import StatsJournal
+from surface_cache import create_text_cache
+from zygote_pool import ZygotePool
+
+CONFIG = load_config()
+
 # Ultra-optimized initialization
+pygame.mixer.pre_init(**mixer_settings(CONFIG))  # Must come before init to take effect
 pygame.init()
-pygame.mixer.pre_init(frequency=22050, size=-16, channels=2, buffer=128)
 
 # Constants
 WINDOW_WIDTH = 1000
 WINDOW_HEIGHT = 700
-TARGET_FPS = 120
+TARGET_FPS = get_setting(CONFIG, "display.target_fps", 120)
 
 class UltimateTheme:
     """Ultimate theme colors"""
@@ -59,7 +67,7 @@ class UltimateRenderer:
     """Ultimate high-performance renderer"""
     def __init__(self, screen):
         self.screen = screen
-        self.surface_cache = {}
+        self.text_cache = create_text_cache()
         
         # Pre-load fonts
         self.fonts = {
@@ -73,10 +81,12 @@ class UltimateRenderer:
     def get_text_surface(self, text: str, font_key: str, color: Tuple[int, int, int]):
         """Cached text rendering"""
         cache_key = (text, font_key, color)
-        if cache_key not in self.surface_cache:
-            font = self.fonts[font_key]
-            self.surface_cache[cache_key] = font.render(text, True, color)
-        return self.surface_cache[cache_key]
+        return self.text_cache.get_or_create(
+            cache_key, lambda: self.fonts[font_key].render(text, True, color))
+    
+    def render_text(self, text: str, font_key: str, color: Tuple[int, int, int]):
+        """Uncached rendering for live overlay text that changes every frame"""
+        return self.fonts[font_key].render(text, True, color)
     
     def draw_rounded_rect(self, color: Tuple[int, int, int], rect: pygame.Rect, radius: int = 12):
         """Optimized rounded rectangle"""
@@ -187,6 +197,11 @@ class UltimateGameLauncher:
         self.clock = pygame.time.Clock()
         self.renderer = UltimateRenderer(self.screen)
         
+        # Pre-warmed game processes for instant launches
+        self.game_pool = ZygotePool(size=1)
+        self.game_pool.start()
+        self.supervisor = ProcessSupervisor()
+        
         # Game data
         self.games = self.load_games()
         self.game_cards = []
@@ -196,8 +211,10 @@ class UltimateGameLauncher:
         self.frame_times = []
         self.fps_display = 120
         
-        # Statistics
+        # Statistics, persisted by a background journal writer
+        self.stats_journal = StatsJournal("arcade_game_launcher/game_stats.json")
         self.stats = self.load_stats()
+        self.stats_journal.start()
         
         self.setup_layout()
         self.load_game_stats()
@@ -262,13 +279,8 @@ class UltimateGameLauncher:
             self.game_cards.append(card)
     
     def load_stats(self) -> Dict:
-        """Load game statistics"""
-        try:
-            stats_path = "arcade_game_launcher/game_stats.json"
-            with open(stats_path, "r") as f:
-                return json.load(f)
-        except:
-            return {}
+        """Load game statistics from the snapshot plus journal"""
+        return self.stats_journal.load()
     
     def load_game_stats(self):
         """Load statistics for each game"""
@@ -277,16 +289,9 @@ class UltimateGameLauncher:
                 game.play_count = self.stats[game.name].get("play_count", 0)
                 game.last_played = self.stats[game.name].get("last_played", 0)
     
-    def save_stats(self):
-        """Save game statistics"""
-        stats_data = {game.name: {"play_count": game.play_count, "last_played": game.last_played} 
-                     for game in self.games}
-        try:
-            stats_path = "arcade_game_launcher/game_stats.json"
-            with open(stats_path, "w") as f:
-                json.dump(stats_data, f, indent=2)
-        except:
-            pass
+    def save_stats(self, game: GameData):
+        """Queue a game's statistics for the journal writer (no file I/O here)"""
+        self.stats_journal.record(game.name, play_count=game.play_count, last_played=game.last_played)
     
     def handle_events(self) -> bool:
         """Handle all events"""
@@ -336,16 +341,24 @@ class UltimateGameLauncher:
     
     def launch_game(self, game: GameData):
         """Launch a game"""
+        # Claim the slot now so a double-click can't count a launch the supervisor would refuse
+        if not self.supervisor.reserve(game.name):
+            print(f"⏳ {game.name} is already running")
+            return
+        
         try:
             game.play_count += 1
             game.last_played = time.time()
-            self.save_stats()
+            self.save_stats(game)
             
             # Launch in separate thread
             def launch_thread():
                 game_dir = os.path.dirname(game.path)
-                subprocess.Popen([sys.executable, os.path.basename(game.path)], 
-                               cwd=game_dir)
+                try:
+                    self.supervisor.launch(game.name, lambda: self.game_pool.launch(game.path, cwd=game_dir),
+                                           reserved=True)
+                except Exception as e:
+                    print(f"❌ Failed to launch {game.name}: {e}")
             
             threading.Thread(target=launch_thread, daemon=True).start()
             print(f"🚀 Launched: {game.name}")
@@ -354,6 +367,9 @@ class UltimateGameLauncher:
     
     def update(self, dt: float):
         """Update game state"""
+        for record in self.supervisor.poll_finished():
+            print(f"🏁 {record.get_summary_text()}")
+        
         # Update performance tracking
         self.frame_times.append(dt)
         if len(self.frame_times) > 60:
@@ -411,12 +427,14 @@ class UltimateGameLauncher:
         """Draw footer"""
         controls = [
             "🖱️ Single Click: Launch instantly • ⌨️ Arrow Keys: Navigate • Enter: Launch • ESC: Exit",
-            f"🎯 Game {self.selected_index + 1}/{len(self.games)} • FPS: {self.fps_display} • Ultimate Performance"
+            f"🎯 Game {self.selected_index + 1}/{len(self.games)} • FPS: {self.fps_display} • {self.renderer.text_cache.get_stats_text()}"
         ]
         
         y_start = WINDOW_HEIGHT - 60
         for i, control in enumerate(controls):
-            control_surface = self.renderer.get_text_surface(control, 'small', UltimateTheme.TEXT_GRAY)
+            # The last line carries live stats, so it skips the cache it reports on
+            render = self.renderer.render_text if i == len(controls) - 1 else self.renderer.get_text_surface
+            control_surface = render(control, 'small', UltimateTheme.TEXT_GRAY)
             control_rect = control_surface.get_rect(center=(WINDOW_WIDTH // 2, y_start + i * 25))
             self.screen.blit(control_surface, control_rect)
     
@@ -444,7 +462,9 @@ class UltimateGameLauncher:
             self.draw()
             self.clock.tick(TARGET_FPS)
         
-        self.save_stats()
+        self.stats_journal.close()
+        self.supervisor.shutdown()
+        self.game_pool.shutdown()
         pygame.quit()
         sys.exit()
 
@@ -14,6 +14,11 @@ from enum import Enum
 from typing import List, Dict, Tuple, Optional
 import json
 
+import numpy
+
+from background_layers import background_layers
+from particle_engine import ParticleEngine
+
 # Initialize Pygame
 pygame.init()
 
@@ -213,7 +218,7 @@ class AdvancedGameLauncher:
         
         # Animations
         self.background_animation = 0
-        self.particles = []
+        self.particles = ParticleEngine(capacity=50, fade=False, wrap=(WINDOW_WIDTH, WINDOW_HEIGHT))
         
         # Initialize UI
         self.setup_game_cards()
@@ -338,14 +343,9 @@ class AdvancedGameLauncher:
         """Create animated background particles"""
         self.particles.clear()
         for _ in range(50):
-            self.particles.append({
-                'x': random.uniform(0, WINDOW_WIDTH),
-                'y': random.uniform(0, WINDOW_HEIGHT),
-                'vx': random.uniform(-0.5, 0.5),
-                'vy': random.uniform(-0.5, 0.5),
-                'size': random.uniform(1, 3),
-                'alpha': random.uniform(50, 150)
-            })
+            self.particles.emit(random.uniform(0, WINDOW_WIDTH), random.uniform(0, WINDOW_HEIGHT),
+                                random.uniform(-0.5, 0.5), random.uniform(-0.5, 0.5), Colors.PRIMARY,
+                                life=math.inf, size=random.uniform(1, 3), alpha=random.uniform(50, 150))
     
     def handle_events(self):
         """Handle input events"""
@@ -411,20 +411,8 @@ class AdvancedGameLauncher:
         # Update background animation
         self.background_animation += dt
         
-        # Update particles
-        for particle in self.particles:
-            particle['x'] += particle['vx']
-            particle['y'] += particle['vy']
-            
-            # Wrap around screen
-            if particle['x'] < 0:
-                particle['x'] = WINDOW_WIDTH
-            elif particle['x'] > WINDOW_WIDTH:
-                particle['x'] = 0
-            if particle['y'] < 0:
-                particle['y'] = WINDOW_HEIGHT
-            elif particle['y'] > WINDOW_HEIGHT:
-                particle['y'] = 0
+        # Update particles (they wrap around the screen)
+        self.particles.update()
         
         # Update scroll
         self.scroll_offset += (self.target_scroll - self.scroll_offset) * dt * 5
@@ -437,23 +425,15 @@ class AdvancedGameLauncher:
     
     def draw_background(self):
         """Draw animated background"""
-        # Gradient background
-        for y in range(WINDOW_HEIGHT):
-            ratio = y / WINDOW_HEIGHT
-            r = int(Colors.BACKGROUND[0] + ratio * 10)
-            g = int(Colors.BACKGROUND[1] + ratio * 10)
-            b = int(Colors.BACKGROUND[2] + ratio * 15)
-            pygame.draw.line(self.screen, (r, g, b), (0, y), (WINDOW_WIDTH, y))
-        
-        # Animated particles
-        for particle in self.particles:
-            alpha = int(particle['alpha'] + 50 * math.sin(self.background_animation + particle['x'] * 0.01))
-            alpha = max(0, min(255, alpha))
-            
-            particle_surf = pygame.Surface((particle['size'] * 2, particle['size'] * 2), pygame.SRCALPHA)
-            pygame.draw.circle(particle_surf, (*Colors.PRIMARY, alpha), 
-                             (particle['size'], particle['size']), particle['size'])
-            self.screen.blit(particle_surf, (particle['x'] - particle['size'], particle['y'] - particle['size']))
+        # Gradient background, rebuilt only when the theme color or window size changes
+        background = Colors.BACKGROUND
+        bottom = (background[0] + 10, background[1] + 10, background[2] + 15)
+        self.screen.blit(background_layers.gradient(self.screen.get_size(), background, bottom), (0, 0))
+        
+        # Animated particles, twinkling with position
+        particles = self.particles
+        alpha = particles.alpha + 50 * numpy.sin(self.background_animation + particles.position[:, 0] * 0.01)
+        particles.draw(self.screen, alpha=numpy.clip(alpha, 0, 255))
     
     def draw_sidebar(self):
         """Draw sidebar with launcher info"""
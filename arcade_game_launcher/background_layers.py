@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Background Layers - Cached Gradient and Static Backgrounds
+Builds each background once with NumPy and keeps it in display format so drawing it costs a single blit
+"""
+
+from typing import Callable, Hashable, Tuple
+
+import pygame
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from surface_cache import DisplaySurfaceCache
+
+Color = Tuple[int, int, int]
+LAYER_CACHE_KB = 16384  # Several full-window layers, so toggling themes or sizes back and forth stays cached
+
+def create_gradient(size: Tuple[int, int], start: Color, end: Color, vertical: bool = True) -> pygame.Surface:
+    """Linear gradient where row (or column) i is start + (end - start) * i / length, truncated"""
+    width, height = size
+    length = height if vertical else width
+    surface = pygame.Surface((width, height))
+    if length <= 0 or width <= 0 or height <= 0:
+        return surface
+    
+    if numpy is None:
+        for i in range(length):
+            color = [int(start[c] + (end[c] - start[c]) * (i / length)) for c in range(3)]
+            line = ((0, i), (width, i)) if vertical else ((i, 0), (i, height))
+            pygame.draw.line(surface, color, *line)
+        return surface
+    
+    ratio = numpy.arange(length, dtype=numpy.float64) / length
+    start_color = numpy.asarray(start[:3], dtype=numpy.float64)
+    end_color = numpy.asarray(end[:3], dtype=numpy.float64)
+    colors = (start_color + (end_color - start_color) * ratio[:, None]).astype(numpy.uint8)
+    
+    # surfarray indexes pixels as [x, y]
+    pixels = numpy.empty((width, height, 3), dtype=numpy.uint8)
+    pixels[:] = colors[None, :, :] if vertical else colors[:, None, :]
+    pygame.surfarray.blit_array(surface, pixels)
+    return surface
+
+class BackgroundLayers:
+    """Display-format background surfaces keyed by everything they depend on (size, colors, theme)"""
+    
+    def __init__(self, max_bytes: int = LAYER_CACHE_KB * 1024):
+        self.cache = DisplaySurfaceCache(max_bytes=max_bytes)
+    
+    def layer(self, key: Hashable, build: Callable[[], pygame.Surface]) -> pygame.Surface:
+        """Cached layer for key, built and converted to the display format on first use"""
+        return self.cache.layer(key, build)
+    
+    def gradient(self, size: Tuple[int, int], start: Color, end: Color, vertical: bool = True) -> pygame.Surface:
+        """Cached gradient; a new size or color set (resize, theme change) builds a new layer"""
+        size = (int(size[0]), int(size[1]))
+        key = ("gradient", size, tuple(start), tuple(end), vertical)
+        return self.layer(key, lambda: create_gradient(size, start, end, vertical))
+    
+    def clear(self):
+        """Drop every layer"""
+        self.cache.clear()
+
+# Shared by everything drawn in this process
+background_layers = BackgroundLayers()
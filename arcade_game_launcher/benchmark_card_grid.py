@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Card Grid Benchmark - Per-Frame Cost vs Library Size
+Scrolls the fixed optimized launcher through synthetic libraries of 6 to 10,000 games
+"""
+
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+from fixed_optimized_launcher import FixedOptimizedGameLauncher, GameData
+from launch_latency import percentile
+
+LIBRARY_SIZES = [6, 100, 1000, 10000]
+FRAMES = 300
+SCROLL_SPAN = 900   # Pixels scrolled back and forth around the middle of the library
+SCROLL_STEP = 30
+
+class BenchmarkLauncher(FixedOptimizedGameLauncher):
+    """Launcher fed with a synthetic library instead of the games directory"""
+    
+    library_size = 6
+    
+    def load_games(self):
+        return [GameData(f"Game {i}", f"games/game_{i}/main.py", "A synthetic benchmark game for the grid",
+                         "Benchmark", (64 + i % 192, 128, 255 - i % 192), "main.py")
+                for i in range(self.library_size)]
+    
+    def load_stats(self):
+        return {}
+
+def measure(library_size: int) -> dict:
+    """Time update + draw while scrolling the same distance in every library"""
+    BenchmarkLauncher.library_size = library_size
+    launcher = BenchmarkLauncher()
+    launcher.poll_startup(block=True)
+    launcher.game_pool.shutdown()
+    time.sleep(1.0)  # Let the retired zygote worker exit so it doesn't skew timings
+    
+    # Ping-pong over a fixed span so every size does the same amount of work per frame
+    max_scroll = launcher.get_max_scroll()
+    span = min(SCROLL_SPAN, max_scroll)
+    base = max(0, max_scroll // 2 - span // 2)
+    launcher.scroll_offset = launcher.target_scroll = base
+    
+    frame_ms = []
+    for frame in range(FRAMES):
+        travel = (frame * SCROLL_STEP) % (2 * span) if span else 0
+        launcher.target_scroll = base + (travel if travel <= span else 2 * span - travel)
+        start = time.perf_counter()
+        launcher.update(1 / 120)
+        launcher.draw()
+        frame_ms.append((time.perf_counter() - start) * 1000)
+    
+    return {
+        "games": library_size,
+        "cards": len(launcher.game_cards),
+        "mean": sum(frame_ms) / len(frame_ms),
+        "p95": percentile(frame_ms, 95)
+    }
+
+def main():
+    """Run the benchmark for every library size"""
+    print("📊 Virtualized card grid benchmark")
+    print("=" * 50)
+    print(f"{'Games':>8} {'Cards':>6} {'Mean ms':>9} {'p95 ms':>8}")
+    
+    for library_size in LIBRARY_SIZES:
+        result = measure(library_size)
+        print(f"{result['games']:>8} {result['cards']:>6} {result['mean']:>9.3f} {result['p95']:>8.3f}")
+    
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+"""
+Game Benchmark - Deterministic Headless Frame Timing
+Steps every bundled game with seeded randomness and scripted input, then compares phase timings to a baseline
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import platform
+import importlib.util
+import multiprocessing
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from launch_latency import percentile
+from fixed_timestep import SIMULATION_HZ
+
+GAMES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "games")
+RESULTS_FILE = "benchmark_results.json"
+BASELINE_FILE = "benchmark_baseline.json"
+FRAMES = 600
+WARMUP_FRAMES = 60  # Stepped but not timed: first draws fill font and surface caches
+SEED = 1234
+FIXED_DT = 1 / SIMULATION_HZ  # The step every game simulates at
+INPUT_INTERVAL = 6  # Frames between scripted key presses
+REGRESSION_THRESHOLD = 0.15  # Fractional slowdown that counts as a regression
+REGRESSION_METRIC = "p50"  # The median is stable run to run; p95/p99 swing with machine load
+NOISE_FLOOR_MS = 0.05  # Ignore changes smaller than this; tiny phases are mostly timer noise
+PHASES = ["events", "update", "draw", "frame"]
+
+@dataclass
+class GameSpec:
+    """How to build and step one game class"""
+    name: str
+    script: str
+    class_name: str
+    keys: List[str]
+    update_takes_dt: bool = False
+    needs_screen: Tuple[int, int] = None
+    clicks: List[Tuple[int, int]] = None
+
+GAME_SPECS = [
+    GameSpec("Dino Run", "dino_run/optimized_dino_run.py", "OptimizedDinoGame",
+             ["K_SPACE", "K_UP", "K_DOWN"], update_takes_dt=True),
+    GameSpec("Gravity Ninja", "gravity_flip_ninja/optimized_gravity_ninja.py", "OptimizedGravityNinja",
+             ["K_SPACE", "K_UP", "K_a", "K_d"], update_takes_dt=True),
+    GameSpec("Maze Explorer", "maze_game/game_logic.py", "MazeGame",
+             ["K_UP", "K_DOWN", "K_LEFT", "K_RIGHT", "K_SPACE"], needs_screen=(1000, 800)),
+    GameSpec("Snake Classic", "snake_game/snake_game.py", "SnakeGame",
+             ["K_UP", "K_LEFT", "K_DOWN", "K_RIGHT", "K_SPACE"]),
+    GameSpec("Fighter Shoot", "fighter_shoot/main.py", "FighterShootGame",
+             ["K_SPACE", "K_LEFT", "K_RIGHT"]),
+    GameSpec("Tic Tac Toe", "tic_tac_toe/main.py", "TicTacToeGame",
+             ["K_r"], clicks=[(75 + 150 * col + 75, 100 + 150 * row + 75) for row in range(3) for col in range(3)])
+]
+
+def load_game_class(spec: GameSpec):
+    """Import a game's module from its file, with its directory first on the path like a real launch"""
+    script_path = os.path.join(GAMES_DIR, spec.script)
+    game_dir = os.path.dirname(script_path)
+    sys.path.insert(0, game_dir)
+    os.chdir(game_dir)
+    
+    module_spec = importlib.util.spec_from_file_location("benchmarked_game", script_path)
+    module = importlib.util.module_from_spec(module_spec)
+    module_spec.loader.exec_module(module)
+    return getattr(module, spec.class_name)
+
+def scripted_events(spec: GameSpec, rng: random.Random, frame: int):
+    """Input for one frame: a key tap (or board click) every few frames, never ESC or QUIT"""
+    import pygame
+    if frame % INPUT_INTERVAL:
+        return []
+    
+    if spec.clicks and rng.random() < 0.8:
+        position = rng.choice(spec.clicks)
+        return [pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=1, pos=position)]
+    
+    key = getattr(pygame, rng.choice(spec.keys))
+    return [pygame.event.Event(event_type, key=key, mod=0, unicode="", scancode=0)
+            for event_type in (pygame.KEYDOWN, pygame.KEYUP)]
+
+def game_state(game) -> Dict[str, int]:
+    """End-of-run fingerprint: identical seeds and input must reproduce it"""
+    return {name: getattr(game, name) for name in ("score", "level", "player_score", "ai_score", "ties")
+            if isinstance(getattr(game, name, None), int)}
+
+def summarize(samples: List[float]) -> Dict[str, float]:
+    """Percentiles and mean of a phase, in ms"""
+    return {
+        "p50": percentile(samples, 50),
+        "p95": percentile(samples, 95),
+        "p99": percentile(samples, 99),
+        "mean": sum(samples) / len(samples) if samples else 0.0
+    }
+
+def benchmark_game(job: Tuple[GameSpec, int, int]) -> Dict:
+    """Pool task: run one game for a fixed number of frames in this fresh process"""
+    spec, frames, seed = job
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    os.environ["SDL_AUDIODRIVER"] = "dummy"
+    os.environ["PYGAME_HIDE_SUPPORT_PROMPT"] = "1"
+    sys.stdout = open(os.devnull, "w")  # Games print banners and tips
+    
+    random.seed(seed)
+    game_class = load_game_class(spec)
+    import pygame
+    pygame.init()
+    
+    if spec.needs_screen:
+        game = game_class(pygame.display.set_mode(spec.needs_screen))
+    else:
+        game = game_class()
+    
+    rng = random.Random(seed)
+    timings = {phase: [] for phase in PHASES}
+    clock = time.perf_counter
+    
+    for frame in range(WARMUP_FRAMES + frames):
+        for event in scripted_events(spec, rng, frame):
+            pygame.event.post(event)
+        
+        start = clock()
+        if hasattr(game, "handle_events"):
+            game.handle_events()
+        else:
+            for event in pygame.event.get():
+                game.handle_event(event)
+        events_done = clock()
+        
+        if spec.update_takes_dt:
+            game.update(FIXED_DT)
+        elif hasattr(game, "update"):
+            game.update()
+        elif game.current_player == 'O' and not game.game_over:
+            game.ai_move()
+        update_done = clock()
+        
+        game.draw()
+        draw_done = clock()
+        
+        if frame < WARMUP_FRAMES:
+            continue
+        timings["events"].append((events_done - start) * 1000)
+        timings["update"].append((update_done - events_done) * 1000)
+        timings["draw"].append((draw_done - update_done) * 1000)
+        timings["frame"].append((draw_done - start) * 1000)
+    
+    pygame.quit()
+    return {
+        "name": spec.name,
+        "frames": frames,
+        "state": game_state(game),
+        "phases": {phase: summarize(samples) for phase, samples in timings.items()}
+    }
+
+def run_benchmarks(specs: List[GameSpec], frames: int, seed: int, jobs: int) -> Dict:
+    """Benchmark games in parallel, one fresh process per game"""
+    # Fresh interpreters: module-level pygame.init() and same-named game modules never leak between games
+    context = multiprocessing.get_context("spawn")
+    with context.Pool(processes=jobs, maxtasksperchild=1) as pool:
+        results = pool.map(benchmark_game, [(spec, frames, seed) for spec in specs], chunksize=1)
+    
+    return {
+        "meta": {
+            "frames": frames,
+            "seed": seed,
+            "jobs": jobs,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": time.time()
+        },
+        "games": {result["name"]: result for result in results}
+    }
+
+def compare(results: Dict, baseline: Dict, threshold: float, metric: str = REGRESSION_METRIC) -> List[str]:
+    """Print per-phase changes of one percentile and return the regressions"""
+    regressions = []
+    print(f"\n📈 Compared with baseline ({metric}, regression above +{threshold:.0%})")
+    
+    for name, result in results["games"].items():
+        previous = baseline.get("games", {}).get(name)
+        if previous is None:
+            print(f"  {name:<16} (no baseline)")
+            continue
+        if previous.get("state") != result["state"] or previous.get("frames") != result["frames"]:
+            print(f"  ⚠️  {name}: game state differs from the baseline run, timings are not like-for-like")
+        
+        changes = []
+        for phase in PHASES:
+            before = previous["phases"][phase][metric]
+            after = result["phases"][phase][metric]
+            change = (after - before) / before if before > 0 else 0.0
+            marker = ""
+            if change > threshold and after - before > NOISE_FLOOR_MS:
+                marker = " ❌"
+                regressions.append(f"{name} {phase}: {before:.3f} → {after:.3f} ms ({change:+.0%})")
+            changes.append(f"{phase} {change:+5.0%}{marker}")
+        print(f"  {name:<16} " + "  ".join(changes))
+    
+    return regressions
+
+def print_results(results: Dict):
+    """Per-game phase table"""
+    print(f"{'Game':<16} {'Phase':<7} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}")
+    for name, result in results["games"].items():
+        for phase in PHASES:
+            stats = result["phases"][phase]
+            label = name if phase == PHASES[0] else ""
+            print(f"{label:<16} {phase:<7} {stats['p50']:>8.3f} {stats['p95']:>8.3f} {stats['p99']:>8.3f}")
+
+def main(argv: Optional[List[str]] = None):
+    """Run, save, and compare against the stored baseline"""
+    parser = argparse.ArgumentParser(description="Deterministic headless benchmark of the bundled games")
+    parser.add_argument("--frames", type=int, default=FRAMES, help="frames stepped per game")
+    parser.add_argument("--seed", type=int, default=SEED, help="seed for random and the input script")
+    parser.add_argument("--jobs", type=int, default=min(len(GAME_SPECS), os.cpu_count() or 1),
+                        help="games benchmarked in parallel (1 for the least noise)")
+    parser.add_argument("--games", nargs="*", help="subset of game names to run")
+    parser.add_argument("--output", default=RESULTS_FILE, help="where to write the JSON results")
+    parser.add_argument("--baseline", default=BASELINE_FILE, help="baseline JSON to compare against")
+    parser.add_argument("--save-baseline", action="store_true", help="store these results as the new baseline")
+    parser.add_argument("--threshold", type=float, default=REGRESSION_THRESHOLD, help="allowed slowdown")
+    parser.add_argument("--metric", choices=["p50", "p95", "p99"], default=REGRESSION_METRIC,
+                        help="percentile compared against the baseline")
+    args = parser.parse_args(argv)
+    
+    specs = [spec for spec in GAME_SPECS if not args.games or spec.name in args.games]
+    if not specs:
+        print(f"❌ No games match {args.games}")
+        return 2
+    
+    print(f"📊 Game benchmark ({len(specs)} games × {args.frames} frames, seed {args.seed}, {args.jobs} jobs)")
+    print("=" * 60)
+    results = run_benchmarks(specs, args.frames, args.seed, max(1, args.jobs))
+    print_results(results)
+    
+    with open(args.output, "w") as f:
+        json.dump(results, f, indent=2)
+    print(f"\n💾 Results written to {args.output}")
+    
+    if args.save_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"📌 Baseline saved to {args.baseline}")
+        return 0
+    
+    if not os.path.exists(args.baseline):
+        print(f"ℹ️  No baseline at {args.baseline}; run with --save-baseline to create one")
+        return 0
+    
+    with open(args.baseline, "r") as f:
+        baseline = json.load(f)
+    regressions = compare(results, baseline, args.threshold, args.metric)
+    if regressions:
+        print("\n❌ Regressions:")
+        for regression in regressions:
+            print(f"  {regression}")
+        return 1
+    
+    print("\n✅ No regressions")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Glow Benchmark - Maze Level Frame Cost With Every Collectible Present
+Compares building each glow surface every frame against blitting cached glow atlas textures
+"""
+
+import os
+import sys
+import math
+import time
+import random
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+from glow_atlas import glow_atlas
+from launch_latency import percentile
+
+MAZE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "games", "maze_game")
+sys.path.insert(0, MAZE_DIR)
+
+import game_logic
+import player
+from settings import (COLLECTIBLE_COLOR, COLLECTIBLE_SIZE, GOAL_COLOR, GOAL_SIZE, PLAYER_COLOR, SCREEN_HEIGHT,
+                      SCREEN_WIDTH, WHITE, YELLOW)
+
+FRAMES = 300
+
+def legacy_collectible_draw(self, screen):
+    """Collectible.draw as it was: a fresh SRCALPHA surface for the glow every frame"""
+    if self.collected:
+        return
+    y_pos = self.pixel_y + self.float_offset
+    glow_size = COLLECTIBLE_SIZE + 8 + math.sin(self.pulse) * 2
+    glow_surface = pygame.Surface((glow_size*2, glow_size*2), pygame.SRCALPHA)
+    pygame.draw.circle(glow_surface, (*COLLECTIBLE_COLOR, 50), (int(glow_size), int(glow_size)), int(glow_size))
+    screen.blit(glow_surface, (self.pixel_x - glow_size, y_pos - glow_size))
+    pygame.draw.circle(screen, WHITE, (int(self.pixel_x), int(y_pos)), COLLECTIBLE_SIZE + 1)
+    pygame.draw.circle(screen, COLLECTIBLE_COLOR, (int(self.pixel_x), int(y_pos)), COLLECTIBLE_SIZE)
+    self._draw_star(screen, self.pixel_x, y_pos, COLLECTIBLE_SIZE - 3, self.rotation)
+
+def legacy_player_glow(self, screen):
+    """Player._draw_glow as it was: stacked circles drawn onto a new surface"""
+    glow_size = self.glow_radius + math.sin(self.glow_pulse) * 3
+    glow_surface = pygame.Surface((glow_size*2, glow_size*2), pygame.SRCALPHA)
+    for i in range(int(glow_size), 0, -2):
+        pygame.draw.circle(glow_surface, (*PLAYER_COLOR, int(30 * (i / glow_size))),
+                           (int(glow_size), int(glow_size)), i)
+    screen.blit(glow_surface, (self.pixel_x - glow_size, self.pixel_y - glow_size + self.bounce_offset))
+
+def legacy_goal(self, offset_x, offset_y):
+    """MazeGame._draw_goal as it was: four new surfaces per frame"""
+    goal_x = self.goal_pos[0] * game_logic.CELL_SIZE + game_logic.CELL_SIZE // 2 + offset_x
+    goal_y = self.goal_pos[1] * game_logic.CELL_SIZE + game_logic.CELL_SIZE // 2 + offset_y
+    glow_size = GOAL_SIZE + 10 + math.sin(pygame.time.get_ticks() * 0.01) * 5
+    glow_surface = pygame.Surface((glow_size*2, glow_size*2), pygame.SRCALPHA)
+    pygame.draw.circle(glow_surface, (*GOAL_COLOR, 80), (int(glow_size), int(glow_size)), int(glow_size))
+    self.screen.blit(glow_surface, (goal_x - glow_size, goal_y - glow_size))
+    pygame.draw.circle(self.screen, WHITE, (int(goal_x), int(goal_y)), GOAL_SIZE + 2)
+    pygame.draw.circle(self.screen, GOAL_COLOR, (int(goal_x), int(goal_y)), GOAL_SIZE)
+    for i in range(3):
+        size = GOAL_SIZE - (i * 4)
+        color = (*YELLOW, 255 - i * 60) if i % 2 == 0 else (*WHITE, 255 - i * 60)
+        goal_surface = pygame.Surface((size*2, size*2), pygame.SRCALPHA)
+        pygame.draw.circle(goal_surface, color, (size, size), size)
+        self.screen.blit(goal_surface, (goal_x - size, goal_y - size))
+
+LEGACY = [(game_logic.Collectible, "draw", legacy_collectible_draw),
+          (player.Player, "_draw_glow", legacy_player_glow),
+          (game_logic.MazeGame, "_draw_goal", legacy_goal)]
+
+def timed(function, spent: list):
+    """Wrap a draw method so its time is added to spent[0]"""
+    def wrapper(*args):
+        start = time.perf_counter()
+        function(*args)
+        spent[0] += time.perf_counter() - start
+    return wrapper
+
+def run_level(screen: pygame.Surface, legacy: bool) -> tuple:
+    """Frame times, glow draw times and collectible count for one level where nothing gets collected"""
+    originals = [(owner, name, getattr(owner, name)) for owner, name, _ in LEGACY]
+    spent = [0.0]
+    for (owner, name, original), (_, _, function) in zip(originals, LEGACY):
+        setattr(owner, name, timed(function if legacy else original, spent))
+    try:
+        random.seed(1)
+        game = game_logic.MazeGame(screen)
+        assert all(not collectible.collected for collectible in game.collectibles)
+        frame_ms, glow_ms = [], []
+        for _ in range(FRAMES):
+            spent[0] = 0.0
+            start = time.perf_counter()
+            game.update()
+            game.draw()
+            frame_ms.append((time.perf_counter() - start) * 1000)
+            glow_ms.append(spent[0] * 1000)
+        return frame_ms, glow_ms, len(game.collectibles)
+    finally:
+        for owner, name, function in originals:
+            setattr(owner, name, function)
+
+def main():
+    """Run the level with the old glow code and with the atlas"""
+    pygame.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    
+    print("📊 Glow benchmark (maze level, update + draw per frame)")
+    print("=" * 70)
+    print(f"{'Version':>9} {'Glows':>6} {'Frame ms':>9} {'p95 ms':>8} {'Glow ms':>8} {'Glow speedup':>13}")
+    
+    baseline = None
+    for name, legacy in (("per-frame", True), ("atlas", False)):
+        frame_ms, glow_ms, collectibles = run_level(screen, legacy)
+        mean = sum(frame_ms) / len(frame_ms)
+        glow = sum(glow_ms) / len(glow_ms)
+        baseline = baseline or glow
+        glows = collectibles + 5  # Collectibles, player, goal glow and its three rings
+        print(f"{name:>9} {glows:>6} {mean:>9.2f} {percentile(frame_ms, 95):>8.2f} {glow:>8.2f} "
+              f"{baseline / glow:>12.1f}x")
+    
+    print(f"\n🖼️  Atlas textures: {len(glow_atlas.cache.entries)} "
+          f"({glow_atlas.cache.current_bytes // 1024} KB)")
+    pygame.quit()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
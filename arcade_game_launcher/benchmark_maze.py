@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Maze Benchmark - Frame Cost From Small to 500x500 Mazes
+Walks a player through mazes of growing size, drawing walls per cell every frame versus from the baked chunk layer
+"""
+
+import os
+import sys
+import time
+import random
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+from launch_latency import percentile
+
+MAZE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "games", "maze_game")
+sys.path.insert(0, MAZE_DIR)
+
+import game_logic
+from settings import CELL_SIZE, DARK_GREEN, GREEN, SCREEN_HEIGHT, SCREEN_WIDTH, WALL_THICKNESS
+
+MAZE_SIZES = [(25, 20), (101, 101), (501, 501)]
+FRAMES = 600
+MAX_SECONDS = 5.0  # Per-cell drawing of a 500x500 maze takes long enough that fewer frames suffice
+FRAME_BUDGET_MS = 1000 / 60
+MOVES = {(0, -1): pygame.K_UP, (0, 1): pygame.K_DOWN, (-1, 0): pygame.K_LEFT, (1, 0): pygame.K_RIGHT}
+
+def legacy_draw_maze(self, offset_x, offset_y):
+    """MazeGame._draw_maze as it was: three rects for every wall cell, every frame"""
+    for y in range(len(self.maze)):
+        for x in range(len(self.maze[0])):
+            pixel_x = x * CELL_SIZE + offset_x
+            pixel_y = y * CELL_SIZE + offset_y
+            if self.maze[y][x] == 1:
+                wall_rect = pygame.Rect(pixel_x, pixel_y, CELL_SIZE, CELL_SIZE)
+                pygame.draw.rect(self.screen, DARK_GREEN, wall_rect)
+                pygame.draw.rect(self.screen, GREEN, wall_rect, WALL_THICKNESS)
+                inner_rect = pygame.Rect(pixel_x + 3, pixel_y + 3, CELL_SIZE - 6, CELL_SIZE - 6)
+                pygame.draw.rect(self.screen, (0, 120, 0), inner_rect, 1)
+
+def next_move(game, heading, rng: random.Random):
+    """Follow corridors, turning at random where the current heading is blocked or at junctions"""
+    x, y = game.player.grid_x, game.player.grid_y
+    open_moves = [move for move in MOVES if game.maze[y + move[1]][x + move[0]] == 0]
+    forward = [move for move in open_moves if move != (-heading[0], -heading[1])]
+    if heading in forward and rng.random() < 0.7:
+        return heading
+    return rng.choice(forward or open_moves)
+
+def run_maze(screen: pygame.Surface, size, legacy: bool):
+    """Generation time and frame times while walking through one maze"""
+    original = game_logic.MazeGame._draw_maze
+    if legacy:
+        game_logic.MazeGame._draw_maze = legacy_draw_maze
+    try:
+        random.seed(1)
+        start = time.perf_counter()
+        game = game_logic.MazeGame(screen, *size)
+        generate_seconds = time.perf_counter() - start
+        
+        rng = random.Random(2)
+        heading = (1, 0)
+        frame_ms = []
+        deadline = time.perf_counter() + MAX_SECONDS
+        for _ in range(FRAMES):
+            start = time.perf_counter()
+            if not game.player.is_moving and game.state == game_logic.GameState.PLAYING:
+                heading = next_move(game, heading, rng)
+                game.handle_event(pygame.event.Event(pygame.KEYDOWN, key=MOVES[heading]))
+            game.update()
+            game.draw()
+            frame_ms.append((time.perf_counter() - start) * 1000)
+            if time.perf_counter() > deadline:
+                break
+        return generate_seconds, frame_ms, game.maze_layer.chunks_rendered
+    finally:
+        game_logic.MazeGame._draw_maze = original
+
+def main():
+    """Run every maze size with per-cell walls and with the baked layer"""
+    pygame.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    
+    print("📊 Maze benchmark (walking the player, update + draw per frame)")
+    print("=" * 78)
+    print(f"{'Maze':>9} {'Version':>9} {'Setup s':>8} {'Frames':>7} {'Mean ms':>9} {'p99 ms':>8} "
+          f"{'Max ms':>8} {'Chunks':>7} {'60 FPS':>7}")
+    
+    for size in MAZE_SIZES:
+        for name, legacy in (("per-cell", True), ("layer", False)):
+            generate_seconds, frame_ms, chunks = run_maze(screen, size, legacy)
+            mean = sum(frame_ms) / len(frame_ms)
+            fits = "✅" if percentile(frame_ms, 99) <= FRAME_BUDGET_MS else "❌"
+            print(f"{size[0]:>4}x{size[1]:<4} {name:>9} {generate_seconds:>8.2f} {len(frame_ms):>7} {mean:>9.2f} "
+                  f"{percentile(frame_ms, 99):>8.2f} {max(frame_ms):>8.2f} {'-' if legacy else chunks:>7} {fits:>6}")
+    
+    pygame.quit()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Maze Generation Benchmark - 100x100 to 4000x4000 Grids
+Times every generator algorithm on growing square mazes and reports throughput and grid memory
+"""
+
+import os
+import sys
+import time
+import argparse
+import tracemalloc
+from typing import List, Optional
+
+MAZE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "games", "maze_game")
+sys.path.insert(0, MAZE_DIR)
+
+from maze_generator import ALGORITHMS, MazeGenerator
+
+MAZE_SIZES = [100, 500, 1000, 2000, 4000]
+SEED = 1
+TIME_LIMIT = 60.0  # Once a run takes longer than this, larger sizes of that algorithm are skipped
+
+def list_grid_bytes(width: int, height: int) -> int:
+    """What the old list-of-lists grid of small ints costs: one 8-byte pointer per cell plus row lists"""
+    return height * (width * 8 + 56) + height * 8 + 56
+
+def run(algorithm: str, size: int, measure_memory: bool) -> tuple:
+    """Seconds to generate one maze, and peak traced allocation in bytes (or None)"""
+    generator = MazeGenerator(size, size, algorithm, seed=SEED)
+    if measure_memory:
+        tracemalloc.start()
+    start = time.perf_counter()
+    generator.generate_maze()
+    seconds = time.perf_counter() - start
+    peak = None
+    if measure_memory:
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    assert generator.as_array()[1, 1] == 0
+    return seconds, peak
+
+def main(argv: Optional[List[str]] = None):
+    """Run every algorithm on every size, skipping sizes past the time limit"""
+    parser = argparse.ArgumentParser(description="Maze generator throughput from 100x100 to 4000x4000")
+    parser.add_argument("--sizes", type=int, nargs="*", default=MAZE_SIZES, help="square maze sizes to run")
+    parser.add_argument("--algorithms", nargs="*", choices=ALGORITHMS, default=list(ALGORITHMS),
+                        help="subset of algorithms to run")
+    parser.add_argument("--time-limit", type=float, default=TIME_LIMIT,
+                        help="seconds after which larger sizes of an algorithm are skipped")
+    parser.add_argument("--memory", action="store_true",
+                        help="also trace peak allocations (slows generation down)")
+    args = parser.parse_args(argv)
+    
+    print("📊 Maze generation benchmark")
+    print("=" * 78)
+    print(f"{'Maze':>11} {'Algorithm':>12} {'Seconds':>9} {'Cells/s':>11} {'Grid MB':>8} {'Lists MB':>9} "
+          f"{'Peak MB':>8}")
+    
+    for algorithm in args.algorithms:
+        skipped_after = None
+        for size in sorted(args.sizes):
+            label = f"{size}x{size}"
+            if skipped_after is not None:
+                print(f"{label:>11} {algorithm:>12} {'skipped':>9}   (over {args.time_limit:.0f}s at {skipped_after})")
+                continue
+            seconds, peak = run(algorithm, size, args.memory)
+            peak_text = f"{peak / 2**20:>8.1f}" if peak is not None else f"{'-':>8}"
+            print(f"{label:>11} {algorithm:>12} {seconds:>9.2f} {size * size / seconds:>11,.0f} "
+                  f"{size * size / 2**20:>8.1f} {list_grid_bytes(size, size) / 2**20:>9.1f} {peak_text}")
+            if seconds > args.time_limit:
+                skipped_after = label
+    
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
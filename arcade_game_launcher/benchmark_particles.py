@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Particle Benchmark - Per-Frame Cost at 1k to 10k Live Particles
+Compares per-object particles that allocate a surface each draw against the pooled structure-of-arrays engine
+"""
+
+import os
+import sys
+import time
+import random
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+from launch_latency import percentile
+from particle_engine import ParticleEngine
+
+PARTICLE_COUNTS = [1000, 10000]
+FRAMES = 120
+SCREEN_SIZE = (1200, 800)
+COLORS = [(255, 165, 0), (255, 0, 0), (0, 100, 255), (128, 0, 128)]
+LIFE = 60  # Ticks; about 1/60 of the particles die and respawn every frame
+
+class ObjectParticle:
+    """The per-instance particle the games used before the engine"""
+    
+    def __init__(self, x, y, color, life):
+        self.x = x
+        self.y = y
+        self.vel_x = random.uniform(-3, 3)
+        self.vel_y = random.uniform(-3, 3)
+        self.color = color
+        self.life = life
+        self.max_life = life
+    
+    def update(self):
+        self.x += self.vel_x
+        self.y += self.vel_y
+        self.life -= 1
+        self.vel_x *= 0.98
+        self.vel_y *= 0.98
+    
+    def draw(self, screen):
+        alpha = int(255 * (self.life / self.max_life))
+        particle_surface = pygame.Surface((4, 4), pygame.SRCALPHA)
+        particle_surface.fill((*self.color, alpha))
+        screen.blit(particle_surface, (self.x, self.y))
+
+def spawn_point(rng: random.Random):
+    """Somewhere on screen"""
+    return rng.uniform(0, SCREEN_SIZE[0]), rng.uniform(0, SCREEN_SIZE[1])
+
+def run_objects(screen: pygame.Surface, count: int) -> list:
+    """Frame times for the list-of-objects version, respawning what dies"""
+    rng = random.Random(1)
+    particles = [ObjectParticle(*spawn_point(rng), rng.choice(COLORS), rng.randint(1, LIFE)) for _ in range(count)]
+    frame_ms = []
+    for _ in range(FRAMES):
+        start = time.perf_counter()
+        for particle in particles[:]:
+            particle.update()
+            if particle.life <= 0:
+                particles.remove(particle)
+        while len(particles) < count:
+            particles.append(ObjectParticle(*spawn_point(rng), rng.choice(COLORS), LIFE))
+        screen.fill((0, 0, 0))
+        for particle in particles:
+            particle.draw(screen)
+        frame_ms.append((time.perf_counter() - start) * 1000)
+    return frame_ms
+
+def run_engine(screen: pygame.Surface, count: int) -> list:
+    """Frame times for the pooled engine, respawning into freed slots"""
+    rng = random.Random(1)
+    engine = ParticleEngine(capacity=count, shape="square", drag=0.98)
+    for _ in range(count):
+        engine.emit(*spawn_point(rng), rng.uniform(-3, 3), rng.uniform(-3, 3), rng.choice(COLORS),
+                    life=rng.randint(1, LIFE))
+    frame_ms = []
+    for _ in range(FRAMES):
+        start = time.perf_counter()
+        engine.update()
+        respawn = count - len(engine)
+        for color in COLORS:
+            engine.burst(respawn // len(COLORS), *spawn_point(rng), 3, color, life=LIFE, spread=200)
+        for _ in range(count - len(engine)):
+            engine.emit(*spawn_point(rng), rng.uniform(-3, 3), rng.uniform(-3, 3), COLORS[0], life=LIFE)
+        screen.fill((0, 0, 0))
+        engine.draw(screen)
+        frame_ms.append((time.perf_counter() - start) * 1000)
+    assert len(engine) == count and engine.capacity == count
+    return frame_ms
+
+def main():
+    """Run both versions at every particle count"""
+    pygame.init()
+    screen = pygame.display.set_mode(SCREEN_SIZE)
+    
+    print("📊 Particle benchmark (update + draw per frame)")
+    print("=" * 58)
+    print(f"{'Particles':>10} {'Version':>9} {'Mean ms':>9} {'p95 ms':>8} {'Speedup':>9}")
+    
+    for count in PARTICLE_COUNTS:
+        baseline = None
+        for name, run in (("objects", run_objects), ("engine", run_engine)):
+            frame_ms = run(screen, count)
+            mean = sum(frame_ms) / len(frame_ms)
+            baseline = baseline or mean
+            print(f"{count:>10} {name:>9} {mean:>9.2f} {percentile(frame_ms, 95):>8.2f} {baseline / mean:>8.1f}x")
+    
+    pygame.quit()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
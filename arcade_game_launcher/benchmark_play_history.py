@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Play History Benchmark - Queries at One Million Sessions
+Fills a temporary SQLite store with synthetic sessions and times the launcher's queries
+"""
+
+import os
+import sys
+import time
+import random
+import tempfile
+
+from launch_latency import percentile
+from play_history import PlayHistory
+
+SESSION_COUNT = 1_000_000
+GAME_COUNT = 500
+BATCH_SIZE = 100_000
+HISTORY_DAYS = 365
+QUERY_RUNS = 50
+
+def generate_sessions(rng: random.Random, count: int, now: float):
+    """Yield synthetic finished sessions spread over the last year"""
+    for _ in range(count):
+        started = now - rng.random() * HISTORY_DAYS * 86400
+        yield (f"Game {int(rng.paretovariate(1.2)) % GAME_COUNT}", started,
+               started + rng.uniform(30, 1800), 0, rng.randint(0, 10000))
+
+def time_query(name: str, query):
+    """Run a query repeatedly and print its latency percentiles"""
+    samples = []
+    for _ in range(QUERY_RUNS):
+        start = time.perf_counter()
+        query()
+        samples.append((time.perf_counter() - start) * 1000)
+    print(f"  {name:<28} p50 {percentile(samples, 50):7.2f} ms   p95 {percentile(samples, 95):7.2f} ms")
+
+def main():
+    """Build the store and time each query"""
+    print(f"📊 Play history benchmark ({SESSION_COUNT:,} sessions, {GAME_COUNT} games)")
+    print("=" * 60)
+    
+    rng = random.Random(42)
+    now = time.time()
+    
+    with tempfile.TemporaryDirectory() as directory:
+        history = PlayHistory(os.path.join(directory, "play_history.db"))
+        
+        start = time.perf_counter()
+        for offset in range(0, SESSION_COUNT, BATCH_SIZE):
+            history.add_sessions(generate_sessions(rng, min(BATCH_SIZE, SESSION_COUNT - offset), now))
+        insert_seconds = time.perf_counter() - start
+        print(f"  Inserted in {insert_seconds:.1f}s ({SESSION_COUNT / insert_seconds:,.0f} rows/s)")
+        
+        session_id = history.start_session("Game 1")
+        time_query("start_session + end_session",
+                   lambda: history.end_session(history.start_session("Game 1"), exit_code=0))
+        history.end_session(session_id, exit_code=0)
+        
+        time_query("most played (all time)", lambda: history.most_played(limit=10))
+        time_query("most played this week", lambda: history.most_played_this_week(limit=10))
+        time_query("recently played", lambda: history.recently_played(limit=10))
+        time_query("recent sessions of one game", lambda: history.recent_sessions("Game 3", limit=20))
+        time_query("full sort ranking", lambda: history.most_played())
+        
+        history.close()
+    
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Card Grid - Virtualized Game Card Layout
+Keeps card objects only for the rows inside the scroll window and hit-tests the grid arithmetically
+"""
+
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import pygame
+
+class GridLayout:
+    """Regular grid of equally sized cells; every lookup is O(1)"""
+    
+    def __init__(self, cards_per_row: int, card_width: int, card_height: int,
+                 margin: int, start_x: int, start_y: int):
+        self.cards_per_row = cards_per_row
+        self.card_width = card_width
+        self.card_height = card_height
+        self.margin = margin
+        self.start_x = start_x
+        self.start_y = start_y
+        self.column_pitch = card_width + margin
+        self.row_pitch = card_height + margin
+    
+    def cell_rect(self, index: int) -> pygame.Rect:
+        """Content-space rect of the cell at index"""
+        row, col = divmod(index, self.cards_per_row)
+        return pygame.Rect(self.start_x + col * self.column_pitch, self.start_y + row * self.row_pitch,
+                           self.card_width, self.card_height)
+    
+    def index_at(self, pos: Tuple[float, float], count: int) -> Optional[int]:
+        """Index of the cell under a content-space point, or None for gaps and empty cells"""
+        x = int(pos[0]) - self.start_x
+        y = int(pos[1]) - self.start_y
+        if x < 0 or y < 0:
+            return None
+        
+        col, col_offset = divmod(x, self.column_pitch)
+        row, row_offset = divmod(y, self.row_pitch)
+        if col >= self.cards_per_row or col_offset >= self.card_width or row_offset >= self.card_height:
+            return None
+        
+        index = row * self.cards_per_row + col
+        return index if index < count else None
+    
+    def visible_range(self, scroll_offset: int, view_height: int, count: int) -> range:
+        """Indices of cells overlapping the scroll window"""
+        first_row = max(0, (scroll_offset - self.start_y) // self.row_pitch)
+        last_row = max(0, (scroll_offset + view_height - self.start_y) // self.row_pitch)
+        first = first_row * self.cards_per_row
+        last = min(count, (last_row + 1) * self.cards_per_row)
+        return range(first, max(first, last))
+    
+    def content_bottom(self, count: int) -> int:
+        """Content-space y of the bottom edge of the last row"""
+        if count <= 0:
+            return 0
+        rows = (count - 1) // self.cards_per_row + 1
+        return self.start_y + (rows - 1) * self.row_pitch + self.card_height
+    
+    def max_visible(self, view_height: int) -> int:
+        """Upper bound on how many cells can overlap the scroll window at once"""
+        return (view_height // self.row_pitch + 2) * self.cards_per_row
+
+class VirtualCardGrid:
+    """Binds a fixed pool of recycled card objects to whichever items are on screen"""
+    
+    def __init__(self, layout: GridLayout, items: Sequence, view_height: int,
+                 card_factory: Callable[[], object]):
+        self.layout = layout
+        self.items = items
+        self.view_height = view_height
+        
+        # Every slot is created up front so the pool never grows while scrolling
+        self.slots = [card_factory() for _ in range(min(len(items), layout.max_visible(view_height)))]
+        self.free: List = list(reversed(self.slots))
+        self.active: Dict[int, object] = {}
+        self.visible = range(0)
+    
+    def sync(self, scroll_offset: int):
+        """Recycle cards that left the window and bind free ones to newly visible items"""
+        visible = self.layout.visible_range(scroll_offset, self.view_height, len(self.items))
+        if visible == self.visible:
+            return
+        self.visible = visible
+        
+        for index in [index for index in self.active if index not in visible]:
+            card = self.active.pop(index)
+            card.release()
+            self.free.append(card)
+        
+        for index in visible:
+            if index not in self.active and self.free:
+                card = self.free.pop()
+                card.bind(self.items[index], self.layout.cell_rect(index))
+                self.active[index] = card
+    
+    def refresh(self, scroll_offset: int):
+        """Rebind every visible card after the items were reordered"""
+        for card in self.active.values():
+            card.release()
+            self.free.append(card)
+        self.active = {}
+        self.visible = range(0)
+        self.sync(scroll_offset)
+    
+    def visible_cards(self) -> List:
+        """Bound cards in grid order"""
+        return [self.active[index] for index in sorted(self.active)]
+    
+    def card_at(self, pos: Tuple[float, float]):
+        """Card under a content-space point, without scanning the grid"""
+        index = self.layout.index_at(pos, len(self.items))
+        return self.active.get(index) if index is not None else None
+    
+    def content_bottom(self) -> int:
+        """Content-space bottom edge of the whole grid"""
+        return self.layout.content_bottom(len(self.items))
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+Config Service - Live performance_config.json
+Loads the shared performance config once and re-applies it to subscribers whenever the file changes on disk
+"""
+
+import os
+import copy
+import json
+import math
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+CONFIG_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "performance_config.json")
+POLL_INTERVAL = 1.0  # Seconds between stat() calls; edits apply within this delay
+
+# Typed settings read by the launchers and games: (type, minimum). A value failing its check
+# keeps the previous good one, or the reader's default if there is none
+SETTING_TYPES = {
+    "display.width": (int, 1),
+    "display.height": (int, 1),
+    "display.target_fps": (int, 1),
+    "display.vsync": (bool, None),
+    "audio.enabled": (bool, None),
+    "audio.frequency": (int, 1),
+    "audio.buffer_size": (int, 1),
+    "audio.sound_effects": (bool, None),
+    "performance.cache_text_surfaces": (bool, None),
+    "performance.cache_size_limit": (int, 0),
+    "performance.animation_quality": (str, None),
+    "graphics.glow_effects": (bool, None),
+    "graphics.particle_effects": (bool, None),
+    "optimization.dirty_rect_updates": (bool, None),
+}
+
+ConfigListener = Callable[["ConfigService"], None]
+
+def read_config(config_path: str = CONFIG_PATH) -> Dict:
+    """Parse the config file; raises OSError or ValueError"""
+    with open(config_path, "r") as f:
+        config = json.load(f)
+    if not isinstance(config, dict):
+        raise ValueError("top level must be an object")
+    return config
+
+def load_config(config_path: str = CONFIG_PATH) -> Dict:
+    """Parse and validate the config file, or return an empty config if it is missing or invalid"""
+    try:
+        config = read_config(config_path)
+    except (OSError, ValueError):
+        return {}
+    return validate_config(config)
+
+def get_setting(config: Dict, key: str, default: Any = None) -> Any:
+    """Look up a dotted key such as "display.target_fps" """
+    value: Any = config
+    for part in key.split("."):
+        if not isinstance(value, dict) or part not in value:
+            return default
+        value = value[part]
+    return value
+
+def check_setting(value: Any, expected_type: type, minimum: Optional[int] = None) -> Any:
+    """Return value as expected_type; raises ValueError if it has the wrong type or is below minimum"""
+    if expected_type is int:
+        # JSON has one number type, so 60.0 is accepted; true/false are not numbers here
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            raise ValueError(f"expected a whole number, got {value!r}")
+        if isinstance(value, float) and not (math.isfinite(value) and value.is_integer()):
+            raise ValueError(f"expected a whole number, got {value!r}")
+        value = int(value)
+        if minimum is not None and value < minimum:
+            raise ValueError(f"must be at least {minimum}, got {value}")
+        return value
+    if not isinstance(value, expected_type):
+        raise ValueError(f"expected {expected_type.__name__}, got {value!r}")
+    return value
+
+def _set_setting(config: Dict, key: str, value: Any):
+    """Store a dotted key, replacing any non-object section on the way"""
+    *sections, name = key.split(".")
+    for section in sections:
+        if not isinstance(config.get(section), dict):
+            config[section] = {}
+        config = config[section]
+    config[name] = value
+
+def _drop_setting(config: Dict, key: str):
+    """Remove a dotted key if it is present"""
+    *sections, name = key.split(".")
+    for section in sections:
+        config = config.get(section)
+        if not isinstance(config, dict):
+            return
+    config.pop(name, None)
+
+def validate_config(config: Dict, previous: Optional[Dict] = None) -> Dict:
+    """Copy of config with every typed setting checked; bad values fall back to previous or are dropped"""
+    config = copy.deepcopy(config)
+    missing = object()
+    for key, (expected_type, minimum) in SETTING_TYPES.items():
+        section = key.rsplit(".", 1)[0]
+        value = get_setting(config, key, missing)
+        if value is missing and isinstance(get_setting(config, section, {}), dict):
+            continue  # An absent key means the reader's default
+        
+        try:
+            if value is missing:
+                raise ValueError(f"{section} is not an object")
+            _set_setting(config, key, check_setting(value, expected_type, minimum))
+        except ValueError as e:
+            fallback = get_setting(previous or {}, key, missing)
+            if fallback is missing:
+                _drop_setting(config, key)
+                print(f"⚠️  Ignoring {key}: {e}; using the default")
+            else:
+                _set_setting(config, key, fallback)
+                print(f"⚠️  Ignoring {key}: {e}; keeping {fallback!r}")
+    return config
+
+def mixer_settings(config: Dict) -> Dict[str, int]:
+    """Keyword arguments for pygame.mixer.pre_init from the audio section"""
+    return {"frequency": int(get_setting(config, "audio.frequency", 22050)), "size": -16, "channels": 2,
+            "buffer": int(get_setting(config, "audio.buffer_size", 512))}
+
+class ConfigService:
+    """Shared view of performance_config.json that notices edits while the session runs"""
+    
+    def __init__(self, config_path: str = CONFIG_PATH, poll_interval: float = POLL_INTERVAL,
+                 clock: Callable[[], float] = time.monotonic):
+        self.config_path = config_path
+        self.poll_interval = poll_interval
+        self.clock = clock
+        self.config = load_config(config_path)
+        self.signature = self.file_signature()
+        self.last_poll = clock()
+        self.listeners: List[ConfigListener] = []
+        self.reloads = 0
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        """Current value of a dotted key"""
+        return get_setting(self.config, key, default)
+    
+    def subscribe(self, listener: ConfigListener):
+        """Call listener with the service now and after every reload"""
+        self.listeners.append(listener)
+        listener(self)
+    
+    def file_signature(self) -> Optional[Tuple[int, int]]:
+        """Modification time and size, cheap enough to check every second"""
+        try:
+            stat = os.stat(self.config_path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+    
+    def poll(self) -> bool:
+        """Reload if the file changed since the last poll; True if subscribers were notified"""
+        now = self.clock()
+        if now - self.last_poll < self.poll_interval:
+            return False
+        self.last_poll = now
+        
+        signature = self.file_signature()
+        if signature == self.signature:
+            return False
+        self.signature = signature
+        
+        try:
+            config = read_config(self.config_path)
+        except (OSError, ValueError) as e:
+            # Half-saved or deleted file: keep running on the last good settings
+            print(f"⚠️  Keeping previous performance config: {e}")
+            return False
+        
+        # A well-formed file can still hold a bad value (null, "abc", 0 FPS); that key keeps its last good value
+        config = validate_config(config, self.config)
+        
+        if config == self.config:
+            return False
+        self.config = config
+        self.reloads += 1
+        print(f"♻️  Reloaded {os.path.basename(self.config_path)}")
+        for listener in self.listeners:
+            listener(self)
+        return True
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Dirty Rectangle Compositor - Retained-Mode Launcher Rendering
+Redraws only the screen regions whose elements changed and presents them with display.update(rects)
+"""
+
+from typing import Callable, Dict, Hashable, List, Optional, Tuple
+
+import pygame
+
+from config_service import CONFIG_PATH, get_setting, load_config
+
+DEBUG_COLOR = (255, 0, 255)
+EMPTY_RECT = pygame.Rect(0, 0, 0, 0)
+
+def load_dirty_rect_setting(config_path: str = CONFIG_PATH) -> bool:
+    """Read optimization.dirty_rect_updates from performance_config.json"""
+    return bool(get_setting(load_config(config_path), "optimization.dirty_rect_updates", True))
+
+def merge_rects(rects: List[pygame.Rect]) -> List[pygame.Rect]:
+    """Merge overlapping rectangles so no pixel is redrawn twice"""
+    merged: List[pygame.Rect] = []
+    for rect in rects:
+        if rect.width <= 0 or rect.height <= 0:
+            continue
+        rect = rect.copy()
+        index = rect.collidelist(merged)
+        while index != -1:
+            rect.union_ip(merged.pop(index))
+            index = rect.collidelist(merged)
+        merged.append(rect)
+    return merged
+
+class RetainedRegion:
+    """A screen element that reports its bounds and a state signature"""
+    
+    def __init__(self, bounds_fn: Callable[[], pygame.Rect], draw_fn: Callable[[], None],
+                 state_fn: Callable[[], Hashable] = lambda: None):
+        self.bounds_fn = bounds_fn
+        self.draw_fn = draw_fn
+        self.state_fn = state_fn
+
+class DirtyRectCompositor:
+    """Tracks element state between frames and recomposes only what changed"""
+    
+    def __init__(self, screen: pygame.Surface, background: Tuple[int, int, int], enabled: bool = True):
+        self.screen = screen
+        self.background = background
+        self.enabled = enabled
+        self.elements: List[RetainedRegion] = []
+        self.last_frame: Dict[RetainedRegion, Tuple[Hashable, pygame.Rect]] = {}
+        self.needs_full_redraw = True
+        
+        # Debug overlay
+        self.debug = False
+        self.debug_rects: List[pygame.Rect] = []
+        
+        # Stats for the overlay
+        self.last_rect_count = 0
+        self.last_coverage = 0.0
+    
+    def set_elements(self, elements: List[RetainedRegion]):
+        """Replace the element list (in draw order) and force a full redraw"""
+        self.elements = elements
+        self.invalidate()
+    
+    def invalidate(self):
+        """Redraw everything on the next frame (resize, expose, fullscreen)"""
+        self.needs_full_redraw = True
+    
+    def toggle_debug(self):
+        """Show or hide outlines of the regions redrawn each frame"""
+        self.debug = not self.debug
+        self.invalidate()
+    
+    def _clip_to_screen(self, rect: pygame.Rect) -> pygame.Rect:
+        """Clip bounds to the screen, returning an empty rect when off-screen"""
+        clipped = rect.clip(self.screen.get_rect())
+        return clipped if clipped.width > 0 and clipped.height > 0 else EMPTY_RECT
+    
+    def _collect_dirty(self) -> List[pygame.Rect]:
+        """Compare each element with its last drawn state"""
+        dirty = []
+        current = {}
+        for element in self.elements:
+            state = element.state_fn()
+            bounds = self._clip_to_screen(element.bounds_fn())
+            current[element] = (state, bounds)
+            
+            previous = self.last_frame.get(element)
+            if previous is None:
+                dirty.append(bounds)
+            elif previous[0] != state or previous[1] != bounds:
+                dirty.append(previous[1])
+                dirty.append(bounds)
+        
+        # Elements that disappeared leave a hole to repaint
+        for element, (_, bounds) in self.last_frame.items():
+            if element not in current:
+                dirty.append(bounds)
+        
+        self.last_frame = current
+        return dirty
+    
+    def render(self) -> List[pygame.Rect]:
+        """Recompose changed regions and present them; returns the updated rects"""
+        screen_rect = self.screen.get_rect()
+        
+        if self.needs_full_redraw or not self.enabled:
+            self.screen.fill(self.background)
+            self.last_frame = {}
+            for element in self.elements:
+                bounds = self._clip_to_screen(element.bounds_fn())
+                self.last_frame[element] = (element.state_fn(), bounds)
+                if bounds.width > 0:
+                    element.draw_fn()
+            self.needs_full_redraw = False
+            self.debug_rects = []
+            self.last_rect_count = 1
+            self.last_coverage = 1.0
+            pygame.display.flip()
+            return [screen_rect]
+        
+        # Previous debug outlines must be painted over as well, but are not outlined again
+        changed = merge_rects([rect.clip(screen_rect) for rect in self._collect_dirty()])
+        regions = merge_rects(changed + self.debug_rects)
+        
+        for region in regions:
+            self.screen.set_clip(region)
+            self.screen.fill(self.background, region)
+            for element, (_, bounds) in self.last_frame.items():
+                if bounds.colliderect(region):
+                    element.draw_fn()
+        self.screen.set_clip(None)
+        
+        self.debug_rects = []
+        if self.debug:
+            for region in changed:
+                pygame.draw.rect(self.screen, DEBUG_COLOR, region, 1)
+            self.debug_rects = [region.copy() for region in changed]
+        
+        self.last_rect_count = len(changed)
+        screen_area = screen_rect.width * screen_rect.height
+        self.last_coverage = sum(r.width * r.height for r in changed) / screen_area if screen_area else 0.0
+        
+        if regions:
+            pygame.display.update(regions)
+        return regions
+    
+    def get_stats_text(self) -> str:
+        """Short summary for the debug overlay"""
+        return f"Dirty: {self.last_rect_count} rects • {self.last_coverage * 100:.1f}% of screen"
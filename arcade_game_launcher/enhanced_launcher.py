@@ -13,14 +13,19 @@ import time
 from typing import List, Dict, Tuple, Optional
 from dataclasses import dataclass
 
+from config_service import get_setting, load_config, mixer_settings
+from surface_cache import create_text_cache
+
+CONFIG = load_config()
+
 # Initialize Pygame
+pygame.mixer.pre_init(**mixer_settings(CONFIG))  # Must come before init to take effect
 pygame.init()
-pygame.mixer.pre_init(frequency=22050, size=-16, channels=2, buffer=512)
 
 # Constants
-WINDOW_WIDTH = 1200
-WINDOW_HEIGHT = 800
-TARGET_FPS = 120
+WINDOW_WIDTH = get_setting(CONFIG, "display.width", 1200)
+WINDOW_HEIGHT = get_setting(CONFIG, "display.height", 800)
+TARGET_FPS = get_setting(CONFIG, "display.target_fps", 120)
 
 class Theme:
     """Enhanced color theme"""
@@ -79,7 +84,7 @@ class OptimizedRenderer:
     """High-performance rendering system"""
     def __init__(self, screen):
         self.screen = screen
-        self.surface_cache = {}
+        self.text_cache = create_text_cache()
         
         # Pre-load fonts
         self.fonts = {
@@ -93,11 +98,8 @@ class OptimizedRenderer:
     def get_text_surface(self, text: str, font_key: str, color: Tuple[int, int, int]) -> pygame.Surface:
         """Cached text rendering"""
         cache_key = (text, font_key, color)
-        if cache_key not in self.surface_cache:
-            font = self.fonts.get(font_key, self.fonts['body'])
-            surface = font.render(text, True, color)
-            self.surface_cache[cache_key] = surface
-        return self.surface_cache[cache_key]
+        return self.text_cache.get_or_create(
+            cache_key, lambda: self.fonts.get(font_key, self.fonts['body']).render(text, True, color))
     
     def draw_rounded_rect(self, surface: pygame.Surface, color: Tuple[int, int, int], 
                          rect: pygame.Rect, radius: int = 8):
@@ -5,6 +5,7 @@ Complete launcher with keyboard controls, last game memory, and single-click lau
 """
 
 from enhanced_launcher import *
+from game_discovery import GameDiscovery
 
 class EnhancedGameLauncher:
     """Main launcher class with enhanced controls"""
@@ -20,6 +21,9 @@ class EnhancedGameLauncher:
         self.performance_monitor = PerformanceMonitor()
         self.renderer = OptimizedRenderer(self.screen)
         
+        # Cached game discovery
+        self.discovery = GameDiscovery()
+        
         # Game data
         self.games = self.load_games()
         self.game_cards = []
@@ -44,37 +48,6 @@ class EnhancedGameLauncher:
         self.setup_game_cards()
         self.load_last_game()
     
-    def find_game_executable(self, game_dir: str) -> Optional[str]:
-        """Find the main executable file for a game"""
-        if not os.path.exists(game_dir):
-            return None
-        
-        possible_mains = [
-            "main.py",
-            f"{os.path.basename(game_dir)}.py",
-            f"run_{os.path.basename(game_dir)}.py",
-            "game.py",
-            "run.py"
-        ]
-        
-        for main_file in possible_mains:
-            full_path = os.path.join(game_dir, main_file)
-            if os.path.exists(full_path):
-                return full_path
-        
-        # Look for any .py file
-        try:
-            py_files = [f for f in os.listdir(game_dir) if f.endswith('.py') and not f.startswith('__')]
-            if py_files:
-                for py_file in py_files:
-                    if any(keyword in py_file.lower() for keyword in ['main', 'game', 'run']):
-                        return os.path.join(game_dir, py_file)
-                return os.path.join(game_dir, py_files[0])
-        except OSError:
-            pass
-        
-        return None
-    
     def load_games(self) -> List[GameData]:
         """Load game data with proper file detection"""
         games = []
@@ -123,31 +96,31 @@ class EnhancedGameLauncher:
         }
         
         try:
-            for game_dir in os.listdir(games_dir):
-                game_path = os.path.join(games_dir, game_dir)
-                if os.path.isdir(game_path):
-                    executable_path = self.find_game_executable(game_path)
-                    if executable_path:
-                        config = game_configs.get(game_dir, {
-                            "name": game_dir.replace('_', ' ').title(),
-                            "description": f"Play {game_dir.replace('_', ' ')}!",
-                            "category": "Game",
-                            "color": (128, 128, 255)
-                        })
-                        
-                        game_data = GameData(
-                            name=config["name"],
-                            path=executable_path,
-                            description=config["description"],
-                            category=config["category"],
-                            color=config["color"],
-                            executable=os.path.basename(executable_path)
-                        )
-                        games.append(game_data)
-                        print(f"✅ Found game: {config['name']} -> {executable_path}")
+            executables = self.discovery.scan(games_dir)
+            for game_dir, executable_path in executables.items():
+                if executable_path:
+                    config = game_configs.get(game_dir, {
+                        "name": game_dir.replace('_', ' ').title(),
+                        "description": f"Play {game_dir.replace('_', ' ')}!",
+                        "category": "Game",
+                        "color": (128, 128, 255)
+                    })
+                    
+                    game_data = GameData(
+                        name=config["name"],
+                        path=executable_path,
+                        description=config["description"],
+                        category=config["category"],
+                        color=config["color"],
+                        executable=os.path.basename(executable_path)
+                    )
+                    games.append(game_data)
+                    print(f"✅ Found game: {config['name']} -> {executable_path}")
         except Exception as e:
             print(f"Error loading games: {e}")
         
+        self.discovery.print_scan_report()
+        
         return games if games else self.get_default_games()
     
     def get_default_games(self) -> List[GameData]:
@@ -485,6 +458,10 @@ class EnhancedGameLauncher:
         status_text = f"Game {self.selected_index + 1}/{len(self.games)}"
         status_surface = self.renderer.get_text_surface(status_text, 'small', Theme.TEXT_GRAY)
         self.screen.blit(status_surface, (WINDOW_WIDTH - 100, 30))
+        
+        # Text cache counters
+        cache_surface = self.renderer.get_text_surface(self.renderer.text_cache.get_stats_text(), 'small', Theme.TEXT_DARK)
+        self.screen.blit(cache_surface, cache_surface.get_rect(topright=(WINDOW_WIDTH - 10, 50)))
     
     def launch_game(self, game_data: GameData):
         """Launch game with enhanced feedback"""
@@ -10,20 +10,50 @@ import os
 import subprocess
 import json
 import threading
-from typing import List, Dict, Tuple, Optional
+from typing import Any, List, Dict, Tuple, Optional
 from dataclasses import dataclass
 from enum import Enum
 import time
 
-# Performance optimizations
-pygame.init()
-pygame.mixer.pre_init(frequency=22050, size=-16, channels=2, buffer=512)
+from card_grid import GridLayout, VirtualCardGrid
+from config_service import ConfigService, get_setting, load_config, mixer_settings
+from dirty_rects import EMPTY_RECT, DirtyRectCompositor, RetainedRegion, load_dirty_rect_setting
+from frame_scheduler import FrameScheduler
+from game_discovery import GameDiscovery
+from game_telemetry import TelemetryMonitor
+from launch_latency import LaunchLatencyTracker
+from play_history import PlayHistoryWriter
+from performance_optimizer import calibrated_level
+from process_supervisor import ProcessSupervisor, SessionRecord
+from quality_governor import QualityGovernor, QualityLevel
+from startup_profiler import startup_profiler
+from stats_journal import StatsJournal
+from surface_cache import SurfaceCache, create_text_cache, text_cache_settings
+from thumbnails import ThumbnailPipeline
+from zygote_pool import ZygotePool
+
+# Startup settings; frame cap, caches and effects are re-applied live when the file changes
+CONFIG = load_config()
+
+# Audio settings only apply if set before the mixer starts; it is started after the first frame
+pygame.mixer.pre_init(**mixer_settings(CONFIG))
+startup_profiler.mark("imports")
 
 # Optimized constants
-WINDOW_WIDTH = 1200
-WINDOW_HEIGHT = 800
-TARGET_FPS = 120
-VSYNC = True
+WINDOW_WIDTH = get_setting(CONFIG, "display.width", 1200)
+WINDOW_HEIGHT = get_setting(CONFIG, "display.height", 800)
+TARGET_FPS = get_setting(CONFIG, "display.target_fps", 120)
+VSYNC = get_setting(CONFIG, "display.vsync", True)
+AUDIO_ENABLED = get_setting(CONFIG, "audio.enabled", True)
+MEASURE_LAUNCH_LATENCY = False  # Opt in to have games report their first frame back to the launcher
+COLLECT_TELEMETRY = True  # Games publish per-frame stats through shared memory
+GENERATE_THUMBNAILS = True  # Headless screenshots replace the card icons once captured
+ADAPTIVE_QUALITY = True  # Lower the frame cap and card animation when frames miss their budget
+CARD_ANIMATION_SPEEDS = {"high": 0.15, "medium": 0.3, "low": 1.0}  # 1.0 snaps straight to the target
+SORT_MODES = ["default", "most played", "this week", "recent"]
+SORT_QUERIES = {"most played": "most_played", "this week": "most_played_this_week", "recent": "recently_played"}
+CARD_SCALE_STEP = 0.025  # Card bitmaps are pre-rendered per quantized scale step
+CARD_CACHE_KB = 8192
 
 class Theme:
     """Optimized color theme with pre-calculated values"""
@@ -52,6 +82,9 @@ class GameData:
     executable: str
     last_played: float = 0
     play_count: int = 0
+    last_launch_ms: float = 0
+    is_running: bool = False
+    thumbnail: Optional[pygame.Surface] = None
 
 class PerformanceMonitor:
     """Monitor and optimize performance"""
@@ -79,8 +112,8 @@ class OptimizedRenderer:
     """High-performance rendering system"""
     def __init__(self, screen):
         self.screen = screen
-        self.surface_cache = {}
-        self.font_cache = {}
+        self.text_cache = create_text_cache()
+        self.card_cache = SurfaceCache(max_bytes=CARD_CACHE_KB * 1024)
         self.dirty_rects = []
         
         # Pre-load fonts
@@ -94,11 +127,12 @@ class OptimizedRenderer:
     def get_text_surface(self, text: str, font_key: str, color: Tuple[int, int, int]) -> pygame.Surface:
         """Cached text rendering"""
         cache_key = (text, font_key, color)
-        if cache_key not in self.surface_cache:
-            font = self.fonts.get(font_key, self.fonts['body'])
-            surface = font.render(text, True, color)
-            self.surface_cache[cache_key] = surface
-        return self.surface_cache[cache_key]
+        return self.text_cache.get_or_create(
+            cache_key, lambda: self.fonts.get(font_key, self.fonts['body']).render(text, True, color))
+    
+    def render_text(self, text: str, font_key: str, color: Tuple[int, int, int]) -> pygame.Surface:
+        """Uncached rendering for live overlay text that changes every frame"""
+        return self.fonts.get(font_key, self.fonts['body']).render(text, True, color)
     
     def draw_rounded_rect(self, surface: pygame.Surface, color: Tuple[int, int, int], 
                          rect: pygame.Rect, radius: int = 8):
@@ -119,7 +153,7 @@ class OptimizedRenderer:
 
 class GameCard:
     """Optimized game card with smooth animations"""
-    def __init__(self, game_data: GameData, x: int, y: int, width: int = 280, height: int = 160):
+    def __init__(self, game_data: Optional[GameData], x: int, y: int, width: int = 280, height: int = 160):
         self.game_data = game_data
         self.rect = pygame.Rect(x, y, width, height)
         self.hover_scale = 1.0
@@ -128,6 +162,23 @@ class GameCard:
         self.is_hovered = False
         self.click_animation = 0.0
     
+    def bind(self, game_data: GameData, rect: pygame.Rect):
+        """Recycle this card for another game in the virtualized grid"""
+        self.game_data = game_data
+        self.rect = rect
+        self.hover_scale = 1.0
+        self.target_scale = 1.0
+        self.is_hovered = False
+        self.click_animation = 0.0
+    
+    def release(self):
+        """Detach from the game once the card scrolls out of view, dropping any tween in flight"""
+        self.game_data = None
+        self.is_hovered = False
+        self.hover_scale = 1.0
+        self.target_scale = 1.0
+        self.click_animation = 0.0
+    
     def update(self, dt: float):
         """Smooth animation updates"""
         # Scale animation
@@ -140,8 +191,12 @@ class GameCard:
     
     def handle_hover(self, mouse_pos: Tuple[int, int]):
         """Handle hover state"""
+        self.set_hovered(self.rect.collidepoint(mouse_pos))
+    
+    def set_hovered(self, hovered: bool):
+        """Start the hover tween when the hover state changes"""
         was_hovered = self.is_hovered
-        self.is_hovered = self.rect.collidepoint(mouse_pos)
+        self.is_hovered = hovered
         
         if self.is_hovered and not was_hovered:
             self.target_scale = 1.05
@@ -153,49 +208,89 @@ class GameCard:
         self.click_animation = 1.0
         return self.game_data
     
-    def draw(self, renderer: OptimizedRenderer):
-        """Optimized drawing"""
-        # Calculate animated position and size
-        scale = self.hover_scale - self.click_animation * 0.05
+    def is_settled(self) -> bool:
+        """True once every tween has reached its target"""
+        if abs(self.target_scale - self.hover_scale) > 0.001 or self.click_animation > 0:
+            return False
+        self.hover_scale = self.target_scale
+        return True
+    
+    def get_scale_step(self) -> int:
+        """Current animated scale quantized to CARD_SCALE_STEP"""
+        return round((self.hover_scale - self.click_animation * 0.05) / CARD_SCALE_STEP)
+    
+    def get_scaled_rect(self, y_offset: int = 0) -> pygame.Rect:
+        """Animated on-screen rect, shifted up by the scroll offset"""
+        scale = self.get_scale_step() * CARD_SCALE_STEP
         scaled_width = int(self.rect.width * scale)
         scaled_height = int(self.rect.height * scale)
         scaled_x = self.rect.x + (self.rect.width - scaled_width) // 2
-        scaled_y = self.rect.y + (self.rect.height - scaled_height) // 2
-        
-        scaled_rect = pygame.Rect(scaled_x, scaled_y, scaled_width, scaled_height)
+        scaled_y = self.rect.y - y_offset + (self.rect.height - scaled_height) // 2
+        return pygame.Rect(scaled_x, scaled_y, scaled_width, scaled_height)
+    
+    def get_data_signature(self) -> Tuple:
+        """Game data shown on the card; a change forces a new bitmap"""
+        return (self.game_data.play_count, int(self.game_data.last_launch_ms), self.game_data.is_running,
+                self.game_data.thumbnail is not None)
+    
+    def get_render_state(self) -> Tuple:
+        """Everything besides position and size that changes how the card looks"""
+        return (self.game_data.path, self.is_hovered) + self.get_data_signature()
+    
+    def draw(self, renderer: OptimizedRenderer, y_offset: int = 0):
+        """Blit the pre-rendered bitmap for the current state and scale step"""
+        scaled_rect = self.get_scaled_rect(y_offset)
+        cache_key = (self.game_data.path, self.is_hovered, self.get_scale_step(), self.get_data_signature())
+        bitmap = renderer.card_cache.get_or_create(
+            cache_key, lambda: self.render_bitmap(renderer, scaled_rect.width, scaled_rect.height))
+        renderer.screen.blit(bitmap, scaled_rect.topleft)
+    
+    def render_bitmap(self, renderer: OptimizedRenderer, width: int, height: int) -> pygame.Surface:
+        """Compose the whole card off-screen at the given size"""
+        bitmap = pygame.Surface((width, height), pygame.SRCALPHA)
+        card_rect = bitmap.get_rect()
         
         # Background
         bg_color = Theme.CARD_HOVER if self.is_hovered else Theme.CARD_BG
-        renderer.draw_rounded_rect(renderer.screen, bg_color, scaled_rect, 12)
+        renderer.draw_rounded_rect(bitmap, bg_color, card_rect, 12)
         
-        # Game icon (colored circle)
-        icon_radius = 24
-        icon_center = (scaled_rect.x + 40, scaled_rect.y + 40)
-        pygame.draw.circle(renderer.screen, self.game_data.color, icon_center, icon_radius)
+        # Game icon: the captured thumbnail, or a colored circle until it is ready
+        if self.game_data.thumbnail is not None:
+            bitmap.blit(self.game_data.thumbnail, self.game_data.thumbnail.get_rect(center=(40, 40)))
+        else:
+            icon_radius = 24
+            pygame.draw.circle(bitmap, self.game_data.color, (40, 40), icon_radius)
         
         # Game name
         name_surface = renderer.get_text_surface(self.game_data.name, 'subtitle', Theme.TEXT_WHITE)
-        name_pos = (scaled_rect.x + 80, scaled_rect.y + 20)
-        renderer.screen.blit(name_surface, name_pos)
+        bitmap.blit(name_surface, (80, 20))
         
         # Category
         category_surface = renderer.get_text_surface(self.game_data.category, 'small', Theme.TEXT_GRAY)
-        category_pos = (scaled_rect.x + 80, scaled_rect.y + 50)
-        renderer.screen.blit(category_surface, category_pos)
+        bitmap.blit(category_surface, (80, 50))
         
         # Description
         desc_lines = self.wrap_text(self.game_data.description, 30)
         for i, line in enumerate(desc_lines[:2]):  # Max 2 lines
             desc_surface = renderer.get_text_surface(line, 'small', Theme.TEXT_DARK)
-            desc_pos = (scaled_rect.x + 20, scaled_rect.y + 80 + i * 20)
-            renderer.screen.blit(desc_surface, desc_pos)
+            bitmap.blit(desc_surface, (20, 80 + i * 20))
         
         # Play count indicator
         if self.game_data.play_count > 0:
             count_text = f"Played {self.game_data.play_count}x"
             count_surface = renderer.get_text_surface(count_text, 'small', Theme.ACCENT)
-            count_pos = (scaled_rect.x + scaled_rect.width - 80, scaled_rect.y + scaled_rect.height - 25)
-            renderer.screen.blit(count_surface, count_pos)
+            bitmap.blit(count_surface, (width - 80, height - 25))
+        
+        # Running badge, otherwise the last click-to-first-frame latency
+        if self.game_data.is_running:
+            running_surface = renderer.get_text_surface("▶ Running", 'small', Theme.SUCCESS)
+            bitmap.blit(running_surface, (20, height - 25))
+        elif self.game_data.last_launch_ms > 0:
+            latency_text = f"⚡ {int(self.game_data.last_launch_ms)}ms"
+            latency_surface = renderer.get_text_surface(latency_text, 'small', Theme.TEXT_GRAY)
+            bitmap.blit(latency_surface, (20, height - 25))
+        
+        return bitmap.convert_alpha()
     
     def wrap_text(self, text: str, max_chars: int) -> List[str]:
         """Simple text wrapping"""
@@ -220,19 +315,43 @@ class FixedOptimizedGameLauncher:
     """Main launcher class with fixed game detection"""
     
     def __init__(self):
-        # Initialize display with optimizations
+        # Only the display and fonts are brought up before the first frame
+        pygame.display.init()
         self.screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT), 
                                             pygame.DOUBLEBUF | pygame.HWSURFACE)
         pygame.display.set_caption("Fixed Optimized Game Launcher")
+        startup_profiler.mark("display init")
+        
+        pygame.font.init()
+        self.renderer = OptimizedRenderer(self.screen)
+        startup_profiler.mark("fonts")
         
         # Performance components
         self.clock = pygame.time.Clock()
+        self.frame_scheduler = FrameScheduler(self.clock, TARGET_FPS)
         self.performance_monitor = PerformanceMonitor()
-        self.renderer = OptimizedRenderer(self.screen)
-        
-        # Game data
-        self.games = self.load_games()
+        # Starts at the level calibrated for this machine, then adapts to live frame times
+        self.governor = (QualityGovernor(TARGET_FPS, initial_level=calibrated_level("launcher"))
+                         if ADAPTIVE_QUALITY else None)
+        self.card_animation_speed = CARD_ANIMATION_SPEEDS["high"]
+        self.animation_quality_cap = "high"  # performance.animation_quality; the governor can only go lower
+        self.config = ConfigService()
+        
+        # Pre-warmed game processes for instant launches, started after the first frame
+        self.game_pool = ZygotePool(size=1)
+        self.supervisor = ProcessSupervisor()
+        self.latency_tracker = LaunchLatencyTracker() if MEASURE_LAUNCH_LATENCY else None
+        self.telemetry = TelemetryMonitor() if COLLECT_TELEMETRY else None
+        self.thumbnails = ThumbnailPipeline() if GENERATE_THUMBNAILS else None
+        
+        # Retained-mode rendering: only changed regions are recomposed
+        self.compositor = DirtyRectCompositor(self.screen, Theme.BG_DARK, enabled=load_dirty_rect_setting())
+        
+        # Game data arrives from the background loader
+        self.discovery = None
+        self.games = []
         self.game_cards = []
+        self.card_grid = None
         self.selected_game = None
         
         # UI state
@@ -240,44 +359,85 @@ class FixedOptimizedGameLauncher:
         self.target_scroll = 0
         self.scroll_speed = 0.2
         
-        # Statistics
-        self.stats = self.load_stats()
+        # Statistics, persisted by a background journal writer
+        self.stats_journal = StatsJournal()
+        self.stats = {}
+        
+        # Per-session play history for sorting and queries, written on its own thread
+        self.play_history = None
+        self.discovery_order = []
+        self.sort_mode = SORT_MODES[0]
         
+        # Discovery, stats and the mixer load while the first frames are shown
+        self.loading = True
+        self.loaded_data = None
+        self.startup_reported = False
         self.setup_game_cards()
+        if self.governor:
+            self.governor.subscribe(self.apply_quality)
+        self.config.subscribe(self.apply_config)
+        self.startup_thread = threading.Thread(target=self.load_in_background, daemon=True)
+        self.startup_thread.start()
+        startup_profiler.mark("launcher setup")
     
-    def find_game_executable(self, game_dir: str) -> Optional[str]:
-        """Find the main executable file for a game"""
-        if not os.path.exists(game_dir):
-            return None
-        
-        # Common main file names to check
-        possible_mains = [
-            "main.py",
-            f"{os.path.basename(game_dir)}.py",
-            f"run_{os.path.basename(game_dir)}.py",
-            "game.py",
-            "run.py"
-        ]
+    def load_in_background(self):
+        """Discover games, load stats and start the mixer off the render thread"""
+        start = time.perf_counter()
+        self.discovery = GameDiscovery()
+        games = self.load_games()
+        startup_profiler.record("game discovery", (time.perf_counter() - start) * 1000)
+        
+        start = time.perf_counter()
+        stats = self.load_stats()
+        startup_profiler.record("stats load", (time.perf_counter() - start) * 1000)
+        
+        start = time.perf_counter()
+        play_history = PlayHistoryWriter()
+        play_history.start(stats)
+        play_history.ready.wait()
+        startup_profiler.record("play history", (time.perf_counter() - start) * 1000)
+        
+        if AUDIO_ENABLED:
+            start = time.perf_counter()
+            try:
+                pygame.mixer.init()
+            except pygame.error as e:
+                print(f"⚠️ Audio unavailable: {e}")
+            startup_profiler.record("mixer init", (time.perf_counter() - start) * 1000)
+        
+        self.loaded_data = (games, stats, play_history)
+    
+    def poll_startup(self, block: bool = False):
+        """Apply the background loader's results on the render thread once ready"""
+        if not self.loading:
+            return
+        if block:
+            self.startup_thread.join()
+        if self.loaded_data is None:
+            return
         
-        for main_file in possible_mains:
-            full_path = os.path.join(game_dir, main_file)
-            if os.path.exists(full_path):
-                return full_path
+        start = time.perf_counter()
+        self.games, self.stats, self.play_history = self.loaded_data
+        self.loaded_data = None
+        self.stats_journal.start()
+        self.discovery_order = list(self.games)
         
-        # If no standard main file found, look for any .py file
-        try:
-            py_files = [f for f in os.listdir(game_dir) if f.endswith('.py') and not f.startswith('__')]
-            if py_files:
-                # Prefer files with 'main', 'game', or 'run' in the name
-                for py_file in py_files:
-                    if any(keyword in py_file.lower() for keyword in ['main', 'game', 'run']):
-                        return os.path.join(game_dir, py_file)
-                # Otherwise return the first .py file
-                return os.path.join(game_dir, py_files[0])
-        except OSError:
-            pass
-        
-        return None
+        self.loading = False
+        self.setup_game_cards()
+        self.apply_sort()  # S may have been pressed while loading
+        if self.thumbnails:
+            self.thumbnails.request([game.path for game in self.games])
+        startup_profiler.record("cards ready", (time.perf_counter() - start) * 1000)
+        
+        print(f"🎯 Found {len(self.games)} games ready to play!")
+        self.report_startup()
+    
+    def report_startup(self):
+        """Print the startup breakdown once the first frame is up and games are loaded"""
+        if self.startup_reported or self.loading or startup_profiler.first_frame_ms is None:
+            return
+        self.startup_reported = True
+        startup_profiler.print_report("Launcher startup")
     
     def load_games(self) -> List[GameData]:
         """Load game data with proper file detection"""
@@ -328,32 +488,31 @@ class FixedOptimizedGameLauncher:
         }
         
         try:
-            for game_dir in os.listdir(games_dir):
-                game_path = os.path.join(games_dir, game_dir)
-                if os.path.isdir(game_path):
-                    # Find the executable file
-                    executable_path = self.find_game_executable(game_path)
-                    if executable_path:
-                        config = game_configs.get(game_dir, {
-                            "name": game_dir.replace('_', ' ').title(),
-                            "description": f"Play {game_dir.replace('_', ' ')}!",
-                            "category": "Game",
-                            "color": (128, 128, 255)
-                        })
-                        
-                        game_data = GameData(
-                            name=config["name"],
-                            path=executable_path,
-                            description=config["description"],
-                            category=config["category"],
-                            color=config["color"],
-                            executable=os.path.basename(executable_path)
-                        )
-                        games.append(game_data)
-                        print(f"✅ Found game: {config['name']} -> {executable_path}")
+            executables = self.discovery.scan(games_dir)
+            for game_dir, executable_path in executables.items():
+                if executable_path:
+                    config = game_configs.get(game_dir, {
+                        "name": game_dir.replace('_', ' ').title(),
+                        "description": f"Play {game_dir.replace('_', ' ')}!",
+                        "category": "Game",
+                        "color": (128, 128, 255)
+                    })
+                    
+                    game_data = GameData(
+                        name=config["name"],
+                        path=executable_path,
+                        description=config["description"],
+                        category=config["category"],
+                        color=config["color"],
+                        executable=os.path.basename(executable_path)
+                    )
+                    games.append(game_data)
+                    print(f"✅ Found game: {config['name']} -> {executable_path}")
         except Exception as e:
             print(f"Error loading games: {e}")
         
+        self.discovery.print_scan_report()
+        
         return games if games else self.get_default_games()
     
     def get_default_games(self) -> List[GameData]:
@@ -363,31 +522,28 @@ class FixedOptimizedGameLauncher:
         ]
     
     def load_stats(self) -> Dict:
-        """Load game statistics"""
-        try:
-            with open("game_stats.json", "r") as f:
-                return json.load(f)
-        except:
-            return {}
-    
-    def save_stats(self):
-        """Save game statistics"""
-        stats_data = {}
-        for game in self.games:
-            stats_data[game.name] = {
-                "play_count": game.play_count,
-                "last_played": game.last_played
-            }
-        
-        try:
-            with open("game_stats.json", "w") as f:
-                json.dump(stats_data, f, indent=2)
-        except Exception as e:
-            print(f"Failed to save stats: {e}")
+        """Load game statistics from the snapshot plus journal"""
+        return self.stats_journal.load()
+    
+    def save_stats(self, game: GameData):
+        """Queue a game's statistics for the journal writer (no file I/O here)"""
+        stats_data = {
+            "play_count": game.play_count,
+            "last_played": game.last_played
+        }
+        if self.latency_tracker and game.name in self.latency_tracker.samples:
+            percentiles = self.latency_tracker.get_percentiles(game.name)
+            stats_data.update({
+                "last_launch_ms": game.last_launch_ms,
+                "launch_latency_ms": self.latency_tracker.samples[game.name],
+                "launch_latency_p50": percentiles["p50"],
+                "launch_latency_p95": percentiles["p95"],
+                "launch_latency_p99": percentiles["p99"]
+            })
+        self.stats_journal.record(game.name, **stats_data)
     
     def setup_game_cards(self):
-        """Create game cards with optimized layout"""
-        self.game_cards = []
+        """Create a virtualized card grid with optimized layout"""
         cards_per_row = 4
         card_width = 280
         card_height = 160
@@ -395,35 +551,105 @@ class FixedOptimizedGameLauncher:
         start_x = (WINDOW_WIDTH - (cards_per_row * card_width + (cards_per_row - 1) * margin)) // 2
         start_y = 120
         
-        for i, game in enumerate(self.games):
-            row = i // cards_per_row
-            col = i % cards_per_row
-            x = start_x + col * (card_width + margin)
-            y = start_y + row * (card_height + margin)
-            
+        for game in self.games:
             # Load stats for this game
             if game.name in self.stats:
                 game.play_count = self.stats[game.name].get("play_count", 0)
                 game.last_played = self.stats[game.name].get("last_played", 0)
-            
-            card = GameCard(game, x, y, card_width, card_height)
-            self.game_cards.append(card)
+                game.last_launch_ms = self.stats[game.name].get("last_launch_ms", 0)
+                if self.latency_tracker:
+                    for sample in self.stats[game.name].get("launch_latency_ms", []):
+                        self.latency_tracker.add_sample(game.name, sample)
+        
+        # Only the rows inside the window get card objects; they are recycled while scrolling
+        layout = GridLayout(cards_per_row, card_width, card_height, margin, start_x, start_y)
+        self.card_grid = VirtualCardGrid(layout, self.games, WINDOW_HEIGHT,
+                                         lambda: self.create_card(card_width, card_height))
+        self.card_grid.sync(int(self.scroll_offset))
+        self.game_cards = self.card_grid.slots
+        
+        self.setup_retained_regions()
+    
+    def create_card(self, width: int, height: int) -> GameCard:
+        """Pooled card animating at the current quality level"""
+        card = GameCard(None, 0, 0, width, height)
+        card.animation_speed = self.card_animation_speed
+        return card
+    
+    def apply_quality(self, level: QualityLevel):
+        """Quality governor subscriber: frame cap and card tween speed"""
+        self.frame_scheduler.target_fps = self.governor.target_fps
+        self.set_animation_quality(max(level.animation_quality, self.animation_quality_cap,
+                                       key=list(CARD_ANIMATION_SPEEDS).index))
+    
+    def set_animation_quality(self, quality: str):
+        """Retune every card's tween speed"""
+        self.card_animation_speed = CARD_ANIMATION_SPEEDS[quality]
+        for card in self.game_cards:
+            card.animation_speed = self.card_animation_speed
+    
+    def apply_config(self, config: ConfigService):
+        """Config service subscriber: frame cap, text cache, animation quality and dirty rects"""
+        self.renderer.text_cache.configure(*text_cache_settings(config.config))
+        
+        dirty_rects = bool(config.get("optimization.dirty_rect_updates", True))
+        if dirty_rects != self.compositor.enabled:
+            self.compositor.enabled = dirty_rects
+            self.compositor.invalidate()
+        
+        quality = config.get("performance.animation_quality", "high")
+        self.animation_quality_cap = quality if quality in CARD_ANIMATION_SPEEDS else "high"
+        target_fps = int(config.get("display.target_fps", TARGET_FPS))
+        if self.governor:
+            self.governor.set_max_fps(target_fps)
+        else:
+            self.frame_scheduler.target_fps = target_fps
+            self.set_animation_quality(self.animation_quality_cap)
+    
+    def setup_retained_regions(self):
+        """Register header, cards and overlays with the compositor in draw order"""
+        regions = [RetainedRegion(lambda: pygame.Rect(0, 0, WINDOW_WIDTH, 95), self.draw_header,
+                                  lambda: (self.loading, len(self.games)))]
+        
+        # One region per pooled card; a released card has empty bounds
+        for card in self.game_cards:
+            regions.append(RetainedRegion(
+                lambda card=card: self.get_card_bounds(card),
+                lambda card=card: self.draw_card(card),
+                lambda card=card: card.get_render_state() if card.game_data else None))
+        
+        regions.append(RetainedRegion(lambda: pygame.Rect(WINDOW_WIDTH - 320, 0, 320, 70),
+                                      self.draw_performance_info, self.get_performance_texts))
+        regions.append(RetainedRegion(lambda: pygame.Rect(0, WINDOW_HEIGHT - 30, WINDOW_WIDTH, 30),
+                                      self.draw_controls_hint, lambda: self.sort_mode))
+        self.compositor.set_elements(regions)
+    
+    def get_card_bounds(self, card: GameCard) -> pygame.Rect:
+        """Screen bounds of a pooled card, including its 1px outline margin"""
+        if card.game_data is None:
+            return EMPTY_RECT
+        return card.get_scaled_rect(int(self.scroll_offset)).inflate(2, 2)
+    
+    def draw_card(self, card: GameCard):
+        """Draw a pooled card if it is bound to a game"""
+        if card.game_data is not None:
+            card.draw(self.renderer, int(self.scroll_offset))
     
-    def handle_events(self) -> bool:
+    def handle_events(self, events: List[pygame.event.Event]) -> bool:
         """Optimized event handling"""
-        for event in pygame.event.get():
+        for event in events:
             if event.type == pygame.QUIT:
                 return False
             
             elif event.type == pygame.MOUSEBUTTONDOWN:
                 if event.button == 1:  # Left click
+                    click_time = time.time()
                     mouse_pos = pygame.mouse.get_pos()
                     adjusted_mouse_pos = (mouse_pos[0], mouse_pos[1] + self.scroll_offset)
-                    for card in self.game_cards:
-                        if card.rect.collidepoint(adjusted_mouse_pos):
-                            selected_game = card.handle_click()
-                            self.launch_game(selected_game)
-                            break
+                    card = self.card_grid.card_at(adjusted_mouse_pos)
+                    if card:
+                        selected_game = card.handle_click()
+                        self.launch_game(selected_game, click_time)
             
             elif event.type == pygame.MOUSEWHEEL:
                 # Smooth scrolling
@@ -435,61 +661,112 @@ class FixedOptimizedGameLauncher:
                     return False
                 elif event.key == pygame.K_F11:
                     self.toggle_fullscreen()
+                elif event.key == pygame.K_F3:
+                    self.compositor.toggle_debug()
+                elif event.key == pygame.K_s:
+                    self.cycle_sort_mode()
+            
+            elif event.type in (pygame.WINDOWEXPOSED, pygame.WINDOWRESTORED, pygame.VIDEOEXPOSE):
+                self.compositor.invalidate()
         
         return True
     
     def get_max_scroll(self) -> int:
         """Calculate maximum scroll offset"""
-        if not self.game_cards:
+        if not self.games:
             return 0
         
-        max_y = max(card.rect.bottom for card in self.game_cards)
+        max_y = self.card_grid.content_bottom()
         return max(0, max_y - WINDOW_HEIGHT + 100)
     
     def toggle_fullscreen(self):
         """Toggle fullscreen mode"""
         pygame.display.toggle_fullscreen()
+        self.compositor.invalidate()
     
     def update(self, dt: float):
         """Update game state with delta time"""
+        # Swap in games once the background loader is done
+        self.poll_startup()
+        
+        # Pick up performance_config.json edits made while the launcher runs
+        self.config.poll()
+        
+        # Sort queries answered by the play history thread
+        if self.play_history:
+            self.play_history.poll()
+        
         # Smooth scrolling
         scroll_diff = self.target_scroll - self.scroll_offset
         self.scroll_offset += scroll_diff * self.scroll_speed
         
-        # Update cards
+        # Recycle cards for the rows now in view
+        self.card_grid.sync(int(self.scroll_offset))
+        
+        # Update visible cards; the hovered one is found arithmetically
         mouse_pos = pygame.mouse.get_pos()
         adjusted_mouse_pos = (mouse_pos[0], mouse_pos[1] + self.scroll_offset)
+        hovered_card = self.card_grid.card_at(adjusted_mouse_pos)
         
-        for card in self.game_cards:
+        for card in self.card_grid.visible_cards():
             card.update(dt)
-            card.handle_hover(adjusted_mouse_pos)
-    
-    def draw(self):
-        """Optimized drawing with minimal redraws"""
-        # Clear screen
-        self.screen.fill(Theme.BG_DARK)
+            card.set_hovered(card is hovered_card)
         
-        # Draw header
-        self.draw_header()
+        # Record sessions of games that exited
+        for record in self.supervisor.poll_finished():
+            self.finish_session(record)
         
-        # Draw game cards with scroll offset
-        for card in self.game_cards:
-            # Adjust card position for scrolling
-            original_y = card.rect.y
-            card.rect.y -= int(self.scroll_offset)
-            
-            # Only draw visible cards
-            if -200 < card.rect.y < WINDOW_HEIGHT + 200:
-                card.draw(self.renderer)
-            
-            # Restore original position
-            card.rect.y = original_y
+        # Collect first-frame reports and frame stats from launched games
+        if self.latency_tracker:
+            self.update_launch_latency()
+        if self.telemetry:
+            self.telemetry.poll()
         
-        # Draw performance info
-        self.draw_performance_info()
+        # Swap card icons for thumbnails as the capture pool finishes them
+        if self.thumbnails:
+            self.apply_thumbnails()
+    
+    def is_settled(self) -> bool:
+        """True when no card animation or scroll is in motion"""
+        if self.loading or abs(self.target_scroll - self.scroll_offset) > 0.5:
+            return False
+        self.scroll_offset = self.target_scroll
+        # Released cards are never updated, so only the bound ones can still be animating
+        return all(card.is_settled() for card in self.card_grid.visible_cards())
+    
+    def update_launch_latency(self):
+        """Apply click-to-first-frame reports from launched games"""
+        completed = self.latency_tracker.poll()
+        if not completed:
+            return
+        
+        games_by_name = {game.name: game for game in self.games}
+        for game_name, latency_ms in completed:
+            if game_name in games_by_name:
+                games_by_name[game_name].last_launch_ms = latency_ms
+                self.save_stats(games_by_name[game_name])
+            print(f"⚡ {game_name}: first frame after {latency_ms:.0f}ms")
+    
+    def apply_thumbnails(self):
+        """Load finished thumbnails onto their games; their cards re-render on the next draw"""
+        finished = self.thumbnails.poll()
+        if not finished:
+            return
         
-        # Update display
-        pygame.display.flip()
+        games_by_path = {os.path.abspath(game.path): game for game in self.games}
+        for script_path, thumbnail_path in finished:
+            game = games_by_path.get(os.path.abspath(script_path))
+            if game is None:
+                continue
+            try:
+                game.thumbnail = pygame.image.load(thumbnail_path).convert()
+            except pygame.error as e:
+                print(f"⚠️ Could not load thumbnail for {game.name}: {e}")
+    
+    def draw(self):
+        """Optimized drawing with minimal redraws"""
+        # Recompose and present only the regions that changed
+        self.compositor.render()
     
     def draw_header(self):
         """Draw the header section"""
@@ -499,7 +776,10 @@ class FixedOptimizedGameLauncher:
         self.screen.blit(title_surface, title_rect)
         
         # Subtitle
-        subtitle_text = f"🚀 {len(self.games)} games ready • Lag-free • Smooth performance"
+        if self.loading:
+            subtitle_text = "🔍 Loading games..."
+        else:
+            subtitle_text = f"🚀 {len(self.games)} games ready • Lag-free • Smooth performance"
         subtitle_surface = self.renderer.get_text_surface(subtitle_text, 'body', Theme.TEXT_GRAY)
         subtitle_rect = subtitle_surface.get_rect(center=(WINDOW_WIDTH // 2, 70))
         self.screen.blit(subtitle_surface, subtitle_rect)
@@ -507,40 +787,112 @@ class FixedOptimizedGameLauncher:
         # Separator line
         pygame.draw.line(self.screen, Theme.BORDER, (50, 90), (WINDOW_WIDTH - 50, 90), 2)
     
+    def get_performance_texts(self) -> Tuple[str, str, str]:
+        """Texts shown in the performance overlay"""
+        fps_text = "FPS: idle" if self.frame_scheduler.idle else f"FPS: {self.performance_monitor.get_fps():.1f}"
+        cache_text = self.renderer.text_cache.get_stats_text()
+        dirty_text = self.compositor.get_stats_text() if self.compositor.debug else ""
+        return fps_text, cache_text, dirty_text
+    
     def draw_performance_info(self):
         """Draw performance information"""
         fps = self.performance_monitor.get_fps()
-        fps_text = f"FPS: {fps:.1f}"
+        fps_text, cache_text, dirty_text = self.get_performance_texts()
         fps_color = Theme.SUCCESS if fps > 60 else Theme.ACCENT if fps > 30 else Theme.TEXT_GRAY
-        fps_surface = self.renderer.get_text_surface(fps_text, 'small', fps_color)
+        fps_surface = self.renderer.render_text(fps_text, 'small', fps_color)
         self.screen.blit(fps_surface, (WINDOW_WIDTH - 100, 10))
         
-        # Controls hint
-        controls_text = "Mouse wheel: scroll • ESC: exit • F11: fullscreen"
+        # Text cache counters, rendered uncached so the overlay doesn't skew what it measures
+        cache_surface = self.renderer.render_text(cache_text, 'small', Theme.TEXT_DARK)
+        self.screen.blit(cache_surface, cache_surface.get_rect(topright=(WINDOW_WIDTH - 10, 30)))
+        
+        # Dirty-rect debug overlay
+        if dirty_text:
+            dirty_surface = self.renderer.render_text(dirty_text, 'small', Theme.ACCENT)
+            self.screen.blit(dirty_surface, dirty_surface.get_rect(topright=(WINDOW_WIDTH - 10, 50)))
+    
+    def cycle_sort_mode(self):
+        """Switch to the next card order; while loading it is only recorded and applied once games arrive"""
+        self.sort_mode = SORT_MODES[(SORT_MODES.index(self.sort_mode) + 1) % len(SORT_MODES)]
+        if not self.loading:
+            self.apply_sort()
+    
+    def apply_sort(self):
+        """Reorder the cards using a play history query run off the render thread"""
+        if self.sort_mode in SORT_QUERIES:
+            self.play_history.query(SORT_QUERIES[self.sort_mode],
+                                    callback=lambda ranking, mode=self.sort_mode: self.apply_ranking(mode, ranking))
+        else:
+            self.apply_ranking(self.sort_mode, [])
+    
+    def apply_ranking(self, mode: str, ranking: List[Tuple[str, Any]]):
+        """Order the cards by a finished query, unless the sort mode changed since it was asked"""
+        if mode != self.sort_mode:
+            return
+        
+        # Ranked games first, the rest keep their discovery order
+        rank = {name: i for i, (name, _) in enumerate(ranking)}
+        order = {id(game): i for i, game in enumerate(self.discovery_order)}
+        self.games.sort(key=lambda game: (rank.get(game.name, len(rank)), order.get(id(game), 0)))
+        self.card_grid.refresh(int(self.scroll_offset))
+    
+    def draw_controls_hint(self):
+        """Draw the controls hint in the footer"""
+        controls_text = f"Mouse wheel: scroll • ESC: exit • F11: fullscreen • F3: dirty rects • S: sort ({self.sort_mode})"
         controls_surface = self.renderer.get_text_surface(controls_text, 'small', Theme.TEXT_DARK)
         self.screen.blit(controls_surface, (10, WINDOW_HEIGHT - 25))
     
-    def launch_game(self, game_data: GameData):
+    def launch_game(self, game_data: GameData, click_time: Optional[float] = None):
         """Launch selected game with error handling"""
         if not os.path.exists(game_data.path):
             print(f"❌ Game file not found: {game_data.path}")
             return
         
+        if self.supervisor.is_running(game_data.name):
+            print(f"⏳ {game_data.name} is already running")
+            return
+        
         try:
             # Update statistics
             game_data.play_count += 1
             game_data.last_played = time.time()
-            self.save_stats()
+            self.save_stats(game_data)
+            session_id = self.play_history.start_session(game_data.name, game_data.last_played)
             
-            # Launch game in separate process
+            # Launch game in a pre-warmed process owned by the supervisor
             game_dir = os.path.dirname(game_data.path)
-            subprocess.Popen([sys.executable, os.path.basename(game_data.path)], 
-                           cwd=game_dir)
+            env = {}
+            if self.latency_tracker:
+                env.update(self.latency_tracker.begin(game_data.name, click_time))
+            if self.telemetry:
+                env.update(self.telemetry.begin(game_data.name))
+            self.supervisor.launch(game_data.name,
+                                   lambda: self.game_pool.launch(game_data.path, cwd=game_dir, env=env),
+                                   session_id)
+            game_data.is_running = True
             print(f"🚀 Launched: {game_data.name}")
             
         except Exception as e:
             print(f"❌ Failed to launch {game_data.name}: {e}")
     
+    def finish_session(self, record: SessionRecord):
+        """Store a reaped game's session and clear its running badge"""
+        for game in self.games:
+            if game.name == record.game_name:
+                game.is_running = False
+                break
+        
+        performance = self.telemetry.end(record.game_name) if self.telemetry else None
+        session_fields = performance.get_session_fields() if performance else {}
+        
+        if self.play_history and record.session_id is not None:
+            self.play_history.end_session(record.session_id, exit_code=record.exit_code, ended=record.ended,
+                                          cpu_seconds=record.cpu_seconds, peak_rss_kb=record.peak_rss_kb,
+                                          **session_fields)
+        print(f"🏁 {record.get_summary_text()}")
+        if performance and performance.frames:
+            print(f"📈 {record.game_name}: {performance.get_summary_text()}")
+    
     def run(self):
         """Main game loop with performance optimizations"""
         running = True
@@ -549,7 +901,6 @@ class FixedOptimizedGameLauncher:
         print("🚀 Fixed Optimized Game Launcher Started!")
         print("📊 Performance monitoring enabled")
         print("🎮 Use mouse wheel to scroll, ESC to exit, F11 for fullscreen")
-        print(f"🎯 Found {len(self.games)} games ready to play!")
         
         while running:
             # Calculate delta time
@@ -560,8 +911,10 @@ class FixedOptimizedGameLauncher:
             # Update performance monitor
             self.performance_monitor.update()
             
-            # Handle events
-            running = self.handle_events()
+            # Handle events (blocks while idle)
+            events = self.frame_scheduler.get_events()
+            frame_start = time.perf_counter()
+            running = self.handle_events(events)
             
             # Update game state
             self.update(dt)
@@ -569,11 +922,34 @@ class FixedOptimizedGameLauncher:
             # Draw everything
             self.draw()
             
-            # Control frame rate
-            self.clock.tick(TARGET_FPS)
+            # Busy time only: idle waits and the frame-cap sleep say nothing about load
+            if self.governor and not self.frame_scheduler.frame_was_idle:
+                if self.governor.record((time.perf_counter() - frame_start) * 1000):
+                    print(f"🎚️ {self.governor.get_status_text()}, capped at {self.governor.target_fps} FPS")
+            
+            if startup_profiler.first_frame_ms is None:
+                startup_profiler.mark_first_frame()
+                self.game_pool.start()
+                self.report_startup()
+            
+            # Control frame rate, idling once everything has settled
+            self.frame_scheduler.tick(self.is_settled())
         
         # Cleanup
-        self.save_stats()
+        print(f"💤 {self.frame_scheduler.get_stats_text()}")
+        if self.governor:
+            print(f"🎚️ {self.governor.get_status_text()}")
+        self.stats_journal.close()
+        if self.play_history:
+            self.play_history.close()
+        self.game_pool.shutdown()
+        self.supervisor.shutdown()
+        if self.latency_tracker:
+            self.latency_tracker.close()
+        if self.telemetry:
+            self.telemetry.close()
+        if self.thumbnails:
+            self.thumbnails.shutdown()
         pygame.quit()
         sys.exit()
 
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Fixed Timestep - Constant-Rate Simulation Loop
+Accumulates real frame time into fixed simulation steps and exposes the leftover fraction for render interpolation
+"""
+
+import os
+import time
+from typing import Callable, Optional
+
+SIMULATION_HZ = 60
+MAX_FRAME_TIME = 0.25  # A longer stall (window drag, breakpoint) is dropped instead of replayed
+RENDER_FPS_ENV = "ARCADE_RENDER_FPS"
+
+def render_fps(default: int) -> int:
+    """Render cap for a game; a weak cabinet can lower it without changing gameplay speed"""
+    try:
+        return max(1, int(os.environ.get(RENDER_FPS_ENV, default)))
+    except ValueError:
+        return default
+
+def lerp(previous: float, current: float, alpha: float) -> float:
+    """Blend a value between its last two simulated states"""
+    return previous + (current - previous) * alpha
+
+class FixedTimestep:
+    """Accumulator loop: simulation always advances in steps of 1/step_hz, rendering runs at any rate"""
+    
+    def __init__(self, step_hz: float = SIMULATION_HZ, max_frame_time: float = MAX_FRAME_TIME,
+                 clock: Callable[[], float] = time.perf_counter):
+        self.step = 1.0 / step_hz
+        self.max_frame_time = max_frame_time
+        self.clock = clock
+        self.accumulator = 0.0
+        self.last_time: Optional[float] = None
+        
+        # Accounting
+        self.steps = 0
+        self.dropped_time = 0.0
+    
+    def advance(self) -> int:
+        """Add the time since the last call and return how many steps to simulate before drawing"""
+        now = self.clock()
+        if self.last_time is None:
+            # First frame only starts the clock
+            self.last_time = now
+            return 0
+        
+        frame_time = now - self.last_time
+        self.last_time = now
+        if frame_time > self.max_frame_time:
+            self.dropped_time += frame_time - self.max_frame_time
+            frame_time = self.max_frame_time
+        
+        self.accumulator += frame_time
+        steps = int(self.accumulator / self.step)
+        self.accumulator -= steps * self.step
+        self.steps += steps
+        return steps
+    
+    @property
+    def alpha(self) -> float:
+        """How far the render time is between the previous and current step, 0..1"""
+        return min(1.0, self.accumulator / self.step)
+    
+    def reset(self):
+        """Forget pending time, e.g. after a pause or restart"""
+        self.accumulator = 0.0
+        self.last_time = None
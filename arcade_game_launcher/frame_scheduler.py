@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Frame Scheduler - Event-Driven Idle Mode
+Runs the launcher at full rate while something animates and sleeps on the event queue once everything settles
+"""
+
+import time
+from typing import List
+
+import pygame
+
+class FrameScheduler:
+    """Switches between a capped frame rate and blocking on pygame.event.wait"""
+    
+    def __init__(self, clock: pygame.time.Clock, target_fps: int,
+                 idle_delay: float = 0.25, idle_timeout_ms: int = 250):
+        self.clock = clock
+        self.target_fps = target_fps
+        self.idle_delay = idle_delay            # Seconds of calm before going idle
+        self.idle_timeout_ms = idle_timeout_ms  # Timer wake-up while idle
+        
+        self.idle = False
+        self.settled_since = None
+        self.frame_was_idle = False
+        self.last_tick = time.perf_counter()
+        
+        # Power accounting
+        self.idle_time = 0.0
+        self.active_time = 0.0
+        self.wakeups = 0
+    
+    def get_events(self) -> List[pygame.event.Event]:
+        """Return this frame's events, blocking until input or the timer when idle"""
+        if not self.idle:
+            self.frame_was_idle = False
+            return pygame.event.get()
+        
+        self.frame_was_idle = True
+        first = pygame.event.wait(self.idle_timeout_ms)
+        events = pygame.event.get()
+        if first.type != pygame.NOEVENT:
+            events.insert(0, first)
+        
+        self.wakeups += 1
+        if events:
+            self.wake()
+        return events
+    
+    def wake(self):
+        """Ramp straight back to the full frame rate"""
+        self.idle = False
+        self.settled_since = None
+    
+    def tick(self, settled: bool):
+        """Finish the frame; settled means no tween or scroll is still moving"""
+        now = time.perf_counter()
+        if settled:
+            if self.settled_since is None:
+                self.settled_since = now
+            elif now - self.settled_since >= self.idle_delay:
+                self.idle = True
+        else:
+            self.wake()
+        
+        if self.idle:
+            # Keep the clock's bookkeeping current without sleeping
+            self.clock.tick()
+        else:
+            self.clock.tick(self.target_fps)
+        
+        now = time.perf_counter()
+        elapsed = now - self.last_tick
+        self.last_tick = now
+        if self.frame_was_idle:
+            self.idle_time += elapsed
+        else:
+            self.active_time += elapsed
+    
+    def get_idle_ratio(self) -> float:
+        """Fraction of wall time spent blocked on the event queue"""
+        total = self.idle_time + self.active_time
+        return self.idle_time / total if total > 0 else 0.0
+    
+    def get_stats_text(self) -> str:
+        """Short idle-versus-active summary"""
+        return (f"Idle {self.get_idle_ratio() * 100:.0f}% • "
+                f"{self.idle_time:.0f}s idle / {self.active_time:.0f}s active")
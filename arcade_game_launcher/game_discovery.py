@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Game Discovery Index - Cached Game Detection
+Persists a manifest of game directories keyed by path and mtime so only changed games are rescanned
+"""
+
+import os
+import json
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+MANIFEST_VERSION = 1
+
+def find_game_executable(game_dir: str) -> Optional[str]:
+    """Find the main executable file for a game"""
+    try:
+        py_files = sorted(entry.name for entry in os.scandir(game_dir)
+                          if entry.is_file() and entry.name.endswith('.py') and not entry.name.startswith('__'))
+    except OSError:
+        return None
+    
+    # Common main file names, in order of preference
+    base_name = os.path.basename(game_dir)
+    possible_mains = [
+        "main.py",
+        f"{base_name}.py",
+        f"run_{base_name}.py",
+        "game.py",
+        "run.py"
+    ]
+    
+    # One directory listing replaces a stat() per candidate name
+    available = set(py_files)
+    for main_file in possible_mains:
+        if main_file in available:
+            return os.path.join(game_dir, main_file)
+    
+    if py_files:
+        # Prefer files with 'main', 'game', or 'run' in the name
+        for py_file in py_files:
+            if any(keyword in py_file.lower() for keyword in ['main', 'game', 'run']):
+                return os.path.join(game_dir, py_file)
+        # Otherwise return the first .py file
+        return os.path.join(game_dir, py_files[0])
+    
+    return None
+
+class GameDiscovery:
+    """Discovers games and caches the result between launcher runs"""
+    
+    def __init__(self, manifest_path: str = "game_index.json", max_workers: int = 8):
+        self.manifest_path = manifest_path
+        self.max_workers = max_workers
+        self.entries: Dict[str, Dict] = {}
+        self.lock = threading.Lock()
+        
+        # Timing counters
+        self.scan_times: Dict[str, float] = {}
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.last_scan_duration = 0.0
+        
+        self.load_manifest()
+    
+    def load_manifest(self):
+        """Load the cached manifest from disk"""
+        try:
+            with open(self.manifest_path, "r") as f:
+                manifest = json.load(f)
+            if manifest.get("version") == MANIFEST_VERSION:
+                self.entries = manifest.get("entries", {})
+        except (OSError, ValueError):
+            self.entries = {}
+    
+    def save_manifest(self):
+        """Atomically write the manifest to disk"""
+        manifest = {"version": MANIFEST_VERSION, "entries": self.entries}
+        temp_path = self.manifest_path + ".tmp"
+        try:
+            with open(temp_path, "w") as f:
+                json.dump(manifest, f)
+            os.replace(temp_path, self.manifest_path)
+        except OSError as e:
+            print(f"Failed to save game index: {e}")
+    
+    def _scan_directory(self, game_dir: str, mtime: int) -> Dict:
+        """Probe one game directory and time it"""
+        start = time.perf_counter()
+        executable = find_game_executable(game_dir)
+        elapsed = time.perf_counter() - start
+        
+        with self.lock:
+            self.scan_times[game_dir] = elapsed
+        return {"mtime": mtime, "executable": executable}
+    
+    def scan(self, games_dir: str = "games") -> Dict[str, Optional[str]]:
+        """Return {directory name: executable path}, rescanning only changed directories"""
+        start = time.perf_counter()
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.scan_times = {}
+        
+        try:
+            subdirs = sorted((entry.name, entry.path, entry.stat().st_mtime_ns)
+                             for entry in os.scandir(games_dir) if entry.is_dir())
+        except OSError:
+            return {}
+        
+        stale = []
+        fresh_entries = {}
+        for name, path, mtime in subdirs:
+            cached = self.entries.get(path)
+            if cached is not None and cached.get("mtime") == mtime:
+                fresh_entries[path] = cached
+                self.cache_hits += 1
+            else:
+                stale.append((path, mtime))
+                self.cache_misses += 1
+        
+        # Fan stale directories out across a thread pool (I/O bound on network storage)
+        if len(stale) > 1:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(stale))) as pool:
+                results = pool.map(lambda item: self._scan_directory(*item), stale)
+                for (path, _), entry in zip(stale, results):
+                    fresh_entries[path] = entry
+        else:
+            for path, mtime in stale:
+                fresh_entries[path] = self._scan_directory(path, mtime)
+        
+        changed = stale or len(fresh_entries) != len(self.entries)
+        self.entries = fresh_entries
+        if changed:
+            self.save_manifest()
+        
+        self.last_scan_duration = time.perf_counter() - start
+        return {name: self.entries[path]["executable"] for name, path, _ in subdirs}
+    
+    def get_slowest_directories(self, count: int = 5) -> List:
+        """Return the most expensive directory scans of the last pass"""
+        return sorted(self.scan_times.items(), key=lambda item: item[1], reverse=True)[:count]
+    
+    def print_scan_report(self):
+        """Print timing counters for the last scan"""
+        print(f"📂 Game index: {self.cache_hits} cached, {self.cache_misses} rescanned "
+              f"in {self.last_scan_duration * 1000:.1f}ms")
+        for game_dir, elapsed in self.get_slowest_directories():
+            print(f"   {game_dir}: {elapsed * 1000:.2f}ms")
@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+Game Telemetry - Shared-Memory Frame Stats
+Games publish frame time, entity count and score into a lock-free ring that the launcher drains each frame
+"""
+
+import os
+import time
+import struct
+from collections import deque
+from dataclasses import dataclass, field
+from multiprocessing import resource_tracker, shared_memory
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from launch_latency import percentile
+
+TELEMETRY_ENV = "ARCADE_TELEMETRY"
+RING_CAPACITY = 1024  # ~17 s of frames at 60 FPS between launcher drains
+HISTORY_FRAMES = 3600  # Frame times kept per game for percentiles
+STUTTER_FACTOR = 2.0  # A frame this many times the running average is a stutter
+
+# Header: magic, capacity, frames written; padded to a cache line so records don't share it
+MAGIC = b"ATL1"
+HEADER = struct.Struct("<4sIQ")
+COUNT_OFFSET = 8
+HEADER_SIZE = 64
+
+# Record: sequence number (0 while being written), frame ms, entities, score
+RECORD = struct.Struct("<QfIq")
+SEQUENCE = struct.Struct("<Q")
+
+Sample = Tuple[float, int, int]
+
+class TelemetryPublisher:
+    """Game side: single writer, a few struct writes per frame and no syscalls"""
+    
+    def __init__(self, name: str):
+        self.shm = shared_memory.SharedMemory(name=name)
+        # The launcher owns the segment; stop this process's tracker from unlinking it on exit
+        resource_tracker.unregister(self.shm._name, "shared_memory")
+        
+        magic, self.capacity, self.count = HEADER.unpack_from(self.shm.buf, 0)
+        if magic != MAGIC or self.capacity == 0:
+            self.shm.close()
+            raise ValueError(f"not a telemetry ring: {name}")
+        self.last_frame: Optional[float] = None
+    
+    def publish(self, entities: int, score: int, frame_ms: Optional[float] = None):
+        """Record one frame; frame time defaults to the interval since the previous call"""
+        now = time.perf_counter()
+        if frame_ms is None:
+            if self.last_frame is None:
+                # First call only starts the frame clock
+                self.last_frame = now
+                return
+            frame_ms = (now - self.last_frame) * 1000
+        self.last_frame = now
+        
+        buf = self.shm.buf
+        offset = HEADER_SIZE + (self.count % self.capacity) * RECORD.size
+        RECORD.pack_into(buf, offset, 0, frame_ms, max(0, entities), int(score))
+        self.count += 1
+        SEQUENCE.pack_into(buf, offset, self.count)
+        SEQUENCE.pack_into(buf, COUNT_OFFSET, self.count)
+    
+    def close(self):
+        """Detach from the ring"""
+        self.shm.close()
+
+def connect_telemetry() -> Optional[TelemetryPublisher]:
+    """Game side: attach to the launcher's ring if it asked for telemetry"""
+    name = os.environ.pop(TELEMETRY_ENV, "")
+    if not name:
+        return None
+    
+    try:
+        return TelemetryPublisher(name)
+    except (OSError, ValueError):
+        return None
+
+@dataclass
+class PerformanceHistory:
+    """Aggregated frame stats for one game or one session"""
+    frame_times: Deque[float] = field(default_factory=lambda: deque(maxlen=HISTORY_FRAMES))
+    frames: int = 0
+    dropped: int = 0
+    stutters: int = 0
+    average_ms: float = 0
+    peak_entities: int = 0
+    last_score: int = 0
+    
+    def add_samples(self, samples: List[Sample]):
+        """Fold drained samples into the history"""
+        for frame_ms, entities, score in samples:
+            if self.average_ms and frame_ms > self.average_ms * STUTTER_FACTOR:
+                self.stutters += 1
+            # Exponential average so a cabinet's normal frame rate sets the stutter baseline
+            self.average_ms = frame_ms if not self.average_ms else self.average_ms * 0.95 + frame_ms * 0.05
+            self.frame_times.append(frame_ms)
+            self.peak_entities = max(self.peak_entities, entities)
+            self.last_score = score
+        self.frames += len(samples)
+    
+    def get_percentiles(self) -> Dict[str, float]:
+        """Return p50/p95/p99 frame time in ms"""
+        history = list(self.frame_times)
+        return {
+            "p50": percentile(history, 50),
+            "p95": percentile(history, 95),
+            "p99": percentile(history, 99)
+        }
+    
+    def get_session_fields(self) -> Dict[str, Any]:
+        """Score and frame stats for PlayHistory.end_session; None where the game never reported a frame"""
+        if not self.frames:
+            return {"score": None, "frame_p95_ms": None, "stutter_frames": None}
+        return {"score": self.last_score, "frame_p95_ms": self.get_percentiles()["p95"],
+                "stutter_frames": self.stutters}
+    
+    def get_summary_text(self) -> str:
+        """One-line frame summary for the console"""
+        percentiles = self.get_percentiles()
+        return (f"{self.frames} frames, p50 {percentiles['p50']:.1f}ms, p99 {percentiles['p99']:.1f}ms, "
+                f"{self.stutters} stutters, peak {self.peak_entities} entities")
+
+class TelemetryChannel:
+    """Launcher side of one game's ring; samples are read straight from the mapping"""
+    
+    def __init__(self, capacity: int = RING_CAPACITY):
+        self.capacity = capacity
+        self.shm = shared_memory.SharedMemory(create=True, size=HEADER_SIZE + capacity * RECORD.size)
+        HEADER.pack_into(self.shm.buf, 0, MAGIC, capacity, 0)
+        self.read_count = 0
+        self.session = PerformanceHistory()
+    
+    @property
+    def name(self) -> str:
+        """Segment name handed to the game"""
+        return self.shm.name
+    
+    def drain(self) -> List[Sample]:
+        """Read every frame published since the last drain"""
+        buf = self.shm.buf
+        write_count = SEQUENCE.unpack_from(buf, COUNT_OFFSET)[0]
+        
+        # The game lapped the ring: the oldest unread frames are gone
+        if write_count - self.read_count > self.capacity:
+            self.session.dropped += write_count - self.capacity - self.read_count
+            self.read_count = write_count - self.capacity
+        
+        samples = []
+        for sequence in range(self.read_count + 1, write_count + 1):
+            offset = HEADER_SIZE + ((sequence - 1) % self.capacity) * RECORD.size
+            written, frame_ms, entities, score = RECORD.unpack_from(buf, offset)
+            # Seqlock check: skip a slot the game was overwriting while we read it
+            if written != sequence or SEQUENCE.unpack_from(buf, offset)[0] != sequence:
+                self.session.dropped += 1
+                continue
+            samples.append((frame_ms, entities, score))
+        
+        self.read_count = write_count
+        return samples
+    
+    def close(self):
+        """Release and remove the segment"""
+        self.shm.close()
+        self.shm.unlink()
+
+class TelemetryMonitor:
+    """Launcher side: one ring per running game, aggregated into per-game histories"""
+    
+    def __init__(self, capacity: int = RING_CAPACITY):
+        self.capacity = capacity
+        self.channels: Dict[str, TelemetryChannel] = {}
+        self.histories: Dict[str, PerformanceHistory] = {}
+    
+    def begin(self, game_name: str) -> Dict[str, str]:
+        """Create a ring for a launch and return the environment the child needs"""
+        self.end(game_name)
+        channel = TelemetryChannel(self.capacity)
+        self.channels[game_name] = channel
+        return {TELEMETRY_ENV: channel.name}
+    
+    def poll(self):
+        """Drain all running games; cheap enough to call every frame"""
+        for game_name, channel in self.channels.items():
+            self._collect(game_name, channel)
+    
+    def _collect(self, game_name: str, channel: TelemetryChannel):
+        """Move one ring's new samples into its session and game histories"""
+        samples = channel.drain()
+        if samples:
+            channel.session.add_samples(samples)
+            self.histories.setdefault(game_name, PerformanceHistory()).add_samples(samples)
+    
+    def end(self, game_name: str) -> Optional[PerformanceHistory]:
+        """Final drain once the game exits; returns that session's stats"""
+        channel = self.channels.pop(game_name, None)
+        if channel is None:
+            return None
+        self._collect(game_name, channel)
+        channel.close()
+        return channel.session
+    
+    def close(self):
+        """Remove every ring"""
+        for game_name in list(self.channels):
+            self.end(game_name)
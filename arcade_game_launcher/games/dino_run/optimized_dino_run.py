@@ -6,17 +6,25 @@ Ultra-smooth performance with proper game speed control
 
 import pygame
 import sys
+import os
 import random
 import math
 
-# Initialize Pygame with optimizations
+# Add the launcher directory to the path for the telemetry and timestep libraries
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from config_service import load_config, mixer_settings
+from game_telemetry import connect_telemetry
+from fixed_timestep import FixedTimestep, lerp, render_fps
+
+# Initialize Pygame with optimizations; mixer settings must be set before init to take effect
+pygame.mixer.pre_init(**mixer_settings(load_config()))
 pygame.init()
-pygame.mixer.pre_init(frequency=22050, size=-16, channels=2, buffer=256)
 
 # Optimized Constants
 WINDOW_WIDTH = 800
 WINDOW_HEIGHT = 400
-TARGET_FPS = 60
+TARGET_FPS = render_fps(60)  # Render cap only; the simulation always steps at 60 Hz
 GROUND_HEIGHT = 50
 
 # Colors
@@ -41,6 +49,7 @@ class OptimizedDino:
         self.is_jumping = False
         self.is_ducking = False
         self.ground_y = WINDOW_HEIGHT - GROUND_HEIGHT - 40
+        self.prev_y = self.y
         
         # Animation
         self.run_frame = 0
@@ -55,17 +64,19 @@ class OptimizedDino:
         self.is_ducking = ducking
         if ducking:
             self.height = 20
-            self.y = self.ground_y + 20
+            self.y = self.prev_y = self.ground_y + 20
         else:
             self.height = 40
             if not self.is_jumping:
-                self.y = self.ground_y
+                self.y = self.prev_y = self.ground_y
     
     def update(self, dt):
+        self.prev_y = self.y
+        
         # Physics with delta time
         if self.is_jumping:
-            self.vel_y += self.gravity
-            self.y += self.vel_y
+            self.vel_y += self.gravity * dt * 60
+            self.y += self.vel_y * dt * 60
             
             if self.y >= self.ground_y:
                 self.y = self.ground_y
@@ -77,26 +88,28 @@ class OptimizedDino:
         if self.run_frame >= 4:
             self.run_frame = 0
     
-    def draw(self, screen):
+    def draw(self, screen, alpha=1.0):
+        y = lerp(self.prev_y, self.y, alpha)
+        
         # Draw dino body
         color = GREEN
         if self.is_ducking:
             # Ducking pose
-            pygame.draw.ellipse(screen, color, (self.x, self.y + 10, self.width, self.height))
+            pygame.draw.ellipse(screen, color, (self.x, y + 10, self.width, self.height))
         else:
             # Standing/jumping pose
-            pygame.draw.rect(screen, color, (self.x, self.y, self.width, self.height))
+            pygame.draw.rect(screen, color, (self.x, y, self.width, self.height))
         
         # Draw eye
         eye_x = self.x + self.width - 8
-        eye_y = self.y + 5 if not self.is_ducking else self.y + 15
+        eye_y = y + 5 if not self.is_ducking else y + 15
         pygame.draw.circle(screen, BLACK, (eye_x, eye_y), 3)
         
         # Draw legs (animated)
         if not self.is_ducking and not self.is_jumping:
             leg_offset = int(self.run_frame) % 2 * 4
-            pygame.draw.rect(screen, color, (self.x + 5 + leg_offset, self.y + self.height, 6, 8))
-            pygame.draw.rect(screen, color, (self.x + 15 - leg_offset, self.y + self.height, 6, 8))
+            pygame.draw.rect(screen, color, (self.x + 5 + leg_offset, y + self.height, 6, 8))
+            pygame.draw.rect(screen, color, (self.x + 15 - leg_offset, y + self.height, 6, 8))
     
     def get_rect(self):
         return pygame.Rect(self.x, self.y, self.width, self.height)
@@ -105,6 +118,7 @@ class OptimizedObstacle:
     """Optimized obstacle with smooth movement"""
     def __init__(self, x, obstacle_type="cactus"):
         self.x = x
+        self.prev_x = x
         self.type = obstacle_type
         self.speed = 6
         
@@ -126,27 +140,29 @@ class OptimizedObstacle:
             self.color = GRAY
     
     def update(self, dt, game_speed):
+        self.prev_x = self.x
         self.x -= self.speed * game_speed * dt * 60
         
         if self.type == "bird":
             self.flap_frame += 0.3 * dt * 60
     
-    def draw(self, screen):
+    def draw(self, screen, alpha=1.0):
+        x = lerp(self.prev_x, self.x, alpha)
         if self.type == "cactus":
             # Draw cactus
-            pygame.draw.rect(screen, self.color, (self.x, self.y, self.width, self.height))
+            pygame.draw.rect(screen, self.color, (x, self.y, self.width, self.height))
             # Cactus arms
-            pygame.draw.rect(screen, self.color, (self.x - 8, self.y + 10, 8, 15))
-            pygame.draw.rect(screen, self.color, (self.x + self.width, self.y + 15, 8, 10))
+            pygame.draw.rect(screen, self.color, (x - 8, self.y + 10, 8, 15))
+            pygame.draw.rect(screen, self.color, (x + self.width, self.y + 15, 8, 10))
         elif self.type == "bird":
             # Draw bird with flapping animation
             wing_offset = int(self.flap_frame) % 2 * 3
-            pygame.draw.ellipse(screen, self.color, (self.x, self.y - wing_offset, self.width, self.height))
+            pygame.draw.ellipse(screen, self.color, (x, self.y - wing_offset, self.width, self.height))
             # Wings
-            pygame.draw.ellipse(screen, self.color, (self.x - 5, self.y - wing_offset - 2, 10, 5))
-            pygame.draw.ellipse(screen, self.color, (self.x + self.width - 5, self.y - wing_offset - 2, 10, 5))
+            pygame.draw.ellipse(screen, self.color, (x - 5, self.y - wing_offset - 2, 10, 5))
+            pygame.draw.ellipse(screen, self.color, (x + self.width - 5, self.y - wing_offset - 2, 10, 5))
         else:  # rock
-            pygame.draw.ellipse(screen, self.color, (self.x, self.y, self.width, self.height))
+            pygame.draw.ellipse(screen, self.color, (x, self.y, self.width, self.height))
     
     def get_rect(self):
         return pygame.Rect(self.x, self.y, self.width, self.height)
@@ -158,17 +174,20 @@ class OptimizedCloud:
     """Optimized background cloud"""
     def __init__(self, x, y):
         self.x = x
+        self.prev_x = x
         self.y = y
         self.speed = 1
         self.size = random.randint(30, 60)
     
     def update(self, dt, game_speed):
+        self.prev_x = self.x
         self.x -= self.speed * game_speed * dt * 60
     
-    def draw(self, screen):
-        pygame.draw.circle(screen, WHITE, (int(self.x), int(self.y)), self.size // 2)
-        pygame.draw.circle(screen, WHITE, (int(self.x + self.size // 3), int(self.y)), self.size // 3)
-        pygame.draw.circle(screen, WHITE, (int(self.x - self.size // 3), int(self.y)), self.size // 3)
+    def draw(self, screen, alpha=1.0):
+        x = lerp(self.prev_x, self.x, alpha)
+        pygame.draw.circle(screen, WHITE, (int(x), int(self.y)), self.size // 2)
+        pygame.draw.circle(screen, WHITE, (int(x + self.size // 3), int(self.y)), self.size // 3)
+        pygame.draw.circle(screen, WHITE, (int(x - self.size // 3), int(self.y)), self.size // 3)
     
     def is_off_screen(self):
         return self.x + self.size < 0
@@ -193,10 +212,14 @@ class OptimizedDinoGame:
         self.running = True
         self.game_over = False
         
-        # Timers
+        # Timers, counted in 60 Hz ticks
         self.obstacle_timer = 0
         self.cloud_timer = 0
         self.speed_increase_timer = 0
+        self.timestep = FixedTimestep()
+        
+        # Frame stats for the launcher (None when run standalone)
+        self.telemetry = connect_telemetry()
         
         # Fonts
         self.font = pygame.font.Font(None, 36)
@@ -272,12 +295,13 @@ class OptimizedDinoGame:
             return
         
         # Update timers
-        self.obstacle_timer -= 1
-        self.cloud_timer -= 1
-        self.speed_increase_timer += 1
+        ticks = dt * 60
+        self.obstacle_timer -= ticks
+        self.cloud_timer -= ticks
+        self.speed_increase_timer += ticks
         
         # Increase game speed gradually
-        if self.speed_increase_timer >= 300:  # Every 5 seconds at 60 FPS
+        if self.speed_increase_timer >= 300:  # Every 5 seconds
             self.game_speed += 0.1
             self.speed_increase_timer = 0
         
@@ -371,22 +395,22 @@ class OptimizedDinoGame:
         self.obstacle_timer = 0
         self.speed_increase_timer = 0
     
-    def draw(self):
+    def draw(self, alpha=1.0):
         # Clear screen with sky color
         self.screen.fill((135, 206, 235))  # Sky blue
         
         # Draw clouds
         for cloud in self.clouds:
-            cloud.draw(self.screen)
+            cloud.draw(self.screen, alpha)
         
         # Draw ground
         self.draw_ground()
         
-        # Draw game objects
-        self.dino.draw(self.screen)
+        # Draw game objects, interpolated between the last two simulation steps
+        self.dino.draw(self.screen, alpha)
         
         for obstacle in self.obstacles:
-            obstacle.draw(self.screen)
+            obstacle.draw(self.screen, alpha)
         
         # Draw UI
         self.draw_ui()
@@ -402,20 +426,15 @@ class OptimizedDinoGame:
         print("🎮 Ultra-smooth performance with proper game speed!")
         print("🎯 Space/↑: Jump, ↓/S: Duck, ESC: Exit")
         
-        last_time = pygame.time.get_ticks()
-        
         while self.running:
-            # Calculate delta time for smooth gameplay
-            current_time = pygame.time.get_ticks()
-            dt = (current_time - last_time) / 1000.0  # Convert to seconds
-            last_time = current_time
-            
-            # Cap delta time to prevent large jumps
-            dt = min(dt, 1/30)  # Max 30 FPS equivalent
-            
             self.handle_events()
-            self.update(dt)
-            self.draw()
+            
+            # Fixed 60 Hz simulation, however fast or slow frames are drawn
+            for _ in range(self.timestep.advance()):
+                self.update(self.timestep.step)
+            self.draw(self.timestep.alpha)
+            if self.telemetry:
+                self.telemetry.publish(len(self.obstacles) + len(self.clouds), self.score)
             self.clock.tick(TARGET_FPS)
         
         pygame.quit()
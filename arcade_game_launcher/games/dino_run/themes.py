@@ -4,6 +4,8 @@ Handles different visual themes for the game
 """
 
 import pygame
+from glow_atlas import glow_atlas
+from starfield import StarLayer, Starfield
 from games.dino_run.settings import *
 
 class Theme:
@@ -114,6 +116,11 @@ class ThemeManager:
         }
         self.current_theme = self.themes['light']
         
+        # Night sky over the top half of the screen, drifting slowly against the run
+        self.starfield = Starfield((SCREEN_WIDTH, SCREEN_HEIGHT // 2),
+                                   layers=(StarLayer(70, 4.0, 1, (120, 190)), StarLayer(30, 10.0, 1, (170, 230))),
+                                   direction=(-1.0, 0.0), seed=42, twinkle=0.5)
+    
     def set_theme(self, theme_name):
         """Set the current theme"""
         if theme_name.lower() in self.themes:
@@ -153,21 +160,8 @@ class ThemeManager:
             
     def draw_stars(self, screen):
         """Draw starfield for dark theme"""
-        import random
-        import math
-        
-        # Static stars (pseudo-random but consistent)
-        random.seed(42)  # Fixed seed for consistent star positions
-        
-        for i in range(100):
-            x = random.randint(0, SCREEN_WIDTH)
-            y = random.randint(0, SCREEN_HEIGHT // 2)
-            
-            # Twinkling effect
-            brightness = 150 + int(50 * math.sin(pygame.time.get_ticks() * 0.001 + i))
-            color = (brightness, brightness, brightness)
-            
-            pygame.draw.circle(screen, color, (x, y), 1)
+        # Baked once with its own seeded RNG, so the game's random stream is left alone
+        self.starfield.draw(screen)
             
     def draw_grid(self, screen):
         """Draw grid for neon theme"""
@@ -182,6 +176,20 @@ class ThemeManager:
         for y in range(0, SCREEN_HEIGHT, grid_size):
             pygame.draw.line(screen, grid_color, (0, y), (SCREEN_WIDTH, y), 1)
             
+    def create_glow_surface(self, size, glow_color):
+        """Halo for a sprite of the given size"""
+        glow_surface = pygame.Surface((size[0] + 10, size[1] + 10), pygame.SRCALPHA)
+        
+        # Draw multiple layers for glow
+        for i in range(3):
+            alpha = 50 - (i * 15)
+            glow_layer = pygame.Surface(size, pygame.SRCALPHA)
+            glow_layer.fill((*glow_color, alpha))
+            
+            offset = i + 1
+            glow_surface.blit(glow_layer, (offset, offset))
+        return glow_surface
+    
     def apply_glow_effect(self, screen, surface, pos, glow_color=None):
         """Apply glow effect to a surface"""
         if not self.has_effect('glow'):
@@ -191,18 +199,12 @@ class ThemeManager:
         if glow_color is None:
             glow_color = self.get_color('ui_primary')
             
-        # Create glow effect
-        glow_surface = pygame.Surface((surface.get_width() + 10, surface.get_height() + 10), pygame.SRCALPHA)
+        # Sprites keep their size, so the halo is built once per size and color
+        size = surface.get_size()
+        glow_color = tuple(glow_color[:3])
+        glow_surface = glow_atlas.layer(("sprite_glow", size, glow_color),
+                                        lambda: self.create_glow_surface(size, glow_color))
         
-        # Draw multiple layers for glow
-        for i in range(3):
-            alpha = 50 - (i * 15)
-            glow_layer = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
-            glow_layer.fill((*glow_color, alpha))
-            
-            offset = i + 1
-            glow_surface.blit(glow_layer, (offset, offset))
-            
         # Draw glow then original surface
         screen.blit(glow_surface, (pos[0] - 5, pos[1] - 5))
         screen.blit(surface, pos)
@@ -6,6 +6,13 @@ Helper functions for collision detection, math, and other utilities
 import pygame
 import math
 import random
+import sys
+import os
+
+# Add the launcher directory to the path for the shared background layers
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from background_layers import create_gradient
 
 def check_collision(rect1, rect2):
     """
@@ -142,26 +149,7 @@ def save_high_score(score):
 
 def create_gradient_surface(width, height, start_color, end_color, vertical=True):
     """Create a gradient surface"""
-    surface = pygame.Surface((width, height))
-    
-    if vertical:
-        for y in range(height):
-            ratio = y / height
-            color = [
-                int(start_color[i] + (end_color[i] - start_color[i]) * ratio)
-                for i in range(3)
-            ]
-            pygame.draw.line(surface, color, (0, y), (width, y))
-    else:
-        for x in range(width):
-            ratio = x / width
-            color = [
-                int(start_color[i] + (end_color[i] - start_color[i]) * ratio)
-                for i in range(3)
-            ]
-            pygame.draw.line(surface, color, (x, 0), (x, height))
-            
-    return surface
+    return create_gradient((width, height), start_color, end_color, vertical)
 
 def shake_screen(intensity, duration):
     """Generate screen shake offset values"""
@@ -6,16 +6,26 @@ Epic space shooter with aliens and power-ups!
 
 import pygame
 import sys
+import os
 import random
 import math
 
-# Initialize Pygame
+# Add the launcher directory to the path for the telemetry and timestep libraries
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from config_service import load_config, mixer_settings
+from game_telemetry import connect_telemetry
+from fixed_timestep import FixedTimestep, lerp, render_fps
+from starfield import Starfield
+
+# Initialize Pygame; mixer settings must be set before init to take effect
+pygame.mixer.pre_init(**mixer_settings(load_config()))
 pygame.init()
 
 # Constants
 WINDOW_WIDTH = 800
 WINDOW_HEIGHT = 600
-FPS = 60
+FPS = render_fps(60)  # Render cap only; update() always runs 60 times a second
 
 # Colors
 BLACK = (0, 0, 0)
@@ -31,6 +41,8 @@ class Player:
     def __init__(self):
         self.x = WINDOW_WIDTH // 2
         self.y = WINDOW_HEIGHT - 60
+        self.prev_x = self.x
+        self.prev_y = self.y
         self.width = 40
         self.height = 30
         self.speed = 5
@@ -38,6 +50,8 @@ class Player:
         self.max_health = 100
         
     def update(self):
+        self.prev_x = self.x
+        self.prev_y = self.y
         keys = pygame.key.get_pressed()
         if keys[pygame.K_LEFT] and self.x > 0:
             self.x -= self.speed
@@ -48,22 +62,25 @@ class Player:
         if keys[pygame.K_DOWN] and self.y < WINDOW_HEIGHT - self.height:
             self.y += self.speed
     
-    def draw(self, screen):
+    def draw(self, screen, alpha=1.0):
+        x = lerp(self.prev_x, self.x, alpha)
+        y = lerp(self.prev_y, self.y, alpha)
+        
         # Draw player ship
         points = [
-            (self.x + self.width // 2, self.y),
-            (self.x, self.y + self.height),
-            (self.x + self.width // 4, self.y + self.height - 5),
-            (self.x + 3 * self.width // 4, self.y + self.height - 5),
-            (self.x + self.width, self.y + self.height)
+            (x + self.width // 2, y),
+            (x, y + self.height),
+            (x + self.width // 4, y + self.height - 5),
+            (x + 3 * self.width // 4, y + self.height - 5),
+            (x + self.width, y + self.height)
         ]
         pygame.draw.polygon(screen, CYAN, points)
         
         # Draw health bar
         health_width = 60
         health_height = 8
-        health_x = self.x + (self.width - health_width) // 2
-        health_y = self.y - 15
+        health_x = x + (self.width - health_width) // 2
+        health_y = y - 15
         
         pygame.draw.rect(screen, RED, (health_x, health_y, health_width, health_height))
         health_fill = int((self.health / self.max_health) * health_width)
@@ -73,16 +90,19 @@ class Bullet:
     def __init__(self, x, y, direction=1):
         self.x = x
         self.y = y
+        self.prev_y = y
         self.width = 4
         self.height = 10
         self.speed = 8 * direction
         self.color = YELLOW if direction > 0 else RED
         
     def update(self):
+        self.prev_y = self.y
         self.y -= self.speed
         
-    def draw(self, screen):
-        pygame.draw.rect(screen, self.color, (self.x, self.y, self.width, self.height))
+    def draw(self, screen, alpha=1.0):
+        y = lerp(self.prev_y, self.y, alpha)
+        pygame.draw.rect(screen, self.color, (self.x, y, self.width, self.height))
         
     def is_off_screen(self):
         return self.y < -self.height or self.y > WINDOW_HEIGHT
@@ -91,6 +111,7 @@ class Enemy:
     def __init__(self):
         self.x = random.randint(0, WINDOW_WIDTH - 30)
         self.y = random.randint(-100, -30)
+        self.prev_y = self.y
         self.width = 30
         self.height = 25
         self.speed = random.uniform(1, 3)
@@ -98,17 +119,20 @@ class Enemy:
         self.shoot_timer = random.randint(60, 180)
         
     def update(self):
+        self.prev_y = self.y
         self.y += self.speed
         self.shoot_timer -= 1
         
-    def draw(self, screen):
+    def draw(self, screen, alpha=1.0):
+        y = lerp(self.prev_y, self.y, alpha)
+        
         # Draw enemy ship
         points = [
-            (self.x + self.width // 2, self.y + self.height),
-            (self.x, self.y),
-            (self.x + self.width // 4, self.y + 5),
-            (self.x + 3 * self.width // 4, self.y + 5),
-            (self.x + self.width, self.y)
+            (self.x + self.width // 2, y + self.height),
+            (self.x, y),
+            (self.x + self.width // 4, y + 5),
+            (self.x + 3 * self.width // 4, y + 5),
+            (self.x + self.width, y)
         ]
         pygame.draw.polygon(screen, RED, points)
         
@@ -125,6 +149,7 @@ class PowerUp:
     def __init__(self):
         self.x = random.randint(20, WINDOW_WIDTH - 20)
         self.y = random.randint(-50, -20)
+        self.prev_y = self.y
         self.width = 20
         self.height = 20
         self.speed = 2
@@ -132,15 +157,17 @@ class PowerUp:
         self.color = GREEN if self.type == 'health' else ORANGE
         
     def update(self):
+        self.prev_y = self.y
         self.y += self.speed
         
-    def draw(self, screen):
-        pygame.draw.circle(screen, self.color, (self.x + self.width // 2, self.y + self.height // 2), self.width // 2)
+    def draw(self, screen, alpha=1.0):
+        y = lerp(self.prev_y, self.y, alpha)
+        pygame.draw.circle(screen, self.color, (self.x + self.width // 2, y + self.height // 2), self.width // 2)
         if self.type == 'health':
-            pygame.draw.rect(screen, WHITE, (self.x + 8, self.y + 6, 4, 8))
-            pygame.draw.rect(screen, WHITE, (self.x + 6, self.y + 8, 8, 4))
+            pygame.draw.rect(screen, WHITE, (self.x + 8, y + 6, 4, 8))
+            pygame.draw.rect(screen, WHITE, (self.x + 6, y + 8, 8, 4))
         else:
-            pygame.draw.circle(screen, WHITE, (self.x + self.width // 2, self.y + self.height // 2), 3)
+            pygame.draw.circle(screen, WHITE, (self.x + self.width // 2, y + self.height // 2), 3)
             
     def is_off_screen(self):
         return self.y > WINDOW_HEIGHT
@@ -165,11 +192,18 @@ class FighterShootGame:
         self.powerup_spawn_timer = 0
         self.rapid_fire_timer = 0
         self.shoot_cooldown = 0
+        self.timestep = FixedTimestep()
+        
+        # Three parallax layers scrolling down past the ship
+        self.starfield = Starfield((WINDOW_WIDTH, WINDOW_HEIGHT))
         
         # Font
         self.font = pygame.font.Font(None, 36)
         self.small_font = pygame.font.Font(None, 24)
         
+        # Frame stats for the launcher (None when run standalone)
+        self.telemetry = connect_telemetry()
+    
     def handle_events(self):
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
@@ -259,6 +293,7 @@ class FighterShootGame:
                     self.rapid_fire_timer = 300
     
     def update(self):
+        """One 60 Hz simulation tick; every timer below counts these ticks"""
         # Update timers
         self.enemy_spawn_timer -= 1
         self.powerup_spawn_timer -= 1
@@ -305,29 +340,26 @@ class FighterShootGame:
         if self.score > 0 and self.score % 100 == 0:
             self.level = self.score // 100 + 1
     
-    def draw(self):
+    def draw(self, alpha=1.0):
         self.screen.fill(BLACK)
         
         # Draw stars background
-        for i in range(50):
-            x = random.randint(0, WINDOW_WIDTH)
-            y = random.randint(0, WINDOW_HEIGHT)
-            pygame.draw.circle(self.screen, WHITE, (x, y), 1)
+        self.starfield.draw(self.screen)
         
-        # Draw game objects
-        self.player.draw(self.screen)
+        # Draw game objects, interpolated between the last two simulation ticks
+        self.player.draw(self.screen, alpha)
         
         for bullet in self.bullets:
-            bullet.draw(self.screen)
+            bullet.draw(self.screen, alpha)
             
         for bullet in self.enemy_bullets:
-            bullet.draw(self.screen)
+            bullet.draw(self.screen, alpha)
         
         for enemy in self.enemies:
-            enemy.draw(self.screen)
+            enemy.draw(self.screen, alpha)
             
         for powerup in self.powerups:
-            powerup.draw(self.screen)
+            powerup.draw(self.screen, alpha)
         
         # Draw UI
         score_text = self.font.render(f"Score: {self.score}", True, WHITE)
@@ -360,8 +392,14 @@ class FighterShootGame:
         running = True
         while running and self.player.health > 0:
             running = self.handle_events()
-            self.update()
-            self.draw()
+            
+            # Fixed 60 Hz simulation, however fast or slow frames are drawn
+            for _ in range(self.timestep.advance()):
+                self.update()
+            self.draw(self.timestep.alpha)
+            if self.telemetry:
+                entities = len(self.bullets) + len(self.enemy_bullets) + len(self.enemies) + len(self.powerups)
+                self.telemetry.publish(entities, self.score)
             self.clock.tick(FPS)
         
         # Game over screen
@@ -6,8 +6,15 @@ Additional effects and utilities for enhanced graphics
 import pygame
 import math
 import random
+import sys
+import os
 from typing import List, Tuple
 
+# Add the launcher directory to the path for the shared glow textures
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from glow_atlas import create_glow
+
 class AdvancedEffects:
     """Collection of advanced visual effects"""
     
@@ -18,16 +25,9 @@ class AdvancedEffects:
         center_x, center_y = size[0] // 2, size[1] // 2
         max_radius = min(center_x, center_y)
         
-        for radius in range(max_radius, 0, -1):
-            alpha = int(255 * (1 - radius / max_radius) * intensity)
-            glow_color = (*color, alpha)
-            
-            # Create temporary surface for alpha blending
-            temp_surf = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
-            pygame.draw.circle(temp_surf, glow_color, (radius, radius), radius)
-            
-            # Blit to main surface
-            surface.blit(temp_surf, (center_x - radius, center_y - radius))
+        # One NumPy-built falloff instead of a temporary surface per radius
+        if max_radius > 0:
+            surface.blit(create_glow(max_radius, color, intensity), (center_x - max_radius, center_y - max_radius))
         
         return surface
     
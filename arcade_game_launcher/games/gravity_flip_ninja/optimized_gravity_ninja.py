@@ -6,17 +6,31 @@ Ultra-smooth performance with proper physics and game speed
 
 import pygame
 import sys
+import os
 import random
 import math
+import time
 
-# Initialize Pygame with optimizations
+# Add the launcher directory to the path for the shared telemetry, timing and quality modules
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from background_layers import background_layers
+from config_service import ConfigService, load_config, mixer_settings
+from game_telemetry import connect_telemetry
+from particle_engine import ParticleEngine, stamp_cache
+from fixed_timestep import FixedTimestep, lerp, render_fps
+from performance_optimizer import calibrated_level
+from quality_governor import QualityGovernor
+from starfield import StarLayer, Starfield
+
+# Initialize Pygame with optimizations; mixer settings must be set before init to take effect
+pygame.mixer.pre_init(**mixer_settings(load_config()))
 pygame.init()
-pygame.mixer.pre_init(frequency=22050, size=-16, channels=2, buffer=256)
 
 # Optimized Constants
 WINDOW_WIDTH = 800
 WINDOW_HEIGHT = 600
-TARGET_FPS = 60
+TARGET_FPS = render_fps(60)  # Render cap only; the simulation always steps at 60 Hz
 
 # Colors
 BLACK = (0, 0, 0)
@@ -34,6 +48,8 @@ class OptimizedNinja:
     def __init__(self):
         self.x = 100
         self.y = WINDOW_HEIGHT // 2
+        self.prev_x = self.x
+        self.prev_y = self.y
         self.width = 20
         self.height = 30
         self.vel_x = 0
@@ -58,8 +74,11 @@ class OptimizedNinja:
             self.vel_y *= 0.5  # Reduce velocity on flip for smoother transition
     
     def update(self, dt):
+        self.prev_x = self.x
+        self.prev_y = self.y
+        
         # Update cooldown
-        self.flip_cooldown = max(0, self.flip_cooldown - 1)
+        self.flip_cooldown = max(0, self.flip_cooldown - dt * 60)
         
         # Smooth rotation
         rotation_diff = self.target_rotation - self.rotation
@@ -106,18 +125,15 @@ class OptimizedNinja:
         if len(self.trail) > self.max_trail_length:
             self.trail.pop(0)
     
-    def draw(self, screen):
-        # Draw trail
-        for i, (trail_x, trail_y) in enumerate(self.trail):
-            alpha = int(255 * (i / len(self.trail)))
-            trail_color = (*BLUE, alpha)
-            trail_surface = pygame.Surface((6, 6), pygame.SRCALPHA)
-            trail_surface.fill(trail_color)
-            screen.blit(trail_surface, (trail_x - 3, trail_y - 3))
+    def draw(self, screen, alpha=1.0):
+        # Draw trail from shared pre-rendered stamps
+        trail_length = len(self.trail)
+        screen.blits([(stamp_cache.stamp("square", 3, BLUE, 255 * i / trail_length), (trail_x - 3, trail_y - 3))
+                      for i, (trail_x, trail_y) in enumerate(self.trail)], doreturn=False)
         
         # Draw ninja body
-        center_x = self.x + self.width // 2
-        center_y = self.y + self.height // 2
+        center_x = lerp(self.prev_x, self.x, alpha) + self.width // 2
+        center_y = lerp(self.prev_y, self.y, alpha) + self.height // 2
         
         # Create ninja surface for rotation
         ninja_surface = pygame.Surface((self.width + 10, self.height + 10), pygame.SRCALPHA)
@@ -152,6 +168,8 @@ class OptimizedObstacle:
     def __init__(self, x, y, width, height, obstacle_type="static"):
         self.x = x
         self.y = y
+        self.prev_x = x
+        self.prev_y = y
         self.width = width
         self.height = height
         self.type = obstacle_type
@@ -167,6 +185,8 @@ class OptimizedObstacle:
             self.color = GRAY
     
     def update(self, dt, game_speed):
+        self.prev_x = self.x
+        self.prev_y = self.y
         self.x -= self.speed * game_speed * dt * 60
         
         if self.type == "moving":
@@ -174,21 +194,23 @@ class OptimizedObstacle:
             self.time_offset += 2 * dt * 60
             self.y = self.original_y + math.sin(self.time_offset / 30) * 50
     
-    def draw(self, screen):
+    def draw(self, screen, alpha=1.0):
+        x = lerp(self.prev_x, self.x, alpha)
+        y = lerp(self.prev_y, self.y, alpha)
         if self.type == "spike":
             # Draw spikes
             points = [
-                (self.x, self.y + self.height),
-                (self.x + self.width // 2, self.y),
-                (self.x + self.width, self.y + self.height)
+                (x, y + self.height),
+                (x + self.width // 2, y),
+                (x + self.width, y + self.height)
             ]
             pygame.draw.polygon(screen, self.color, points)
         else:
-            pygame.draw.rect(screen, self.color, (self.x, self.y, self.width, self.height))
+            pygame.draw.rect(screen, self.color, (x, y, self.width, self.height))
             
             # Add some detail
             if self.type == "moving":
-                pygame.draw.rect(screen, WHITE, (self.x + 5, self.y + 5, self.width - 10, self.height - 10), 2)
+                pygame.draw.rect(screen, WHITE, (x + 5, y + 5, self.width - 10, self.height - 10), 2)
     
     def get_rect(self):
         return pygame.Rect(self.x, self.y, self.width, self.height)
@@ -196,34 +218,6 @@ class OptimizedObstacle:
     def is_off_screen(self):
         return self.x + self.width < 0
 
-class OptimizedParticle:
-    """Optimized particle system"""
-    def __init__(self, x, y, color):
-        self.x = x
-        self.y = y
-        self.vel_x = random.uniform(-3, 3)
-        self.vel_y = random.uniform(-3, 3)
-        self.color = color
-        self.life = 30
-        self.max_life = 30
-    
-    def update(self, dt):
-        self.x += self.vel_x * dt * 60
-        self.y += self.vel_y * dt * 60
-        self.life -= 1
-        self.vel_x *= 0.98
-        self.vel_y *= 0.98
-    
-    def draw(self, screen):
-        alpha = int(255 * (self.life / self.max_life))
-        particle_color = (*self.color, alpha)
-        particle_surface = pygame.Surface((4, 4), pygame.SRCALPHA)
-        particle_surface.fill(particle_color)
-        screen.blit(particle_surface, (self.x, self.y))
-    
-    def is_dead(self):
-        return self.life <= 0
-
 class OptimizedGravityNinja:
     """Ultra-optimized Gravity Ninja game"""
     
@@ -235,7 +229,7 @@ class OptimizedGravityNinja:
         # Game objects
         self.ninja = OptimizedNinja()
         self.obstacles = []
-        self.particles = []
+        self.particles = ParticleEngine(shape="square", drag=0.98)
         
         # Game state
         self.score = 0
@@ -245,17 +239,41 @@ class OptimizedGravityNinja:
         self.game_over = False
         self.level = 1
         
-        # Timers
+        # Timers, counted in 60 Hz ticks
         self.obstacle_timer = 0
         self.speed_increase_timer = 0
         self.particle_timer = 0
+        self.timestep = FixedTimestep()
         
         # Fonts
         self.font = pygame.font.Font(None, 36)
         self.small_font = pygame.font.Font(None, 24)
         
         # Background stars
-        self.stars = [(random.randint(0, WINDOW_WIDTH), random.randint(0, WINDOW_HEIGHT)) for _ in range(50)]
+        self.starfield = Starfield((WINDOW_WIDTH, WINDOW_HEIGHT), layers=(StarLayer(50, 0.0, 1, (255, 255)),),
+                                   seed=random.getrandbits(32), twinkle=0.0)
+        
+        # Frame stats for the launcher (None when run standalone)
+        self.telemetry = connect_telemetry()
+        
+        # Effects the quality governor drops when frames run over budget
+        self.render_fps = TARGET_FPS
+        self.show_particles = True
+        self.gradient_background = True
+        self.particles_allowed = True  # graphics.particle_effects in performance_config.json
+        self.governor = QualityGovernor(TARGET_FPS, initial_level=calibrated_level("game"))
+        self.governor.subscribe(self.apply_quality)
+        self.config = ConfigService()
+        self.config.subscribe(self.apply_config)
+    
+    def apply_quality(self, level):
+        self.render_fps = self.governor.target_fps
+        self.show_particles = level.particles and self.particles_allowed
+        self.gradient_background = level.gradient_background
+    
+    def apply_config(self, config):
+        self.particles_allowed = bool(config.get("graphics.particle_effects", True))
+        self.apply_quality(self.governor.level)
     
     def load_high_score(self):
         try:
@@ -282,13 +300,9 @@ class OptimizedGravityNinja:
                     else:
                         self.ninja.flip_gravity()
                         # Add flip particles
-                        for _ in range(5):
-                            particle = OptimizedParticle(
-                                self.ninja.x + self.ninja.width // 2,
-                                self.ninja.y + self.ninja.height // 2,
-                                ORANGE
-                            )
-                            self.particles.append(particle)
+                        self.particles.burst(5 if self.show_particles else 0,
+                                             self.ninja.x + self.ninja.width // 2,
+                                             self.ninja.y + self.ninja.height // 2, 3, ORANGE)
                 elif event.key == pygame.K_ESCAPE:
                     self.running = False
     
@@ -325,31 +339,24 @@ class OptimizedGravityNinja:
                     self.save_high_score()
                 
                 # Add explosion particles
-                for _ in range(20):
-                    particle = OptimizedParticle(
-                        self.ninja.x + self.ninja.width // 2,
-                        self.ninja.y + self.ninja.height // 2,
-                        RED
-                    )
-                    self.particles.append(particle)
+                self.particles.burst(20, self.ninja.x + self.ninja.width // 2,
+                                     self.ninja.y + self.ninja.height // 2, 3, RED)
                 break
     
     def update(self, dt):
         if self.game_over:
             # Update particles even when game over
-            for particle in self.particles[:]:
-                particle.update(dt)
-                if particle.is_dead():
-                    self.particles.remove(particle)
+            self.particles.update(dt * 60)
             return
         
         # Update timers
-        self.obstacle_timer -= 1
-        self.speed_increase_timer += 1
-        self.particle_timer += 1
+        ticks = dt * 60
+        self.obstacle_timer -= ticks
+        self.speed_increase_timer += ticks
+        self.particle_timer += ticks
         
         # Increase difficulty
-        if self.speed_increase_timer >= 600:  # Every 10 seconds at 60 FPS
+        if self.speed_increase_timer >= 600:  # Every 10 seconds
             self.game_speed += 0.1
             self.level += 1
             self.speed_increase_timer = 0
@@ -367,21 +374,13 @@ class OptimizedGravityNinja:
                 self.obstacles.remove(obstacle)
         
         # Update particles
-        for particle in self.particles[:]:
-            particle.update(dt)
-            if particle.is_dead():
-                self.particles.remove(particle)
+        self.particles.update(dt * 60)
         
         # Add ambient particles
         if self.particle_timer >= 10:
-            if random.random() < 0.3:
-                particle = OptimizedParticle(
-                    WINDOW_WIDTH,
-                    random.randint(0, WINDOW_HEIGHT),
-                    random.choice([BLUE, PURPLE, GREEN])
-                )
-                particle.vel_x = -2
-                self.particles.append(particle)
+            if random.random() < 0.3 and self.show_particles:
+                self.particles.emit(WINDOW_WIDTH, random.randint(0, WINDOW_HEIGHT), -2, random.uniform(-3, 3),
+                                    random.choice([BLUE, PURPLE, GREEN]))
             self.particle_timer = 0
         
         # Spawn obstacles
@@ -391,17 +390,14 @@ class OptimizedGravityNinja:
         self.check_collisions()
     
     def draw_background(self):
-        # Gradient background
-        for y in range(WINDOW_HEIGHT):
-            color_ratio = y / WINDOW_HEIGHT
-            r = int(DARK_BLUE[0] * (1 - color_ratio) + BLACK[0] * color_ratio)
-            g = int(DARK_BLUE[1] * (1 - color_ratio) + BLACK[1] * color_ratio)
-            b = int(DARK_BLUE[2] * (1 - color_ratio) + BLACK[2] * color_ratio)
-            pygame.draw.line(self.screen, (r, g, b), (0, y), (WINDOW_WIDTH, y))
+        # Gradient background, or a flat fill when the quality governor drops it
+        if self.gradient_background:
+            self.screen.blit(background_layers.gradient(self.screen.get_size(), DARK_BLUE, BLACK), (0, 0))
+        else:
+            self.screen.fill(BLACK)
         
         # Draw stars
-        for star_x, star_y in self.stars:
-            pygame.draw.circle(self.screen, WHITE, (star_x, star_y), 1)
+        self.starfield.draw(self.screen)
     
     def draw_ui(self):
         # Score
@@ -462,7 +458,7 @@ class OptimizedGravityNinja:
     def restart_game(self):
         self.ninja = OptimizedNinja()
         self.obstacles = []
-        self.particles = []
+        self.particles.clear()
         self.score = 0
         self.game_speed = 1.0
         self.level = 1
@@ -470,20 +466,19 @@ class OptimizedGravityNinja:
         self.obstacle_timer = 0
         self.speed_increase_timer = 0
     
-    def draw(self):
+    def draw(self, alpha=1.0):
         # Draw background
         self.draw_background()
         
         # Draw particles
-        for particle in self.particles:
-            particle.draw(self.screen)
+        self.particles.draw(self.screen)
         
-        # Draw obstacles
+        # Draw obstacles, interpolated between the last two simulation steps
         for obstacle in self.obstacles:
-            obstacle.draw(self.screen)
+            obstacle.draw(self.screen, alpha)
         
         # Draw ninja
-        self.ninja.draw(self.screen)
+        self.ninja.draw(self.screen, alpha)
         
         # Draw UI
         self.draw_ui()
@@ -499,21 +494,19 @@ class OptimizedGravityNinja:
         print("🎮 Ultra-smooth performance with proper physics!")
         print("🎯 Space/↑: Flip Gravity, A/D: Move, ESC: Exit")
         
-        last_time = pygame.time.get_ticks()
-        
         while self.running:
-            # Calculate delta time for smooth gameplay
-            current_time = pygame.time.get_ticks()
-            dt = (current_time - last_time) / 1000.0  # Convert to seconds
-            last_time = current_time
-            
-            # Cap delta time to prevent large jumps
-            dt = min(dt, 1/30)  # Max 30 FPS equivalent
-            
+            frame_start = time.perf_counter()
             self.handle_events()
-            self.update(dt)
-            self.draw()
-            self.clock.tick(TARGET_FPS)
+            self.config.poll()
+            
+            # Fixed 60 Hz simulation, however fast or slow frames are drawn
+            for _ in range(self.timestep.advance()):
+                self.update(self.timestep.step)
+            self.draw(self.timestep.alpha)
+            if self.telemetry:
+                self.telemetry.publish(len(self.obstacles) + len(self.particles), self.score)
+            self.governor.record((time.perf_counter() - frame_start) * 1000)
+            self.clock.tick(self.render_fps)
         
         pygame.quit()
         sys.exit()
@@ -7,8 +7,14 @@ import pygame
 import random
 import math
 from enum import Enum
+from background_layers import background_layers
+from config_service import ConfigService
+from fixed_timestep import lerp
+from glow_atlas import glow_atlas
+from particle_engine import ParticleEngine
 from settings import *
 from maze_generator import MazeGenerator
+from maze_renderer import MazeLayer
 from player import Player
 
 class GameState(Enum):
@@ -36,7 +42,7 @@ class Collectible:
         self.rotation += 3
         self.float_offset = math.sin(self.pulse) * 3
         
-    def draw(self, screen):
+    def draw(self, screen, glow=True):
         """Draw animated collectible"""
         if self.collected:
             return
@@ -44,11 +50,9 @@ class Collectible:
         y_pos = self.pixel_y + self.float_offset
         
         # Glow effect
-        glow_size = COLLECTIBLE_SIZE + 8 + math.sin(self.pulse) * 2
-        glow_surface = pygame.Surface((glow_size*2, glow_size*2), pygame.SRCALPHA)
-        glow_color = (*COLLECTIBLE_COLOR, 50)
-        pygame.draw.circle(glow_surface, glow_color, (int(glow_size), int(glow_size)), int(glow_size))
-        screen.blit(glow_surface, (self.pixel_x - glow_size, y_pos - glow_size))
+        if glow:
+            glow_size = COLLECTIBLE_SIZE + 8 + math.sin(self.pulse) * 2
+            glow_atlas.draw(screen, (self.pixel_x, y_pos), glow_size, COLLECTIBLE_COLOR, 50 / 255, "solid")
         
         # Main collectible
         pygame.draw.circle(screen, WHITE, (int(self.pixel_x), int(y_pos)), COLLECTIBLE_SIZE + 1)
@@ -76,16 +80,18 @@ class Collectible:
 class MazeGame:
     """Main maze game with smooth graphics and gameplay"""
     
-    def __init__(self, screen):
+    def __init__(self, screen, maze_width=MAZE_WIDTH, maze_height=MAZE_HEIGHT, algorithm=MAZE_ALGORITHM, seed=None):
         self.screen = screen
         self.state = GameState.MENU
         self.clock = pygame.time.Clock()
         
         # Game objects
-        self.maze_generator = MazeGenerator()
+        self.maze_generator = MazeGenerator(maze_width, maze_height, algorithm, seed)
         self.maze = []
+        self.maze_layer = None
         self.player = None
         self.collectibles = []
+        self.collectible_cells = {}  # (x, y) -> uncollected Collectible, so big mazes only touch nearby items
         self.goal_pos = None
         
         # Game state
@@ -95,8 +101,12 @@ class MazeGame:
         self.total_items = 0
         
         # Visual effects
-        self.background_particles = []
+        self.background_particles = ParticleEngine(capacity=20, fade=False, wrap=(SCREEN_WIDTH, SCREEN_HEIGHT))
         self.screen_shake = 0
+        self.particle_effects = True  # graphics.particle_effects in performance_config.json
+        self.glow_effects = True  # graphics.glow_effects in performance_config.json
+        self.config = ConfigService()
+        self.config.subscribe(self.apply_config)
         
         # Fonts
         pygame.font.init()
@@ -107,16 +117,24 @@ class MazeGame:
         # Initialize first level
         self.start_new_level()
         
+    def apply_config(self, config):
+        """Pick up the effect toggles, at startup and whenever the config file changes"""
+        self.particle_effects = bool(config.get("graphics.particle_effects", True))
+        self.glow_effects = bool(config.get("graphics.glow_effects", True))
+    
     def start_new_level(self):
         """Start a new level with generated maze"""
         # Generate new maze
         self.maze = self.maze_generator.generate_maze()
         
+        # Walls never change during a level, so they are rendered once (or once per chunk)
+        self.maze_layer = MazeLayer(self.maze)
+        
         # Create player at start position
         self.player = Player(1, 1)
         
         # Set goal position
-        self.goal_pos = (MAZE_WIDTH - 2, MAZE_HEIGHT - 2)
+        self.goal_pos = (self.maze_generator.width - 2, self.maze_generator.height - 2)
         
         # Create collectibles
         self._create_collectibles()
@@ -135,31 +153,26 @@ class MazeGame:
         valid_positions = [pos for pos in valid_positions 
                           if pos != (1, 1) and pos != self.goal_pos]
         
-        # Create collectibles (about 20% of valid positions)
+        # Create collectibles (about 20% of valid positions), from the maze's stream so seeded levels repeat
         num_collectibles = max(3, len(valid_positions) // 5)
-        collectible_positions = random.sample(valid_positions, 
-                                            min(num_collectibles, len(valid_positions)))
+        collectible_positions = self.maze_generator.rng.sample(valid_positions,
+                                                               min(num_collectibles, len(valid_positions)))
         
         for x, y in collectible_positions:
             self.collectibles.append(Collectible(x, y))
+        self.collectible_cells = {(c.grid_x, c.grid_y): c for c in self.collectibles}
         
         self.total_items = len(self.collectibles)
         self.collected_items = 0
     
     def _create_background_particles(self):
         """Create ambient background particles"""
-        self.background_particles = []
+        self.background_particles.clear()
         for _ in range(20):
-            particle = {
-                'x': random.randint(0, SCREEN_WIDTH),
-                'y': random.randint(0, SCREEN_HEIGHT),
-                'vx': random.uniform(-0.5, 0.5),
-                'vy': random.uniform(-0.5, 0.5),
-                'size': random.randint(1, 3),
-                'color': random.choice([LIGHT_BLUE, WHITE, SILVER]),
-                'alpha': random.randint(30, 100)
-            }
-            self.background_particles.append(particle)
+            self.background_particles.emit(random.randint(0, SCREEN_WIDTH), random.randint(0, SCREEN_HEIGHT),
+                                           random.uniform(-0.5, 0.5), random.uniform(-0.5, 0.5),
+                                           random.choice([LIGHT_BLUE, WHITE, SILVER]), life=math.inf,
+                                           size=random.randint(1, 3), alpha=random.randint(30, 100))
     
     def handle_event(self, event):
         """Handle game events"""
@@ -191,14 +204,13 @@ class MazeGame:
     
     def _check_collectibles(self):
         """Check if player collected any items"""
-        player_grid_pos = (self.player.grid_x, self.player.grid_y)
-        
-        for collectible in self.collectibles:
-            if not collectible.collected and (collectible.grid_x, collectible.grid_y) == player_grid_pos:
-                collectible.collected = True
-                self.collected_items += 1
-                self.score += 100
-                self.screen_shake = 5  # Screen shake effect
+        collectible = self.collectible_cells.pop((self.player.grid_x, self.player.grid_y), None)
+        
+        if collectible is not None:
+            collectible.collected = True
+            self.collected_items += 1
+            self.score += 100
+            self.screen_shake = 5  # Screen shake effect
     
     def _check_goal(self):
         """Check if player reached the goal"""
@@ -209,12 +221,12 @@ class MazeGame:
             self.state = GameState.LEVEL_COMPLETE
     
     def update(self):
-        """Update game state"""
+        """Advance the game by one fixed 60 Hz step"""
         if self.state == GameState.PLAYING:
             self.player.update()
             
-            # Update collectibles
-            for collectible in self.collectibles:
+            # Update collectibles (only the ones on screen; the animation is purely visual)
+            for collectible in self._visible_collectibles(*self._camera_offset()):
                 collectible.update()
             
             # Update background particles
@@ -225,24 +237,11 @@ class MazeGame:
                 self.screen_shake -= 1
     
     def _update_background_particles(self):
-        """Update ambient background particles"""
-        for particle in self.background_particles:
-            particle['x'] += particle['vx']
-            particle['y'] += particle['vy']
-            
-            # Wrap around screen
-            if particle['x'] < 0:
-                particle['x'] = SCREEN_WIDTH
-            elif particle['x'] > SCREEN_WIDTH:
-                particle['x'] = 0
-            
-            if particle['y'] < 0:
-                particle['y'] = SCREEN_HEIGHT
-            elif particle['y'] > SCREEN_HEIGHT:
-                particle['y'] = 0
+        """Update ambient background particles (they wrap around the screen)"""
+        self.background_particles.update()
     
-    def draw(self):
-        """Draw everything"""
+    def draw(self, alpha=1.0):
+        """Draw everything, with the player interpolated between the last two steps"""
         # Apply screen shake
         shake_x = random.randint(-self.screen_shake, self.screen_shake) if self.screen_shake > 0 else 0
         shake_y = random.randint(-self.screen_shake, self.screen_shake) if self.screen_shake > 0 else 0
@@ -253,34 +252,25 @@ class MazeGame:
         if self.state == GameState.MENU:
             self._draw_menu()
         elif self.state == GameState.PLAYING:
-            self._draw_game(shake_x, shake_y)
+            self._draw_game(shake_x, shake_y, alpha)
         elif self.state == GameState.LEVEL_COMPLETE:
             self._draw_level_complete()
     
     def _draw_background(self):
         """Draw gradient background with particles"""
-        # Gradient background
-        for y in range(SCREEN_HEIGHT):
-            color_ratio = y / SCREEN_HEIGHT
-            r = int(20 + (40 - 20) * color_ratio)
-            g = int(25 + (50 - 25) * color_ratio)
-            b = int(40 + (80 - 40) * color_ratio)
-            pygame.draw.line(self.screen, (r, g, b), (0, y), (SCREEN_WIDTH, y))
+        # Gradient background, built once per window size
+        self.screen.blit(background_layers.gradient(self.screen.get_size(), (20, 25, 40), (40, 50, 80)), (0, 0))
         
         # Background particles
-        for particle in self.background_particles:
-            particle_surface = pygame.Surface((particle['size']*2, particle['size']*2), pygame.SRCALPHA)
-            color = (*particle['color'], particle['alpha'])
-            pygame.draw.circle(particle_surface, color, (particle['size'], particle['size']), particle['size'])
-            self.screen.blit(particle_surface, (particle['x'] - particle['size'], particle['y'] - particle['size']))
+        if self.particle_effects:
+            self.background_particles.draw(self.screen)
     
-    def _draw_game(self, shake_x, shake_y):
+    def _draw_game(self, shake_x, shake_y, alpha=1.0):
         """Draw the main game"""
-        # Calculate maze offset to center it
-        maze_pixel_width = MAZE_WIDTH * CELL_SIZE
-        maze_pixel_height = MAZE_HEIGHT * CELL_SIZE
-        offset_x = (SCREEN_WIDTH - maze_pixel_width) // 2 + shake_x
-        offset_y = (SCREEN_HEIGHT - maze_pixel_height) // 2 + shake_y
+        # Calculate maze offset: centered, or following the player in mazes larger than the screen
+        camera_x, camera_y = self._camera_offset(alpha)
+        offset_x = camera_x + shake_x
+        offset_y = camera_y + shake_y
         
         # Draw maze
         self._draw_maze(offset_x, offset_y)
@@ -289,50 +279,55 @@ class MazeGame:
         self._draw_goal(offset_x, offset_y)
         
         # Draw collectibles
-        for collectible in self.collectibles:
-            if not collectible.collected:
-                # Adjust collectible position for screen offset
-                original_x = collectible.pixel_x
-                original_y = collectible.pixel_y
-                collectible.pixel_x = original_x + offset_x
-                collectible.pixel_y = original_y + offset_y
-                collectible.draw(self.screen)
-                collectible.pixel_x = original_x
-                collectible.pixel_y = original_y
+        for collectible in self._visible_collectibles(camera_x, camera_y):
+            # Adjust collectible position for screen offset
+            original_x = collectible.pixel_x
+            original_y = collectible.pixel_y
+            collectible.pixel_x = original_x + offset_x
+            collectible.pixel_y = original_y + offset_y
+            collectible.draw(self.screen, self.glow_effects)
+            collectible.pixel_x = original_x
+            collectible.pixel_y = original_y
         
         # Draw player
         original_x = self.player.pixel_x
         original_y = self.player.pixel_y
-        self.player.pixel_x = original_x + offset_x
-        self.player.pixel_y = original_y + offset_y
-        self.player.draw(self.screen)
+        self.player.pixel_x = lerp(self.player.prev_x, original_x, alpha) + offset_x
+        self.player.pixel_y = lerp(self.player.prev_y, original_y, alpha) + offset_y
+        self.player.draw(self.screen, self.particle_effects, self.glow_effects)
         self.player.pixel_x = original_x
         self.player.pixel_y = original_y
         
         # Draw UI
         self._draw_ui()
     
+    def _camera_offset(self, alpha=1.0):
+        """Screen position of the maze's top-left corner, following the interpolated player"""
+        player_x = lerp(self.player.prev_x, self.player.pixel_x, alpha)
+        player_y = lerp(self.player.prev_y, self.player.pixel_y, alpha)
+        offsets = []
+        for screen_size, cells, player_pos in ((SCREEN_WIDTH, self.maze_generator.width, player_x),
+                                               (SCREEN_HEIGHT, self.maze_generator.height, player_y)):
+            maze_size = cells * CELL_SIZE
+            if maze_size <= screen_size:
+                offsets.append((screen_size - maze_size) // 2)
+            else:
+                # Keep the player centered without scrolling past the maze edges
+                offsets.append(int(min(0, max(screen_size - maze_size, screen_size // 2 - player_pos))))
+        return offsets
+    
+    def _visible_collectibles(self, camera_x, camera_y):
+        """Uncollected items within a cell of the screen"""
+        first_x = max(0, -camera_x // CELL_SIZE - 1)
+        last_x = min(self.maze_generator.width, (SCREEN_WIDTH - camera_x) // CELL_SIZE + 2)
+        first_y = max(0, -camera_y // CELL_SIZE - 1)
+        last_y = min(self.maze_generator.height, (SCREEN_HEIGHT - camera_y) // CELL_SIZE + 2)
+        cells = self.collectible_cells
+        return [cells[(x, y)] for y in range(first_y, last_y) for x in range(first_x, last_x) if (x, y) in cells]
+    
     def _draw_maze(self, offset_x, offset_y):
-        """Draw the maze with good graphics"""
-        for y in range(MAZE_HEIGHT):
-            for x in range(MAZE_WIDTH):
-                pixel_x = x * CELL_SIZE + offset_x
-                pixel_y = y * CELL_SIZE + offset_y
-                
-                if self.maze[y][x] == 1:  # Wall
-                    # Draw wall with gradient effect
-                    wall_rect = pygame.Rect(pixel_x, pixel_y, CELL_SIZE, CELL_SIZE)
-                    
-                    # Main wall
-                    pygame.draw.rect(self.screen, DARK_GREEN, wall_rect)
-                    
-                    # Highlight edges
-                    pygame.draw.rect(self.screen, GREEN, wall_rect, WALL_THICKNESS)
-                    
-                    # Inner highlight
-                    inner_rect = pygame.Rect(pixel_x + 3, pixel_y + 3, 
-                                           CELL_SIZE - 6, CELL_SIZE - 6)
-                    pygame.draw.rect(self.screen, (0, 120, 0), inner_rect, 1)
+        """Draw the maze walls from the pre-rendered layer"""
+        self.maze_layer.draw(self.screen, offset_x, offset_y)
     
     def _draw_goal(self, offset_x, offset_y):
         """Draw animated goal"""
@@ -340,13 +335,10 @@ class MazeGame:
         goal_y = self.goal_pos[1] * CELL_SIZE + CELL_SIZE // 2 + offset_y
         
         # Pulsing glow
-        pulse = math.sin(pygame.time.get_ticks() * 0.01) * 5
-        glow_size = GOAL_SIZE + 10 + pulse
-        
-        glow_surface = pygame.Surface((glow_size*2, glow_size*2), pygame.SRCALPHA)
-        glow_color = (*GOAL_COLOR, 80)
-        pygame.draw.circle(glow_surface, glow_color, (int(glow_size), int(glow_size)), int(glow_size))
-        self.screen.blit(glow_surface, (goal_x - glow_size, goal_y - glow_size))
+        if self.glow_effects:
+            pulse = math.sin(pygame.time.get_ticks() * 0.01) * 5
+            glow_size = GOAL_SIZE + 10 + pulse
+            glow_atlas.draw(self.screen, (goal_x, goal_y), glow_size, GOAL_COLOR, 80 / 255, "solid")
         
         # Main goal
         pygame.draw.circle(self.screen, WHITE, (int(goal_x), int(goal_y)), GOAL_SIZE + 2)
@@ -357,10 +349,8 @@ class MazeGame:
             size = GOAL_SIZE - (i * 4)
             if size > 0:
                 alpha = 255 - (i * 60)
-                color = (*YELLOW, alpha) if i % 2 == 0 else (*WHITE, alpha)
-                goal_surface = pygame.Surface((size*2, size*2), pygame.SRCALPHA)
-                pygame.draw.circle(goal_surface, color, (size, size), size)
-                self.screen.blit(goal_surface, (goal_x - size, goal_y - size))
+                color = YELLOW if i % 2 == 0 else WHITE
+                glow_atlas.draw(self.screen, (goal_x, goal_y), size, color, alpha / 255, "solid")
     
     def _draw_ui(self):
         """Draw user interface"""
@@ -7,31 +7,44 @@ Advanced maze game with smooth character movement and good graphics
 import pygame
 import sys
 import os
+import argparse
 
 # Add the project root to the path for imports
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
 
 from games.maze_game.game_logic import MazeGame
-from games.maze_game.settings import SCREEN_WIDTH, SCREEN_HEIGHT, FPS, GAME_TITLE
+from games.maze_game.maze_generator import ALGORITHMS
+from games.maze_game.settings import SCREEN_WIDTH, SCREEN_HEIGHT, FPS, GAME_TITLE, MAZE_WIDTH, MAZE_HEIGHT, MAZE_ALGORITHM
+from config_service import load_config, mixer_settings
+from fixed_timestep import FixedTimestep, render_fps
 
 def main():
     """Main entry point for Maze Adventure game"""
+    parser = argparse.ArgumentParser(description="Maze Adventure")
+    parser.add_argument("--size", type=int, nargs=2, metavar=("WIDTH", "HEIGHT"),
+                        default=(MAZE_WIDTH, MAZE_HEIGHT), help="Maze size in cells, e.g. --size 501 501")
+    parser.add_argument("--algorithm", choices=ALGORITHMS, default=MAZE_ALGORITHM, help="Maze generation algorithm")
+    parser.add_argument("--seed", type=int, help="Seed for a repeatable sequence of levels")
+    args, _ = parser.parse_known_args()
     
     print("🎮 Starting Maze Adventure - Smooth Explorer...")
     print("Controls: WASD or Arrow Keys to move, SPACE to start/continue")
     
-    # Initialize Pygame
+    # Initialize Pygame; mixer settings must be set before init to take effect
+    pygame.mixer.pre_init(**mixer_settings(load_config()))
     pygame.init()
     
     # Set up the display
     screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
     pygame.display.set_caption(GAME_TITLE)
     
-    # Set up the clock for FPS control
+    # Set up the clock for FPS control; the render cap never changes how fast the player moves
     clock = pygame.time.Clock()
+    target_fps = render_fps(FPS)
+    timestep = FixedTimestep()
     
     # Create game instance
-    game = MazeGame(screen)
+    game = MazeGame(screen, *args.size, args.algorithm, args.seed)
     
     # Main game loop
     running = True
@@ -42,18 +55,20 @@ def main():
                 running = False
             else:
                 game.handle_event(event)
+        game.config.poll()
         
-        # Update game state
-        game.update()
+        # Fixed 60 Hz simulation, however fast or slow frames are drawn
+        for _ in range(timestep.advance()):
+            game.update()
         
         # Draw everything
-        game.draw()
+        game.draw(timestep.alpha)
         
         # Update display
         pygame.display.flip()
         
         # Control frame rate
-        clock.tick(FPS)
+        clock.tick(target_fps)
     
     # Clean up
     pygame.quit()
@@ -1,28 +1,57 @@
 """
 Maze Generator
-Creates interesting mazes using recursive backtracking algorithm
+Creates interesting mazes on a compact byte grid with the backtracking, Kruskal, Wilson or Eller algorithm
 """
 
 import random
-from settings import MAZE_WIDTH, MAZE_HEIGHT
+from array import array
+
+import numpy
+
+from settings import MAZE_WIDTH, MAZE_HEIGHT, MAZE_ALGORITHM
+
+ALGORITHMS = ("backtracker", "kruskal", "wilson", "eller")
+WALL_BATCH = 1 << 20  # Shuffled Kruskal walls converted to Python ints at a time
 
 class MazeGenerator:
     """Generates mazes with good layouts"""
     
-    def __init__(self, width=MAZE_WIDTH, height=MAZE_HEIGHT):
+    def __init__(self, width=MAZE_WIDTH, height=MAZE_HEIGHT, algorithm=MAZE_ALGORITHM, seed=None):
+        if algorithm not in ALGORITHMS:
+            raise ValueError(f"unknown maze algorithm: {algorithm}")
+        if width < 3 or height < 3:
+            raise ValueError(f"maze must be at least 3x3, got {width}x{height}")
         self.width = width
         self.height = height
-        self.maze = []
-        self.visited = []
+        self.algorithm = algorithm
+        # A seed gives the generator its own stream; without one it follows the global random module
+        self.rng = random.Random(seed) if seed is not None else random
         
+        # Rooms sit on odd coordinates; the cells between them stay walls until carved
+        self.rooms_x = (width - 1) // 2
+        self.rooms_y = (height - 1) // 2
+        
+        # One byte per cell; maze[y] is a memoryview row, so maze[y][x] indexing works as before
+        self.cells = bytearray()
+        self.maze = []
+    
     def generate_maze(self):
-        """Generate a new maze using recursive backtracking"""
+        """Generate a new maze with the configured algorithm"""
         # Initialize maze with all walls
-        self.maze = [[1 for _ in range(self.width)] for _ in range(self.height)]
-        self.visited = [[False for _ in range(self.width)] for _ in range(self.height)]
+        self.cells = bytearray(b"\x01") * (self.width * self.height)
+        view = memoryview(self.cells)
+        self.maze = [view[y * self.width:(y + 1) * self.width] for y in range(self.height)]
         
-        # Start from top-left corner
-        self._carve_path(1, 1)
+        if self.algorithm == "backtracker":
+            # Start from top-left corner
+            self._carve_path(1, 1)
+        elif self.algorithm == "kruskal":
+            self._kruskal()
+        elif self.algorithm == "wilson":
+            self._wilson()
+        else:
+            for row, cells in zip(self.maze, self.eller_rows()):
+                row[:] = cells
         
         # Ensure start and end are clear
         self.maze[1][1] = 0  # Start position
@@ -33,46 +62,217 @@ class MazeGenerator:
         
         return self.maze
     
+    def as_array(self):
+        """The grid as a (height, width) NumPy array sharing the same bytes"""
+        return numpy.frombuffer(self.cells, dtype=numpy.uint8).reshape(self.height, self.width)
+    
     def _carve_path(self, x, y):
-        """Recursively carve paths through the maze"""
-        self.visited[y][x] = True
+        """Carve paths depth-first, visiting cells in the same order as recursion would"""
+        # An explicit stack keeps 500x500 and larger mazes within Python's recursion limit
+        stack = [(x, y, self._visit(x, y))]
+        
+        while stack:
+            x, y, directions = stack[-1]
+            for dx, dy in directions:
+                nx, ny = x + dx, y + dy
+                
+                # Check bounds; a room still walled in has not been visited
+                if (0 < nx < self.width-1 and 0 < ny < self.height-1 and
+                    self.maze[ny][nx] == 1):
+                    
+                    # Carve the wall between current and next cell
+                    self.maze[y + dy//2][x + dx//2] = 0
+                    stack.append((nx, ny, self._visit(nx, ny)))
+                    break
+            else:
+                stack.pop()
+    
+    def _visit(self, x, y):
+        """Open a cell and return its remaining directions in random order"""
         self.maze[y][x] = 0  # 0 = path, 1 = wall
         
         # Get random directions
         directions = [(0, 2), (2, 0), (0, -2), (-2, 0)]
-        random.shuffle(directions)
+        self.rng.shuffle(directions)
+        return iter(directions)
+    
+    def _open_rooms(self):
+        """Open every room cell, leaving all walls between them standing"""
+        for y in range(1, 2 * self.rooms_y, 2):
+            self.maze[y][1:2 * self.rooms_x:2] = bytes(self.rooms_x)
+    
+    def _room_cell(self, room):
+        """Index into cells of a room numbered row by row"""
+        return (2 * (room // self.rooms_x) + 1) * self.width + 2 * (room % self.rooms_x) + 1
+    
+    def _kruskal(self):
+        """Knock down walls in random order unless the rooms on both sides are already joined"""
+        rooms_x = self.rooms_x
+        rooms = rooms_x * self.rooms_y
+        self._open_rooms()
         
-        for dx, dy in directions:
-            nx, ny = x + dx, y + dy
-            
-            # Check bounds
-            if (0 < nx < self.width-1 and 0 < ny < self.height-1 and 
-                not self.visited[ny][nx]):
+        # Wall 2r is east of room r and wall 2r + 1 is south of it; drop the ones on the border
+        walls = numpy.arange(rooms * 2, dtype=numpy.int32)
+        room = walls >> 1
+        south = (walls & 1) == 1
+        walls = walls[numpy.where(south, room // rooms_x < self.rooms_y - 1, room % rooms_x < rooms_x - 1)]
+        numpy.random.default_rng(self.rng.getrandbits(64)).shuffle(walls)
+        
+        # Union-find over rooms with path halving
+        parent = array("i", range(rooms))
+        joins_left = rooms - 1
+        for start in range(0, len(walls), WALL_BATCH):
+            for wall in walls[start:start + WALL_BATCH].tolist():
+                first = wall >> 1
+                second = first + rooms_x if wall & 1 else first + 1
+                while parent[first] != first:
+                    parent[first] = parent[parent[first]]
+                    first = parent[first]
+                while parent[second] != second:
+                    parent[second] = parent[parent[second]]
+                    second = parent[second]
+                if first == second:
+                    continue
                 
-                # Carve the wall between current and next cell
-                self.maze[y + dy//2][x + dx//2] = 0
-                self._carve_path(nx, ny)
+                parent[first] = second
+                cell = self._room_cell(wall >> 1)
+                self.cells[cell + self.width if wall & 1 else cell + 1] = 0
+                joins_left -= 1
+                if not joins_left:
+                    return
+    
+    def _wilson(self):
+        """Add loop-erased random walks to a growing tree, so every possible maze is equally likely"""
+        rooms_x, rooms_y = self.rooms_x, self.rooms_y
+        rooms = rooms_x * rooms_y
+        width = self.width
+        cells = self.cells
+        getrandbits = self.rng.getrandbits
+        self._open_rooms()
+        
+        in_tree = bytearray(rooms)
+        in_tree[self.rng.randrange(rooms)] = 1
+        # Direction each room was last left by; overwriting it on a revisit erases the loop
+        exits = bytearray(rooms)
+        
+        for start in range(rooms):
+            if in_tree[start]:
+                continue
+            
+            # Walk at random until the tree is hit
+            room, x, y = start, start % rooms_x, start // rooms_x
+            while not in_tree[room]:
+                direction = getrandbits(2)
+                if direction == 0:
+                    if x == rooms_x - 1:
+                        continue
+                    exits[room] = 0
+                    room += 1
+                    x += 1
+                elif direction == 1:
+                    if x == 0:
+                        continue
+                    exits[room] = 1
+                    room -= 1
+                    x -= 1
+                elif direction == 2:
+                    if y == rooms_y - 1:
+                        continue
+                    exits[room] = 2
+                    room += rooms_x
+                    y += 1
+                else:
+                    if y == 0:
+                        continue
+                    exits[room] = 3
+                    room -= rooms_x
+                    y -= 1
+            
+            # Follow the last exits from the start, which skips every loop, and carve the path
+            room = start
+            while not in_tree[room]:
+                in_tree[room] = 1
+                cell = self._room_cell(room)
+                direction = exits[room]
+                if direction == 0:
+                    cells[cell + 1] = 0
+                    room += 1
+                elif direction == 1:
+                    cells[cell - 1] = 0
+                    room -= 1
+                elif direction == 2:
+                    cells[cell + width] = 0
+                    room += rooms_x
+                else:
+                    cells[cell - width] = 0
+                    room -= rooms_x
+    
+    def eller_rows(self):
+        """Yield the maze one row at a time with Eller's algorithm, keeping only one row of sets in memory"""
+        rooms_x = self.rooms_x
+        wall_row = b"\x01" * self.width
+        rng = self.rng
+        
+        yield bytearray(wall_row)  # Top border
+        sets = list(range(rooms_x))
+        next_set = rooms_x
+        
+        for room_y in range(self.rooms_y):
+            last = room_y == self.rooms_y - 1
+            row = bytearray(wall_row)
+            row[1:2 * rooms_x:2] = bytes(rooms_x)
+            members = {}
+            for room_x, room_set in enumerate(sets):
+                members.setdefault(room_set, []).append(room_x)
+            
+            # Join neighbours from different sets at random; the last row must join them all
+            for room_x in range(rooms_x - 1):
+                kept, merged = sets[room_x], sets[room_x + 1]
+                if kept != merged and (last or rng.random() < 0.5):
+                    row[2 * room_x + 2] = 0
+                    if len(members[kept]) < len(members[merged]):
+                        kept, merged = merged, kept
+                    for column in members[merged]:
+                        sets[column] = kept
+                    members[kept].extend(members.pop(merged))
+            yield row
+            if last:
+                break
+            
+            # Every set continues down at least once; rooms not reached from above start new sets
+            below = bytearray(wall_row)
+            next_sets = list(range(next_set, next_set + rooms_x))
+            next_set += rooms_x
+            for room_set, columns in members.items():
+                down = [column for column in columns if rng.random() < 0.5] or [rng.choice(columns)]
+                for column in down:
+                    below[2 * column + 1] = 0
+                    next_sets[column] = room_set
+            sets = next_sets
+            yield below
+        
+        # Bottom border (two rows when the height is even)
+        for _ in range(self.height - 2 * self.rooms_y):
+            yield bytearray(wall_row)
     
     def _add_extra_paths(self):
         """Add some extra paths to make the maze more interesting"""
+        if self.width < 5 or self.height < 5:
+            return  # No interior walls away from the border to knock through
         extra_paths = min(10, (self.width * self.height) // 20)
         
         for _ in range(extra_paths):
-            x = random.randint(2, self.width-3)
-            y = random.randint(2, self.height-3)
+            x = self.rng.randint(2, self.width-3)
+            y = self.rng.randint(2, self.height-3)
             
             # Randomly remove some walls to create loops
-            if random.random() < 0.3:
+            if self.rng.random() < 0.3:
                 self.maze[y][x] = 0
     
     def get_valid_positions(self):
         """Get all valid (path) positions in the maze"""
-        positions = []
-        for y in range(self.height):
-            for x in range(self.width):
-                if self.maze[y][x] == 0:  # Path
-                    positions.append((x, y))
-        return positions
+        ys, xs = numpy.nonzero(self.as_array() == 0)
+        return list(zip(xs.tolist(), ys.tolist()))
     
     def is_valid_position(self, x, y):
         """Check if position is valid (within bounds and not a wall)"""
@@ -0,0 +1,88 @@
+"""
+Maze Renderer
+Bakes the static maze walls once and serves large mazes as cached chunks around the viewport
+"""
+
+import pygame
+from surface_cache import SurfaceCache
+from settings import *
+
+WALL_KEY = (255, 0, 255)  # Transparent color of the wall layer; the walls never use it
+BAKE_LIMIT = 2048  # Mazes up to this many pixels on each side are baked into a single layer
+CHUNK_CELLS = 16  # Cells per chunk side for larger mazes
+CHUNK_CACHE_KB = 32768  # About 35 chunks of 16x16 cells, several screens' worth
+
+def create_wall_tile():
+    """One wall cell: dark fill, bright edge and an inner highlight"""
+    tile = pygame.Surface((CELL_SIZE, CELL_SIZE))
+    wall_rect = tile.get_rect()
+    pygame.draw.rect(tile, DARK_GREEN, wall_rect)
+    pygame.draw.rect(tile, GREEN, wall_rect, WALL_THICKNESS)
+    pygame.draw.rect(tile, (0, 120, 0), pygame.Rect(3, 3, CELL_SIZE - 6, CELL_SIZE - 6), 1)
+    return tile
+
+class MazeLayer:
+    """Wall layer for one maze, rendered once per chunk and blitted at the camera offset every frame"""
+    
+    def __init__(self, maze, max_bytes=CHUNK_CACHE_KB * 1024):
+        self.maze = maze
+        self.width = len(maze[0])
+        self.height = len(maze)
+        
+        # Small mazes are one chunk covering everything; large ones are split into tiles
+        fits = self.width * CELL_SIZE <= BAKE_LIMIT and self.height * CELL_SIZE <= BAKE_LIMIT
+        self.chunk_cells = (self.width, self.height) if fits else (CHUNK_CELLS, CHUNK_CELLS)
+        self.chunks_x = -(-self.width // self.chunk_cells[0])
+        self.chunks_y = -(-self.height // self.chunk_cells[1])
+        self.cache = SurfaceCache(max_bytes=max_bytes)
+        self.chunks_rendered = 0
+        self.tile = None
+        
+        if fits:
+            self.chunk(0, 0)
+    
+    def chunk(self, chunk_x, chunk_y):
+        """Cached wall surface for one chunk"""
+        return self.cache.get_or_create((chunk_x, chunk_y), lambda: self.render_chunk(chunk_x, chunk_y))
+    
+    def render_chunk(self, chunk_x, chunk_y):
+        """Draw every wall cell of a chunk with one batched blit"""
+        if self.tile is None:
+            self.tile = create_wall_tile()
+            if pygame.display.get_surface() is not None:
+                self.tile = self.tile.convert()
+        
+        first_x = chunk_x * self.chunk_cells[0]
+        first_y = chunk_y * self.chunk_cells[1]
+        last_x = min(self.width, first_x + self.chunk_cells[0])
+        last_y = min(self.height, first_y + self.chunk_cells[1])
+        
+        surface = pygame.Surface(((last_x - first_x) * CELL_SIZE, (last_y - first_y) * CELL_SIZE))
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert()
+        surface.fill(WALL_KEY)
+        surface.blits([(self.tile, ((x - first_x) * CELL_SIZE, (y - first_y) * CELL_SIZE))
+                       for y in range(first_y, last_y) for x in range(first_x, last_x)
+                       if self.maze[y][x] == 1], doreturn=False)
+        
+        # Run-length encoding skips the transparent paths quickly
+        surface.set_colorkey(WALL_KEY, pygame.RLEACCEL)
+        self.chunks_rendered += 1
+        return surface
+    
+    def draw(self, surface, offset_x, offset_y):
+        """Blit the chunks that intersect the visible area, rendering any that are missing"""
+        view = surface.get_clip()
+        chunk_width = self.chunk_cells[0] * CELL_SIZE
+        chunk_height = self.chunk_cells[1] * CELL_SIZE
+        first_x = max(0, (view.left - offset_x) // chunk_width)
+        last_x = min(self.chunks_x - 1, (view.right - 1 - offset_x) // chunk_width)
+        first_y = max(0, (view.top - offset_y) // chunk_height)
+        last_y = min(self.chunks_y - 1, (view.bottom - 1 - offset_y) // chunk_height)
+        
+        blits = []
+        for chunk_y in range(first_y, last_y + 1):
+            for chunk_x in range(first_x, last_x + 1):
+                position = (offset_x + chunk_x * chunk_width, offset_y + chunk_y * chunk_height)
+                blits.append((self.chunk(chunk_x, chunk_y), position))
+        surface.blits(blits, doreturn=False)
@@ -6,6 +6,8 @@ Advanced player with smooth movement, animations, and effects
 import pygame
 import math
 import random
+from glow_atlas import glow_atlas
+from particle_engine import ParticleEngine, stamp_cache
 from settings import *
 
 class Player:
@@ -18,6 +20,8 @@ class Player:
         self.pixel_y = y * CELL_SIZE + CELL_SIZE // 2
         self.target_x = self.pixel_x
         self.target_y = self.pixel_y
+        self.prev_x = self.pixel_x
+        self.prev_y = self.pixel_y
         
         # Movement and animation
         self.speed = PLAYER_SPEED
@@ -26,7 +30,7 @@ class Player:
         
         # Visual effects
         self.trail = []
-        self.particles = []
+        self.particles = ParticleEngine(drag=0.98, shrink=True)
         self.glow_radius = PLAYER_SIZE + 5
         self.glow_pulse = 0
         
@@ -67,7 +71,10 @@ class Player:
         return False
     
     def update(self):
-        """Update player position and animations"""
+        """Advance one 60 Hz step of movement and animations"""
+        self.prev_x = self.pixel_x
+        self.prev_y = self.pixel_y
+        
         if self.is_moving:
             # Smooth interpolation
             self.move_progress += self.speed * 0.1
@@ -101,40 +108,24 @@ class Player:
     
     def _add_particles(self):
         """Add movement particles for visual effect"""
-        for _ in range(PARTICLE_COUNT):
-            particle = {
-                'x': self.pixel_x + random.randint(-5, 5),
-                'y': self.pixel_y + random.randint(-5, 5),
-                'vx': random.uniform(-2, 2),
-                'vy': random.uniform(-2, 2),
-                'life': 30,
-                'max_life': 30,
-                'color': PLAYER_TRAIL_COLOR
-            }
-            self.particles.append(particle)
+        self.particles.burst(PARTICLE_COUNT, self.pixel_x, self.pixel_y, 2, PLAYER_TRAIL_COLOR, size=3, spread=5)
     
     def _update_particles(self):
         """Update particle effects"""
-        for particle in self.particles[:]:
-            particle['x'] += particle['vx']
-            particle['y'] += particle['vy']
-            particle['life'] -= 1
-            particle['vx'] *= 0.98  # Friction
-            particle['vy'] *= 0.98
-            
-            if particle['life'] <= 0:
-                self.particles.remove(particle)
+        self.particles.update()
     
-    def draw(self, screen):
-        """Draw player with all visual effects"""
+    def draw(self, screen, particles=True, glow=True):
+        """Draw player with the visual effects that are switched on"""
         # Draw trail
         self._draw_trail(screen)
         
         # Draw particles
-        self._draw_particles(screen)
+        if particles:
+            self._draw_particles(screen)
         
         # Draw glow effect
-        self._draw_glow(screen)
+        if glow:
+            self._draw_glow(screen)
         
         # Draw main player
         self._draw_player(screen)
@@ -142,38 +133,23 @@ class Player:
     def _draw_trail(self, screen):
         """Draw smooth trail behind player"""
         if len(self.trail) > 1:
+            stamps = []
             for i, (x, y) in enumerate(self.trail):
                 alpha = int(255 * (i / len(self.trail)) * 0.5)
                 size = int(PLAYER_SIZE * 0.3 * (i / len(self.trail)))
                 if size > 0:
-                    trail_surface = pygame.Surface((size*2, size*2), pygame.SRCALPHA)
-                    color = (*PLAYER_TRAIL_COLOR, alpha)
-                    pygame.draw.circle(trail_surface, color, (size, size), size)
-                    screen.blit(trail_surface, (x - size, y - size))
+                    stamps.append((stamp_cache.stamp("circle", size, PLAYER_TRAIL_COLOR, alpha), (x - size, y - size)))
+            screen.blits(stamps, doreturn=False)
     
     def _draw_particles(self, screen):
         """Draw particle effects"""
-        for particle in self.particles:
-            alpha = int(255 * (particle['life'] / particle['max_life']))
-            size = max(1, int(3 * (particle['life'] / particle['max_life'])))
-            
-            particle_surface = pygame.Surface((size*2, size*2), pygame.SRCALPHA)
-            color = (*particle['color'], alpha)
-            pygame.draw.circle(particle_surface, color, (size, size), size)
-            screen.blit(particle_surface, (particle['x'] - size, particle['y'] - size))
+        self.particles.draw(screen)
     
     def _draw_glow(self, screen):
         """Draw glow effect around player"""
         glow_size = self.glow_radius + math.sin(self.glow_pulse) * 3
-        glow_surface = pygame.Surface((glow_size*2, glow_size*2), pygame.SRCALPHA)
-        
-        # Create gradient glow
-        for i in range(int(glow_size), 0, -2):
-            alpha = int(30 * (i / glow_size))
-            color = (*PLAYER_COLOR, alpha)
-            pygame.draw.circle(glow_surface, color, (int(glow_size), int(glow_size)), i)
-        
-        screen.blit(glow_surface, (self.pixel_x - glow_size, self.pixel_y - glow_size + self.bounce_offset))
+        # Soft falloff about as bright at the center as the stacked rings it replaces
+        glow_atlas.draw(screen, (self.pixel_x, self.pixel_y + self.bounce_offset), glow_size, PLAYER_COLOR, 0.5)
     
     def _draw_player(self, screen):
         """Draw the main player character"""
@@ -31,6 +31,7 @@ SILVER = (192, 192, 192)
 CELL_SIZE = 30
 MAZE_WIDTH = 25
 MAZE_HEIGHT = 20
+MAZE_ALGORITHM = "backtracker"  # Or "kruskal", "wilson", "eller"
 WALL_THICKNESS = 3
 
 # Player settings - Smooth character
@@ -3,7 +3,15 @@ import random
 import sys
 import os
 
-# Initialize Pygame
+# Add the launcher directory to the path for the telemetry and timestep libraries
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from config_service import load_config, mixer_settings
+from game_telemetry import connect_telemetry
+from fixed_timestep import FixedTimestep, lerp, render_fps
+
+# Initialize Pygame; mixer settings must be set before init to take effect
+pygame.mixer.pre_init(**mixer_settings(load_config()))
 pygame.init()
 
 # Game constants
@@ -12,6 +20,8 @@ WINDOW_HEIGHT = 600
 GRID_SIZE = 20
 GRID_WIDTH = WINDOW_WIDTH // GRID_SIZE
 GRID_HEIGHT = WINDOW_HEIGHT // GRID_SIZE
+MOVES_PER_SECOND = 10  # Simulation rate: one grid step per update
+RENDER_FPS = render_fps(60)  # Segments glide between cells at the render rate
 
 # Colors
 BLACK = (0, 0, 0)
@@ -29,13 +39,19 @@ class SnakeGame:
         self.font = pygame.font.Font(None, 36)
         self.big_font = pygame.font.Font(None, 72)
         
+        # Frame stats for the launcher (None when run standalone)
+        self.telemetry = connect_telemetry()
+        self.timestep = FixedTimestep(MOVES_PER_SECOND)
+        
         # Game state
         self.reset_game()
         
     def reset_game(self):
         """Reset the game to initial state"""
         self.snake = [(GRID_WIDTH // 2, GRID_HEIGHT // 2)]
+        self.prev_snake = list(self.snake)
         self.direction = (1, 0)  # Moving right initially
+        self.moved_direction = self.direction
         self.food = self.generate_food()
         self.score = 0
         self.game_over = False
@@ -68,14 +84,15 @@ class SnakeGame:
                     if event.key == pygame.K_p:
                         self.paused = False
                 else:
-                    # Movement controls
-                    if event.key == pygame.K_UP and self.direction != (0, 1):
+                    # Movement controls, checked against the last step actually taken so two
+                    # quick turns between steps can't reverse the snake into itself
+                    if event.key == pygame.K_UP and self.moved_direction != (0, 1):
                         self.direction = (0, -1)
-                    elif event.key == pygame.K_DOWN and self.direction != (0, -1):
+                    elif event.key == pygame.K_DOWN and self.moved_direction != (0, -1):
                         self.direction = (0, 1)
-                    elif event.key == pygame.K_LEFT and self.direction != (1, 0):
+                    elif event.key == pygame.K_LEFT and self.moved_direction != (1, 0):
                         self.direction = (-1, 0)
-                    elif event.key == pygame.K_RIGHT and self.direction != (-1, 0):
+                    elif event.key == pygame.K_RIGHT and self.moved_direction != (-1, 0):
                         self.direction = (1, 0)
                     elif event.key == pygame.K_p:
                         self.paused = True
@@ -83,7 +100,8 @@ class SnakeGame:
         return True
     
     def update(self):
-        """Update game logic"""
+        """Advance the snake one grid step"""
+        self.prev_snake = list(self.snake)
         if self.game_over or self.paused:
             return
         
@@ -104,6 +122,7 @@ class SnakeGame:
         
         # Add new head
         self.snake.insert(0, new_head)
+        self.moved_direction = self.direction
         
         # Check food collision
         if new_head == self.food:
@@ -113,13 +132,15 @@ class SnakeGame:
             # Remove tail if no food eaten
             self.snake.pop()
     
-    def draw(self):
-        """Draw everything on screen"""
+    def draw(self, alpha=1.0):
+        """Draw everything on screen, with the snake part way between its last two steps"""
         self.screen.fill(BLACK)
         
-        # Draw snake
+        # Draw snake; a segment added by eating has no previous cell and stays put
         for i, segment in enumerate(self.snake):
-            x, y = segment
+            prev_x, prev_y = self.prev_snake[i] if i < len(self.prev_snake) else segment
+            x = lerp(prev_x, segment[0], alpha)
+            y = lerp(prev_y, segment[1], alpha)
             color = GREEN if i == 0 else DARK_GREEN  # Head is brighter
             pygame.draw.rect(self.screen, color,
                            (x * GRID_SIZE, y * GRID_SIZE, GRID_SIZE, GRID_SIZE))
@@ -194,9 +215,14 @@ class SnakeGame:
         
         while running:
             running = self.handle_events()
-            self.update()
-            self.draw()
-            self.clock.tick(10)  # 10 FPS for snake game
+            
+            # The snake moves 10 cells a second however fast frames are drawn
+            for _ in range(self.timestep.advance()):
+                self.update()
+            self.draw(self.timestep.alpha)
+            if self.telemetry:
+                self.telemetry.publish(len(self.snake), self.score)
+            self.clock.tick(RENDER_FPS)
         
         pygame.quit()
 
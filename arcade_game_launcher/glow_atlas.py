@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Glow Atlas - Cached Radial Glow Textures
+Pre-renders radial falloff textures with NumPy per (radius bucket, color, intensity) so drawing a glow is one blit
+"""
+
+from typing import Callable, Hashable, Tuple
+
+import numpy
+import pygame
+
+from surface_cache import DisplaySurfaceCache
+
+Color = Tuple[int, int, int]
+RADIUS_STEP = 2  # Radii are rounded to this many pixels, so pulsing glows reuse a handful of textures
+INTENSITY_STEPS = 32  # Intensity is quantized to this many levels
+GLOW_CACHE_KB = 4096
+
+def radial_alpha(radius: int, falloff: str = "linear") -> numpy.ndarray:
+    """Coverage in 0..1 over a (2r, 2r) grid: fading to the rim ("linear") or a flat disc ("solid")"""
+    # Distance from the center, measured at pixel centers
+    offsets = numpy.arange(radius * 2, dtype=numpy.float32) + 0.5 - radius
+    distance = numpy.sqrt(offsets[:, None] ** 2 + offsets[None, :] ** 2)
+    if falloff == "solid":
+        # One pixel of antialiasing at the rim
+        return numpy.clip(radius - distance + 0.5, 0.0, 1.0)
+    return numpy.clip(1.0 - distance / radius, 0.0, 1.0)
+
+def create_glow(radius: int, color: Color, intensity: float = 1.0, falloff: str = "linear") -> pygame.Surface:
+    """SRCALPHA surface 2*radius across holding one radial glow"""
+    radius = max(1, int(radius))
+    surface = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+    surface.fill((*color[:3], 0))
+    alpha = pygame.surfarray.pixels_alpha(surface)
+    alpha[:] = (radial_alpha(radius, falloff) * (255 * max(0.0, min(1.0, intensity)))).astype(numpy.uint8)
+    del alpha  # Unlock the surface
+    return surface
+
+class GlowAtlas:
+    """LRU cache of display-format glow textures, bucketed by radius and intensity"""
+    
+    def __init__(self, max_bytes: int = GLOW_CACHE_KB * 1024, radius_step: int = RADIUS_STEP,
+                 intensity_steps: int = INTENSITY_STEPS):
+        self.cache = DisplaySurfaceCache(max_bytes=max_bytes, alpha=True)
+        self.radius_step = radius_step
+        self.intensity_steps = intensity_steps
+    
+    def radius_bucket(self, radius: float) -> int:
+        """Radius rounded to the nearest step"""
+        return max(self.radius_step, int(radius / self.radius_step + 0.5) * self.radius_step)
+    
+    def intensity_bucket(self, intensity: float) -> int:
+        """Intensity 0..1 quantized to a level"""
+        return max(0, min(self.intensity_steps, int(intensity * self.intensity_steps + 0.5)))
+    
+    def layer(self, key: Hashable, build: Callable[[], pygame.Surface]) -> pygame.Surface:
+        """Cached texture for key, built and converted to the display format on first use"""
+        return self.cache.layer(key, build)
+    
+    def get(self, radius: float, color: Color, intensity: float = 1.0, falloff: str = "linear") -> pygame.Surface:
+        """Glow texture for a radius and peak intensity (0..1 of full opacity)"""
+        radius = self.radius_bucket(radius)
+        level = self.intensity_bucket(intensity)
+        key = ("glow", radius, tuple(color[:3]), level, falloff)
+        # Hit path first: this runs for every glow every frame
+        if self.cache.is_current():
+            glow = self.cache.get(key)
+            if glow is not None:
+                return glow
+        return self.layer(key, lambda: create_glow(radius, key[2], level / self.intensity_steps, falloff))
+    
+    def draw(self, surface: pygame.Surface, center: Tuple[float, float], radius: float, color: Color,
+             intensity: float = 1.0, falloff: str = "linear"):
+        """Blit a glow centered on a point"""
+        glow = self.get(radius, color, intensity, falloff)
+        half = glow.get_width() // 2
+        surface.blit(glow, (int(center[0]) - half, int(center[1]) - half))
+    
+    def clear(self):
+        """Drop every texture"""
+        self.cache.clear()
+
+# Shared by everything drawn in this process
+glow_atlas = GlowAtlas()
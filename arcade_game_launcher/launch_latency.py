@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Launch Latency - Click-to-First-Frame Measurement
+Opt-in handshake where a launched game reports its first display flip back to the launcher
+"""
+
+import os
+import math
+import socket
+import time
+from typing import Dict, List, Optional, Tuple
+
+LAUNCH_REPORT_ENV = "ARCADE_LAUNCH_REPORT"
+MAX_SAMPLES = 50
+PENDING_TIMEOUT = 60.0  # Seconds before a launch that never reported (crash, no hook) is forgotten
+
+def percentile(samples: List[float], pct: float) -> float:
+    """Nearest-rank percentile of a sample list"""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, math.ceil(pct / 100.0 * len(ordered)) - 1))
+    return ordered[index]
+
+class LaunchLatencyTracker:
+    """Launcher side of the handshake: hands out launch ids and collects reports"""
+    
+    def __init__(self):
+        # Localhost datagram socket, polled without blocking once per frame
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.sock.bind(("127.0.0.1", 0))
+        self.sock.setblocking(False)
+        self.port = self.sock.getsockname()[1]
+        
+        self.next_id = 1
+        self.pending: Dict[int, Tuple[str, float]] = {}
+        self.samples: Dict[str, List[float]] = {}
+    
+    def begin(self, game_name: str, click_time: Optional[float] = None) -> Dict[str, str]:
+        """Register a launch and return the environment the child needs"""
+        launch_id = self.next_id
+        self.next_id += 1
+        self.pending[launch_id] = (game_name, click_time if click_time is not None else time.time())
+        return {LAUNCH_REPORT_ENV: f"127.0.0.1:{self.port}:{launch_id}"}
+    
+    def poll(self, now: Optional[float] = None) -> List[Tuple[str, float]]:
+        """Drain reports from children and expire stale launches; returns [(game name, latency ms)]"""
+        completed = []
+        while True:
+            try:
+                data, _ = self.sock.recvfrom(256)
+            except (BlockingIOError, InterruptedError):
+                break
+            except OSError:
+                break
+            
+            try:
+                launch_id_text, frame_time_text = data.decode("ascii").split(":")
+                launch_id = int(launch_id_text)
+                frame_time = float(frame_time_text)
+            except ValueError:
+                continue
+            
+            if launch_id not in self.pending:
+                continue
+            game_name, click_time = self.pending.pop(launch_id)
+            latency_ms = max(0.0, (frame_time - click_time) * 1000.0)
+            self.add_sample(game_name, latency_ms)
+            completed.append((game_name, latency_ms))
+        
+        self.expire(now if now is not None else time.time())
+        return completed
+    
+    def expire(self, now: float):
+        """Drop launches whose first frame never arrived within the timeout"""
+        stale = [launch_id for launch_id, (_, click_time) in self.pending.items()
+                 if now - click_time > PENDING_TIMEOUT]
+        for launch_id in stale:
+            del self.pending[launch_id]
+    
+    def add_sample(self, game_name: str, latency_ms: float):
+        """Record a latency sample, keeping a bounded history per game"""
+        history = self.samples.setdefault(game_name, [])
+        history.append(latency_ms)
+        if len(history) > MAX_SAMPLES:
+            del history[:-MAX_SAMPLES]
+    
+    def get_percentiles(self, game_name: str) -> Dict[str, float]:
+        """Return p50/p95/p99 launch latency for a game"""
+        history = self.samples.get(game_name, [])
+        return {
+            "p50": percentile(history, 50),
+            "p95": percentile(history, 95),
+            "p99": percentile(history, 99)
+        }
+    
+    def close(self):
+        """Release the report socket"""
+        self.sock.close()
+
+def install_first_frame_hook():
+    """Game side: report the first display flip if the launcher asked for it"""
+    target = os.environ.pop(LAUNCH_REPORT_ENV, "")
+    if not target:
+        return
+    
+    try:
+        host, port, launch_id = target.rsplit(":", 2)
+        address = (host, int(port))
+    except ValueError:
+        return
+    
+    import pygame
+    original_flip = pygame.display.flip
+    original_update = pygame.display.update
+    
+    def report():
+        # Restore the originals first so the hook costs nothing after frame one
+        pygame.display.flip = original_flip
+        pygame.display.update = original_update
+        try:
+            with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+                sock.sendto(f"{launch_id}:{time.time()}".encode("ascii"), address)
+        except OSError:
+            pass
+    
+    def flip_hook():
+        original_flip()
+        report()
+    
+    def update_hook(*args):
+        original_update(*args)
+        report()
+    
+    pygame.display.flip = flip_hook
+    pygame.display.update = update_hook
@@ -15,15 +15,20 @@ from dataclasses import dataclass
 from enum import Enum
 import time
 
+from config_service import get_setting, load_config, mixer_settings
+from surface_cache import create_text_cache
+
+CONFIG = load_config()
+
 # Performance optimizations
+pygame.mixer.pre_init(**mixer_settings(CONFIG))  # Must come before init to take effect
 pygame.init()
-pygame.mixer.pre_init(frequency=22050, size=-16, channels=2, buffer=512)
 
 # Optimized constants
-WINDOW_WIDTH = 1200
-WINDOW_HEIGHT = 800
-TARGET_FPS = 120  # Higher FPS for smoother experience
-VSYNC = True
+WINDOW_WIDTH = get_setting(CONFIG, "display.width", 1200)
+WINDOW_HEIGHT = get_setting(CONFIG, "display.height", 800)
+TARGET_FPS = get_setting(CONFIG, "display.target_fps", 120)  # Higher FPS for smoother experience
+VSYNC = get_setting(CONFIG, "display.vsync", True)
 
 class Theme:
     """Optimized color theme with pre-calculated values"""
@@ -79,8 +84,7 @@ class OptimizedRenderer:
     """High-performance rendering system"""
     def __init__(self, screen):
         self.screen = screen
-        self.surface_cache = {}
-        self.font_cache = {}
+        self.text_cache = create_text_cache()
         self.dirty_rects = []
         
         # Pre-load fonts
@@ -94,11 +98,12 @@ class OptimizedRenderer:
     def get_text_surface(self, text: str, font_key: str, color: Tuple[int, int, int]) -> pygame.Surface:
         """Cached text rendering"""
         cache_key = (text, font_key, color)
-        if cache_key not in self.surface_cache:
-            font = self.fonts.get(font_key, self.fonts['body'])
-            surface = font.render(text, True, color)
-            self.surface_cache[cache_key] = surface
-        return self.surface_cache[cache_key]
+        return self.text_cache.get_or_create(
+            cache_key, lambda: self.fonts.get(font_key, self.fonts['body']).render(text, True, color))
+    
+    def render_text(self, text: str, font_key: str, color: Tuple[int, int, int]) -> pygame.Surface:
+        """Uncached rendering for live overlay text that changes every frame"""
+        return self.fonts.get(font_key, self.fonts['body']).render(text, True, color)
     
     def draw_rounded_rect(self, surface: pygame.Surface, color: Tuple[int, int, int], 
                          rect: pygame.Rect, radius: int = 8):
@@ -430,8 +435,12 @@ class OptimizedGameLauncher:
         """Draw performance information"""
         fps = self.performance_monitor.get_fps()
         fps_text = f"FPS: {fps:.1f}"
-        fps_surface = self.renderer.get_text_surface(fps_text, 'small', Theme.TEXT_GRAY)
+        fps_surface = self.renderer.render_text(fps_text, 'small', Theme.TEXT_GRAY)
         self.screen.blit(fps_surface, (WINDOW_WIDTH - 100, 10))
+        
+        # Text cache counters, rendered uncached so the overlay doesn't skew what it measures
+        cache_surface = self.renderer.render_text(self.renderer.text_cache.get_stats_text(), 'small', Theme.TEXT_DARK)
+        self.screen.blit(cache_surface, cache_surface.get_rect(topright=(WINDOW_WIDTH - 10, 30)))
     
     def launch_game(self, game_data: GameData):
         """Launch selected game with error handling"""
@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+Particle Engine - Pooled Structure-of-Arrays Particles
+Keeps particle state in NumPy arrays, updates every particle in one vectorized step and draws them with batched blits of pre-rendered stamps
+"""
+
+import random
+from typing import Dict, List, Optional, Tuple
+
+import numpy
+import pygame
+
+Color = Tuple[int, int, int]
+ALPHA_BUCKETS = 16  # Stamps per (shape, size, color); alpha is quantized to this many steps
+DEFAULT_CAPACITY = 256  # Slots allocated up front; the pool doubles when it runs out
+
+class StampCache:
+    """Pre-rendered particle bitmaps per (shape, size, color, alpha bucket)"""
+    
+    def __init__(self, alpha_buckets: int = ALPHA_BUCKETS):
+        self.alpha_buckets = alpha_buckets
+        self.stamps: Dict[Tuple, pygame.Surface] = {}
+    
+    def bucket(self, alpha: float) -> int:
+        """Alpha bucket for an alpha value in 0..255"""
+        return max(0, min(self.alpha_buckets - 1, int(alpha * (self.alpha_buckets - 1) / 255 + 0.5)))
+    
+    def get(self, shape: str, size: int, color: Color, bucket: int) -> pygame.Surface:
+        """Stamp 2*size pixels across: a circle of radius size or a filled square"""
+        key = (shape, size, color, bucket)
+        stamp = self.stamps.get(key)
+        if stamp is None:
+            alpha = round(255 * bucket / (self.alpha_buckets - 1))
+            stamp = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+            if shape == "circle":
+                pygame.draw.circle(stamp, (*color, alpha), (size, size), size)
+            else:
+                stamp.fill((*color, alpha))
+            if pygame.display.get_surface() is not None:
+                stamp = stamp.convert_alpha()
+            self.stamps[key] = stamp
+        return stamp
+    
+    def stamp(self, shape: str, size: int, color: Color, alpha: float) -> pygame.Surface:
+        """Stamp for an unquantized alpha, for one-off effects such as trails"""
+        return self.get(shape, size, color, self.bucket(alpha))
+
+# Shared so every engine and trail in a process reuses the same bitmaps
+stamp_cache = StampCache()
+
+class ParticleEngine:
+    """Particle pool stored as parallel arrays; dead slots go on a free list and are reused"""
+    
+    def __init__(self, capacity: int = DEFAULT_CAPACITY, shape: str = "circle", drag: float = 1.0,
+                 fade: bool = True, shrink: bool = False, wrap: Optional[Tuple[int, int]] = None,
+                 stamps: StampCache = stamp_cache):
+        self.shape = shape
+        self.drag = drag        # Velocity multiplier per tick
+        self.fade = fade        # Alpha scales with remaining life
+        self.shrink = shrink    # Size scales with remaining life
+        self.wrap = wrap        # (width, height) to wrap positions around instead of leaving the screen
+        self.stamps = stamps
+        
+        self.palette: List[Color] = []
+        self.palette_index: Dict[Color, int] = {}
+        self.free: List[int] = []
+        self.high_water = 0  # Slots at or above this index have never been used
+        self.count = 0
+        self.allocate(capacity)
+    
+    def allocate(self, capacity: int):
+        """Create or grow the arrays, keeping existing particles"""
+        old = self.high_water
+        arrays = {
+            "position": numpy.zeros((capacity, 2), dtype=numpy.float32),
+            "velocity": numpy.zeros((capacity, 2), dtype=numpy.float32),
+            "life": numpy.zeros(capacity, dtype=numpy.float32),
+            "max_life": numpy.ones(capacity, dtype=numpy.float32),
+            "size": numpy.zeros(capacity, dtype=numpy.float32),
+            "alpha": numpy.zeros(capacity, dtype=numpy.float32),
+            "color": numpy.zeros(capacity, dtype=numpy.int32),
+            "alive": numpy.zeros(capacity, dtype=bool)
+        }
+        for name, array in arrays.items():
+            if old:
+                array[:old] = getattr(self, name)[:old]
+            setattr(self, name, array)
+        self.capacity = capacity
+    
+    def __len__(self) -> int:
+        return self.count
+    
+    def color_id(self, color: Color) -> int:
+        """Index of a color in the engine's palette"""
+        color = tuple(color[:3])
+        index = self.palette_index.get(color)
+        if index is None:
+            index = self.palette_index[color] = len(self.palette)
+            self.palette.append(color)
+        return index
+    
+    def take_slots(self, count: int) -> numpy.ndarray:
+        """Claim slots for new particles, reusing dead ones first"""
+        reused = min(count, len(self.free))
+        slots = [self.free.pop() for _ in range(reused)]
+        fresh = count - reused
+        if self.high_water + fresh > self.capacity:
+            self.allocate(max(self.capacity * 2, self.high_water + fresh))
+        slots.extend(range(self.high_water, self.high_water + fresh))
+        self.high_water += fresh
+        self.count += count
+        return numpy.array(slots, dtype=numpy.intp)
+    
+    def emit(self, x: float, y: float, vx: float, vy: float, color: Color,
+             life: float = 30.0, size: float = 2.0, alpha: float = 255.0):
+        """Add one particle; life is in 60 Hz ticks (infinite for ambient particles)"""
+        slot = self.take_slots(1)[0]
+        self.position[slot] = (x, y)
+        self.velocity[slot] = (vx, vy)
+        self.life[slot] = self.max_life[slot] = life
+        self.size[slot] = size
+        self.alpha[slot] = alpha
+        self.color[slot] = self.color_id(color)
+        self.alive[slot] = True
+    
+    def burst(self, count: int, x: float, y: float, speed: float, color: Color,
+              life: float = 30.0, size: float = 2.0, spread: float = 0.0, alpha: float = 255.0):
+        """Add count particles at once with velocities uniform in [-speed, speed]"""
+        if count <= 0:
+            return
+        # Seeded from the random module so seeded runs (benchmarks, replays) stay reproducible
+        rng = numpy.random.default_rng(random.getrandbits(32))
+        slots = self.take_slots(count)
+        self.position[slots] = (x, y)
+        if spread:
+            self.position[slots] += rng.uniform(-spread, spread, (count, 2))
+        self.velocity[slots] = rng.uniform(-speed, speed, (count, 2))
+        self.life[slots] = life
+        self.max_life[slots] = life
+        self.size[slots] = size
+        self.alpha[slots] = alpha
+        self.color[slots] = self.color_id(color)
+        self.alive[slots] = True
+    
+    def update(self, ticks: float = 1.0):
+        """Advance every particle by ticks 60 Hz steps and free the ones that died"""
+        used = self.high_water
+        if not self.count:
+            return
+        position = self.position[:used]
+        position += self.velocity[:used] * ticks
+        if self.drag != 1.0:
+            self.velocity[:used] *= self.drag ** ticks
+        if self.wrap:
+            numpy.mod(position, self.wrap, out=position)
+        
+        life = self.life[:used]
+        life -= ticks
+        died = numpy.flatnonzero(self.alive[:used] & (life <= 0))
+        if len(died):
+            self.alive[died] = False
+            self.free.extend(died.tolist())
+            self.count -= len(died)
+    
+    def draw(self, surface: pygame.Surface, offset: Tuple[int, int] = (0, 0),
+             alpha: Optional[numpy.ndarray] = None):
+        """Blit every live particle in one Surface.blits call; alpha optionally overrides per-slot alpha"""
+        if not self.count:
+            return
+        slots = numpy.flatnonzero(self.alive[:self.high_water])
+        
+        ratio = None
+        if self.fade or self.shrink:
+            # inf / inf (ambient particles that never die) counts as full life
+            ratio = numpy.nan_to_num(numpy.clip(self.life[slots] / self.max_life[slots], 0.0, 1.0), nan=1.0)
+        alphas = alpha[slots] if alpha is not None else self.alpha[slots]
+        if self.fade:
+            alphas = alphas * ratio
+        sizes = self.size[slots] * ratio if self.shrink else self.size[slots]
+        sizes = numpy.maximum(1, sizes.astype(numpy.int32))
+        
+        # Fully transparent or off-surface particles cost a blit for nothing
+        buckets = numpy.clip((alphas * (self.stamps.alpha_buckets - 1) / 255 + 0.5).astype(numpy.int32),
+                             0, self.stamps.alpha_buckets - 1)
+        topleft = (self.position[slots] + offset - sizes[:, None]).astype(numpy.int32)
+        visible = ((buckets > 0) & (topleft > -2 * sizes[:, None]).all(axis=1)
+                   & (topleft < surface.get_size()).all(axis=1))
+        slots, sizes, buckets, topleft = slots[visible], sizes[visible], buckets[visible], topleft[visible]
+        if not len(slots):
+            return
+        
+        # One stamp lookup per distinct (color, size, bucket), not per particle
+        keys = (self.color[slots].astype(numpy.int64) * 4096 + sizes) * self.stamps.alpha_buckets + buckets
+        unique_keys, inverse = numpy.unique(keys, return_inverse=True)
+        stamps = []
+        for key in unique_keys.tolist():
+            bucket = key % self.stamps.alpha_buckets
+            size = (key // self.stamps.alpha_buckets) % 4096
+            color = self.palette[key // self.stamps.alpha_buckets // 4096]
+            stamps.append(self.stamps.get(self.shape, size, color, bucket))
+        
+        surface.blits(zip(map(stamps.__getitem__, inverse.tolist()), topleft.tolist()), doreturn=False)
+    
+    def clear(self):
+        """Kill every particle and forget the slots"""
+        self.alive[:] = False
+        self.free.clear()
+        self.high_water = 0
+        self.count = 0
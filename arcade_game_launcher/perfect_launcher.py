@@ -12,14 +12,24 @@ import json
 import time
 from typing import List, Dict, Tuple, Optional
 
+from config_service import ConfigService, get_setting, load_config, mixer_settings
+from frame_scheduler import FrameScheduler
+from process_supervisor import ProcessSupervisor
+from stats_journal import StatsJournal
+from surface_cache import create_text_cache, text_cache_settings
+from zygote_pool import ZygotePool
+
+# Startup settings; frame cap and caches are re-applied live when the file changes
+CONFIG = load_config()
+
 # Initialize Pygame with optimizations
+pygame.mixer.pre_init(**mixer_settings(CONFIG))  # Must come before init to take effect
 pygame.init()
-pygame.mixer.pre_init(frequency=22050, size=-16, channels=2, buffer=256)
 
 # Optimized Constants
 WINDOW_WIDTH = 1000
 WINDOW_HEIGHT = 700
-TARGET_FPS = 144  # Higher FPS for ultra-smooth experience
+TARGET_FPS = get_setting(CONFIG, "display.target_fps", 144)
 
 class Theme:
     """Ultra-modern theme colors"""
@@ -56,8 +66,7 @@ class PerformanceRenderer:
     """Ultra-high performance rendering system"""
     def __init__(self, screen):
         self.screen = screen
-        self.surface_cache = {}
-        self.max_cache_size = 500
+        self.text_cache = create_text_cache()
         
         # Pre-load optimized fonts
         self.fonts = {
@@ -71,19 +80,12 @@ class PerformanceRenderer:
     def get_text_surface(self, text: str, font_key: str, color: Tuple[int, int, int]):
         """Ultra-fast cached text rendering"""
         cache_key = (text, font_key, color)
-        
-        if cache_key not in self.surface_cache:
-            if len(self.surface_cache) >= self.max_cache_size:
-                # Clear oldest entries
-                keys_to_remove = list(self.surface_cache.keys())[:100]
-                for key in keys_to_remove:
-                    del self.surface_cache[key]
-            
-            font = self.fonts.get(font_key, self.fonts['body'])
-            surface = font.render(text, True, color)
-            self.surface_cache[cache_key] = surface
-        
-        return self.surface_cache[cache_key]
+        return self.text_cache.get_or_create(
+            cache_key, lambda: self.fonts.get(font_key, self.fonts['body']).render(text, True, color))
+    
+    def render_text(self, text: str, font_key: str, color: Tuple[int, int, int]):
+        """Uncached rendering for live overlay text that changes every frame"""
+        return self.fonts.get(font_key, self.fonts['body']).render(text, True, color)
     
     def draw_rounded_rect(self, color: Tuple[int, int, int], rect: pygame.Rect, radius: int = 12):
         """Optimized rounded rectangle with glow effect"""
@@ -145,6 +147,15 @@ class GameCard:
         else:
             self.target_scale = 1.05 if self.is_hovered else 1.0
     
+    def is_settled(self) -> bool:
+        """True once scale and glow tweens have reached their targets"""
+        target_glow = 1.0 if (self.is_selected or self.is_hovered) else 0.0
+        if abs(self.target_scale - self.hover_scale) > 0.001 or abs(target_glow - self.glow_intensity) > 0.001:
+            return False
+        self.hover_scale = self.target_scale
+        self.glow_intensity = target_glow
+        return True
+    
     def draw(self, renderer: PerformanceRenderer):
         """Perfect card drawing"""
         # Calculate scaled rect
@@ -207,8 +218,14 @@ class PerfectGameLauncher:
         
         # Performance components
         self.clock = pygame.time.Clock()
+        self.frame_scheduler = FrameScheduler(self.clock, TARGET_FPS)
         self.renderer = PerformanceRenderer(self.screen)
         
+        # Pre-warmed game processes for instant launches
+        self.game_pool = ZygotePool(size=1)
+        self.game_pool.start()
+        self.supervisor = ProcessSupervisor()
+        
         # Game data
         self.games = self.load_games()
         self.game_cards = []
@@ -218,11 +235,20 @@ class PerfectGameLauncher:
         self.scroll_offset = 0
         self.target_scroll = 0
         
-        # Statistics
+        # Statistics, persisted by a background journal writer
+        self.stats_journal = StatsJournal()
         self.stats = self.load_stats()
+        self.stats_journal.start()
         
         self.setup_perfect_layout()
         self.load_game_stats()
+        self.config = ConfigService()
+        self.config.subscribe(self.apply_config)
+    
+    def apply_config(self, config: ConfigService):
+        """Config service subscriber: frame cap and text cache"""
+        self.frame_scheduler.target_fps = int(config.get("display.target_fps", TARGET_FPS))
+        self.renderer.text_cache.configure(*text_cache_settings(config.config))
     
     def load_games(self) -> List[GameData]:
         """Load games with perfect configuration"""
@@ -285,12 +311,8 @@ class PerfectGameLauncher:
         print(f"🎯 Perfect layout created: {len(self.games)} games in 3-column design")
     
     def load_stats(self) -> Dict:
-        """Load game statistics"""
-        try:
-            with open("game_stats.json", "r") as f:
-                return json.load(f)
-        except:
-            return {}
+        """Load game statistics from the snapshot plus journal"""
+        return self.stats_journal.load()
     
     def load_game_stats(self):
         """Load statistics for each game"""
@@ -299,24 +321,13 @@ class PerfectGameLauncher:
                 game.play_count = self.stats[game.name].get("play_count", 0)
                 game.last_played = self.stats[game.name].get("last_played", 0)
     
-    def save_stats(self):
-        """Save game statistics"""
-        stats_data = {}
-        for game in self.games:
-            stats_data[game.name] = {
-                "play_count": game.play_count,
-                "last_played": game.last_played
-            }
-        
-        try:
-            with open("game_stats.json", "w") as f:
-                json.dump(stats_data, f, indent=2)
-        except Exception as e:
-            print(f"Failed to save stats: {e}")
+    def save_stats(self, game: GameData):
+        """Queue a game's statistics for the journal writer (no file I/O here)"""
+        self.stats_journal.record(game.name, play_count=game.play_count, last_played=game.last_played)
     
-    def handle_events(self) -> bool:
+    def handle_events(self, events: List[pygame.event.Event]) -> bool:
         """Perfect event handling"""
-        for event in pygame.event.get():
+        for event in events:
             if event.type == pygame.QUIT:
                 return False
             
@@ -370,16 +381,19 @@ class PerfectGameLauncher:
             print(f"❌ {game.name} is not available")
             return
         
+        if self.supervisor.is_running(game.name):
+            print(f"⏳ {game.name} is already running")
+            return
+        
         try:
             # Update statistics
             game.play_count += 1
             game.last_played = time.time()
-            self.save_stats()
+            self.save_stats(game)
             
-            # Launch game in separate process
+            # Launch game in a pre-warmed process
             game_dir = os.path.dirname(game.path)
-            subprocess.Popen([sys.executable, os.path.basename(game.path)], 
-                           cwd=game_dir)
+            self.supervisor.launch(game.name, lambda: self.game_pool.launch(game.path, cwd=game_dir))
             print(f"🚀 Launched: {game.name}")
             
         except Exception as e:
@@ -387,12 +401,20 @@ class PerfectGameLauncher:
     
     def update(self, dt: float):
         """Perfect update loop"""
+        self.config.poll()
+        for record in self.supervisor.poll_finished():
+            print(f"🏁 {record.get_summary_text()}")
+        
         # Update cards
         mouse_pos = pygame.mouse.get_pos()
         for card in self.game_cards:
             card.update(dt)
             card.handle_hover(mouse_pos)
     
+    def is_settled(self) -> bool:
+        """True when no card animation is in motion"""
+        return all(card.is_settled() for card in self.game_cards)
+    
     def draw(self):
         """Perfect drawing with no lag"""
         # Clear screen
@@ -441,12 +463,14 @@ class PerfectGameLauncher:
         controls = [
             "🖱️ Single Click: Launch game instantly",
             "⌨️ Arrow Keys: Navigate • Enter: Launch • ESC: Exit",
-            f"🎯 Game {self.selected_index + 1}/{len(self.games)} • FPS: {int(self.clock.get_fps())}"
+            f"🎯 Game {self.selected_index + 1}/{len(self.games)} • FPS: {int(self.clock.get_fps())} • {self.renderer.text_cache.get_stats_text()}"
         ]
         
         y_start = WINDOW_HEIGHT - 80
         for i, control in enumerate(controls):
-            control_surface = self.renderer.get_text_surface(control, 'small', Theme.TEXT_GRAY)
+            # The last line carries live stats, so it skips the cache it reports on
+            render = self.renderer.render_text if i == len(controls) - 1 else self.renderer.get_text_surface
+            control_surface = render(control, 'small', Theme.TEXT_GRAY)
             control_rect = control_surface.get_rect(center=(WINDOW_WIDTH // 2, y_start + i * 25))
             self.screen.blit(control_surface, control_rect)
     
@@ -469,8 +493,8 @@ class PerfectGameLauncher:
             dt = current_time - last_time
             last_time = current_time
             
-            # Handle events
-            running = self.handle_events()
+            # Handle events (blocks while idle)
+            running = self.handle_events(self.frame_scheduler.get_events())
             
             # Update
             self.update(dt)
@@ -478,11 +502,14 @@ class PerfectGameLauncher:
             # Draw
             self.draw()
             
-            # Perfect frame rate control
-            self.clock.tick(TARGET_FPS)
+            # Frame rate control, idling once everything has settled
+            self.frame_scheduler.tick(self.is_settled())
         
         # Cleanup
-        self.save_stats()
+        print(f"💤 {self.frame_scheduler.get_stats_text()}")
+        self.stats_journal.close()
+        self.supervisor.shutdown()
+        self.game_pool.shutdown()
         pygame.quit()
         sys.exit()
 
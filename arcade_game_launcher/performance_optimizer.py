@@ -6,21 +6,178 @@ Automatically detects and fixes common performance issues
 
 import os
 import sys
+import copy
 import json
-import psutil
+import time
+import random
+import hashlib
 import platform
-from typing import Dict, List, Tuple
+import subprocess
+from typing import Dict, List, Optional, Tuple
+
+from config_service import CONFIG_PATH, load_config
+from launch_latency import percentile
+from quality_governor import QUALITY_LEVELS, QualityLevel
+
+CALIBRATE_FLAG = "--calibrate-worker"
+CALIBRATION_SECONDS = 0.5  # Per scene and quality level: 2 scenes x 4 levels is a few seconds
+CALIBRATION_WARMUP_FRAMES = 10
+CALIBRATION_HEADROOM = 1.5  # Scenes are a stand-in for real frames, so demand this much spare speed
+CALIBRATION_SCENES = {"launcher": 120, "game": 60}  # Scene -> the frame cap it runs at
+SCENE_SIZE = (1200, 800)
+
+def cpu_model() -> str:
+    """CPU model name, without spawning a process"""
+    try:
+        with open("/proc/cpuinfo", "r") as f:
+            for line in f:
+                if line.startswith("model name"):
+                    return line.split(":", 1)[1].strip()
+    except OSError:
+        pass
+    return platform.processor()
+
+def hardware_fingerprint() -> str:
+    """Identifies the machine and renderer a calibration was measured on"""
+    import pygame
+    parts = [platform.system(), platform.machine(), cpu_model(), str(os.cpu_count()),
+             pygame.version.ver, ".".join(map(str, pygame.get_sdl_version()))]
+    return hashlib.sha1("|".join(parts).encode("utf-8")).hexdigest()[:16]
+
+def load_profile(config_path: str = CONFIG_PATH) -> Optional[Dict]:
+    """The stored calibration, if it was measured on this hardware"""
+    profile = load_config(config_path).get("calibration")
+    if not profile or profile.get("fingerprint") != hardware_fingerprint():
+        return None
+    return profile
+
+def calibrated_level(scene: str, config_path: str = CONFIG_PATH) -> int:
+    """Starting quality level index for a scene; the best level when uncalibrated"""
+    profile = load_profile(config_path)
+    if profile is None:
+        return 0
+    recommended = profile.get("scenes", {}).get(scene, {}).get("recommended")
+    names = [level.name for level in QUALITY_LEVELS]
+    return names.index(recommended) if recommended in names else 0
+
+class CalibrationScenes:
+    """Off-screen stand-ins for a launcher frame and a game frame, drawn per quality level"""
+    
+    def __init__(self, screen):
+        import pygame
+        self.pygame = pygame
+        self.screen = screen
+        self.rng = random.Random(1234)
+        font = pygame.font.Font(None, 24)
+        self.texts = [font.render(text, True, (255, 255, 255))
+                      for text in ("Dino Run", "Action", "Played 12x", "Score: 1200", "Level: 3")]
+        
+        # One card bitmap, like the launcher's card cache holds
+        self.card = pygame.Surface((280, 160), pygame.SRCALPHA)
+        pygame.draw.rect(self.card, (28, 28, 44), self.card.get_rect(), border_radius=12)
+        pygame.draw.circle(self.card, (255, 100, 100), (40, 40), 24)
+        for i, text in enumerate(self.texts[:3]):
+            self.card.blit(text, (80, 20 + i * 30))
+        self.card = self.card.convert_alpha()
+        
+        # The games blit a cached gradient layer rather than drawing it line by line
+        from background_layers import create_gradient
+        self.sky = create_gradient(screen.get_size(), (32, 64, 128), (0, 0, 0)).convert()
+    
+    def draw_launcher(self, level: QualityLevel, frame: int):
+        """Card grid with glow, re-scaling the hovered card as its tween runs"""
+        pygame = self.pygame
+        self.screen.fill((12, 12, 20))
+        for i in range(12):
+            x, y = 40 + (i % 4) * 290, 120 + (i // 4) * 180
+            if level.glow and i == frame % 12:
+                pygame.draw.rect(self.screen, (64, 128, 255), (x - 4, y - 4, 288, 168), border_radius=16)
+            self.screen.blit(self.card, (x, y))
+        
+        # Hover tween: a fresh scale step each frame at high quality, a cheap one at medium
+        size = (280 + frame % 14, 160 + frame % 8)
+        if level.animation_quality == "high":
+            self.screen.blit(pygame.transform.smoothscale(self.card, size), (40, 120))
+        elif level.animation_quality == "medium":
+            self.screen.blit(pygame.transform.scale(self.card, size), (40, 120))
+    
+    def draw_game(self, level: QualityLevel, frame: int):
+        """Gradient sky, obstacles, alpha particles and a HUD"""
+        pygame = self.pygame
+        width, height = self.screen.get_size()
+        if level.gradient_background:
+            self.screen.blit(self.sky, (0, 0))
+        else:
+            self.screen.fill((0, 0, 0))
+        
+        for i in range(20):
+            pygame.draw.rect(self.screen, (128, 128, 128), ((i * 97 + frame * 4) % width, (i * 53) % height, 40, 60))
+        
+        if level.particles:
+            for _ in range(150):
+                particle = pygame.Surface((4, 4), pygame.SRCALPHA)
+                particle.fill((255, 128, 64, self.rng.randint(0, 255)))
+                self.screen.blit(particle, (self.rng.randrange(width), self.rng.randrange(height)))
+        
+        for i, text in enumerate(self.texts[3:]):
+            self.screen.blit(text, (10, 10 + i * 30))
+
+def measure_scene(draw, level: QualityLevel, seconds: float) -> Dict[str, float]:
+    """Uncapped FPS and p95 frame time of one scene at one level"""
+    for frame in range(CALIBRATION_WARMUP_FRAMES):
+        draw(level, frame)
+    
+    frame_times = []
+    start = time.perf_counter()
+    while time.perf_counter() - start < seconds:
+        frame_start = time.perf_counter()
+        draw(level, len(frame_times))
+        frame_times.append((time.perf_counter() - frame_start) * 1000)
+    
+    elapsed = time.perf_counter() - start
+    return {"fps": round(len(frame_times) / elapsed, 1), "p95_ms": round(percentile(frame_times, 95), 3)}
+
+def recommend_level(levels: Dict[str, Dict[str, float]], max_fps: int) -> str:
+    """Best level whose measured FPS clears its frame cap with headroom"""
+    for level in QUALITY_LEVELS:
+        if levels[level.name]["fps"] >= min(max_fps, level.target_fps) * CALIBRATION_HEADROOM:
+            return level.name
+    return QUALITY_LEVELS[-1].name
+
+def run_calibration(seconds: float) -> Dict:
+    """Calibration worker: render every scene at every level on a headless display"""
+    import pygame
+    pygame.display.init()
+    pygame.font.init()
+    screen = pygame.display.set_mode(SCENE_SIZE)
+    scenes = CalibrationScenes(screen)
+    draws = {"launcher": scenes.draw_launcher, "game": scenes.draw_game}
+    
+    results = {}
+    for scene, max_fps in CALIBRATION_SCENES.items():
+        levels = {level.name: measure_scene(draws[scene], level, seconds) for level in QUALITY_LEVELS}
+        results[scene] = {"max_fps": max_fps, "levels": levels, "recommended": recommend_level(levels, max_fps)}
+    
+    pygame.quit()
+    return {
+        "fingerprint": hardware_fingerprint(),
+        "measured_at": time.time(),
+        "seconds_per_level": seconds,
+        "scenes": results
+    }
 
 class PerformanceOptimizer:
     """Analyzes system and optimizes launcher performance"""
     
-    def __init__(self):
+    def __init__(self, config_path: str = CONFIG_PATH):
         self.system_info = self.get_system_info()
         self.recommendations = []
-        self.config_path = "performance_config.json"
+        self.config_path = config_path
+        self.profile = None
     
     def get_system_info(self) -> Dict:
         """Gather system information"""
+        import psutil
         return {
             "cpu_count": psutil.cpu_count(),
             "memory_gb": psutil.virtual_memory().total / (1024**3),
@@ -30,12 +187,39 @@ class PerformanceOptimizer:
             "memory_percent": psutil.virtual_memory().percent
         }
     
+    def calibrate(self, seconds: float = CALIBRATION_SECONDS) -> Optional[Dict]:
+        """Measure achievable FPS per quality level in a headless child process"""
+        env = dict(os.environ, SDL_VIDEODRIVER="dummy", SDL_AUDIODRIVER="dummy", PYGAME_HIDE_SUPPORT_PROMPT="1")
+        result = subprocess.run([sys.executable, os.path.abspath(__file__), CALIBRATE_FLAG, str(seconds)],
+                                env=env, capture_output=True, text=True)
+        if result.returncode != 0:
+            print(f"⚠️  Calibration failed: {result.stderr.strip().splitlines()[-1:] or result.returncode}")
+            return None
+        return json.loads(result.stdout)
+    
+    def get_profile(self, recalibrate: bool = False) -> Optional[Dict]:
+        """Stored calibration for this hardware, measuring a new one when missing or stale"""
+        if self.profile is None and not recalibrate:
+            self.profile = load_profile(self.config_path)
+            if self.profile:
+                print("♻️  Reusing calibration measured on this hardware")
+        if self.profile is None:
+            print("🔬 Calibrating: rendering launcher and game scenes headlessly...")
+            self.profile = self.calibrate()
+        return self.profile
+    
     def analyze_performance(self) -> List[str]:
         """Analyze system and provide recommendations"""
         recommendations = []
+        profile = self.get_profile()
         
-        # CPU Analysis
-        if self.system_info["cpu_count"] < 4:
+        # Frame rate and effects from measured rendering speed when calibrated, core count otherwise
+        if profile:
+            for scene, result in profile["scenes"].items():
+                measured = result["levels"][result["recommended"]]["fps"]
+                recommendations.append(f"CALIBRATED_{scene.upper()}: Use {result['recommended']} quality "
+                                       f"for the {scene} ({measured:.0f} FPS measured)")
+        elif self.system_info["cpu_count"] < 4:
             recommendations.append("LOW_CPU: Reduce target FPS to 60")
             recommendations.append("LOW_CPU: Disable smooth animations")
         
@@ -45,7 +229,7 @@ class PerformanceOptimizer:
             recommendations.append("LOW_MEMORY: Disable surface caching")
         
         # Current Load Analysis
-        if self.system_info["cpu_percent"] > 80:
+        if self.system_info["cpu_percent"] > 80 and not profile:
             recommendations.append("HIGH_CPU_LOAD: Lower FPS target")
         
         if self.system_info["memory_percent"] > 80:
@@ -86,11 +270,19 @@ class PerformanceOptimizer:
         }
     
     def optimize_config(self, config: Dict) -> Dict:
-        """Apply optimizations to configuration"""
+        """Apply optimizations to a copy of the configuration"""
+        config = copy.deepcopy(config)
         recommendations = self.analyze_performance()
         
         for rec in recommendations:
-            if "LOW_CPU" in rec:
+            if "CALIBRATED_LAUNCHER" in rec:
+                self.apply_level(config, self.profile["scenes"]["launcher"])
+            
+            elif "CALIBRATED_GAME" in rec:
+                config.setdefault("graphics", {})["particle_effects"] = self.find_level(
+                    self.profile["scenes"]["game"]["recommended"]).particles
+            
+            elif "LOW_CPU" in rec:
                 if "Reduce target FPS" in rec:
                     config["display"]["target_fps"] = 60
                 elif "Disable smooth animations" in rec:
@@ -111,13 +303,29 @@ class PerformanceOptimizer:
             elif "WINDOWS" in rec and "hardware acceleration" in rec:
                 config["display"]["hardware_acceleration"] = True
         
+        if self.profile:
+            config["calibration"] = self.profile
         return config
     
+    def find_level(self, name: str) -> QualityLevel:
+        """Quality level by name"""
+        return next(level for level in QUALITY_LEVELS if level.name == name)
+    
+    def apply_level(self, config: Dict, scene: Dict):
+        """Write a scene's recommended level into the display and effect settings"""
+        level = self.find_level(scene["recommended"])
+        config["display"]["target_fps"] = min(scene["max_fps"], level.target_fps)
+        config["performance"]["animation_quality"] = level.animation_quality
+        config.setdefault("graphics", {})["glow_effects"] = level.glow
+    
     def save_config(self, config: Dict):
         """Save optimized configuration"""
         try:
-            with open(self.config_path, 'w') as f:
+            # Replace atomically so running launchers never reload a half-written file
+            temp_path = self.config_path + ".tmp"
+            with open(temp_path, 'w') as f:
                 json.dump(config, f, indent=2)
+            os.replace(temp_path, self.config_path)
             print(f"✅ Configuration saved to {self.config_path}")
         except Exception as e:
             print(f"❌ Failed to save config: {e}")
@@ -132,6 +340,13 @@ class PerformanceOptimizer:
         print(f"   CPU Usage: {self.system_info['cpu_percent']:.1f}%")
         print(f"   Memory Usage: {self.system_info['memory_percent']:.1f}%")
     
+    def print_calibration(self, profile: Dict):
+        """Print measured FPS per scene and quality level"""
+        print("\n🔬 Calibration (uncapped FPS per quality level):")
+        for scene, result in profile["scenes"].items():
+            measured = "  ".join(f"{name} {stats['fps']:.0f}" for name, stats in result["levels"].items())
+            print(f"   {scene:<9} {measured}  → {result['recommended']}")
+    
     def print_recommendations(self, recommendations: List[str]):
         """Print optimization recommendations"""
         if not recommendations:
@@ -142,7 +357,7 @@ class PerformanceOptimizer:
         for rec in recommendations:
             print(f"   • {rec.split(': ', 1)[1] if ': ' in rec else rec}")
     
-    def run_optimization(self):
+    def run_optimization(self, recalibrate: bool = False):
         """Run full optimization process"""
         print("🚀 Performance Optimizer for Game Launcher")
         print("=" * 50)
@@ -150,6 +365,11 @@ class PerformanceOptimizer:
         # Show system info
         self.print_system_info()
         
+        # Measure rendering speed, or reuse the measurement for this hardware
+        profile = self.get_profile(recalibrate)
+        if profile:
+            self.print_calibration(profile)
+        
         # Analyze performance
         recommendations = self.analyze_performance()
         self.print_recommendations(recommendations)
@@ -174,6 +394,8 @@ class PerformanceOptimizer:
         """Show configuration differences"""
         def compare_dict(old_dict, new_dict, prefix=""):
             for key, new_value in new_dict.items():
+                if key == "calibration":
+                    continue  # Printed as a table
                 old_value = old_dict.get(key)
                 current_key = f"{prefix}.{key}" if prefix else key
                 
@@ -188,7 +410,7 @@ def main():
     """Main function"""
     try:
         optimizer = PerformanceOptimizer()
-        optimizer.run_optimization()
+        optimizer.run_optimization(recalibrate="--recalibrate" in sys.argv)
     except ImportError as e:
         if "psutil" in str(e):
             print("Installing psutil for system analysis...")
@@ -201,4 +423,7 @@ def main():
         print(f"Optimization error: {e}")
 
 if __name__ == "__main__":
-    main()
+    if len(sys.argv) == 3 and sys.argv[1] == CALIBRATE_FLAG:
+        print(json.dumps(run_calibration(float(sys.argv[2]))))
+    else:
+        main()
@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+"""
+Play History - SQLite Session Store
+Records one row per play session in WAL mode and answers launcher queries through indexes
+"""
+
+import time
+import queue
+import sqlite3
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+HISTORY_DB = "play_history.db"
+WEEK_SECONDS = 7 * 24 * 60 * 60
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS games (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE,
+    play_count INTEGER NOT NULL DEFAULT 0,
+    last_played REAL NOT NULL DEFAULT 0,
+    total_seconds REAL NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS sessions (
+    id INTEGER PRIMARY KEY,
+    game_id INTEGER NOT NULL REFERENCES games(id),
+    started REAL NOT NULL,
+    ended REAL,
+    duration REAL,
+    exit_code INTEGER,
+    score INTEGER,
+    cpu_seconds REAL,
+    peak_rss_kb INTEGER,
+    frame_p95_ms REAL,
+    stutter_frames INTEGER
+);
+CREATE INDEX IF NOT EXISTS idx_sessions_started ON sessions(started, game_id);
+CREATE INDEX IF NOT EXISTS idx_sessions_game ON sessions(game_id, started);
+CREATE INDEX IF NOT EXISTS idx_games_last_played ON games(last_played);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+# Session columns added after the first release, for databases created before them
+ADDED_SESSION_COLUMNS = {"cpu_seconds": "REAL", "peak_rss_kb": "INTEGER",
+                         "frame_p95_ms": "REAL", "stutter_frames": "INTEGER"}
+
+class PlayHistory:
+    """Per-session play history; games keeps running totals so all-time queries stay small"""
+    
+    def __init__(self, db_path: str = HISTORY_DB):
+        self.db_path = db_path
+        self.conn = sqlite3.connect(db_path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA foreign_keys=ON")
+        self.conn.executescript(SCHEMA)
+        self._add_missing_columns()
+        self.game_ids: Dict[str, int] = {}
+    
+    def _add_missing_columns(self):
+        """Upgrade a sessions table created by an older version"""
+        existing = {row[1] for row in self.conn.execute("PRAGMA table_info(sessions)")}
+        with self.conn:
+            for column, column_type in ADDED_SESSION_COLUMNS.items():
+                if column not in existing:
+                    self.conn.execute(f"ALTER TABLE sessions ADD COLUMN {column} {column_type}")
+    
+    def _game_id(self, game_name: str) -> int:
+        """Row id for a game, creating it on first use"""
+        game_id = self.game_ids.get(game_name)
+        if game_id is None:
+            self.conn.execute("INSERT OR IGNORE INTO games (name) VALUES (?)", (game_name,))
+            game_id = self.conn.execute("SELECT id FROM games WHERE name = ?", (game_name,)).fetchone()[0]
+            self.game_ids[game_name] = game_id
+        return game_id
+    
+    def migrate_from_stats(self, stats: Dict[str, Dict]) -> bool:
+        """One-time import of play_count/last_played from game_stats.json"""
+        with self.conn:
+            if self.conn.execute("SELECT 1 FROM meta WHERE key = 'migrated_stats_json'").fetchone():
+                return False
+            
+            for game_name, game_stats in stats.items():
+                game_id = self._game_id(game_name)
+                self.conn.execute(
+                    "UPDATE games SET play_count = play_count + ?, last_played = MAX(last_played, ?) WHERE id = ?",
+                    (int(game_stats.get("play_count", 0)), float(game_stats.get("last_played", 0)), game_id))
+            self.conn.execute("INSERT INTO meta (key, value) VALUES ('migrated_stats_json', ?)", (str(time.time()),))
+        return True
+    
+    def last_session_id(self) -> int:
+        """Highest session id stored so far, 0 for an empty database"""
+        return self.conn.execute("SELECT COALESCE(MAX(id), 0) FROM sessions").fetchone()[0]
+    
+    def start_session(self, game_name: str, started: Optional[float] = None,
+                      session_id: Optional[int] = None) -> int:
+        """Open a session at launch and return its id, optionally one reserved in advance"""
+        started = started if started is not None else time.time()
+        with self.conn:
+            game_id = self._game_id(game_name)
+            cursor = self.conn.execute("INSERT INTO sessions (id, game_id, started) VALUES (?, ?, ?)",
+                                       (session_id, game_id, started))
+            self.conn.execute(
+                "UPDATE games SET play_count = play_count + 1, last_played = MAX(last_played, ?) WHERE id = ?",
+                (started, game_id))
+        return cursor.lastrowid
+    
+    def end_session(self, session_id: int, exit_code: Optional[int] = None,
+                    score: Optional[int] = None, ended: Optional[float] = None,
+                    cpu_seconds: Optional[float] = None, peak_rss_kb: Optional[int] = None,
+                    frame_p95_ms: Optional[float] = None, stutter_frames: Optional[int] = None):
+        """Close a session once its process has exited"""
+        ended = ended if ended is not None else time.time()
+        with self.conn:
+            row = self.conn.execute("SELECT game_id, started FROM sessions WHERE id = ?", (session_id,)).fetchone()
+            if row is None:
+                return
+            game_id, started = row
+            duration = max(0.0, ended - started)
+            self.conn.execute(
+                "UPDATE sessions SET ended = ?, duration = ?, exit_code = ?, score = ?, "
+                "cpu_seconds = ?, peak_rss_kb = ?, frame_p95_ms = ?, stutter_frames = ? WHERE id = ?",
+                (ended, duration, exit_code, score, cpu_seconds, peak_rss_kb,
+                 frame_p95_ms, stutter_frames, session_id))
+            self.conn.execute("UPDATE games SET total_seconds = total_seconds + ? WHERE id = ?",
+                              (duration, game_id))
+    
+    def add_sessions(self, sessions: Iterable[Tuple[str, float, float, Optional[int], Optional[int]]]):
+        """Bulk insert finished sessions: (game, started, ended, exit_code, score)"""
+        rows = []
+        totals: Dict[int, List[float]] = {}
+        with self.conn:
+            for name, started, ended, exit_code, score in sessions:
+                game_id = self._game_id(name)
+                duration = max(0.0, ended - started)
+                rows.append((game_id, started, ended, duration, exit_code, score))
+                
+                total = totals.setdefault(game_id, [0, 0.0, 0.0])
+                total[0] += 1
+                total[1] = max(total[1], started)
+                total[2] += duration
+            
+            self.conn.executemany(
+                "INSERT INTO sessions (game_id, started, ended, duration, exit_code, score) VALUES (?, ?, ?, ?, ?, ?)",
+                rows)
+            self.conn.executemany(
+                "UPDATE games SET play_count = play_count + ?, last_played = MAX(last_played, ?), "
+                "total_seconds = total_seconds + ? WHERE id = ?",
+                [(count, last, seconds, game_id) for game_id, (count, last, seconds) in totals.items()])
+    
+    def most_played(self, since: Optional[float] = None, limit: Optional[int] = None) -> List[Tuple[str, int]]:
+        """Games ordered by session count, all time or since a timestamp"""
+        limit = -1 if limit is None else limit
+        if since is None:
+            return self.conn.execute(
+                "SELECT name, play_count FROM games WHERE play_count > 0 "
+                "ORDER BY play_count DESC, name LIMIT ?", (limit,)).fetchall()
+        
+        # Range scan over the started index; without statistics SQLite would walk all sessions by game
+        return self.conn.execute(
+            "SELECT g.name, c.plays FROM "
+            "(SELECT game_id, COUNT(*) AS plays FROM sessions INDEXED BY idx_sessions_started "
+            "WHERE started >= ? GROUP BY game_id) c "
+            "JOIN games g ON g.id = c.game_id ORDER BY c.plays DESC, g.name LIMIT ?", (since, limit)).fetchall()
+    
+    def most_played_this_week(self, limit: Optional[int] = None) -> List[Tuple[str, int]]:
+        """Games ordered by sessions started in the last seven days"""
+        return self.most_played(since=time.time() - WEEK_SECONDS, limit=limit)
+    
+    def recently_played(self, limit: Optional[int] = None) -> List[Tuple[str, float]]:
+        """Games ordered by their latest session start"""
+        limit = -1 if limit is None else limit
+        return self.conn.execute(
+            "SELECT name, last_played FROM games WHERE last_played > 0 "
+            "ORDER BY last_played DESC LIMIT ?", (limit,)).fetchall()
+    
+    def recent_sessions(self, game_name: str, limit: int = 10) -> List[Tuple[float, Optional[float], Optional[int], Optional[int]]]:
+        """Latest sessions of one game: (started, duration, exit_code, score)"""
+        return self.conn.execute(
+            "SELECT s.started, s.duration, s.exit_code, s.score FROM sessions s "
+            "JOIN games g ON g.id = s.game_id WHERE g.name = ? ORDER BY s.started DESC LIMIT ?",
+            (game_name, limit)).fetchall()
+    
+    def frame_stats(self, limit: Optional[int] = None) -> List[Tuple[str, float, int]]:
+        """Games with telemetry ordered by worst average p95 frame time: (name, p95 ms, stutters)"""
+        limit = -1 if limit is None else limit
+        return self.conn.execute(
+            "SELECT g.name, AVG(s.frame_p95_ms), SUM(s.stutter_frames) FROM sessions s "
+            "JOIN games g ON g.id = s.game_id WHERE s.frame_p95_ms IS NOT NULL "
+            "GROUP BY s.game_id ORDER BY AVG(s.frame_p95_ms) DESC LIMIT ?", (limit,)).fetchall()
+    
+    def close(self):
+        """Checkpoint the WAL and close the database"""
+        try:
+            self.conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        except sqlite3.Error:
+            pass
+        self.conn.close()
+
+class PlayHistoryWriter:
+    """Runs a PlayHistory on a background thread; the render thread only queues work and polls results"""
+    
+    def __init__(self, db_path: str = HISTORY_DB):
+        self.db_path = db_path
+        self.queue: "queue.Queue[Optional[Tuple]]" = queue.Queue()
+        self.results: "queue.Queue[Tuple[Callable[[Any], None], Any]]" = queue.Queue()
+        self.writer_thread: Optional[threading.Thread] = None
+        self.ready = threading.Event()
+        self.enabled = True  # False once the database failed to open; queued calls are then dropped
+        self.next_session_id = 1
+    
+    def start(self, stats: Optional[Dict[str, Dict]] = None):
+        """Open the database on the writer thread, migrating game_stats.json counts once"""
+        if self.writer_thread is not None:
+            return
+        self.writer_thread = threading.Thread(target=self._writer_loop, args=(stats,), daemon=True)
+        self.writer_thread.start()
+    
+    def _writer_loop(self, stats: Optional[Dict[str, Dict]]):
+        """Own the connection and run queued calls in order"""
+        history = None
+        try:
+            history = PlayHistory(self.db_path)
+            if stats is not None:
+                history.migrate_from_stats(stats)
+            self.next_session_id = history.last_session_id() + 1
+        except Exception as e:
+            # Unwritable directory, locked or corrupt database: keep launching games, just without history
+            print(f"⚠️ Play history disabled: {e}")
+            if history is not None:
+                history.close()
+            history = None
+            self.enabled = False
+        finally:
+            # Set even on failure, or the loader and start_session would wait forever
+            self.ready.set()
+        
+        while True:
+            item = self.queue.get()
+            if item is None:
+                break
+            if history is None:
+                continue
+            method, args, kwargs, callback = item
+            try:
+                result = getattr(history, method)(*args, **kwargs)
+            except Exception as e:
+                print(f"⚠️ Play history {method} failed: {e}")
+                continue
+            if callback is not None:
+                self.results.put((callback, result))
+        if history is not None:
+            history.close()
+    
+    def _submit(self, method: str, *args, callback: Optional[Callable[[Any], None]] = None, **kwargs):
+        """Queue a PlayHistory call for the writer thread"""
+        self.queue.put((method, args, kwargs, callback))
+    
+    def start_session(self, game_name: str, started: Optional[float] = None) -> int:
+        """Reserve a session id now and insert the row in the background"""
+        self.ready.wait()
+        session_id = self.next_session_id
+        self.next_session_id += 1
+        self._submit("start_session", game_name, started, session_id)
+        return session_id
+    
+    def end_session(self, session_id: int, **fields):
+        """Close a session in the background"""
+        self._submit("end_session", session_id, **fields)
+    
+    def query(self, method: str, *args, callback: Callable[[Any], None], **kwargs):
+        """Run a read query after every write queued before it; poll() delivers the result"""
+        self._submit(method, *args, callback=callback, **kwargs)
+    
+    def poll(self) -> int:
+        """Hand finished query results to their callbacks on the calling thread"""
+        delivered = 0
+        while True:
+            try:
+                callback, result = self.results.get_nowait()
+            except queue.Empty:
+                return delivered
+            callback(result)
+            delivered += 1
+    
+    def close(self):
+        """Finish queued work, then checkpoint and close the database"""
+        if self.writer_thread is not None:
+            self.queue.put(None)
+            self.writer_thread.join()
+            self.writer_thread = None
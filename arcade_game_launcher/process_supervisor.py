@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Process Supervisor - Game Process Ownership and Accounting
+Reaps launched games from a watcher thread and records wall time, exit status, CPU time and peak RSS
+"""
+
+import os
+import time
+import queue
+import threading
+import subprocess
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Set
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+POLL_INTERVAL = 0.25  # Seconds between watcher passes
+
+@dataclass
+class SessionRecord:
+    """One finished (or running) game process"""
+    game_name: str
+    pid: int
+    started: float
+    ended: float = 0
+    exit_code: Optional[int] = None
+    cpu_seconds: float = 0
+    peak_rss_kb: int = 0
+    session_id: Optional[int] = None
+    
+    @property
+    def duration(self) -> float:
+        """Wall-clock seconds, measured up to now while still running"""
+        return max(0.0, (self.ended or time.time()) - self.started)
+    
+    def get_summary_text(self) -> str:
+        """One-line session summary for the console"""
+        return (f"{self.game_name}: {self.duration:.0f}s, exit {self.exit_code}, "
+                f"CPU {self.cpu_seconds:.1f}s, peak {self.peak_rss_kb // 1024}MB")
+
+class ProcessSupervisor:
+    """Owns every game process: one instance per game, reaped without blocking the render loop"""
+    
+    def __init__(self, poll_interval: float = POLL_INTERVAL):
+        self.poll_interval = poll_interval
+        self.lock = threading.Lock()
+        self.children: Dict[str, subprocess.Popen] = {}
+        self.records: Dict[str, SessionRecord] = {}
+        self.reserved: Set[str] = set()
+        self.finished: "queue.Queue[SessionRecord]" = queue.Queue()
+        
+        self.running = True
+        self.wake_event = threading.Event()
+        self.watcher_thread = threading.Thread(target=self._watch_loop, daemon=True)
+        self.watcher_thread.start()
+    
+    def is_running(self, game_name: str) -> bool:
+        """True while the game has a live process (or one is being started)"""
+        with self.lock:
+            return game_name in self.children or game_name in self.reserved
+    
+    def reserve(self, game_name: str) -> bool:
+        """Claim a game's slot ahead of a launch on another thread; False if it is running or claimed"""
+        with self.lock:
+            if game_name in self.children or game_name in self.reserved:
+                return False
+            self.reserved.add(game_name)
+            return True
+    
+    def launch(self, game_name: str, start: Callable[[], subprocess.Popen],
+               session_id: Optional[int] = None, reserved: bool = False) -> Optional[subprocess.Popen]:
+        """Start a game unless it is already running; returns None for a duplicate launch"""
+        if not reserved and not self.reserve(game_name):
+            return None
+        
+        try:
+            process = start()
+        finally:
+            with self.lock:
+                self.reserved.discard(game_name)
+        
+        with self.lock:
+            self.children[game_name] = process
+            self.records[game_name] = SessionRecord(game_name, process.pid, time.time(), session_id=session_id)
+        self.wake_event.set()
+        return process
+    
+    def poll_finished(self) -> List[SessionRecord]:
+        """Sessions that ended since the last call (never blocks)"""
+        records = []
+        while True:
+            try:
+                records.append(self.finished.get_nowait())
+            except queue.Empty:
+                return records
+    
+    def _watch_loop(self):
+        """Sample running children and reap the ones that exited"""
+        while self.running:
+            self.wake_event.wait(self.poll_interval)
+            self.wake_event.clear()
+            
+            with self.lock:
+                children = list(self.children.items())
+            
+            for game_name, process in children:
+                record = self.records[game_name]
+                if self._reap(process, record):
+                    with self.lock:
+                        del self.children[game_name]
+                        del self.records[game_name]
+                    self.finished.put(record)
+                else:
+                    self._sample(process, record)
+    
+    def _reap(self, process: subprocess.Popen, record: SessionRecord) -> bool:
+        """Collect an exited child; wait4 also returns its exact CPU time and peak RSS"""
+        if hasattr(os, "wait4"):
+            try:
+                pid, status, usage = os.wait4(process.pid, os.WNOHANG)
+            except ChildProcessError:
+                # Already reaped elsewhere (e.g. Popen.poll)
+                record.exit_code = process.returncode
+                record.ended = time.time()
+                return True
+            if pid == 0:
+                return False
+            
+            process.returncode = os.waitstatus_to_exitcode(status)
+            record.exit_code = process.returncode
+            record.cpu_seconds = usage.ru_utime + usage.ru_stime
+            record.peak_rss_kb = max(record.peak_rss_kb, usage.ru_maxrss)  # kilobytes on Linux
+            record.ended = time.time()
+            return True
+        
+        # No wait4 (Windows): rely on the last psutil sample
+        if process.poll() is None:
+            return False
+        record.exit_code = process.returncode
+        record.ended = time.time()
+        return True
+    
+    def _sample(self, process: subprocess.Popen, record: SessionRecord):
+        """Track CPU and peak RSS while the game runs, where wait4 is unavailable"""
+        if psutil is None or hasattr(os, "wait4"):
+            return
+        try:
+            info = psutil.Process(process.pid)
+            cpu = info.cpu_times()
+            record.cpu_seconds = cpu.user + cpu.system
+            record.peak_rss_kb = max(record.peak_rss_kb, info.memory_info().rss // 1024)
+        except psutil.Error:
+            pass
+    
+    def get_running_games(self) -> List[str]:
+        """Names of games with a live process"""
+        with self.lock:
+            return list(self.children)
+    
+    def shutdown(self):
+        """Stop watching; running games keep running after the launcher exits"""
+        self.running = False
+        self.wake_event.set()
+        self.watcher_thread.join(timeout=1.0)
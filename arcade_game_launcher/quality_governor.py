@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Quality Governor - Runtime Adaptive Quality
+Watches live frame times and steps visual quality down when frames miss their budget and back up once headroom returns
+"""
+
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Deque, Dict, List
+
+from launch_latency import percentile
+
+WINDOW_FRAMES = 60  # Busy frame times judged together
+BUDGET_PERCENTILE = 90  # A level holds while this percentile of frames fits the budget
+DOWNGRADE_RATIO = 1.0  # Step down when the percentile exceeds the budget
+UPGRADE_RATIO = 0.6  # Step up only when it would fit in this share of the next level's budget
+UPGRADE_WINDOWS = 3  # Consecutive good windows needed before stepping up
+MAX_UPGRADE_WINDOWS = 48  # Backoff cap for an upgrade that keeps failing
+
+@dataclass(frozen=True)
+class QualityLevel:
+    """Visual settings for one quality step"""
+    name: str
+    target_fps: int
+    animation_quality: str
+    particles: bool
+    glow: bool
+    gradient_background: bool
+
+# Best first; each step gives up the most expensive remaining effect
+QUALITY_LEVELS = [
+    QualityLevel("high", 144, "high", particles=True, glow=True, gradient_background=True),
+    QualityLevel("medium", 90, "medium", particles=True, glow=False, gradient_background=True),
+    QualityLevel("low", 60, "low", particles=False, glow=False, gradient_background=True),
+    QualityLevel("minimal", 30, "low", particles=False, glow=False, gradient_background=False)
+]
+
+QualityListener = Callable[[QualityLevel], None]
+
+class QualityGovernor:
+    """Steps through quality levels from a rolling window of frame times, with hysteresis"""
+    
+    def __init__(self, max_fps: int, levels: List[QualityLevel] = QUALITY_LEVELS,
+                 initial_level: int = 0, window_frames: int = WINDOW_FRAMES):
+        self.max_fps = max(1, int(max_fps))
+        self.levels = levels
+        self.index = max(0, min(initial_level, len(levels) - 1))
+        self.window: Deque[float] = deque(maxlen=window_frames)
+        self.listeners: List[QualityListener] = []
+        
+        # Hysteresis state
+        self.good_windows = 0
+        self.upgrade_windows: Dict[int, int] = {}  # Level index -> good windows needed to return to it
+        self.probing = False  # The last change was an upgrade not yet confirmed by a full window
+        
+        # Accounting
+        self.downgrades = 0
+        self.upgrades = 0
+    
+    @property
+    def level(self) -> QualityLevel:
+        """Current quality level"""
+        return self.levels[self.index]
+    
+    @property
+    def target_fps(self) -> int:
+        """Frame rate cap at the current level"""
+        return min(self.max_fps, self.level.target_fps)
+    
+    def budget_ms(self, index: int) -> float:
+        """Busy time a frame may take at a level"""
+        return 1000.0 / min(self.max_fps, self.levels[index].target_fps)
+    
+    def subscribe(self, listener: QualityListener):
+        """Call listener with the current level now and on every change"""
+        self.listeners.append(listener)
+        listener(self.level)
+    
+    def record(self, frame_ms: float) -> bool:
+        """Add one frame's busy time (excluding the frame-cap sleep); True if the level changed"""
+        self.window.append(frame_ms)
+        if len(self.window) < self.window.maxlen:
+            return False
+        
+        observed = percentile(list(self.window), BUDGET_PERCENTILE)
+        self.window.clear()
+        
+        if observed > self.budget_ms(self.index) * DOWNGRADE_RATIO and self.index < len(self.levels) - 1:
+            if self.probing:
+                # The level we just returned to still doesn't fit: wait longer before trying it again
+                needed = self.upgrade_windows.get(self.index, UPGRADE_WINDOWS)
+                self.upgrade_windows[self.index] = min(MAX_UPGRADE_WINDOWS, needed * 2)
+            self.downgrades += 1
+            self.probing = False
+            self.set_level(self.index + 1)
+            return True
+        
+        self.probing = False
+        if self.index > 0 and observed < self.budget_ms(self.index - 1) * UPGRADE_RATIO:
+            self.good_windows += 1
+            if self.good_windows >= self.upgrade_windows.get(self.index - 1, UPGRADE_WINDOWS):
+                self.upgrades += 1
+                self.set_level(self.index - 1)
+                self.probing = True
+                return True
+        else:
+            self.good_windows = 0
+        return False
+    
+    def set_level(self, index: int):
+        """Switch levels and notify subscribers"""
+        self.index = max(0, min(index, len(self.levels) - 1))
+        self.good_windows = 0
+        self.window.clear()
+        for listener in self.listeners:
+            listener(self.level)
+    
+    def set_max_fps(self, max_fps: int):
+        """Change the configured frame cap and re-notify subscribers"""
+        self.max_fps = max(1, int(max_fps))
+        self.set_level(self.index)
+    
+    def get_status_text(self) -> str:
+        """Short summary for overlays and logs"""
+        return f"Quality {self.level.name} ({self.downgrades}↓ {self.upgrades}↑)"
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Starfield - Pre-Baked Parallax Star Layers
+Bakes each depth layer into sparse surfaces once, scrolls them with wraparound blits and twinkles them from an alpha table
+"""
+
+import math
+import random
+from dataclasses import dataclass
+from typing import List, Optional, Sequence, Tuple
+
+import pygame
+
+TWINKLE_GROUPS = 2  # Stars in a twinkling layer are split into groups that twinkle out of phase
+ALPHA_TABLE_SIZE = 32  # Steps in one twinkle cycle
+TWINKLE_PERIOD = 6.0  # Seconds per twinkle cycle
+STAR_KEY = (0, 0, 0)  # Transparent color of the baked layers; stars are never pure black
+
+@dataclass
+class StarLayer:
+    """One depth layer: far layers have more, dimmer, slower stars"""
+    count: int
+    speed: float  # Pixels per second along the scroll direction
+    radius: int = 1
+    brightness: Tuple[int, int] = (150, 220)
+    twinkle: bool = True  # Each twinkling layer costs an extra blit per group, so dim far layers usually skip it
+
+DEFAULT_LAYERS = (
+    StarLayer(60, 8.0, 1, (90, 150), twinkle=False),
+    StarLayer(30, 20.0, 1, (150, 210), twinkle=False),
+    StarLayer(12, 45.0, 2, (210, 255))
+)
+
+def alpha_table(depth: float, steps: int = ALPHA_TABLE_SIZE) -> List[int]:
+    """One sine twinkle cycle; depth 0 keeps stars fully lit, 1 fades them out at the trough"""
+    return [int(255 * (1 - depth * (0.5 - 0.5 * math.cos(2 * math.pi * i / steps)))) for i in range(steps)]
+
+class Starfield:
+    """Parallax star background with its own RNG, so drawing it never touches the global random module"""
+    
+    def __init__(self, size: Tuple[int, int], layers: Sequence[StarLayer] = DEFAULT_LAYERS,
+                 direction: Tuple[float, float] = (0.0, 1.0), seed: int = 0, twinkle: float = 0.4,
+                 color: Tuple[int, int, int] = (255, 255, 255)):
+        self.size = (int(size[0]), int(size[1]))
+        self.layers = list(layers)
+        self.direction = direction
+        self.seed = seed
+        self.color = color
+        self.alphas = alpha_table(twinkle)
+        self.twinkle = twinkle
+        # groups[layer][group] is a colorkeyed surface the size of the field
+        self.groups: List[List[pygame.Surface]] = []
+        self.display: Optional[pygame.Surface] = None
+    
+    def bake(self):
+        """Draw every star once into its layer's twinkle group surfaces"""
+        rng = random.Random(self.seed)
+        width, height = self.size
+        self.display = pygame.display.get_surface()
+        self.groups = []
+        for layer in self.layers:
+            groups = []
+            for _ in range(TWINKLE_GROUPS if self.twinkle and layer.twinkle else 1):
+                surface = pygame.Surface(self.size)
+                if self.display is not None:
+                    surface = surface.convert()
+                surface.fill(STAR_KEY)
+                groups.append(surface)
+            for i in range(layer.count):
+                x, y = rng.randrange(width), rng.randrange(height)
+                level = rng.randint(*layer.brightness) / 255
+                color = tuple(max(1, int(c * level)) for c in self.color)
+                # Stars near an edge also appear on the opposite side so wrapped blits have no seams
+                for dx in (-width, 0, width):
+                    for dy in (-height, 0, height):
+                        pygame.draw.circle(groups[i % len(groups)], color, (x + dx, y + dy), layer.radius)
+            for surface in groups:
+                # Run-length encoding makes blitting a mostly empty surface nearly free
+                surface.set_colorkey(STAR_KEY, pygame.RLEACCEL)
+            self.groups.append(groups)
+    
+    def draw(self, surface: pygame.Surface, seconds: Optional[float] = None, pos: Tuple[int, int] = (0, 0)):
+        """Blit every layer scrolled and twinkled for a point in time (defaults to the pygame clock)"""
+        # A new display (set_mode, fullscreen toggle) may use another pixel format
+        if not self.groups or pygame.display.get_surface() is not self.display:
+            self.bake()
+        if seconds is None:
+            seconds = pygame.time.get_ticks() / 1000
+        width, height = self.size
+        phase = seconds / TWINKLE_PERIOD * len(self.alphas)
+        
+        blits = []
+        for layer, groups in zip(self.layers, self.groups):
+            offset_x = int(self.direction[0] * layer.speed * seconds) % width
+            offset_y = int(self.direction[1] * layer.speed * seconds) % height
+            # Up to four copies cover the field once it has scrolled past an edge
+            spots = [(pos[0] + x, pos[1] + y)
+                     for x in ((offset_x, offset_x - width) if offset_x else (0,))
+                     for y in ((offset_y, offset_y - height) if offset_y else (0,))]
+            for index, group in enumerate(groups):
+                if len(groups) > 1:
+                    step = int(phase + index * len(self.alphas) / len(groups)) % len(self.alphas)
+                    group.set_alpha(self.alphas[step], pygame.RLEACCEL)
+                blits.extend((group, spot) for spot in spots)
+        
+        # Clip to the field so a partial-height starfield (sky band) stays in its band
+        clip = surface.get_clip()
+        surface.set_clip(pygame.Rect(pos, self.size).clip(clip))
+        surface.blits(blits, doreturn=False)
+        surface.set_clip(clip)
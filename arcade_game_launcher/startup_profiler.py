@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Startup Profiler - Launcher Cold-Start Breakdown
+Times each startup phase from process creation to the first frame and checks it against a budget
+"""
+
+import os
+import time
+from typing import List, Optional, Tuple
+
+FIRST_FRAME_BUDGET_MS = 500
+
+def process_age_ms() -> Optional[float]:
+    """Milliseconds since this process was created (Linux /proc, 10 ms resolution)"""
+    try:
+        with open("/proc/self/stat", "r") as f:
+            # Field 22 counts clock ticks from boot; the command name before it may contain spaces
+            start_ticks = int(f.read().rsplit(")", 1)[1].split()[19])
+        with open("/proc/uptime", "r") as f:
+            uptime = float(f.read().split()[0])
+        return max(0.0, uptime - start_ticks / os.sysconf("SC_CLK_TCK")) * 1000
+    except (OSError, ValueError, IndexError):
+        return None
+
+class StartupProfiler:
+    """Records named phases; phases after the first frame are reported as deferred"""
+    
+    def __init__(self, budget_ms: float = FIRST_FRAME_BUDGET_MS):
+        self.budget_ms = budget_ms
+        self.phases: List[Tuple[str, float]] = []
+        self.deferred: List[Tuple[str, float]] = []
+        self.first_frame_ms: Optional[float] = None
+        self.last_mark = time.perf_counter()
+        
+        # Interpreter start-up and every import before this module was loaded
+        age = process_age_ms()
+        self.origin = self.last_mark - (age or 0.0) / 1000
+        if age is not None:
+            self.phases.append(("interpreter + early imports", age))
+    
+    def mark(self, phase: str) -> float:
+        """Close the current phase and return its duration in ms"""
+        now = time.perf_counter()
+        duration = (now - self.last_mark) * 1000
+        self.last_mark = now
+        (self.deferred if self.first_frame_ms is not None else self.phases).append((phase, duration))
+        return duration
+    
+    def record(self, phase: str, duration_ms: float):
+        """Add deferred work timed elsewhere, e.g. on a background thread"""
+        self.deferred.append((phase, duration_ms))
+    
+    def mark_first_frame(self):
+        """Close the last phase before the first presented frame"""
+        if self.first_frame_ms is not None:
+            return
+        self.mark("first frame")
+        self.first_frame_ms = (self.last_mark - self.origin) * 1000
+    
+    def elapsed_ms(self) -> float:
+        """Time since process start as read from /proc, or since this profiler was created where /proc is unavailable"""
+        return (time.perf_counter() - self.origin) * 1000
+    
+    def print_report(self, title: str = "Startup"):
+        """Print the phase breakdown and the first-frame budget check"""
+        print(f"⏱️  {title} breakdown")
+        for phase, duration in self.phases:
+            print(f"   {phase:<30} {duration:8.1f} ms")
+        
+        if self.first_frame_ms is not None:
+            status = "✅ within" if self.first_frame_ms <= self.budget_ms else "⚠️  over"
+            print(f"   {'time to first frame':<30} {self.first_frame_ms:8.1f} ms "
+                  f"({status} {self.budget_ms:.0f} ms budget)")
+        
+        for phase, duration in self.deferred:
+            print(f"   {'(deferred) ' + phase:<30} {duration:8.1f} ms")
+
+# Shared instance so module-level code can mark import phases
+startup_profiler = StartupProfiler()
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Stats Journal - Crash-Safe Game Statistics
+Appends stat updates to a journal from a background thread and compacts them into an atomically replaced snapshot
+"""
+
+import os
+import json
+import queue
+import threading
+from typing import Dict, List, Optional
+
+COMPACT_EVERY = 64  # Journal entries between snapshot compactions
+
+class StatsJournal:
+    """Snapshot plus append-only journal; the render thread only touches memory"""
+    
+    def __init__(self, snapshot_path: str = "game_stats.json", journal_path: Optional[str] = None,
+                 compact_every: int = COMPACT_EVERY):
+        self.snapshot_path = snapshot_path
+        self.journal_path = journal_path or snapshot_path + ".journal"
+        self.compact_every = compact_every
+        
+        self.state: Dict[str, Dict] = {}
+        self.lock = threading.Lock()
+        self.queue: "queue.Queue[Optional[str]]" = queue.Queue()
+        self.writer_thread: Optional[threading.Thread] = None
+        self.journal_file = None
+        self.journal_needs_newline = False
+        self.entries_since_compact = 0
+        
+        # Recovery counters
+        self.replayed_entries = 0
+        self.torn_entries = 0
+    
+    def load(self) -> Dict[str, Dict]:
+        """Rebuild stats from the snapshot plus every journal entry written after it"""
+        try:
+            with open(self.snapshot_path, "r") as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            state = {}
+        
+        # Entries are absolute field values, so replaying one twice is harmless
+        try:
+            with open(self.journal_path, "r") as f:
+                for line in f:
+                    self.journal_needs_newline = not line.endswith("\n")
+                    if not line.strip():
+                        continue
+                    try:
+                        entry = json.loads(line)
+                        state.setdefault(entry["game"], {}).update(entry["fields"])
+                        self.replayed_entries += 1
+                    except (ValueError, KeyError, TypeError):
+                        # A line cut short by a crash; everything before it is intact
+                        self.torn_entries += 1
+        except OSError:
+            pass
+        
+        with self.lock:
+            self.state = state
+            self.entries_since_compact = self.replayed_entries
+        return {name: dict(fields) for name, fields in state.items()}
+    
+    def start(self):
+        """Start the background writer"""
+        if self.writer_thread is not None:
+            return
+        self.writer_thread = threading.Thread(target=self._writer_loop, daemon=True)
+        self.writer_thread.start()
+    
+    def record(self, game_name: str, **fields):
+        """Update a game's stats in memory and queue the change for the journal"""
+        fields = {key: list(value) if isinstance(value, list) else value for key, value in fields.items()}
+        with self.lock:
+            self.state.setdefault(game_name, {}).update(fields)
+        self.queue.put(json.dumps({"game": game_name, "fields": fields}))
+    
+    def _writer_loop(self):
+        """Append queued entries in batches, compacting every compact_every entries"""
+        while True:
+            line = self.queue.get()
+            batch: List[str] = []
+            stop = line is None
+            if line is not None:
+                batch.append(line)
+            
+            # Drain whatever else is waiting so one fsync covers the batch
+            while not stop:
+                try:
+                    line = self.queue.get_nowait()
+                except queue.Empty:
+                    break
+                if line is None:
+                    stop = True
+                else:
+                    batch.append(line)
+            
+            if batch:
+                self._append(batch)
+            if stop:
+                return
+    
+    def _append(self, batch: List[str]):
+        """Durably append entries to the journal"""
+        try:
+            if self.journal_file is None:
+                self.journal_file = open(self.journal_path, "a")
+            if self.journal_needs_newline:
+                # Never glue a new entry onto a torn tail
+                self.journal_file.write("\n")
+                self.journal_needs_newline = False
+            self.journal_file.write("".join(line + "\n" for line in batch))
+            self.journal_file.flush()
+            os.fsync(self.journal_file.fileno())
+        except OSError as e:
+            print(f"Failed to write stats journal: {e}")
+            return
+        
+        self.entries_since_compact += len(batch)
+        if self.entries_since_compact >= self.compact_every:
+            self.compact()
+    
+    def compact(self):
+        """Write the full state to a new snapshot, swap it in atomically, then empty the journal"""
+        with self.lock:
+            snapshot = json.dumps(self.state, indent=2)
+        
+        temp_path = self.snapshot_path + ".tmp"
+        try:
+            with open(temp_path, "w") as f:
+                f.write(snapshot)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, self.snapshot_path)
+            
+            # A crash before this truncate only means some entries are replayed again
+            if self.journal_file is None:
+                self.journal_file = open(self.journal_path, "a")
+            self.journal_file.seek(0)
+            self.journal_file.truncate()
+            os.fsync(self.journal_file.fileno())
+            self.journal_needs_newline = False
+            self.entries_since_compact = 0
+        except OSError as e:
+            print(f"Failed to compact stats journal: {e}")
+    
+    def close(self):
+        """Flush pending entries, compact, and stop the writer"""
+        if self.writer_thread is not None:
+            self.queue.put(None)
+            self.writer_thread.join()
+            self.writer_thread = None
+        else:
+            # Never started: write whatever was recorded on this thread
+            batch = []
+            while not self.queue.empty():
+                line = self.queue.get_nowait()
+                if line is not None:
+                    batch.append(line)
+            if batch:
+                self._append(batch)
+        
+        if self.entries_since_compact > 0:
+            self.compact()
+        if self.journal_file is not None:
+            self.journal_file.close()
+            self.journal_file = None
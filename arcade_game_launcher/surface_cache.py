@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Surface Cache - Bounded LRU Cache for Rendered Surfaces
+Evicts least-recently-used surfaces once a byte budget is exceeded and tracks hit/miss stats
+"""
+
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, Optional, Tuple
+
+import pygame
+
+from config_service import CONFIG_PATH, get_setting, load_config
+
+DEFAULT_CACHE_KB = 1000
+
+def surface_bytes(surface: pygame.Surface) -> int:
+    """Memory used by a surface's pixel buffer"""
+    return surface.get_pitch() * surface.get_height()
+
+class SurfaceCache:
+    """LRU surface cache with a budget measured in surface bytes"""
+    
+    def __init__(self, max_bytes: int = DEFAULT_CACHE_KB * 1024, enabled: bool = True):
+        self.max_bytes = max_bytes
+        self.enabled = enabled
+        self.entries: "OrderedDict[Hashable, pygame.Surface]" = OrderedDict()
+        self.current_bytes = 0
+        
+        # Counters for the FPS overlay
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    def get(self, key: Hashable) -> Optional[pygame.Surface]:
+        """Return a cached surface and mark it most recently used"""
+        surface = self.entries.get(key)
+        if surface is None:
+            self.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return surface
+    
+    def put(self, key: Hashable, surface: pygame.Surface):
+        """Store a surface, evicting old entries to stay within budget"""
+        if not self.enabled:
+            return
+        
+        size = surface_bytes(surface)
+        if size > self.max_bytes:
+            return
+        
+        old_surface = self.entries.pop(key, None)
+        if old_surface is not None:
+            self.current_bytes -= surface_bytes(old_surface)
+        
+        self.entries[key] = surface
+        self.current_bytes += size
+        
+        while self.current_bytes > self.max_bytes:
+            _, evicted = self.entries.popitem(last=False)
+            self.current_bytes -= surface_bytes(evicted)
+            self.evictions += 1
+    
+    def get_or_create(self, key: Hashable, factory: Callable[[], pygame.Surface]) -> pygame.Surface:
+        """Return the cached surface for key, rendering it on a miss"""
+        surface = self.get(key)
+        if surface is None:
+            surface = factory()
+            self.put(key, surface)
+        return surface
+    
+    def clear(self):
+        """Drop every cached surface"""
+        self.entries.clear()
+        self.current_bytes = 0
+    
+    def resize(self, max_bytes: int):
+        """Change the byte budget, evicting immediately if it shrank"""
+        self.max_bytes = max_bytes
+        while self.entries and self.current_bytes > self.max_bytes:
+            _, evicted = self.entries.popitem(last=False)
+            self.current_bytes -= surface_bytes(evicted)
+            self.evictions += 1
+    
+    def configure(self, max_bytes: int, enabled: bool):
+        """Apply new settings live; disabling drops everything cached so far"""
+        self.enabled = enabled
+        if not enabled:
+            self.clear()
+        self.resize(max_bytes)
+    
+    def get_hit_rate(self) -> float:
+        """Fraction of lookups served from the cache"""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+    
+    def get_stats_text(self) -> str:
+        """Short summary for the performance overlay"""
+        return (f"Cache: {self.get_hit_rate() * 100:.0f}% hit • "
+                f"{self.current_bytes // 1024}KB • {self.evictions} evicted")
+
+class DisplaySurfaceCache(SurfaceCache):
+    """SurfaceCache of display-format surfaces, emptied whenever the display surface is replaced"""
+    
+    def __init__(self, max_bytes: int = DEFAULT_CACHE_KB * 1024, alpha: bool = False, enabled: bool = True):
+        super().__init__(max_bytes, enabled)
+        self.alpha = alpha  # convert_alpha() for translucent surfaces, convert() for opaque ones
+        self.display: Optional[pygame.Surface] = None
+    
+    def is_current(self) -> bool:
+        """True while the cached surfaces were converted for the current display"""
+        return pygame.display.get_surface() is self.display
+    
+    def layer(self, key: Hashable, build: Callable[[], pygame.Surface]) -> pygame.Surface:
+        """Cached surface for key, built and converted to the display format on first use"""
+        # A new display (set_mode, fullscreen toggle) may use another pixel format
+        display = pygame.display.get_surface()
+        if display is not self.display:
+            self.display = display
+            self.clear()
+        return self.get_or_create(key, lambda: self.to_display_format(build()))
+    
+    def to_display_format(self, surface: pygame.Surface) -> pygame.Surface:
+        """Match the display's pixel format so blits need no conversion"""
+        if self.display is None:
+            return surface
+        return surface.convert_alpha() if self.alpha else surface.convert()
+
+def text_cache_settings(config: Dict) -> Tuple[int, bool]:
+    """Byte budget and enabled flag for the text cache from a performance config"""
+    # cache_size_limit is the budget in kilobytes of surface memory
+    limit_kb = get_setting(config, "performance.cache_size_limit", DEFAULT_CACHE_KB)
+    enabled = get_setting(config, "performance.cache_text_surfaces", True)
+    return int(limit_kb) * 1024, bool(enabled)
+
+def create_text_cache(config_path: str = CONFIG_PATH) -> SurfaceCache:
+    """Create a text cache sized by performance_config.json"""
+    max_bytes, enabled = text_cache_settings(load_config(config_path))
+    return SurfaceCache(max_bytes=max_bytes, enabled=enabled)
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Test script for cached background layers
+Checks NumPy gradients against the line-drawn originals and layer reuse across frames, themes and sizes
+"""
+
+import sys
+import pygame
+
+from background_layers import BackgroundLayers, create_gradient
+
+def draw_lines(size, start, end) -> pygame.Surface:
+    """The per-frame loop the layers replace"""
+    width, height = size
+    surface = pygame.Surface(size)
+    for y in range(height):
+        ratio = y / height
+        color = [int(start[i] + (end[i] - start[i]) * ratio) for i in range(3)]
+        pygame.draw.line(surface, color, (0, y), (width, y))
+    return surface
+
+def test_matches_line_drawing():
+    """Every row and column equals the line-by-line gradient"""
+    for start, end in (((20, 25, 40), (40, 50, 80)), ((32, 64, 128), (0, 0, 0))):
+        layer = create_gradient((64, 97), start, end)
+        reference = draw_lines((64, 97), start, end)
+        for x, y in ((0, 0), (63, 48), (17, 96)):
+            assert layer.get_at((x, y)) == reference.get_at((x, y)), (x, y)
+    
+    horizontal = create_gradient((100, 4), (0, 0, 0), (200, 100, 50), vertical=False)
+    assert tuple(horizontal.get_at((50, 3)))[:3] == (100, 50, 25)
+    print("✅ Gradients match the line-drawn originals")
+
+def test_layer_reused():
+    """The same size and colors return the same surface; a theme or size change builds another"""
+    layers = BackgroundLayers()
+    first = layers.gradient((80, 60), (10, 10, 10), (20, 20, 25))
+    assert layers.gradient((80, 60), (10, 10, 10), (20, 20, 25)) is first
+    assert layers.gradient((80, 60), (30, 10, 10), (40, 20, 25)) is not first
+    assert layers.gradient((120, 60), (10, 10, 10), (20, 20, 25)).get_size() == (120, 60)
+    assert layers.cache.hits == 1 and layers.cache.misses == 3
+    print(f"✅ Layers reused: {layers.cache.get_stats_text()}")
+
+def test_new_display_rebuilds():
+    """Layers are dropped when the display surface is replaced"""
+    pygame.display.init()
+    try:
+        pygame.display.set_mode((80, 60))
+        layers = BackgroundLayers()
+        first = layers.gradient((80, 60), (10, 10, 10), (20, 20, 25))
+        assert first.get_bitsize() == pygame.display.get_surface().get_bitsize()
+        pygame.display.quit()
+        pygame.display.init()
+        pygame.display.set_mode((80, 60))
+        assert layers.gradient((80, 60), (10, 10, 10), (20, 20, 25)) is not first
+    finally:
+        pygame.display.quit()
+    print("✅ New display rebuilds layers")
+
+def main():
+    """Run all tests"""
+    print("🧪 Testing Background Layers")
+    print("=" * 40)
+    
+    tests = [
+        ("Gradient Pixels", test_matches_line_drawing),
+        ("Layer Reuse", test_layer_reused),
+        ("Display Change", test_new_display_rebuilds)
+    ]
+    
+    passed = 0
+    total = len(tests)
+    
+    for test_name, test_func in tests:
+        print(f"\n🔍 Testing {test_name}...")
+        try:
+            test_func()
+            passed += 1
+        except AssertionError as e:
+            print(f"❌ {test_name} failed: {e}")
+    
+    print("\n" + "=" * 40)
+    print(f"📊 Test Results: {passed}/{total} passed")
+    return passed == total
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
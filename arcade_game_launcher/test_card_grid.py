@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Test script for the virtualized card grid
+Validates arithmetic hit-testing, card recycling, released cards settling and cached card bitmaps
+"""
+
+import os
+import sys
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+from card_grid import GridLayout, VirtualCardGrid
+from fixed_optimized_launcher import CARD_SCALE_STEP, GameCard, GameData, OptimizedRenderer
+
+class RecordingScreen(pygame.Surface):
+    """Screen that remembers the source and position of every blit"""
+    
+    def __init__(self, size):
+        super().__init__(size)
+        self.blits = []
+    
+    def blit(self, source, dest, *args, **kwargs):
+        self.blits.append((source, tuple(dest)))
+        return super().blit(source, dest, *args, **kwargs)
+
+def make_grid(count=40):
+    """Four 280x160 cards per row in an 800 pixel window"""
+    layout = GridLayout(4, 280, 160, 20, 10, 120)
+    return VirtualCardGrid(layout, [f"Game {i}" for i in range(count)], 800, lambda: GameCard(None, 0, 0))
+
+def test_hit_testing():
+    """Points map to cells, gaps and empty cells to nothing"""
+    layout = GridLayout(4, 280, 160, 20, 10, 120)
+    assert layout.index_at((10, 120), 6) == 0
+    assert layout.index_at((10 + 300, 120 + 180), 6) == 5
+    assert layout.index_at((10 + 285, 130), 6) is None  # Gap between columns
+    assert layout.index_at((10 + 300, 120 + 180), 5) is None  # Past the last item
+    print("✅ Hit testing")
+
+def test_recycling():
+    """Scrolling rebinds the fixed pool instead of creating cards"""
+    grid = make_grid()
+    grid.sync(0)
+    slots = list(grid.slots)
+    first = [card.game_data for card in grid.visible_cards()]
+    assert first[0] == "Game 0" and len(slots) < 40
+    
+    grid.sync(1500)
+    assert grid.slots == slots
+    names = [card.game_data for card in grid.visible_cards()]
+    assert "Game 0" not in names and names == [f"Game {i}" for i in grid.visible]
+    assert all(card.game_data is None for card in grid.free)
+    print("✅ Cards recycled")
+
+def test_released_cards_settle():
+    """A card scrolled out mid-tween is settled, so idle mode can still engage"""
+    grid = make_grid()
+    grid.sync(0)
+    card = grid.visible_cards()[0]
+    card.set_hovered(True)
+    card.click_animation = 1.0
+    card.update(1 / 60)
+    assert not card.is_settled()
+    
+    grid.sync(1500)
+    assert card in grid.free and card.is_settled()
+    assert all(card.is_settled() for card in grid.slots)
+    print("✅ Released cards settle")
+
+def make_card():
+    """A bound card, a renderer drawing to a recording screen and a render_bitmap call counter"""
+    pygame.init()
+    pygame.display.set_mode((800, 600))
+    renderer = OptimizedRenderer(RecordingScreen((800, 600)))
+    game = GameData("Snake Classic", "games/snake", "Eat apples and grow longer", "Arcade", (0, 200, 0), "snake.py")
+    card = GameCard(game, 20, 120)
+    renders = []
+    render_bitmap = card.render_bitmap
+    
+    def counting_render(renderer, width, height):
+        renders.append((width, height))
+        return render_bitmap(renderer, width, height)
+    
+    card.render_bitmap = counting_render
+    return renderer, card, renders
+
+def test_bitmap_reused():
+    """Drawing an unchanged card twice blits one cached bitmap, pixel for pixel"""
+    renderer, card, renders = make_card()
+    card.draw(renderer)
+    card.draw(renderer, y_offset=40)
+    assert len(renders) == 1 and renderer.card_cache.hits == 1
+    (bitmap, first), (again, second) = renderer.screen.blits
+    assert again is bitmap and list(renderer.card_cache.entries.values()) == [bitmap]
+    assert second == (first[0], first[1] - 40)
+    
+    fresh = GameCard.render_bitmap(card, renderer, *bitmap.get_size())
+    assert pygame.image.tobytes(fresh, "RGBA") == pygame.image.tobytes(bitmap, "RGBA")
+    print("✅ Bitmap reused")
+
+def test_changes_rerender():
+    """Play count, hover state and a new thumbnail each force a fresh bitmap"""
+    renderer, card, renders = make_card()
+    card.draw(renderer)
+    
+    card.game_data.play_count += 1
+    card.draw(renderer)
+    assert len(renders) == 2
+    
+    card.is_hovered = True
+    card.draw(renderer)
+    assert len(renders) == 3
+    
+    card.game_data.thumbnail = pygame.Surface((48, 48))
+    card.draw(renderer)
+    assert len(renders) == 4
+    
+    card.draw(renderer)
+    assert len(renders) == 4
+    print("✅ Changes re-render")
+
+def test_bitmap_matches_scaled_rect():
+    """Each scale step blits a bitmap exactly the size and place of the animated rect"""
+    renderer, card, renders = make_card()
+    for step in range(-2, 4):
+        card.hover_scale = 1.0 + step * CARD_SCALE_STEP
+        card.draw(renderer, y_offset=30)
+        scaled_rect = card.get_scaled_rect(30)
+        bitmap, position = renderer.screen.blits[-1]
+        assert (bitmap.get_size(), position) == (scaled_rect.size, scaled_rect.topleft), step
+    assert len(renders) == 6
+    print("✅ Bitmaps match the scaled rect")
+
+def main():
+    """Run all tests"""
+    print("🧪 Testing Card Grid")
+    print("=" * 40)
+    
+    tests = [
+        ("Hit Testing", test_hit_testing),
+        ("Recycling", test_recycling),
+        ("Released Cards", test_released_cards_settle),
+        ("Bitmap Reuse", test_bitmap_reused),
+        ("Re-render", test_changes_rerender),
+        ("Scale Steps", test_bitmap_matches_scaled_rect)
+    ]
+    
+    passed = 0
+    total = len(tests)
+    
+    for test_name, test_func in tests:
+        print(f"\n🔍 Testing {test_name}...")
+        try:
+            test_func()
+            passed += 1
+        except AssertionError as e:
+            print(f"❌ {test_name} failed: {e}")
+    
+    print("\n" + "=" * 40)
+    print(f"📊 Test Results: {passed}/{total} passed")
+    return passed == total
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Test script for the live performance config
+Edits a temporary config file and checks reloads, subscribers and cache resizing
+"""
+
+import os
+import sys
+import json
+import tempfile
+import pygame
+
+from config_service import ConfigService, get_setting, load_config
+from quality_governor import QualityGovernor
+from surface_cache import SurfaceCache, surface_bytes, text_cache_settings
+
+class FakeClock:
+    """Manually advanced stand-in for time.monotonic"""
+    
+    def __init__(self):
+        self.now = 0.0
+    
+    def __call__(self) -> float:
+        return self.now
+
+def write_config(config_path: str, config: dict, mtime: int):
+    """Write a config with a distinct modification time"""
+    with open(config_path, "w") as f:
+        json.dump(config, f)
+    os.utime(config_path, (mtime, mtime))
+
+def test_dotted_lookup():
+    """Nested keys resolve and missing ones fall back"""
+    config = {"display": {"target_fps": 90}}
+    assert get_setting(config, "display.target_fps") == 90
+    assert get_setting(config, "display.vsync", True) is True
+    assert get_setting(config, "audio.buffer_size", 512) == 512
+    print("✅ Dotted lookup working")
+
+def test_edit_reaches_subscribers():
+    """A changed file is picked up on the next poll after the interval"""
+    clock = FakeClock()
+    with tempfile.TemporaryDirectory() as directory:
+        config_path = os.path.join(directory, "performance_config.json")
+        write_config(config_path, {"display": {"target_fps": 120}}, mtime=1000)
+        service = ConfigService(config_path, poll_interval=1.0, clock=clock)
+        seen = []
+        service.subscribe(lambda config: seen.append(config.get("display.target_fps")))
+        assert seen == [120]
+        
+        write_config(config_path, {"display": {"target_fps": 60}}, mtime=2000)
+        assert not service.poll()  # Interval not yet elapsed
+        clock.now = 1.0
+        assert service.poll()
+        assert seen == [120, 60] and service.reloads == 1
+        
+        clock.now = 2.0
+        assert not service.poll()  # Unchanged file
+    print("✅ Edits reach subscribers")
+
+def test_invalid_edit_keeps_settings():
+    """A half-saved file leaves the last good config in place"""
+    clock = FakeClock()
+    with tempfile.TemporaryDirectory() as directory:
+        config_path = os.path.join(directory, "performance_config.json")
+        write_config(config_path, {"display": {"target_fps": 120}}, mtime=1000)
+        service = ConfigService(config_path, poll_interval=1.0, clock=clock)
+        
+        with open(config_path, "w") as f:
+            f.write('{"display": {"target_')
+        os.utime(config_path, (2000, 2000))
+        clock.now = 1.0
+        assert not service.poll()
+        assert service.get("display.target_fps") == 120
+        
+        write_config(config_path, {"display": {"target_fps": 30}}, mtime=3000)
+        clock.now = 2.0
+        assert service.poll()
+        assert service.get("display.target_fps") == 30
+    print("✅ Invalid edit ignored until fixed")
+
+def test_bad_values_keep_settings():
+    """Well-formed edits with bad values keep the last good value for that key only"""
+    clock = FakeClock()
+    with tempfile.TemporaryDirectory() as directory:
+        config_path = os.path.join(directory, "performance_config.json")
+        write_config(config_path, {"display": {"target_fps": 90}, "graphics": {"particle_effects": True}}, mtime=1000)
+        service = ConfigService(config_path, poll_interval=1.0, clock=clock)
+        governor = QualityGovernor(max_fps=120)
+        service.subscribe(lambda config: governor.set_max_fps(config.get("display.target_fps", 120)))
+        
+        for step, bad_value in enumerate((None, "abc", 0, -5, 12.5, True)):
+            write_config(config_path, {"display": {"target_fps": bad_value},
+                                       "graphics": {"particle_effects": step % 2 == 0}}, mtime=2000 + step)
+            clock.now = 1.0 + step
+            service.poll()
+            assert service.get("display.target_fps") == 90, bad_value
+            assert service.get("graphics.particle_effects") is (step % 2 == 0)
+            assert governor.budget_ms(0) > 0
+        
+        write_config(config_path, {"display": "fast"}, mtime=3000)
+        clock.now = 10.0
+        assert service.poll() and service.get("display.target_fps") == 90
+        
+        write_config(config_path, {"display": {"target_fps": 0}, "audio": {"buffer_size": "big"}}, mtime=4000)
+        config = load_config(config_path)
+        assert get_setting(config, "display.target_fps", 60) == 60
+        assert get_setting(config, "audio.buffer_size", 512) == 512
+    print("✅ Bad values keep last good settings")
+
+def test_cache_reconfigured_live():
+    """Shrinking or disabling the text cache takes effect immediately"""
+    surface = pygame.Surface((10, 10), 0, 32)
+    size = surface_bytes(surface)
+    cache = SurfaceCache(max_bytes=size * 4)
+    for key in "abcd":
+        cache.put(key, surface.copy())
+    
+    cache.configure(size * 2, True)
+    assert len(cache.entries) == 2 and cache.get("d") is not None
+    
+    max_bytes, enabled = text_cache_settings({"performance": {"cache_size_limit": 1, "cache_text_surfaces": False}})
+    cache.configure(max_bytes, enabled)
+    assert max_bytes == 1024 and not cache.entries and cache.current_bytes == 0
+    cache.put("e", surface.copy())
+    assert not cache.entries
+    print("✅ Cache settings applied live")
+
+def main():
+    """Run all tests"""
+    print("🧪 Testing Config Service")
+    print("=" * 40)
+    
+    tests = [
+        ("Dotted Lookup", test_dotted_lookup),
+        ("Hot Reload", test_edit_reaches_subscribers),
+        ("Invalid Edit", test_invalid_edit_keeps_settings),
+        ("Bad Values", test_bad_values_keep_settings),
+        ("Live Cache", test_cache_reconfigured_live)
+    ]
+    
+    passed = 0
+    total = len(tests)
+    
+    for test_name, test_func in tests:
+        print(f"\n🔍 Testing {test_name}...")
+        try:
+            test_func()
+            passed += 1
+        except AssertionError as e:
+            print(f"❌ {test_name} failed: {e}")
+    
+    print("\n" + "=" * 40)
+    print(f"📊 Test Results: {passed}/{total} passed")
+    return passed == total
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
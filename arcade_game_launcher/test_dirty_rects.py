@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Test script for the dirty rectangle compositor
+Checks that only regions whose elements changed are redrawn and presented
+"""
+
+import os
+import sys
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from dirty_rects import DirtyRectCompositor, RetainedRegion, merge_rects
+
+class Box:
+    """A retained element with a position, a colour and a draw counter"""
+    
+    def __init__(self, screen, rect, color):
+        self.screen = screen
+        self.rect = pygame.Rect(rect)
+        self.color = color
+        self.draws = 0
+        self.region = RetainedRegion(lambda: self.rect, self.draw, lambda: self.color)
+    
+    def draw(self):
+        self.draws += 1
+        self.screen.fill(self.color, self.rect)
+
+def make_scene():
+    """Two boxes far apart on a 400x300 window"""
+    pygame.init()
+    screen = pygame.display.set_mode((400, 300))
+    left = Box(screen, (10, 10, 50, 50), (255, 0, 0))
+    right = Box(screen, (300, 200, 50, 50), (0, 0, 255))
+    compositor = DirtyRectCompositor(screen, (0, 0, 0))
+    compositor.set_elements([left.region, right.region])
+    return screen, compositor, left, right
+
+def test_merge_rects():
+    """Overlapping rects collapse into one, disjoint and empty ones are kept apart or dropped"""
+    merged = merge_rects([pygame.Rect(0, 0, 10, 10), pygame.Rect(5, 5, 10, 10),
+                          pygame.Rect(50, 50, 5, 5), pygame.Rect(0, 0, 0, 0)])
+    assert merged == [pygame.Rect(0, 0, 15, 15), pygame.Rect(50, 50, 5, 5)]
+    print("✅ Rects merged")
+
+def test_only_changed_regions_redrawn():
+    """An unchanged frame draws nothing; a changed element redraws and presents its own bounds"""
+    screen, compositor, left, right = make_scene()
+    assert compositor.render() == [screen.get_rect()]
+    assert left.draws == 1 and right.draws == 1
+    
+    assert compositor.render() == []
+    assert left.draws == 1 and right.draws == 1
+    
+    left.color = (0, 255, 0)
+    assert compositor.render() == [left.rect]
+    assert left.draws == 2 and right.draws == 1
+    assert screen.get_at(left.rect.center)[:3] == (0, 255, 0)
+    assert compositor.last_rect_count == 1
+    assert abs(compositor.last_coverage - 2500 / 120000) < 1e-9
+    print("✅ Only changed regions redrawn")
+
+def test_moved_element_repaints_hole():
+    """Moving an element repaints both where it was and where it is"""
+    screen, compositor, left, right = make_scene()
+    compositor.render()
+    
+    left.rect = pygame.Rect(100, 10, 50, 50)
+    regions = compositor.render()
+    assert sorted(map(tuple, regions)) == [(10, 10, 50, 50), (100, 10, 50, 50)]
+    assert screen.get_at((30, 30))[:3] == (0, 0, 0)
+    assert screen.get_at((120, 30))[:3] == (255, 0, 0)
+    assert right.draws == 1
+    
+    compositor.set_elements([right.region])
+    assert compositor.render() == [screen.get_rect()]
+    assert screen.get_at((120, 30))[:3] == (0, 0, 0)
+    print("✅ Moved element repainted")
+
+def test_disabled_redraws_everything():
+    """With dirty rects switched off every frame is a full redraw"""
+    screen, compositor, left, right = make_scene()
+    compositor.enabled = False
+    compositor.render()
+    compositor.render()
+    assert left.draws == 2 and right.draws == 2
+    assert compositor.last_coverage == 1.0
+    print("✅ Disabled compositor redraws everything")
+
+def main():
+    """Run all tests"""
+    print("🧪 Testing Dirty Rects")
+    print("=" * 40)
+    
+    tests = [
+        ("Merge", test_merge_rects),
+        ("Changed Regions", test_only_changed_regions_redrawn),
+        ("Moved Element", test_moved_element_repaints_hole),
+        ("Disabled", test_disabled_redraws_everything)
+    ]
+    
+    passed = 0
+    total = len(tests)
+    
+    for test_name, test_func in tests:
+        print(f"\n🔍 Testing {test_name}...")
+        try:
+            test_func()
+            passed += 1
+        except AssertionError as e:
+            print(f"❌ {test_name} failed: {e}")
+    
+    print("\n" + "=" * 40)
+    print(f"📊 Test Results: {passed}/{total} passed")
+    pygame.quit()
+    return passed == total
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Test script for the fixed-timestep loop
+Drives the accumulator with a fake clock and checks step counts, interpolation and stall handling
+"""
+
+import sys
+
+from fixed_timestep import FixedTimestep, lerp
+
+class FakeClock:
+    """Manually advanced stand-in for time.perf_counter"""
+    
+    def __init__(self):
+        self.now = 0.0
+    
+    def __call__(self) -> float:
+        return self.now
+
+def run_frames(frame_time: float, duration: float, step_hz: float = 64) -> FixedTimestep:
+    """Render frames of a fixed length for a while and return the loop"""
+    clock = FakeClock()
+    loop = FixedTimestep(step_hz, clock=clock)
+    loop.advance()
+    while clock.now < duration:
+        clock.now += frame_time
+        loop.advance()
+    return loop
+
+def test_render_rate_independent():
+    """The same wall time gives the same number of steps at 128, 64 or 32 FPS"""
+    # Power-of-two rates keep the fake times exact in binary floating point
+    for frame_time in (1 / 128, 1 / 64, 1 / 32):
+        assert run_frames(frame_time, 1.0).steps == 64
+    print("✅ Steps depend only on elapsed time")
+
+def test_alpha_between_steps():
+    """Leftover time shows up as the interpolation fraction"""
+    clock = FakeClock()
+    loop = FixedTimestep(64, clock=clock)
+    assert loop.advance() == 0
+    
+    clock.now = 1 / 64 + 1 / 128
+    assert loop.advance() == 1
+    assert loop.alpha == 0.5
+    assert lerp(10, 20, loop.alpha) == 15
+    
+    clock.now += 1 / 128
+    assert loop.advance() == 1
+    assert loop.alpha == 0.0
+    print("✅ Alpha tracks the partial step")
+
+def test_stall_is_clamped():
+    """A long hitch replays at most max_frame_time of simulation"""
+    clock = FakeClock()
+    loop = FixedTimestep(64, max_frame_time=0.25, clock=clock)
+    loop.advance()
+    
+    clock.now = 5.0
+    assert loop.advance() == 16
+    assert loop.dropped_time == 4.75
+    
+    loop.reset()
+    clock.now = 10.0
+    assert loop.advance() == 0
+    print("✅ Stalls are clamped and reset forgets pending time")
+
+def main():
+    """Run all tests"""
+    print("🧪 Testing Fixed Timestep")
+    print("=" * 40)
+    
+    tests = [
+        ("Render Rate", test_render_rate_independent),
+        ("Interpolation", test_alpha_between_steps),
+        ("Stall Clamp", test_stall_is_clamped)
+    ]
+    
+    passed = 0
+    total = len(tests)
+    
+    for test_name, test_func in tests:
+        print(f"\n🔍 Testing {test_name}...")
+        try:
+            test_func()
+            passed += 1
+        except AssertionError as e:
+            print(f"❌ {test_name} failed: {e}")
+    
+    print("\n" + "=" * 40)
+    print(f"📊 Test Results: {passed}/{total} passed")
+    return passed == total
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Test script for the frame scheduler
+Checks the switch into idle mode, the blocking event.wait path and waking on input
+"""
+
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from frame_scheduler import FrameScheduler
+
+def make_scheduler():
+    """A scheduler that idles after 50 ms of calm and wakes every 50 ms while idle"""
+    pygame.init()
+    pygame.display.set_mode((200, 150))
+    pygame.event.clear()
+    return FrameScheduler(pygame.time.Clock(), 60, idle_delay=0.05, idle_timeout_ms=50)
+
+def settle(scheduler: FrameScheduler):
+    """Report calm frames until the scheduler goes idle"""
+    deadline = time.time() + 2.0
+    while not scheduler.idle and time.time() < deadline:
+        scheduler.get_events()
+        scheduler.tick(settled=True)
+
+def test_goes_idle_after_delay():
+    """Settled frames only switch to idle once the delay has passed; motion resets it"""
+    scheduler = make_scheduler()
+    scheduler.tick(settled=True)
+    assert not scheduler.idle and scheduler.settled_since is not None
+    
+    scheduler.tick(settled=False)
+    assert not scheduler.idle and scheduler.settled_since is None
+    
+    settle(scheduler)
+    assert scheduler.idle
+    print("✅ Idle after delay")
+
+def test_idle_waits_on_events():
+    """An idle frame blocks in event.wait until the timeout and stays idle when nothing arrived"""
+    scheduler = make_scheduler()
+    settle(scheduler)
+    
+    start = time.perf_counter()
+    events = scheduler.get_events()
+    waited = time.perf_counter() - start
+    assert events == [] and waited >= 0.04
+    assert scheduler.idle and scheduler.frame_was_idle and scheduler.wakeups == 1
+    
+    idle_before = scheduler.idle_time
+    scheduler.tick(settled=True)
+    assert scheduler.idle_time - idle_before >= 0.04
+    assert scheduler.get_idle_ratio() > 0
+    print("✅ Idle frames wait on the event queue")
+
+def test_input_wakes():
+    """An event arriving while idle is returned at once and restores the full frame rate"""
+    scheduler = make_scheduler()
+    settle(scheduler)
+    
+    pygame.event.post(pygame.event.Event(pygame.USEREVENT, marker=1))
+    start = time.perf_counter()
+    events = scheduler.get_events()
+    assert time.perf_counter() - start < 0.04
+    assert [event.type for event in events] == [pygame.USEREVENT]
+    assert not scheduler.idle and scheduler.settled_since is None
+    
+    scheduler.tick(settled=False)
+    assert not scheduler.get_events() and not scheduler.frame_was_idle
+    print("✅ Input wakes the scheduler")
+
+def main():
+    """Run all tests"""
+    print("🧪 Testing Frame Scheduler")
+    print("=" * 40)
+    
+    tests = [
+        ("Idle Delay", test_goes_idle_after_delay),
+        ("Idle Wait", test_idle_waits_on_events),
+        ("Wake", test_input_wakes)
+    ]
+    
+    passed = 0
+    total = len(tests)
+    
+    for test_name, test_func in tests:
+        print(f"\n🔍 Testing {test_name}...")
+        try:
+            test_func()
+            passed += 1
+        except AssertionError as e:
+            print(f"❌ {test_name} failed: {e}")
+    
+    print("\n" + "=" * 40)
+    print(f"📊 Test Results: {passed}/{total} passed")
+    pygame.quit()
+    return passed == total
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Test script for the game discovery index
+Checks that the manifest is reused while directory mtimes are unchanged and rescanned when they move
+"""
+
+import os
+import sys
+import json
+import tempfile
+
+from game_discovery import GameDiscovery, find_game_executable
+
+def make_games(root: str):
+    """Two game directories with different entry point names"""
+    games_dir = os.path.join(root, "games")
+    for name, files in (("snake", ["helpers.py", "snake.py"]), ("maze", ["main.py", "maze_game.py"])):
+        os.makedirs(os.path.join(games_dir, name))
+        for file_name in files:
+            open(os.path.join(games_dir, name, file_name), "w").close()
+    return games_dir
+
+def test_executable_preference():
+    """main.py wins, then <dir>.py, then names with main/game/run"""
+    with tempfile.TemporaryDirectory() as root:
+        games_dir = make_games(root)
+        assert find_game_executable(os.path.join(games_dir, "maze")).endswith("main.py")
+        assert find_game_executable(os.path.join(games_dir, "snake")).endswith("snake.py")
+        assert find_game_executable(os.path.join(root, "missing")) is None
+    print("✅ Executable preference")
+
+def test_manifest_reused():
+    """A fresh index trusts the manifest for directories whose mtime has not changed"""
+    with tempfile.TemporaryDirectory() as root:
+        games_dir = make_games(root)
+        manifest_path = os.path.join(root, "game_index.json")
+        
+        first = GameDiscovery(manifest_path)
+        games = first.scan(games_dir)
+        assert first.cache_misses == 2 and first.cache_hits == 0
+        assert os.path.basename(games["maze"]) == "main.py"
+        
+        # Poison the cached entry: only a rescan would notice the executable is wrong
+        with open(manifest_path) as f:
+            manifest = json.load(f)
+        manifest["entries"][os.path.join(games_dir, "maze")]["executable"] = "cached.py"
+        with open(manifest_path, "w") as f:
+            json.dump(manifest, f)
+        saved_at = os.stat(manifest_path).st_mtime_ns
+        
+        second = GameDiscovery(manifest_path)
+        games = second.scan(games_dir)
+        assert second.cache_hits == 2 and second.cache_misses == 0
+        assert games["maze"] == "cached.py" and not second.scan_times
+        assert os.stat(manifest_path).st_mtime_ns == saved_at
+    print("✅ Manifest reused")
+
+def test_changed_directory_rescanned():
+    """Touching a directory rescans it alone; removed directories leave the manifest"""
+    with tempfile.TemporaryDirectory() as root:
+        games_dir = make_games(root)
+        manifest_path = os.path.join(root, "game_index.json")
+        GameDiscovery(manifest_path).scan(games_dir)
+        
+        snake_dir = os.path.join(games_dir, "snake")
+        open(os.path.join(snake_dir, "main.py"), "w").close()
+        stat = os.stat(snake_dir)
+        os.utime(snake_dir, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        
+        discovery = GameDiscovery(manifest_path)
+        games = discovery.scan(games_dir)
+        assert discovery.cache_hits == 1 and discovery.cache_misses == 1
+        assert os.path.basename(games["snake"]) == "main.py"
+        assert list(discovery.scan_times) == [snake_dir]
+        
+        os.remove(os.path.join(games_dir, "maze", "main.py"))
+        os.remove(os.path.join(games_dir, "maze", "maze_game.py"))
+        os.rmdir(os.path.join(games_dir, "maze"))
+        assert list(discovery.scan(games_dir)) == ["snake"]
+        with open(manifest_path) as f:
+            assert list(json.load(f)["entries"]) == [snake_dir]
+    print("✅ Changed directory rescanned")
+
+def main():
+    """Run all tests"""
+    print("🧪 Testing Game Discovery")
+    print("=" * 40)
+    
+    tests = [
+        ("Executable Preference", test_executable_preference),
+        ("Manifest Reuse", test_manifest_reused),
+        ("Rescan", test_changed_directory_rescanned)
+    ]
+    
+    passed = 0
+    total = len(tests)
+    
+    for test_name, test_func in tests:
+        print(f"\n🔍 Testing {test_name}...")
+        try:
+            test_func()
+            passed += 1
+        except AssertionError as e:
+            print(f"❌ {test_name} failed: {e}")
+    
+    print("\n" + "=" * 40)
+    print(f"📊 Test Results: {passed}/{total} passed")
+    return passed == total
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Test script for the game telemetry ring
+Publishes frames from a child process and checks what the launcher side reads back
+"""
+
+import os
+import sys
+import tempfile
+import subprocess
+
+from game_telemetry import TELEMETRY_ENV, PerformanceHistory, TelemetryMonitor
+from play_history import PlayHistory, PlayHistoryWriter
+
+PUBLISH_SCRIPT = """
+import sys
+from game_telemetry import connect_telemetry
+telemetry = connect_telemetry()
+for frame in range(int(sys.argv[1])):
+    telemetry.publish(entities=frame % 7, score=frame * 10, frame_ms=50.0 if frame == 40 else 16.0)
+telemetry.close()
+"""
+
+def run_publisher(env, frames: int):
+    """Publish frames from a separate process, like a launched game"""
+    child_env = {**os.environ, **env}
+    child_env["PYTHONPATH"] = os.path.dirname(os.path.abspath(__file__))
+    result = subprocess.run([sys.executable, "-c", PUBLISH_SCRIPT, str(frames)], env=child_env)
+    assert result.returncode == 0
+
+def test_round_trip():
+    """Every published frame arrives with its entity count and score"""
+    monitor = TelemetryMonitor()
+    run_publisher(monitor.begin("Dino Run"), 100)
+    session = monitor.end("Dino Run")
+    
+    assert session.frames == 100 and session.dropped == 0
+    assert session.peak_entities == 6
+    assert session.last_score == 990
+    assert session.stutters == 1
+    assert session.get_percentiles()["p50"] == 16.0
+    assert monitor.histories["Dino Run"].frames == 100
+    print(f"✅ Round trip: {session.get_summary_text()}")
+
+def test_lapped_ring_counts_drops():
+    """Frames overwritten before a drain are counted, not misread"""
+    monitor = TelemetryMonitor(capacity=64)
+    run_publisher(monitor.begin("Snake Classic"), 200)
+    session = monitor.end("Snake Classic")
+    
+    assert session.frames == 64
+    assert session.dropped == 136
+    assert session.last_score == 1990
+    print("✅ Lapped ring keeps the newest frames")
+
+def test_history_spans_sessions():
+    """Per-game history accumulates across launches"""
+    monitor = TelemetryMonitor()
+    for _ in range(2):
+        run_publisher(monitor.begin("Fighter Shoot"), 30)
+        monitor.poll()
+        assert monitor.end("Fighter Shoot").frames == 30
+    
+    assert monitor.histories["Fighter Shoot"].frames == 60
+    assert not monitor.channels
+    assert TELEMETRY_ENV not in os.environ
+    print("✅ History spans sessions")
+
+def test_session_score_stored():
+    """The last published score and frame stats end up on the session's play history row"""
+    monitor = TelemetryMonitor()
+    run_publisher(monitor.begin("Dino Run"), 50)
+    monitor.poll()
+    fields = monitor.end("Dino Run").get_session_fields()
+    assert fields["score"] == 490 and fields["stutter_frames"] == 1
+    
+    with tempfile.TemporaryDirectory() as directory:
+        db_path = os.path.join(directory, "play_history.db")
+        writer = PlayHistoryWriter(db_path)
+        writer.start()
+        session_id = writer.start_session("Dino Run", started=1000.0)
+        writer.end_session(session_id, exit_code=0, ended=1030.0, **fields)
+        writer.close()
+        assert PlayHistory(db_path).recent_sessions("Dino Run") == [(1000.0, 30.0, 0, 490)]
+    
+    assert PerformanceHistory().get_session_fields() == {"score": None, "frame_p95_ms": None, "stutter_frames": None}
+    print("✅ Session score stored")
+
+def main():
+    """Run all tests"""
+    print("🧪 Testing Game Telemetry")
+    print("=" * 40)
+    
+    tests = [
+        ("Round Trip", test_round_trip),
+        ("Lapped Ring", test_lapped_ring_counts_drops),
+        ("History", test_history_spans_sessions),
+        ("Session Score", test_session_score_stored)
+    ]
+    
+    passed = 0
+    total = len(tests)
+    
+    for test_name, test_func in tests:
+        print(f"\n🔍 Testing {test_name}...")
+        try:
+            test_func()
+            passed += 1
+        except AssertionError as e:
+            print(f"❌ {test_name} failed: {e}")
+    
+    print("\n" + "=" * 40)
+    print(f"📊 Test Results: {passed}/{total} passed")
+    return passed == total
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
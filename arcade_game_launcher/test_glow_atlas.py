@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Test script for the glow atlas
+Checks the radial falloff, radius bucketing, LRU eviction and display changes of glow textures
+"""
+
+import sys
+import pygame
+
+from glow_atlas import GlowAtlas, create_glow
+from surface_cache import surface_bytes
+
+def test_falloff_shape():
+    """Linear glows fade from the center to the rim; solid ones stay flat"""
+    glow = create_glow(20, (255, 200, 0), 0.5)
+    assert glow.get_size() == (40, 40)
+    assert glow.get_at((20, 20))[:3] == (255, 200, 0)
+    center, middle, corner = glow.get_at((20, 20)).a, glow.get_at((30, 20)).a, glow.get_at((0, 0)).a
+    assert 120 <= center <= 127 and 55 <= middle <= 70 and corner == 0
+    
+    disc = create_glow(20, (0, 255, 0), 80 / 255, "solid")
+    assert disc.get_at((20, 20)).a == disc.get_at((30, 20)).a == 80
+    assert disc.get_at((0, 0)).a == 0
+    print("✅ Falloff shapes correct")
+
+def test_pulsing_radius_reuses_textures():
+    """A pulsing glow maps onto a few radius buckets"""
+    atlas = GlowAtlas()
+    for frame in range(120):
+        atlas.get(20 + (frame % 5) * 0.5, (0, 255, 0), 50 / 255, "solid")
+    assert len(atlas.cache.entries) == 2  # Radii 20 and 22
+    assert atlas.get(20.4, (0, 255, 0), 50 / 255, "solid") is atlas.get(19.6, (0, 255, 0), 50 / 255, "solid")
+    assert atlas.get(20, (0, 255, 0), 0.5) is not atlas.get(20, (0, 255, 0), 0.25)
+    print("✅ Radius buckets reused")
+
+def test_lru_eviction():
+    """The least recently drawn texture goes first when the budget is full"""
+    size = surface_bytes(create_glow(10, (255, 0, 0)))
+    atlas = GlowAtlas(max_bytes=size * 2)
+    first = atlas.get(10, (255, 0, 0))
+    atlas.get(10, (0, 255, 0))
+    assert atlas.get(10, (255, 0, 0)) is first  # Touch red so green is oldest
+    atlas.get(10, (0, 0, 255))
+    assert len(atlas.cache.entries) == 2 and atlas.cache.evictions == 1
+    assert atlas.get(10, (255, 0, 0)) is first
+    
+    target = pygame.Surface((40, 40))
+    atlas.draw(target, (20, 20), 10, (255, 255, 255), 1.0, "solid")
+    assert target.get_at((20, 20))[:3] == (255, 255, 255) and target.get_at((2, 2))[:3] == (0, 0, 0)
+    print("✅ LRU eviction working")
+
+def test_new_display_rebuilds():
+    """Textures keep their alpha in display format and are dropped when the display is replaced"""
+    pygame.display.init()
+    try:
+        pygame.display.set_mode((80, 60))
+        atlas = GlowAtlas()
+        first = atlas.get(10, (255, 0, 0))
+        assert first.get_flags() & pygame.SRCALPHA and first.get_at((0, 0))[3] == 0
+        assert atlas.get(10, (255, 0, 0)) is first
+        pygame.display.quit()
+        pygame.display.init()
+        pygame.display.set_mode((80, 60))
+        assert atlas.get(10, (255, 0, 0)) is not first
+        assert len(atlas.cache.entries) == 1
+    finally:
+        pygame.display.quit()
+    print("✅ New display rebuilds textures")
+
+def main():
+    """Run all tests"""
+    print("🧪 Testing Glow Atlas")
+    print("=" * 40)
+    
+    tests = [
+        ("Falloff", test_falloff_shape),
+        ("Radius Buckets", test_pulsing_radius_reuses_textures),
+        ("LRU Eviction", test_lru_eviction),
+        ("Display Change", test_new_display_rebuilds)
+    ]
+    
+    passed = 0
+    total = len(tests)
+    
+    for test_name, test_func in tests:
+        print(f"\n🔍 Testing {test_name}...")
+        try:
+            test_func()
+            passed += 1
+        except AssertionError as e:
+            print(f"❌ {test_name} failed: {e}")
+    
+    print("\n" + "=" * 40)
+    print(f"📊 Test Results: {passed}/{total} passed")
+    return passed == total
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
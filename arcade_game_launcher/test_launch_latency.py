@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Test script for the launch latency tracker
+Validates the report handshake and the expiry of launches that never report
+"""
+
+import sys
+import time
+import socket
+
+from launch_latency import LAUNCH_REPORT_ENV, PENDING_TIMEOUT, LaunchLatencyTracker
+
+def send_report(env, frame_time):
+    """Send a report the way the game-side hook does"""
+    host, port, launch_id = env[LAUNCH_REPORT_ENV].rsplit(":", 2)
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+        sock.sendto(f"{launch_id}:{frame_time}".encode("ascii"), (host, int(port)))
+
+def poll_until(tracker, count):
+    """Poll until the expected number of reports arrived or a second passed"""
+    completed = []
+    deadline = time.time() + 1.0
+    while len(completed) < count and time.time() < deadline:
+        completed.extend(tracker.poll())
+        time.sleep(0.01)
+    return completed
+
+def test_report_completes_launch():
+    """A report turns the pending launch into a latency sample"""
+    tracker = LaunchLatencyTracker()
+    try:
+        env = tracker.begin("Snake", click_time=100.0)
+        send_report(env, 100.25)
+        completed = poll_until(tracker, 1)
+        assert len(completed) == 1 and completed[0][0] == "Snake"
+        assert abs(completed[0][1] - 250.0) < 0.01
+        assert not tracker.pending and tracker.samples["Snake"] == [completed[0][1]]
+    finally:
+        tracker.close()
+    print("✅ Report completes launch")
+
+def test_silent_launches_expire():
+    """Launches that never report are dropped once they are older than the timeout"""
+    tracker = LaunchLatencyTracker()
+    try:
+        tracker.begin("Crashed Game", click_time=0.0)
+        tracker.begin("Fresh Game", click_time=PENDING_TIMEOUT)
+        assert tracker.poll(now=PENDING_TIMEOUT + 1.0) == []
+        assert [name for name, _ in tracker.pending.values()] == ["Fresh Game"]
+        
+        tracker.poll(now=2 * PENDING_TIMEOUT + 1.0)
+        assert not tracker.pending and not tracker.samples
+    finally:
+        tracker.close()
+    print("✅ Silent launches expire")
+
+def main():
+    """Run all tests"""
+    print("🧪 Testing Launch Latency")
+    print("=" * 40)
+    
+    tests = [
+        ("Report", test_report_completes_launch),
+        ("Expiry", test_silent_launches_expire)
+    ]
+    
+    passed = 0
+    total = len(tests)
+    
+    for test_name, test_func in tests:
+        print(f"\n🔍 Testing {test_name}...")
+        try:
+            test_func()
+            passed += 1
+        except AssertionError as e:
+            print(f"❌ {test_name} failed: {e}")
+    
+    print("\n" + "=" * 40)
+    print(f"📊 Test Results: {passed}/{total} passed")
+    return passed == total
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
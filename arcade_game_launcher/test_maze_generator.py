@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Test script for the maze generator algorithms
+Checks that every algorithm builds connected, seed-reproducible mazes on the byte grid
+"""
+
+import os
+import sys
+
+# Add the maze game directory to the path for its flat imports
+sys.path.append(os.path.join(os.path.dirname(__file__), "games", "maze_game"))
+
+from maze_generator import ALGORITHMS, MazeGenerator
+
+def reachable(generator):
+    """Every open cell reachable from the start"""
+    seen = {(1, 1)}
+    frontier = [(1, 1)]
+    while frontier:
+        x, y = frontier.pop()
+        for nx, ny in ((x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)):
+            if (nx, ny) not in seen and generator.is_valid_position(nx, ny):
+                seen.add((nx, ny))
+                frontier.append((nx, ny))
+    return seen
+
+def test_algorithms_connected():
+    """Every algorithm joins all rooms and the goal, with the border left standing"""
+    for algorithm in ALGORITHMS:
+        for width, height in ((41, 31), (40, 30), (20, 4), (3, 40), (7, 3)):
+            generator = MazeGenerator(width, height, algorithm, seed=3)
+            maze = generator.generate_maze()
+            assert len(maze) == height and all(len(row) == width for row in maze)
+            grid = generator.as_array()
+            assert grid[0].all() and grid[-1].all() and grid[:, 0].all() and grid[:, -1].all(), algorithm
+            
+            seen = reachable(generator)
+            rooms = [(x, y) for y in range(1, 2 * generator.rooms_y, 2) for x in range(1, 2 * generator.rooms_x, 2)]
+            assert all(room in seen for room in rooms), algorithm
+            if width % 2:
+                assert (width - 2, height - 2) in seen, algorithm
+    print("✅ All algorithms connected")
+
+def test_perfect_before_extra_paths():
+    """Without the extra loops each algorithm carves a spanning tree: one passage fewer than rooms"""
+    for algorithm in ALGORITHMS:
+        generator = MazeGenerator(61, 41, algorithm, seed=9)
+        generator._add_extra_paths = lambda: None
+        generator.generate_maze()
+        rooms = generator.rooms_x * generator.rooms_y
+        open_cells = int((generator.as_array() == 0).sum())
+        assert open_cells - rooms == rooms - 1, algorithm
+    print("✅ Perfect mazes")
+
+def test_seed_reproducible():
+    """The same seed builds the same maze, and the global random module is left alone"""
+    import random
+    for algorithm in ALGORITHMS:
+        random.seed(0)
+        first = MazeGenerator(51, 51, algorithm, seed=12)
+        first.generate_maze()
+        second = MazeGenerator(51, 51, algorithm, seed=12)
+        second.generate_maze()
+        assert first.cells == second.cells, algorithm
+        assert random.random() == random.Random(0).random(), algorithm
+        
+        other = MazeGenerator(51, 51, algorithm, seed=13)
+        other.generate_maze()
+        assert other.cells != first.cells, algorithm
+    print("✅ Seeds reproducible")
+
+def test_eller_streams_rows():
+    """Eller's rows stream out one at a time at the maze width"""
+    generator = MazeGenerator(301, 200, "eller", seed=4)
+    rows = 0
+    for row in generator.eller_rows():
+        assert len(row) == 301
+        rows += 1
+    assert rows == 200
+    print("✅ Eller rows streamed")
+
+def test_grid_is_compact():
+    """The grid is one byte per cell, shared by the rows and the NumPy view"""
+    generator = MazeGenerator(25, 21, seed=1)
+    maze = generator.generate_maze()
+    assert len(generator.cells) == 25 * 21
+    grid = generator.as_array()
+    maze[3][4] = 1
+    assert grid[3, 4] == 1
+    grid[3, 4] = 0
+    assert maze[3][4] == 0 and generator.is_valid_position(4, 3)
+    print("✅ Compact grid")
+
+def test_invalid_arguments():
+    """Unknown algorithms and degenerate sizes are rejected"""
+    for kwargs in ({"algorithm": "prim"}, {"width": 2}, {"height": 1}):
+        try:
+            MazeGenerator(**kwargs)
+        except ValueError:
+            continue
+        raise AssertionError(f"accepted {kwargs}")
+    print("✅ Invalid arguments rejected")
+
+def main():
+    """Run all tests"""
+    print("🧪 Testing Maze Generator")
+    print("=" * 40)
+    
+    tests = [
+        ("Connectivity", test_algorithms_connected),
+        ("Perfect Mazes", test_perfect_before_extra_paths),
+        ("Seeds", test_seed_reproducible),
+        ("Eller Rows", test_eller_streams_rows),
+        ("Compact Grid", test_grid_is_compact),
+        ("Invalid Arguments", test_invalid_arguments)
+    ]
+    
+    passed = 0
+    total = len(tests)
+    
+    for test_name, test_func in tests:
+        print(f"\n🔍 Testing {test_name}...")
+        try:
+            test_func()
+            passed += 1
+        except AssertionError as e:
+            print(f"❌ {test_name} failed: {e}")
+    
+    print("\n" + "=" * 40)
+    print(f"📊 Test Results: {passed}/{total} passed")
+    return passed == total
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Test script for the baked maze wall layer
+Compares the layer with per-cell wall drawing and checks chunking, eviction and large maze generation
+"""
+
+import os
+import sys
+import random
+import pygame
+
+# Add the maze game directory to the path for its flat imports
+sys.path.append(os.path.join(os.path.dirname(__file__), "games", "maze_game"))
+
+from maze_generator import MazeGenerator
+from maze_renderer import MazeLayer
+from settings import CELL_SIZE, DARK_GREEN, GREEN, WALL_THICKNESS
+
+def draw_walls_per_cell(surface, maze, offset_x, offset_y):
+    """The original per-frame wall drawing"""
+    for y in range(len(maze)):
+        for x in range(len(maze[0])):
+            if maze[y][x] == 1:
+                wall_rect = pygame.Rect(x * CELL_SIZE + offset_x, y * CELL_SIZE + offset_y, CELL_SIZE, CELL_SIZE)
+                pygame.draw.rect(surface, DARK_GREEN, wall_rect)
+                pygame.draw.rect(surface, GREEN, wall_rect, WALL_THICKNESS)
+                pygame.draw.rect(surface, (0, 120, 0), wall_rect.inflate(-6, -6), 1)
+
+def same_pixels(first, second):
+    """True if two surfaces hold identical RGB pixels"""
+    return pygame.image.tostring(first, "RGB") == pygame.image.tostring(second, "RGB")
+
+def test_small_maze_baked_once():
+    """A screen-sized maze is one layer that looks exactly like per-cell drawing"""
+    random.seed(5)
+    maze = MazeGenerator(25, 20).generate_maze()
+    layer = MazeLayer(maze)
+    assert layer.chunks_rendered == 1
+    
+    expected, actual = pygame.Surface((1000, 800)), pygame.Surface((1000, 800))
+    for offset in ((125, 100), (128, 97)):  # Centered, then shaken
+        expected.fill((20, 25, 40))
+        actual.fill((20, 25, 40))
+        draw_walls_per_cell(expected, maze, *offset)
+        layer.draw(actual, *offset)
+        assert same_pixels(expected, actual)
+    assert layer.chunks_rendered == 1
+    print("✅ Small maze baked once")
+
+def test_large_maze_chunks():
+    """Only chunks under the viewport are rendered, and old ones are evicted"""
+    random.seed(6)
+    maze = MazeGenerator(201, 201).generate_maze()
+    layer = MazeLayer(maze)
+    assert layer.chunks_rendered == 0 and layer.chunk_cells[0] < 201
+    
+    expected, actual = pygame.Surface((1000, 800)), pygame.Surface((1000, 800))
+    draw_walls_per_cell(expected, maze, -2000, -1500)
+    layer.draw(actual, -2000, -1500)
+    assert same_pixels(expected, actual)
+    assert layer.chunks_rendered <= 9
+    
+    chunk_bytes = max(layer.cache.current_bytes // len(layer.cache.entries), 1)
+    small = MazeLayer(maze, max_bytes=chunk_bytes * 12)
+    for step in range(10):
+        small.draw(actual, -step * 500, -step * 500)
+    assert len(small.cache.entries) <= 12 and small.cache.evictions > 0
+    print("✅ Large maze chunked")
+
+def test_large_maze_generation():
+    """Mazes far past the old recursion limit generate, with every room reachable"""
+    random.seed(7)
+    generator = MazeGenerator(501, 501)
+    maze = generator.generate_maze()
+    assert all(maze[y][x] == 0 for y in range(1, 500, 2) for x in range(1, 500, 2))
+    
+    # Flood fill from the start reaches every room (odd cell) and the goal
+    seen = {(1, 1)}
+    frontier = [(1, 1)]
+    while frontier:
+        x, y = frontier.pop()
+        for nx, ny in ((x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)):
+            if (nx, ny) not in seen and generator.is_valid_position(nx, ny):
+                seen.add((nx, ny))
+                frontier.append((nx, ny))
+    assert all((x, y) in seen for y in range(1, 500, 2) for x in range(1, 500, 2))
+    assert (499, 499) in seen
+    print("✅ Large maze generated")
+
+def main():
+    """Run all tests"""
+    print("🧪 Testing Maze Layer")
+    print("=" * 40)
+    
+    tests = [
+        ("Baked Layer", test_small_maze_baked_once),
+        ("Chunk Cache", test_large_maze_chunks),
+        ("Large Generation", test_large_maze_generation)
+    ]
+    
+    passed = 0
+    total = len(tests)
+    
+    for test_name, test_func in tests:
+        print(f"\n🔍 Testing {test_name}...")
+        try:
+            test_func()
+            passed += 1
+        except AssertionError as e:
+            print(f"❌ {test_name} failed: {e}")
+    
+    print("\n" + "=" * 40)
+    print(f"📊 Test Results: {passed}/{total} passed")
+    return passed == total
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
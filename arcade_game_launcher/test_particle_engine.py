@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Test script for the pooled particle engine
+Checks vectorized updates, free-list slot reuse, pool growth and stamp caching
+"""
+
+import sys
+import math
+import pygame
+
+from particle_engine import ParticleEngine, StampCache
+
+def test_update_moves_and_kills():
+    """One update moves every particle and frees the ones out of life"""
+    engine = ParticleEngine(capacity=4, drag=0.5)
+    engine.emit(10, 10, 2, -2, (255, 0, 0), life=1)
+    engine.emit(0, 0, 1, 1, (0, 255, 0), life=5)
+    engine.update()
+    assert len(engine) == 1 and engine.free == [0]
+    assert tuple(engine.position[1]) == (1, 1) and tuple(engine.velocity[1]) == (0.5, 0.5)
+    print("✅ Vectorized update and death")
+
+def test_dead_slots_reused():
+    """New particles fill freed slots before touching fresh ones"""
+    engine = ParticleEngine(capacity=8)
+    engine.burst(6, 0, 0, 1, (255, 255, 255), life=1)
+    engine.update()
+    assert len(engine) == 0 and len(engine.free) == 6
+    engine.burst(4, 0, 0, 1, (255, 255, 255))
+    assert engine.high_water == 6 and len(engine.free) == 2
+    print("✅ Free list reused")
+
+def test_pool_grows():
+    """Running out of slots doubles the arrays and keeps live particles"""
+    engine = ParticleEngine(capacity=2)
+    engine.emit(5, 6, 0, 0, (1, 2, 3))
+    engine.burst(3, 0, 0, 1, (4, 5, 6))
+    assert engine.capacity == 4 and len(engine) == 4
+    assert tuple(engine.position[0]) == (5, 6) and engine.palette[engine.color[0]] == (1, 2, 3)
+    print("✅ Pool grows on demand")
+
+def test_draw_uses_shared_stamps():
+    """Particles sharing size, color and alpha bucket share one stamp"""
+    stamps = StampCache()
+    engine = ParticleEngine(shape="square", stamps=stamps)
+    surface = pygame.Surface((100, 100), pygame.SRCALPHA)
+    for x in range(10, 90, 10):
+        engine.emit(x, 50, 0, 0, (255, 0, 0), life=30)
+    engine.emit(-50, -50, 0, 0, (255, 0, 0), life=30)  # Off-surface: culled
+    engine.draw(surface)
+    assert len(stamps.stamps) == 1
+    assert surface.get_at((10, 50)) == (255, 0, 0, 255)
+    
+    # Ambient particles live forever and keep their base alpha
+    ambient = ParticleEngine(fade=False, wrap=(100, 100), stamps=stamps)
+    ambient.emit(99, 50, 2, 0, (0, 0, 255), life=math.inf, size=1, alpha=255)
+    ambient.update()
+    assert tuple(ambient.position[0]) == (1, 50) and len(ambient) == 1
+    ambient.draw(surface)
+    assert surface.get_at((0, 49)) == (0, 0, 255, 255)
+    print("✅ Batched draw from shared stamps")
+
+def main():
+    """Run all tests"""
+    print("🧪 Testing Particle Engine")
+    print("=" * 40)
+    
+    tests = [
+        ("Update", test_update_moves_and_kills),
+        ("Slot Reuse", test_dead_slots_reused),
+        ("Growth", test_pool_grows),
+        ("Draw", test_draw_uses_shared_stamps)
+    ]
+    
+    passed = 0
+    total = len(tests)
+    
+    for test_name, test_func in tests:
+        print(f"\n🔍 Testing {test_name}...")
+        try:
+            test_func()
+            passed += 1
+        except AssertionError as e:
+            print(f"❌ {test_name} failed: {e}")
+    
+    print("\n" + "=" * 40)
+    print(f"📊 Test Results: {passed}/{total} passed")
+    return passed == total
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Test script for calibrated performance profiles
+Runs a short headless calibration and checks profile reuse and invalidation
+"""
+
+import os
+import sys
+import json
+import tempfile
+import subprocess
+
+from performance_optimizer import (CALIBRATE_FLAG, calibrated_level, hardware_fingerprint,
+                                   load_profile, recommend_level)
+
+def run_worker(seconds: float) -> dict:
+    """Calibrate in a headless child process, like the optimizer does"""
+    env = dict(os.environ, SDL_VIDEODRIVER="dummy", SDL_AUDIODRIVER="dummy", PYGAME_HIDE_SUPPORT_PROMPT="1")
+    script = os.path.join(os.path.dirname(os.path.abspath(__file__)), "performance_optimizer.py")
+    result = subprocess.run([sys.executable, script, CALIBRATE_FLAG, str(seconds)],
+                            env=env, capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+    return json.loads(result.stdout)
+
+def write_config(directory: str, profile: dict) -> str:
+    """Config file holding only a calibration"""
+    config_path = os.path.join(directory, "performance_config.json")
+    with open(config_path, "w") as f:
+        json.dump({"calibration": profile}, f)
+    return config_path
+
+def test_calibration_measures_every_level():
+    """Both scenes get a measured FPS for every quality level"""
+    profile = run_worker(0.02)
+    assert profile["fingerprint"] == hardware_fingerprint()
+    for scene in ("launcher", "game"):
+        levels = profile["scenes"][scene]["levels"]
+        assert set(levels) == {"high", "medium", "low", "minimal"}
+        assert all(stats["fps"] > 0 and stats["p95_ms"] > 0 for stats in levels.values())
+    print(f"✅ Calibrated: launcher {profile['scenes']['launcher']['recommended']}, "
+          f"game {profile['scenes']['game']['recommended']}")
+
+def test_recommendation_needs_headroom():
+    """The best level is picked only if it clears its frame cap with headroom"""
+    levels = {"high": {"fps": 100}, "medium": {"fps": 100}, "low": {"fps": 100}, "minimal": {"fps": 500}}
+    assert recommend_level(levels, 60) == "high"
+    assert recommend_level(levels, 120) == "low"
+    levels = {name: {"fps": 20} for name in levels}
+    assert recommend_level(levels, 60) == "minimal"
+    print("✅ Recommendation respects headroom")
+
+def test_profile_reused_until_hardware_changes():
+    """A stored profile applies on the same hardware and is ignored elsewhere"""
+    profile = {"fingerprint": hardware_fingerprint(), "scenes": {"launcher": {"recommended": "low"}}}
+    with tempfile.TemporaryDirectory() as directory:
+        config_path = write_config(directory, profile)
+        assert load_profile(config_path) == profile
+        assert calibrated_level("launcher", config_path) == 2
+        assert calibrated_level("game", config_path) == 0
+        
+        config_path = write_config(directory, dict(profile, fingerprint="another-machine"))
+        assert load_profile(config_path) is None
+        assert calibrated_level("launcher", config_path) == 0
+    print("✅ Profile reused only on matching hardware")
+
+def main():
+    """Run all tests"""
+    print("🧪 Testing Performance Calibration")
+    print("=" * 40)
+    
+    tests = [
+        ("Calibration", test_calibration_measures_every_level),
+        ("Recommendation", test_recommendation_needs_headroom),
+        ("Profile Reuse", test_profile_reused_until_hardware_changes)
+    ]
+    
+    passed = 0
+    total = len(tests)
+    
+    for test_name, test_func in tests:
+        print(f"\n🔍 Testing {test_name}...")
+        try:
+            test_func()
+            passed += 1
+        except AssertionError as e:
+            print(f"❌ {test_name} failed: {e}")
+    
+    print("\n" + "=" * 40)
+    print(f"📊 Test Results: {passed}/{total} passed")
+    return passed == total
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Test script for the play history store
+Validates the one-time migration and the launcher's sort queries on an in-memory database
+"""
+
+import os
+import sys
+import time
+import tempfile
+
+from play_history import PlayHistory, PlayHistoryWriter, WEEK_SECONDS
+
+def test_migration_runs_once():
+    """game_stats.json counts are imported exactly once"""
+    history = PlayHistory(":memory:")
+    stats = {"Dino Run": {"play_count": 8, "last_played": 100.0}}
+    assert history.migrate_from_stats(stats)
+    assert not history.migrate_from_stats(stats)
+    assert history.most_played() == [("Dino Run", 8)]
+    print("✅ Migration imported once")
+
+def test_session_lifecycle():
+    """Sessions record duration, exit code and score"""
+    history = PlayHistory(":memory:")
+    session_id = history.start_session("Snake Classic", started=1000.0)
+    history.end_session(session_id, exit_code=0, score=42, ended=1060.0)
+    assert history.recent_sessions("Snake Classic") == [(1000.0, 60.0, 0, 42)]
+    assert history.recently_played() == [("Snake Classic", 1000.0)]
+    print("✅ Session recorded with duration and score")
+
+def test_weekly_ranking():
+    """Only sessions from the last seven days count for this week"""
+    history = PlayHistory(":memory:")
+    now = time.time()
+    old = now - 2 * WEEK_SECONDS
+    history.add_sessions([("Maze Explorer", old, old + 60, 0, None)] * 5)
+    history.add_sessions([("Tic Tac Toe", now - 60, now, 0, None)] * 2)
+    
+    assert history.most_played()[0] == ("Maze Explorer", 5)
+    assert history.most_played_this_week() == [("Tic Tac Toe", 2)]
+    print("✅ Weekly ranking ignores old sessions")
+
+def test_background_writer():
+    """Sessions are written off the calling thread, ids continue across runs and queries see earlier writes"""
+    with tempfile.TemporaryDirectory() as directory:
+        db_path = os.path.join(directory, "play_history.db")
+        writer = PlayHistoryWriter(db_path)
+        writer.start({"Dino Run": {"play_count": 3, "last_played": 50.0}})
+        first = writer.start_session("Snake Classic", started=1000.0)
+        writer.end_session(first, exit_code=0, ended=1030.0)
+        
+        results = []
+        writer.query("most_played", callback=results.append)
+        writer.close()
+        assert writer.poll() == 1
+        assert results == [[("Dino Run", 3), ("Snake Classic", 1)]]
+        
+        writer = PlayHistoryWriter(db_path)
+        writer.start()
+        second = writer.start_session("Snake Classic", started=2000.0)
+        writer.close()
+        assert second == first + 1
+        assert PlayHistory(db_path).recent_sessions("Snake Classic") == [(2000.0, None, None, None),
+                                                                          (1000.0, 30.0, 0, None)]
+    print("✅ Background writer keeps session order")
+
+def test_writer_disabled_on_bad_database():
+    """A database that cannot be opened still sets ready, and later calls are dropped instead of blocking"""
+    with tempfile.TemporaryDirectory() as directory:
+        writer = PlayHistoryWriter(os.path.join(directory, "missing", "play_history.db"))
+        writer.start({"Dino Run": {"play_count": 3}})
+        assert writer.ready.wait(5), "writer never became ready"
+        assert not writer.enabled
+        
+        session_id = writer.start_session("Snake Classic", started=1000.0)
+        writer.end_session(session_id, exit_code=0, ended=1030.0)
+        results = []
+        writer.query("most_played", callback=results.append)
+        writer.close()
+        assert writer.poll() == 0 and results == []
+    print("✅ Bad database disables the writer")
+
+def main():
+    """Run all tests"""
+    print("🧪 Testing Play History")
+    print("=" * 40)
+    
+    tests = [
+        ("Migration", test_migration_runs_once),
+        ("Session Lifecycle", test_session_lifecycle),
+        ("Weekly Ranking", test_weekly_ranking),
+        ("Background Writer", test_background_writer),
+        ("Bad Database", test_writer_disabled_on_bad_database)
+    ]
+    
+    passed = 0
+    total = len(tests)
+    
+    for test_name, test_func in tests:
+        print(f"\n🔍 Testing {test_name}...")
+        try:
+            test_func()
+            passed += 1
+        except AssertionError as e:
+            print(f"❌ {test_name} failed: {e}")
+    
+    print("\n" + "=" * 40)
+    print(f"📊 Test Results: {passed}/{total} passed")
+    return passed == total
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
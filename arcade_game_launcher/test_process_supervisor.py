@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Test script for the process supervisor
+Launches short-lived Python children and checks reaping, duplicate suppression and accounting
+"""
+
+import sys
+import time
+import subprocess
+
+from process_supervisor import ProcessSupervisor
+
+def start_child(code: str):
+    """Factory for a child process running a snippet of Python"""
+    return lambda: subprocess.Popen([sys.executable, "-c", code])
+
+def wait_finished(supervisor: ProcessSupervisor, timeout: float = 10.0):
+    """Poll until at least one session has ended"""
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        records = supervisor.poll_finished()
+        if records:
+            return records
+        time.sleep(0.05)
+    return []
+
+def test_reaps_exit_code():
+    """A finished game is reaped with its exit code and duration"""
+    supervisor = ProcessSupervisor(poll_interval=0.05)
+    process = supervisor.launch("Exit Game", start_child("import sys; sys.exit(3)"), session_id=7)
+    assert process is not None
+    
+    records = wait_finished(supervisor)
+    supervisor.shutdown()
+    assert len(records) == 1
+    assert records[0].exit_code == 3
+    assert records[0].session_id == 7
+    assert records[0].duration > 0
+    assert not supervisor.is_running("Exit Game")
+    print("✅ Exit code and duration recorded")
+
+def test_duplicate_launch_ignored():
+    """A second launch of a running game is refused"""
+    supervisor = ProcessSupervisor(poll_interval=0.05)
+    first = supervisor.launch("Slow Game", start_child("import time; time.sleep(0.5)"))
+    second = supervisor.launch("Slow Game", start_child("pass"))
+    assert first is not None and second is None
+    assert supervisor.get_running_games() == ["Slow Game"]
+    
+    assert len(wait_finished(supervisor)) == 1
+    supervisor.shutdown()
+    print("✅ Duplicate launch ignored")
+
+def test_reserved_launch():
+    """A reserved slot refuses other launches until the reserving launch starts the game"""
+    supervisor = ProcessSupervisor(poll_interval=0.05)
+    assert supervisor.reserve("Quick Game")
+    assert not supervisor.reserve("Quick Game")
+    assert supervisor.is_running("Quick Game")
+    assert supervisor.launch("Quick Game", start_child("pass")) is None
+    
+    process = supervisor.launch("Quick Game", start_child("pass"), reserved=True)
+    assert process is not None and supervisor.get_running_games() == ["Quick Game"]
+    assert len(wait_finished(supervisor)) == 1
+    supervisor.shutdown()
+    print("✅ Reserved launch claimed once")
+
+def test_resource_accounting():
+    """CPU time and peak memory of the child are captured"""
+    supervisor = ProcessSupervisor(poll_interval=0.05)
+    supervisor.launch("Busy Game", start_child(
+        "import time\nblock = bytearray(32 * 1024 * 1024)\nend = time.time() + 0.3\nwhile time.time() < end: pass"))
+    
+    records = wait_finished(supervisor)
+    supervisor.shutdown()
+    assert records[0].cpu_seconds > 0.1
+    assert records[0].peak_rss_kb > 32 * 1024
+    print(f"✅ Accounting: {records[0].get_summary_text()}")
+
+def main():
+    """Run all tests"""
+    print("🧪 Testing Process Supervisor")
+    print("=" * 40)
+    
+    tests = [
+        ("Exit Code", test_reaps_exit_code),
+        ("Duplicate Launch", test_duplicate_launch_ignored),
+        ("Reserved Launch", test_reserved_launch),
+        ("Resource Accounting", test_resource_accounting)
+    ]
+    
+    passed = 0
+    total = len(tests)
+    
+    for test_name, test_func in tests:
+        print(f"\n🔍 Testing {test_name}...")
+        try:
+            test_func()
+            passed += 1
+        except AssertionError as e:
+            print(f"❌ {test_name} failed: {e}")
+    
+    print("\n" + "=" * 40)
+    print(f"📊 Test Results: {passed}/{total} passed")
+    return passed == total
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Test script for the adaptive quality governor
+Feeds synthetic frame times and checks downgrades, upgrades and hysteresis
+"""
+
+import sys
+
+from quality_governor import UPGRADE_WINDOWS, QualityGovernor
+
+WINDOW = 10
+
+def feed(governor: QualityGovernor, frame_ms: float, windows: int = 1) -> int:
+    """Record whole windows of one frame time; returns how many level changes happened"""
+    changes = 0
+    for _ in range(windows * WINDOW):
+        changes += governor.record(frame_ms)
+    return changes
+
+def test_downgrade_notifies_subscribers():
+    """A window over budget steps down one level and tells every subscriber"""
+    governor = QualityGovernor(max_fps=60, window_frames=WINDOW)
+    seen = []
+    governor.subscribe(lambda level: seen.append(level.name))
+    assert seen == ["high"]
+    
+    assert feed(governor, 25.0) == 1
+    assert seen == ["high", "medium"]
+    assert governor.level.particles and not governor.level.glow
+    print("✅ Over-budget window steps down")
+
+def test_bottom_level_caps_fps():
+    """The lowest level halves the frame cap"""
+    governor = QualityGovernor(max_fps=60, window_frames=WINDOW)
+    feed(governor, 50.0, windows=5)
+    assert governor.level.name == "minimal"
+    assert governor.target_fps == 30
+    assert not governor.level.gradient_background
+    print("✅ Sustained overload bottoms out at 30 FPS")
+
+def test_upgrade_needs_sustained_headroom():
+    """Stepping back up takes several good windows in a row"""
+    governor = QualityGovernor(max_fps=60, window_frames=WINDOW, initial_level=1)
+    assert feed(governor, 5.0, windows=UPGRADE_WINDOWS - 1) == 0
+    assert feed(governor, 5.0) == 1
+    assert governor.level.name == "high"
+    print("✅ Upgrade after sustained headroom")
+
+def test_hysteresis_band_holds():
+    """Frames that fit the budget but leave little headroom change nothing"""
+    governor = QualityGovernor(max_fps=60, window_frames=WINDOW, initial_level=1)
+    # 14 ms fits the 16.7 ms budget but is above 60% of it
+    assert feed(governor, 14.0, windows=20) == 0
+    assert governor.level.name == "medium"
+    print("✅ No oscillation inside the hysteresis band")
+
+def test_failed_upgrade_backs_off():
+    """An upgrade that immediately misses its budget doubles the wait before the next try"""
+    governor = QualityGovernor(max_fps=60, window_frames=WINDOW, initial_level=1)
+    feed(governor, 5.0, windows=UPGRADE_WINDOWS)
+    assert governor.level.name == "high"
+    feed(governor, 25.0)
+    assert governor.level.name == "medium"
+    
+    assert feed(governor, 5.0, windows=UPGRADE_WINDOWS) == 0
+    assert feed(governor, 5.0, windows=UPGRADE_WINDOWS) == 1
+    assert governor.downgrades == 1 and governor.upgrades == 2
+    print("✅ Failed upgrade backs off")
+
+def main():
+    """Run all tests"""
+    print("🧪 Testing Quality Governor")
+    print("=" * 40)
+    
+    tests = [
+        ("Downgrade", test_downgrade_notifies_subscribers),
+        ("Bottom Level", test_bottom_level_caps_fps),
+        ("Upgrade", test_upgrade_needs_sustained_headroom),
+        ("Hysteresis", test_hysteresis_band_holds),
+        ("Backoff", test_failed_upgrade_backs_off)
+    ]
+    
+    passed = 0
+    total = len(tests)
+    
+    for test_name, test_func in tests:
+        print(f"\n🔍 Testing {test_name}...")
+        try:
+            test_func()
+            passed += 1
+        except AssertionError as e:
+            print(f"❌ {test_name} failed: {e}")
+    
+    print("\n" + "=" * 40)
+    print(f"📊 Test Results: {passed}/{total} passed")
+    return passed == total
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Test script for the parallax starfield
+Checks that stars are baked once, scroll with wraparound, twinkle and leave the global RNG alone
+"""
+
+import sys
+import random
+import pygame
+
+from starfield import StarLayer, Starfield, alpha_table
+
+def lit_pixels(surface: pygame.Surface) -> set:
+    """Positions of every non-black pixel"""
+    width, height = surface.get_size()
+    return {(x, y) for x in range(width) for y in range(height) if surface.get_at((x, y))[:3] != (0, 0, 0)}
+
+def test_global_rng_untouched():
+    """Baking and drawing never consume or reseed the random module"""
+    target = pygame.Surface((120, 80))
+    starfield = Starfield((120, 80), seed=7)
+    random.seed(1234)
+    state = random.getstate()
+    for frame in range(5):
+        starfield.draw(target, frame / 60)
+    assert random.getstate() == state
+    print("✅ Global RNG untouched")
+
+def test_same_seed_same_sky():
+    """A seed fixes the layout and the surfaces are only baked once"""
+    first, second = pygame.Surface((120, 80)), pygame.Surface((120, 80))
+    starfield = Starfield((120, 80), seed=3)
+    starfield.draw(first, 0.0)
+    groups = starfield.groups
+    starfield.draw(first, 0.0)
+    Starfield((120, 80), seed=3).draw(second, 0.0)
+    assert starfield.groups is groups
+    assert lit_pixels(first) and lit_pixels(first) == lit_pixels(second)
+    print("✅ Seeded layout baked once")
+
+def test_scroll_wraps_around():
+    """After a full scroll period the field lines up again, and midway nothing is lost off the edge"""
+    layer = StarLayer(40, 10.0, 1, (255, 255))
+    starfield = Starfield((100, 60), layers=(layer,), direction=(0.0, 1.0), twinkle=0.0)
+    start, middle, end = pygame.Surface((100, 60)), pygame.Surface((100, 60)), pygame.Surface((100, 60))
+    starfield.draw(start, 0.0)
+    starfield.draw(middle, 2.5)  # Scrolled 25 pixels
+    starfield.draw(end, 6.0)  # Scrolled the full 60 pixels
+    assert lit_pixels(start) == lit_pixels(end)
+    assert {(x, (y + 25) % 60) for x, y in lit_pixels(start)} == lit_pixels(middle)
+    print("✅ Wraparound scrolling working")
+
+def test_twinkle_table():
+    """Twinkle depth sets how far stars dim, and groups sit at different phases"""
+    assert alpha_table(0.0) == [255] * len(alpha_table(0.0))
+    table = alpha_table(0.5)
+    assert table[0] == 255 and min(table) == 127
+    starfield = Starfield((40, 40), twinkle=0.5)
+    starfield.draw(pygame.Surface((40, 40)), 0.0)
+    alphas = {group.get_alpha() for group in starfield.groups[-1]}  # The near layer twinkles
+    assert len(alphas) > 1 and len(starfield.groups[0]) == 1  # Far layers are baked flat
+    print("✅ Twinkle table working")
+
+def main():
+    """Run all tests"""
+    print("🧪 Testing Starfield")
+    print("=" * 40)
+    
+    tests = [
+        ("Global RNG", test_global_rng_untouched),
+        ("Seeded Layout", test_same_seed_same_sky),
+        ("Wraparound", test_scroll_wraps_around),
+        ("Twinkle", test_twinkle_table)
+    ]
+    
+    passed = 0
+    total = len(tests)
+    
+    for test_name, test_func in tests:
+        print(f"\n🔍 Testing {test_name}...")
+        try:
+            test_func()
+            passed += 1
+        except AssertionError as e:
+            print(f"❌ {test_name} failed: {e}")
+    
+    print("\n" + "=" * 40)
+    print(f"📊 Test Results: {passed}/{total} passed")
+    return passed == total
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Test script for the startup profiler
+Validates phase accounting before and after the first frame and the budget report
+"""
+
+import io
+import sys
+import time
+from contextlib import redirect_stdout
+
+from startup_profiler import StartupProfiler, process_age_ms
+
+def test_phase_accounting():
+    """Phases before the first frame add up to it; later ones are deferred"""
+    profiler = StartupProfiler(budget_ms=10000)
+    early = list(profiler.phases)
+    time.sleep(0.02)
+    duration = profiler.mark("imports")
+    assert duration >= 15
+    assert profiler.phases[-1] == ("imports", duration)
+    
+    profiler.mark_first_frame()
+    assert profiler.phases[-1][0] == "first frame"
+    total = sum(phase_duration for _, phase_duration in profiler.phases)
+    assert abs(total - profiler.first_frame_ms) < 1.0
+    if early:
+        assert early[0][0] == "interpreter + early imports"
+    
+    first_frame = profiler.first_frame_ms
+    profiler.mark_first_frame()
+    assert profiler.first_frame_ms == first_frame
+    
+    profiler.mark("thumbnails")
+    profiler.record("game discovery", 12.5)
+    assert [name for name, _ in profiler.deferred] == ["thumbnails", "game discovery"]
+    assert profiler.phases[-1][0] == "first frame"
+    print("✅ Phases accounted")
+
+def test_process_age():
+    """Process age reads /proc where available and anchors elapsed_ms at process start"""
+    age = process_age_ms()
+    if age is None:
+        print("⚠️ /proc unavailable, skipping")
+        return
+    profiler = StartupProfiler()
+    assert profiler.elapsed_ms() >= age - 20
+    print("✅ Process age read")
+
+def test_budget_report():
+    """The report flags a first frame over budget"""
+    profiler = StartupProfiler(budget_ms=0)
+    profiler.mark_first_frame()
+    profiler.record("mixer init", 3.0)
+    output = io.StringIO()
+    with redirect_stdout(output):
+        profiler.print_report("Test")
+    report = output.getvalue()
+    assert "over 0 ms budget" in report and "(deferred) mixer init" in report
+    print("✅ Budget report")
+
+def main():
+    """Run all tests"""
+    print("🧪 Testing Startup Profiler")
+    print("=" * 40)
+    
+    tests = [
+        ("Phase Accounting", test_phase_accounting),
+        ("Process Age", test_process_age),
+        ("Budget Report", test_budget_report)
+    ]
+    
+    passed = 0
+    total = len(tests)
+    
+    for test_name, test_func in tests:
+        print(f"\n🔍 Testing {test_name}...")
+        try:
+            test_func()
+            passed += 1
+        except AssertionError as e:
+            print(f"❌ {test_name} failed: {e}")
+    
+    print("\n" + "=" * 40)
+    print(f"📊 Test Results: {passed}/{total} passed")
+    return passed == total
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Test script for the stats journal
+Validates replay, torn-write recovery and compaction using temporary files
+"""
+
+import os
+import sys
+import json
+import tempfile
+
+from stats_journal import StatsJournal
+
+def make_journal(directory: str, compact_every: int = 64) -> StatsJournal:
+    """Create a journal whose snapshot lives in a temporary directory"""
+    return StatsJournal(os.path.join(directory, "game_stats.json"), compact_every=compact_every)
+
+def test_replay_without_compaction():
+    """Entries survive a crash before any snapshot was written"""
+    with tempfile.TemporaryDirectory() as directory:
+        journal = make_journal(directory)
+        journal.load()
+        journal.start()
+        journal.record("Dino Run", play_count=1, last_played=10.0)
+        journal.record("Dino Run", play_count=2, last_played=20.0)
+        
+        # Simulate a crash: stop the writer without compacting
+        journal.queue.put(None)
+        journal.writer_thread.join()
+        journal.journal_file.close()
+        assert not os.path.exists(journal.snapshot_path)
+        
+        stats = make_journal(directory).load()
+        assert stats == {"Dino Run": {"play_count": 2, "last_played": 20.0}}
+        print("✅ Journal replay restores state")
+
+def test_torn_tail_is_ignored():
+    """A half-written last line is skipped and never merged with the next entry"""
+    with tempfile.TemporaryDirectory() as directory:
+        journal = make_journal(directory)
+        with open(journal.journal_path, "w") as f:
+            f.write(json.dumps({"game": "Snake Classic", "fields": {"play_count": 3}}) + "\n")
+            f.write('{"game": "Snake Cla')
+        
+        stats = journal.load()
+        assert stats == {"Snake Classic": {"play_count": 3}}
+        assert journal.torn_entries == 1
+        
+        journal.record("Tic Tac Toe", play_count=1)
+        journal.close()
+        stats = make_journal(directory).load()
+        assert stats["Tic Tac Toe"] == {"play_count": 1}
+        print("✅ Torn tail skipped")
+
+def test_compaction():
+    """Compaction writes the snapshot atomically and empties the journal"""
+    with tempfile.TemporaryDirectory() as directory:
+        journal = make_journal(directory, compact_every=2)
+        journal.load()
+        journal.start()
+        for count in range(1, 4):
+            journal.record("Maze Explorer", play_count=count)
+        journal.close()
+        
+        with open(journal.snapshot_path, "r") as f:
+            assert json.load(f) == {"Maze Explorer": {"play_count": 3}}
+        assert os.path.getsize(journal.journal_path) == 0
+        assert not os.path.exists(journal.snapshot_path + ".tmp")
+        print("✅ Compaction produced a clean snapshot")
+
+def main():
+    """Run all tests"""
+    print("🧪 Testing Stats Journal")
+    print("=" * 40)
+    
+    tests = [
+        ("Replay", test_replay_without_compaction),
+        ("Torn Tail", test_torn_tail_is_ignored),
+        ("Compaction", test_compaction)
+    ]
+    
+    passed = 0
+    total = len(tests)
+    
+    for test_name, test_func in tests:
+        print(f"\n🔍 Testing {test_name}...")
+        try:
+            test_func()
+            passed += 1
+        except AssertionError as e:
+            print(f"❌ {test_name} failed: {e}")
+    
+    print("\n" + "=" * 40)
+    print(f"📊 Test Results: {passed}/{total} passed")
+    return passed == total
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
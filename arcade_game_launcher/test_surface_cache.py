@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Test script for the shared surface cache
+Validates LRU eviction and byte budgeting without opening a window
+"""
+
+import sys
+import pygame
+
+from surface_cache import SurfaceCache, surface_bytes
+
+def make_surface(width: int = 10, height: int = 10) -> pygame.Surface:
+    """Create a plain 32-bit surface of a known size"""
+    return pygame.Surface((width, height), 0, 32)
+
+def test_hit_and_miss_counters():
+    """Lookups update hit and miss counters"""
+    cache = SurfaceCache(max_bytes=1024 * 1024)
+    assert cache.get("missing") is None
+    cache.put("a", make_surface())
+    assert cache.get("a") is not None
+    assert cache.hits == 1 and cache.misses == 1
+    print(f"✅ Counters working: {cache.get_stats_text()}")
+
+def test_lru_eviction():
+    """Least recently used entries are evicted first"""
+    size = surface_bytes(make_surface())
+    cache = SurfaceCache(max_bytes=size * 2)
+    cache.put("a", make_surface())
+    cache.put("b", make_surface())
+    cache.get("a")
+    cache.put("c", make_surface())
+    
+    assert "a" in cache.entries and "c" in cache.entries
+    assert "b" not in cache.entries
+    assert cache.evictions == 1
+    assert cache.current_bytes <= cache.max_bytes
+    print("✅ LRU eviction keeps recently used surfaces")
+
+def test_disabled_cache():
+    """A disabled cache still renders but never stores"""
+    cache = SurfaceCache(enabled=False)
+    surface = cache.get_or_create("a", make_surface)
+    assert surface is not None
+    assert not cache.entries
+    print("✅ Disabled cache renders without storing")
+
+def test_resize():
+    """Shrinking the budget evicts immediately"""
+    size = surface_bytes(make_surface())
+    cache = SurfaceCache(max_bytes=size * 4)
+    for key in "abcd":
+        cache.put(key, make_surface())
+    cache.resize(size)
+    assert list(cache.entries) == ["d"]
+    print("✅ Resize evicts down to the new budget")
+
+def main():
+    """Run all tests"""
+    print("🧪 Testing Surface Cache")
+    print("=" * 40)
+    
+    tests = [
+        ("Counters", test_hit_and_miss_counters),
+        ("LRU Eviction", test_lru_eviction),
+        ("Disabled Cache", test_disabled_cache),
+        ("Resize", test_resize)
+    ]
+    
+    passed = 0
+    total = len(tests)
+    
+    for test_name, test_func in tests:
+        print(f"\n🔍 Testing {test_name}...")
+        try:
+            test_func()
+            passed += 1
+        except AssertionError as e:
+            print(f"❌ {test_name} failed: {e}")
+    
+    print("\n" + "=" * 40)
+    print(f"📊 Test Results: {passed}/{total} passed")
+    return passed == total
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Test script for headless thumbnail capture
+Runs a tiny stand-in game through the capture pipeline and checks the cache
+"""
+
+import os
+import sys
+import time
+import tempfile
+
+import pygame
+
+from thumbnails import THUMBNAIL_SIZE, ThumbnailPipeline, source_hash
+
+FAKE_GAME = """
+import pygame
+pygame.init()
+screen = pygame.display.set_mode((400, 300))
+clock = pygame.time.Clock()
+while True:
+    for event in pygame.event.get():
+        if event.type == pygame.QUIT:
+            raise SystemExit
+    screen.fill((200, 30, 30))
+    pygame.display.flip()
+    clock.tick(200)
+"""
+
+def write_game(directory: str, source: str = FAKE_GAME) -> str:
+    """Create a stand-in game script"""
+    script_path = os.path.join(directory, "main.py")
+    with open(script_path, "w") as f:
+        f.write(source)
+    return script_path
+
+def wait_for(pipeline: ThumbnailPipeline, timeout: float = 30.0):
+    """Poll the pipeline like the launcher does until a thumbnail arrives"""
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        finished = pipeline.poll()
+        if finished:
+            return finished
+        time.sleep(0.05)
+    return []
+
+def test_capture_and_cache():
+    """A capture is downscaled to the thumbnail box and reused on the next request"""
+    with tempfile.TemporaryDirectory() as directory:
+        script_path = write_game(directory)
+        pipeline = ThumbnailPipeline(os.path.join(directory, "cache"), frames=10)
+        pipeline.request([script_path])
+        finished = wait_for(pipeline)
+        assert len(finished) == 1
+        
+        thumbnail = pygame.image.load(finished[0][1])
+        assert thumbnail.get_size() == (THUMBNAIL_SIZE[0], THUMBNAIL_SIZE[0] * 3 // 4)
+        red, green, blue = thumbnail.get_at((10, 10))[:3]
+        assert abs(red - 200) <= 4 and abs(green - 30) <= 4 and abs(blue - 30) <= 4
+        
+        start = time.perf_counter()
+        assert pipeline.generate(script_path) == finished[0][1]
+        assert time.perf_counter() - start < 0.5
+        pipeline.shutdown()
+    print("✅ Capture downscaled and cached")
+
+def test_source_edit_invalidates():
+    """Editing any source file in the game directory changes the cache key"""
+    with tempfile.TemporaryDirectory() as directory:
+        script_path = write_game(directory)
+        before = source_hash(script_path)
+        with open(os.path.join(directory, "helper.py"), "w") as f:
+            f.write("SPEED = 2\n")
+        assert source_hash(script_path) != before
+    print("✅ Source edit changes the cache key")
+
+def test_missing_game_skipped():
+    """Games without a script on disk are never queued"""
+    pipeline = ThumbnailPipeline(tempfile.gettempdir())
+    pipeline.request(["does/not/exist.py"])
+    assert not pipeline.pending
+    pipeline.shutdown()
+    print("✅ Missing game skipped")
+
+def main():
+    """Run all tests"""
+    print("🧪 Testing Thumbnails")
+    print("=" * 40)
+    
+    tests = [
+        ("Capture and Cache", test_capture_and_cache),
+        ("Cache Invalidation", test_source_edit_invalidates),
+        ("Missing Game", test_missing_game_skipped)
+    ]
+    
+    passed = 0
+    total = len(tests)
+    
+    for test_name, test_func in tests:
+        print(f"\n🔍 Testing {test_name}...")
+        try:
+            test_func()
+            passed += 1
+        except AssertionError as e:
+            print(f"❌ {test_name} failed: {e}")
+    
+    print("\n" + "=" * 40)
+    print(f"📊 Test Results: {passed}/{total} passed")
+    return passed == total
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Test script for the zygote pool
+Runs tiny game scripts in pre-warmed workers and checks reuse, respawn, cold fallback and mixer settings
+"""
+
+import os
+import sys
+import json
+import time
+import tempfile
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+from zygote_pool import ZygotePool
+
+GAME_SCRIPT = """import os
+with open(os.environ["ZYGOTE_TEST_OUTPUT"], "w") as f:
+    f.write(f"{os.getpid()} {os.getcwd()}")
+"""
+
+MIXER_SCRIPT = """import os, sys
+sys.path.append(os.environ["ZYGOTE_TEST_LAUNCHER"])
+import pygame
+from config_service import load_config, mixer_settings
+pygame.mixer.pre_init(**mixer_settings(load_config(os.environ["ZYGOTE_TEST_CONFIG"])))
+pygame.init()
+with open(os.environ["ZYGOTE_TEST_OUTPUT"], "w") as f:
+    f.write(repr(pygame.mixer.get_init()))
+"""
+
+def wait_for(condition, timeout: float = 15.0) -> bool:
+    """Poll until condition() holds or the timeout passes"""
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if condition():
+            return True
+        time.sleep(0.05)
+    return False
+
+def idle_pids(pool: ZygotePool):
+    """Process ids of the live idle workers"""
+    with pool.lock:
+        return [worker.pid for worker in pool.idle_workers if worker.poll() is None]
+
+def run_game(pool: ZygotePool, directory: str):
+    """Launch the test game and return its worker and what it wrote"""
+    script = os.path.join(directory, "game.py")
+    with open(script, "w") as f:
+        f.write(GAME_SCRIPT)
+    output = os.path.join(directory, "output.txt")
+    worker = pool.launch(script, env={"ZYGOTE_TEST_OUTPUT": output})
+    worker.wait(timeout=15)
+    with open(output) as f:
+        pid, cwd = f.read().split(" ", 1)
+    return worker, int(pid), cwd
+
+def test_warm_worker_reused():
+    """A launch takes the idle worker, runs the game in it and the pool respawns"""
+    pool = ZygotePool(size=1)
+    try:
+        pool.start()
+        assert wait_for(lambda: len(idle_pids(pool)) == 1), "pool never filled"
+        warm_pid = idle_pids(pool)[0]
+        
+        with tempfile.TemporaryDirectory() as directory:
+            worker, pid, cwd = run_game(pool, directory)
+            assert worker.pid == warm_pid and pid == warm_pid
+            assert os.path.samefile(cwd, directory)
+            assert worker.returncode == 0
+        assert pool.warm_launches == 1 and pool.cold_launches == 0
+        
+        assert wait_for(lambda: idle_pids(pool) and idle_pids(pool)[0] != warm_pid), "pool never refilled"
+    finally:
+        pool.shutdown()
+    print("✅ Warm worker reused and replaced")
+
+def test_dead_worker_respawned():
+    """A worker that died while idle is skipped for a cold start and replaced"""
+    pool = ZygotePool(size=1)
+    try:
+        pool.start()
+        assert wait_for(lambda: len(idle_pids(pool)) == 1), "pool never filled"
+        dead = pool.idle_workers[0]
+        dead.kill()
+        dead.wait()
+        
+        with tempfile.TemporaryDirectory() as directory:
+            worker, pid, _ = run_game(pool, directory)
+            assert pid != dead.pid and worker.returncode == 0
+        assert pool.warm_launches == 0 and pool.cold_launches == 1
+        
+        assert wait_for(lambda: len(idle_pids(pool)) == 1), "pool never refilled"
+        assert dead.pid not in idle_pids(pool)
+    finally:
+        pool.shutdown()
+    print("✅ Dead worker respawned")
+
+def test_pooled_game_configures_mixer():
+    """A warm worker leaves the mixer closed, so the game's configured pre_init settings apply"""
+    pool = ZygotePool(size=1)
+    try:
+        pool.start()
+        assert wait_for(lambda: len(idle_pids(pool)) == 1), "pool never filled"
+        
+        with tempfile.TemporaryDirectory() as directory:
+            config_path = os.path.join(directory, "performance_config.json")
+            with open(config_path, "w") as f:
+                json.dump({"audio": {"frequency": 11025, "buffer_size": 256}}, f)
+            script = os.path.join(directory, "game.py")
+            with open(script, "w") as f:
+                f.write(MIXER_SCRIPT)
+            output = os.path.join(directory, "output.txt")
+            worker = pool.launch(script, env={"ZYGOTE_TEST_OUTPUT": output, "ZYGOTE_TEST_CONFIG": config_path,
+                                              "ZYGOTE_TEST_LAUNCHER": os.path.dirname(os.path.abspath(__file__))})
+            assert worker.wait(timeout=15) == 0
+            with open(output) as f:
+                mixer = f.read()
+        assert pool.warm_launches == 1
+        assert mixer.startswith("(11025,"), mixer
+    finally:
+        pool.shutdown()
+    print("✅ Pooled game configures the mixer")
+
+def test_shutdown_retires_workers():
+    """Shutdown closes idle workers' pipes so they exit without running anything"""
+    pool = ZygotePool(size=2)
+    pool.start()
+    assert wait_for(lambda: len(idle_pids(pool)) == 2), "pool never filled"
+    workers = list(pool.idle_workers)
+    pool.shutdown()
+    assert not pool.idle_workers
+    assert all(worker.wait(timeout=15) == 0 for worker in workers)
+    print("✅ Idle workers retired")
+
+def main():
+    """Run all tests"""
+    print("🧪 Testing Zygote Pool")
+    print("=" * 40)
+    
+    tests = [
+        ("Warm Reuse", test_warm_worker_reused),
+        ("Respawn", test_dead_worker_respawned),
+        ("Mixer Settings", test_pooled_game_configures_mixer),
+        ("Shutdown", test_shutdown_retires_workers)
+    ]
+    
+    passed = 0
+    total = len(tests)
+    
+    for test_name, test_func in tests:
+        print(f"\n🔍 Testing {test_name}...")
+        try:
+            test_func()
+            passed += 1
+        except AssertionError as e:
+            print(f"❌ {test_name} failed: {e}")
+    
+    print("\n" + "=" * 40)
+    print(f"📊 Test Results: {passed}/{total} passed")
+    return passed == total
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
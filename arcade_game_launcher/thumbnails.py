@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Thumbnails - Headless Game Screenshots for Cards
+Runs each game off-screen with scripted input and caches a downscaled capture keyed by its source hash
+"""
+
+import os
+import sys
+import runpy
+import hashlib
+import threading
+import subprocess
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, List, Optional, Set, Tuple
+
+CAPTURE_FLAG = "--capture-thumbnail"
+THUMBNAIL_DIR = "thumbnail_cache"
+THUMBNAIL_SIZE = (64, 48)  # Fits the card's icon area
+CAPTURE_FRAMES = 90
+CAPTURE_TIMEOUT = 30.0
+MAX_WORKERS = 2
+CAPTURE_NICENESS = 10
+
+# Keys posted at these frames: start keys for title screens, then a square of turns so
+# steering games stay alive (never ESC, which quits most games)
+SCRIPTED_KEYS = [(3, "K_SPACE"), (5, "K_RETURN")] + [
+    (frame, ("K_UP", "K_LEFT", "K_DOWN", "K_RIGHT")[i % 4]) for i, frame in enumerate(range(8, CAPTURE_FRAMES, 8))]
+
+def source_hash(script_path: str) -> str:
+    """Hash of every Python file in the game's directory, so any edit invalidates the thumbnail"""
+    game_dir = os.path.dirname(os.path.abspath(script_path))
+    digest = hashlib.sha1(f"{os.path.basename(script_path)}:{THUMBNAIL_SIZE}:{CAPTURE_FRAMES}".encode("utf-8"))
+    
+    for root, dirs, files in os.walk(game_dir):
+        dirs[:] = sorted(d for d in dirs if d != "__pycache__")
+        for name in sorted(files):
+            if not name.endswith(".py"):
+                continue
+            path = os.path.join(root, name)
+            digest.update(os.path.relpath(path, game_dir).encode("utf-8"))
+            with open(path, "rb") as f:
+                digest.update(f.read())
+    
+    return digest.hexdigest()
+
+def fit_size(size: Tuple[int, int], box: Tuple[int, int] = THUMBNAIL_SIZE) -> Tuple[int, int]:
+    """Largest size with the capture's aspect ratio that fits the box"""
+    scale = min(box[0] / size[0], box[1] / size[1])
+    return max(1, round(size[0] * scale)), max(1, round(size[1] * scale))
+
+class ThumbnailPipeline:
+    """Launcher side: runs at most a few capture processes at once and hands back finished thumbnails"""
+    
+    def __init__(self, cache_dir: str = THUMBNAIL_DIR, max_workers: int = MAX_WORKERS,
+                 frames: int = CAPTURE_FRAMES):
+        self.cache_dir = os.path.abspath(cache_dir)
+        self.frames = frames
+        # Threads only wait on capture processes; every capture runs in its own low-priority interpreter
+        self.executor = ThreadPoolExecutor(max_workers, thread_name_prefix="thumbnail")
+        self.pending: Dict[str, Future] = {}
+        self.lock = threading.Lock()
+        self.processes: Set[subprocess.Popen] = set()
+        self.running = True
+    
+    def request(self, script_paths: List[str]):
+        """Queue thumbnails for games that have a script on disk"""
+        for script_path in script_paths:
+            if script_path in self.pending or not os.path.exists(script_path):
+                continue
+            self.pending[script_path] = self.executor.submit(self.generate, os.path.abspath(script_path))
+    
+    def generate(self, script_path: str) -> Optional[str]:
+        """Return the cached thumbnail path, capturing the game first on a miss"""
+        if not os.path.exists(script_path):
+            return None
+        
+        thumbnail_path = os.path.join(self.cache_dir, f"{source_hash(script_path)}.png")
+        if os.path.exists(thumbnail_path):
+            return thumbnail_path
+        
+        os.makedirs(self.cache_dir, exist_ok=True)
+        env = dict(os.environ, SDL_VIDEODRIVER="dummy", SDL_AUDIODRIVER="dummy")
+        with self.lock:
+            if not self.running:
+                return None
+            process = subprocess.Popen([sys.executable, os.path.abspath(__file__), CAPTURE_FLAG,
+                                        script_path, thumbnail_path, str(self.frames)],
+                                       cwd=os.path.dirname(script_path), env=env, stdin=subprocess.DEVNULL,
+                                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            self.processes.add(process)
+        
+        try:
+            process.wait(timeout=CAPTURE_TIMEOUT)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+        finally:
+            with self.lock:
+                self.processes.discard(process)
+        
+        return thumbnail_path if os.path.exists(thumbnail_path) else None
+    
+    def poll(self) -> List[Tuple[str, str]]:
+        """Finished thumbnails as (script path, image path); never blocks"""
+        finished = []
+        for script_path, future in list(self.pending.items()):
+            if not future.done():
+                continue
+            del self.pending[script_path]
+            try:
+                thumbnail_path = future.result()
+            except Exception:
+                thumbnail_path = None
+            if thumbnail_path:
+                finished.append((script_path, thumbnail_path))
+        return finished
+    
+    def shutdown(self):
+        """Drop queued captures and stop running ones so the launcher exits promptly"""
+        with self.lock:
+            self.running = False
+            for process in self.processes:
+                process.kill()
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        self.pending = {}
+
+def save_thumbnail(surface, thumbnail_path: str):
+    """Downscale a capture and move it into the cache atomically"""
+    import pygame
+    thumbnail = pygame.transform.smoothscale(surface.convert(24), fit_size(surface.get_size()))
+    # pygame picks the format from the extension, so the temporary name ends in .png too
+    temp_path = f"{thumbnail_path[:-4]}.{os.getpid()}.tmp.png"
+    pygame.image.save(thumbnail, temp_path)
+    os.replace(temp_path, thumbnail_path)
+
+def run_capture(script: str, thumbnail_path: str, frames: int):
+    """Capture entry point: run a game headless and save its thumbnail after N frames"""
+    # Low priority so captures never starve the launcher's render loop
+    if hasattr(os, "nice"):
+        os.nice(CAPTURE_NICENESS)
+    
+    import pygame
+    original_flip = pygame.display.flip
+    original_update = pygame.display.update
+    scripted_keys = {frame: getattr(pygame, name) for frame, name in SCRIPTED_KEYS}
+    frame_count = 0
+    
+    def after_frame():
+        nonlocal frame_count
+        frame_count += 1
+        key = scripted_keys.get(frame_count)
+        if key is not None:
+            for event_type in (pygame.KEYDOWN, pygame.KEYUP):
+                pygame.event.post(pygame.event.Event(event_type, key=key, mod=0, unicode="", scancode=0))
+        
+        if frame_count >= frames:
+            surface = pygame.display.get_surface()
+            if surface is not None:
+                save_thumbnail(surface, thumbnail_path)
+            os._exit(0)
+    
+    def flip_hook():
+        original_flip()
+        after_frame()
+    
+    def update_hook(*args):
+        original_update(*args)
+        after_frame()
+    
+    pygame.display.flip = flip_hook
+    pygame.display.update = update_hook
+    
+    sys.argv = [script]
+    sys.path[0] = os.path.dirname(script)
+    runpy.run_path(script, run_name="__main__")
+
+if __name__ == "__main__":
+    if len(sys.argv) == 5 and sys.argv[1] == CAPTURE_FLAG:
+        run_capture(sys.argv[2], sys.argv[3], int(sys.argv[4]))
@@ -14,15 +14,27 @@ import threading
 from typing import List, Dict, Tuple, Optional
 from dataclasses import dataclass
 
+from config_service import ConfigService, get_setting, load_config, mixer_settings
+from frame_scheduler import FrameScheduler
+from performance_optimizer import calibrated_level
+from process_supervisor import ProcessSupervisor
+from quality_governor import QualityGovernor, QualityLevel
+from stats_journal import StatsJournal
+from surface_cache import create_text_cache, text_cache_settings
+from zygote_pool import ZygotePool
+
+# Startup settings; frame cap, caches and effects are re-applied live when the file changes
+CONFIG = load_config()
+
 # Ultra-optimized initialization
+pygame.mixer.pre_init(**mixer_settings(CONFIG))  # Must come before init to take effect
 pygame.init()
-pygame.mixer.pre_init(frequency=22050, size=-16, channels=2, buffer=128)
 
 # Ultra-smooth constants
 WINDOW_WIDTH = 1000
 WINDOW_HEIGHT = 700
-TARGET_FPS = 120  # Higher FPS for ultra-smoothness
-VSYNC = True
+TARGET_FPS = get_setting(CONFIG, "display.target_fps", 120)
+VSYNC = get_setting(CONFIG, "display.vsync", True)
 
 class UltraTheme:
     """Ultra-optimized theme colors"""
@@ -56,8 +68,7 @@ class UltraRenderer:
     """Ultra-high performance renderer with zero micro-lag"""
     def __init__(self, screen):
         self.screen = screen
-        self.surface_cache = {}
-        self.font_cache = {}
+        self.text_cache = create_text_cache()
         
         # Pre-load all fonts at startup
         self.fonts = {
@@ -82,19 +93,17 @@ class UltraRenderer:
         ]
         
         for text, font_key, color in common_texts:
-            cache_key = (text, font_key, color)
-            font = self.fonts[font_key]
-            self.surface_cache[cache_key] = font.render(text, True, color)
+            self.get_text_surface(text, font_key, color)
     
     def get_text_surface(self, text: str, font_key: str, color: Tuple[int, int, int]):
         """Ultra-fast cached text rendering"""
         cache_key = (text, font_key, color)
-        
-        if cache_key not in self.surface_cache:
-            font = self.fonts[font_key]
-            self.surface_cache[cache_key] = font.render(text, True, color)
-        
-        return self.surface_cache[cache_key]
+        return self.text_cache.get_or_create(
+            cache_key, lambda: self.fonts[font_key].render(text, True, color))
+    
+    def render_text(self, text: str, font_key: str, color: Tuple[int, int, int]):
+        """Uncached rendering for live overlay text that changes every frame"""
+        return self.fonts[font_key].render(text, True, color)
     
     def draw_rounded_rect(self, color: Tuple[int, int, int], rect: pygame.Rect, radius: int = 12):
         """Ultra-optimized rounded rectangle"""
@@ -122,6 +131,7 @@ class UltraSmoothCard:
         self.is_hovered = False
         self.is_selected = False
         self.glow_intensity = 0.0
+        self.glow_enabled = True  # Switched off by the quality governor under load
         
         # Ultra-smooth animation parameters
         self.animation_speed = 0.25  # Faster response
@@ -158,6 +168,15 @@ class UltraSmoothCard:
         else:
             self.target_scale = 1.05 if self.is_hovered else 1.0
     
+    def is_settled(self) -> bool:
+        """True once scale and glow tweens have reached their targets"""
+        target_glow = 1.0 if (self.is_selected or self.is_hovered) else 0.0
+        if abs(self.target_scale - self.hover_scale) > 0.001 or abs(target_glow - self.glow_intensity) > 0.001:
+            return False
+        self.hover_scale = self.target_scale
+        self.glow_intensity = target_glow
+        return True
+    
     def draw(self, renderer: UltraRenderer):
         """Ultra-optimized drawing with zero lag"""
         # Calculate scaled dimensions
@@ -169,7 +188,7 @@ class UltraSmoothCard:
         scaled_rect = pygame.Rect(scaled_x, scaled_y, scaled_width, scaled_height)
         
         # Draw glow effect
-        if self.glow_intensity > 0.1:
+        if self.glow_enabled and self.glow_intensity > 0.1:
             glow_size = int(4 * self.glow_intensity)
             glow_rect = pygame.Rect(scaled_rect.x - glow_size, scaled_rect.y - glow_size,
                                   scaled_rect.width + 2*glow_size, scaled_rect.height + 2*glow_size)
@@ -210,8 +229,17 @@ class UltraSmoothLauncher:
         
         # Ultra-high performance clock
         self.clock = pygame.time.Clock()
+        self.frame_scheduler = FrameScheduler(self.clock, TARGET_FPS)
+        self.governor = QualityGovernor(TARGET_FPS, initial_level=calibrated_level("launcher"))
+        self.config = ConfigService()
+        self.glow_allowed = True  # graphics.glow_effects; the governor can only switch glow off
         self.renderer = UltraRenderer(self.screen)
         
+        # Pre-warmed game processes for instant launches
+        self.game_pool = ZygotePool(size=1)
+        self.game_pool.start()
+        self.supervisor = ProcessSupervisor()
+        
         # Game data
         self.games = self.load_games()
         self.game_cards = []
@@ -221,11 +249,27 @@ class UltraSmoothLauncher:
         self.frame_times = []
         self.fps_display = 120
         
-        # Statistics
+        # Statistics, persisted by a background journal writer
+        self.stats_journal = StatsJournal()
         self.stats = self.load_stats()
+        self.stats_journal.start()
         
         self.setup_ultra_layout()
         self.load_game_stats()
+        self.governor.subscribe(self.apply_quality)
+        self.config.subscribe(self.apply_config)
+    
+    def apply_quality(self, level: QualityLevel):
+        """Quality governor subscriber: frame cap and card glow"""
+        self.frame_scheduler.target_fps = self.governor.target_fps
+        for card in self.game_cards:
+            card.glow_enabled = level.glow and self.glow_allowed
+    
+    def apply_config(self, config: ConfigService):
+        """Config service subscriber: frame cap, text cache and glow"""
+        self.renderer.text_cache.configure(*text_cache_settings(config.config))
+        self.glow_allowed = bool(config.get("graphics.glow_effects", True))
+        self.governor.set_max_fps(int(config.get("display.target_fps", TARGET_FPS)))
     
     def load_games(self) -> List[GameData]:
         """Load games with ultra-fast detection"""
@@ -276,12 +320,8 @@ class UltraSmoothLauncher:
             self.game_cards.append(card)
     
     def load_stats(self) -> Dict:
-        """Ultra-fast stats loading"""
-        try:
-            with open("game_stats.json", "r") as f:
-                return json.load(f)
-        except:
-            return {}
+        """Ultra-fast stats loading from the snapshot plus journal"""
+        return self.stats_journal.load()
     
     def load_game_stats(self):
         """Load statistics for each game"""
@@ -290,19 +330,13 @@ class UltraSmoothLauncher:
                 game.play_count = self.stats[game.name].get("play_count", 0)
                 game.last_played = self.stats[game.name].get("last_played", 0)
     
-    def save_stats(self):
-        """Ultra-fast stats saving"""
-        stats_data = {game.name: {"play_count": game.play_count, "last_played": game.last_played} 
-                     for game in self.games}
-        try:
-            with open("game_stats.json", "w") as f:
-                json.dump(stats_data, f, indent=2)
-        except:
-            pass
+    def save_stats(self, game: GameData):
+        """Ultra-fast stats saving: queued for the journal writer thread"""
+        self.stats_journal.record(game.name, play_count=game.play_count, last_played=game.last_played)
     
-    def handle_events(self) -> bool:
+    def handle_events(self, events: List[pygame.event.Event]) -> bool:
         """Ultra-responsive event handling"""
-        for event in pygame.event.get():
+        for event in events:
             if event.type == pygame.QUIT:
                 return False
             elif event.type == pygame.KEYDOWN:
@@ -348,16 +382,24 @@ class UltraSmoothLauncher:
     
     def launch_game(self, game: GameData):
         """Ultra-optimized game launching"""
+        # Claim the slot now so a double-click can't count a launch the supervisor would refuse
+        if not self.supervisor.reserve(game.name):
+            print(f"⏳ {game.name} is already running")
+            return
+        
         try:
             game.play_count += 1
             game.last_played = time.time()
-            self.save_stats()
+            self.save_stats(game)
             
             # Launch in separate thread for zero lag
             def launch_thread():
                 game_dir = os.path.dirname(game.path)
-                subprocess.Popen([sys.executable, os.path.basename(game.path)], 
-                               cwd=game_dir)
+                try:
+                    self.supervisor.launch(game.name, lambda: self.game_pool.launch(game.path, cwd=game_dir),
+                                           reserved=True)
+                except Exception as e:
+                    print(f"❌ Failed to launch {game.name}: {e}")
             
             threading.Thread(target=launch_thread, daemon=True).start()
             print(f"🚀 Launched: {game.name}")
@@ -366,6 +408,10 @@ class UltraSmoothLauncher:
     
     def update(self, dt: float):
         """Ultra-smooth update loop"""
+        self.config.poll()
+        for record in self.supervisor.poll_finished():
+            print(f"🏁 {record.get_summary_text()}")
+        
         # Update performance tracking
         self.frame_times.append(dt)
         if len(self.frame_times) > 60:
@@ -380,6 +426,10 @@ class UltraSmoothLauncher:
             card.update(dt)
             card.handle_hover(mouse_pos)
     
+    def is_settled(self) -> bool:
+        """True when no card animation is in motion"""
+        return all(card.is_settled() for card in self.game_cards)
+    
     def draw(self):
         """Ultra-optimized drawing with zero micro-lag"""
         # Clear with optimized fill
@@ -425,12 +475,14 @@ class UltraSmoothLauncher:
         """Ultra-optimized footer drawing"""
         controls = [
             "🖱️ Single Click: Launch instantly • ⌨️ Arrow Keys: Navigate • Enter: Launch • ESC: Exit",
-            f"🎯 Game {self.selected_index + 1}/{len(self.games)} • FPS: {self.fps_display} • Ultra-Smooth Performance"
+            f"🎯 Game {self.selected_index + 1}/{len(self.games)} • FPS: {self.fps_display} • {self.renderer.text_cache.get_stats_text()}"
         ]
         
         y_start = WINDOW_HEIGHT - 60
         for i, control in enumerate(controls):
-            control_surface = self.renderer.get_text_surface(control, 'small', UltraTheme.TEXT_GRAY)
+            # The last line carries live stats, so it skips the cache it reports on
+            render = self.renderer.render_text if i == len(controls) - 1 else self.renderer.get_text_surface
+            control_surface = render(control, 'small', UltraTheme.TEXT_GRAY)
             control_rect = control_surface.get_rect(center=(WINDOW_WIDTH // 2, y_start + i * 25))
             self.screen.blit(control_surface, control_rect)
     
@@ -455,8 +507,10 @@ class UltraSmoothLauncher:
             # Cap delta time for stability
             dt = min(dt, 1/60)
             
-            # Ultra-responsive event handling
-            running = self.handle_events()
+            # Ultra-responsive event handling (blocks while idle)
+            events = self.frame_scheduler.get_events()
+            frame_start = time.perf_counter()
+            running = self.handle_events(events)
             
             # Ultra-smooth updates
             self.update(dt)
@@ -464,11 +518,19 @@ class UltraSmoothLauncher:
             # Ultra-optimized drawing
             self.draw()
             
-            # Ultra-smooth frame rate control
-            self.clock.tick(TARGET_FPS)
+            # Adapt quality to the busy part of the frame
+            if not self.frame_scheduler.frame_was_idle:
+                if self.governor.record((time.perf_counter() - frame_start) * 1000):
+                    print(f"🎚️ {self.governor.get_status_text()}, capped at {self.governor.target_fps} FPS")
+            
+            # Frame rate control, idling once everything has settled
+            self.frame_scheduler.tick(self.is_settled())
         
         # Cleanup
-        self.save_stats()
+        print(f"💤 {self.frame_scheduler.get_stats_text()}")
+        self.stats_journal.close()
+        self.supervisor.shutdown()
+        self.game_pool.shutdown()
         pygame.quit()
         sys.exit()
 
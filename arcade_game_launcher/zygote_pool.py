@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Zygote Pool - Pre-warmed Game Processes
+Keeps interpreters with pygame imported and its display initialized, ready to run a game instantly
+"""
+
+import os
+import sys
+import json
+import runpy
+import subprocess
+import threading
+from typing import Dict, List, Optional
+
+WORKER_FLAG = "--zygote-worker"
+
+class ZygotePool:
+    """Pool of idle, pre-initialized game processes"""
+    
+    def __init__(self, size: int = 1, python: str = sys.executable):
+        self.size = max(0, size)
+        self.python = python
+        self.worker_script = os.path.abspath(__file__)
+        self.idle_workers: List[subprocess.Popen] = []
+        self.lock = threading.Lock()
+        self.refill_event = threading.Event()
+        self.running = False
+        self.refill_thread = None
+        
+        # Launch statistics
+        self.warm_launches = 0
+        self.cold_launches = 0
+    
+    def start(self):
+        """Start filling the pool in the background"""
+        if self.running or self.size == 0:
+            return
+        self.running = True
+        self.refill_thread = threading.Thread(target=self._refill_loop, daemon=True)
+        self.refill_thread.start()
+        self.refill_event.set()
+    
+    def _refill_loop(self):
+        """Keep the pool topped up without blocking the render loop"""
+        while self.running:
+            self.refill_event.wait()
+            self.refill_event.clear()
+            
+            while self.running:
+                with self.lock:
+                    self.idle_workers = [w for w in self.idle_workers if w.poll() is None]
+                    missing = self.size - len(self.idle_workers)
+                if missing <= 0:
+                    break
+                
+                worker = self._spawn_worker()
+                if worker is None:
+                    break
+                with self.lock:
+                    if self.running:
+                        self.idle_workers.append(worker)
+                    else:
+                        self._retire(worker)
+    
+    def _spawn_worker(self) -> Optional[subprocess.Popen]:
+        """Start one worker that warms up and then waits for a game"""
+        try:
+            return subprocess.Popen([self.python, self.worker_script, WORKER_FLAG],
+                                    stdin=subprocess.PIPE)
+        except OSError as e:
+            print(f"❌ Failed to start zygote worker: {e}")
+            return None
+    
+    def _retire(self, worker: subprocess.Popen):
+        """Let an idle worker exit by closing its command pipe"""
+        try:
+            worker.stdin.close()
+        except OSError:
+            pass
+    
+    def _take_worker(self) -> Optional[subprocess.Popen]:
+        """Pop a live idle worker, if any"""
+        with self.lock:
+            while self.idle_workers:
+                worker = self.idle_workers.pop(0)
+                if worker.poll() is None:
+                    return worker
+        return None
+    
+    def launch(self, script_path: str, cwd: Optional[str] = None,
+               env: Optional[Dict[str, str]] = None) -> subprocess.Popen:
+        """Run a game script in a warm worker, falling back to a cold one"""
+        script_path = os.path.abspath(script_path)
+        cwd = os.path.abspath(cwd) if cwd else os.path.dirname(script_path)
+        command = json.dumps({"script": script_path, "cwd": cwd, "env": env or {}}) + "\n"
+        
+        worker = self._take_worker()
+        self.refill_event.set()
+        
+        if worker is not None and self._send_command(worker, command):
+            self.warm_launches += 1
+            return worker
+        
+        # Pool empty: start a worker and hand it the game immediately
+        self.cold_launches += 1
+        worker = self._spawn_worker()
+        if worker is not None and self._send_command(worker, command):
+            return worker
+        return subprocess.Popen([self.python, os.path.basename(script_path)], cwd=cwd,
+                                env={**os.environ, **env} if env else None)
+    
+    def _send_command(self, worker: subprocess.Popen, command: str) -> bool:
+        """Hand a launch command to a worker"""
+        try:
+            worker.stdin.write(command.encode("utf-8"))
+            worker.stdin.close()
+            return True
+        except OSError:
+            return False
+    
+    def shutdown(self):
+        """Stop refilling and release all idle workers"""
+        self.running = False
+        self.refill_event.set()
+        with self.lock:
+            for worker in self.idle_workers:
+                self._retire(worker)
+            self.idle_workers = []
+
+def run_worker():
+    """Worker entry point: warm up, wait for a game, then become that game"""
+    try:
+        import pygame
+        # The mixer is left to the game: once it is open, the game's mixer.pre_init settings are ignored
+        pygame.display.init()
+        pygame.font.init()
+    except Exception:
+        # The game will report its own import errors once it runs
+        pass
+    
+    line = sys.stdin.readline()
+    if not line:
+        return
+    
+    command = json.loads(line)
+    script = command["script"]
+    sys.stdin = open(os.devnull, "r")
+    
+    os.environ.update(command.get("env", {}))
+    from launch_latency import install_first_frame_hook
+    install_first_frame_hook()
+    
+    os.chdir(command["cwd"])
+    sys.argv = [script]
+    sys.path[0] = os.path.dirname(script)
+    runpy.run_path(script, run_name="__main__")
+
+if __name__ == "__main__":
+    if WORKER_FLAG in sys.argv:
+        run_worker()